@@ -138,6 +138,7 @@ def init_logging(conf_filename: str,
     import pandas as pd
     from ruamel.yaml import YAML
 
+    from hummingbot.logger.queue_logging import install_queue_logging, uninstall_queue_logging
     from hummingbot.logger.struct_logger import StructLogger, StructLogRecord
     global STRUCT_LOGGER_SET
     if not STRUCT_LOGGER_SET:
@@ -147,6 +148,8 @@ def init_logging(conf_filename: str,
 
     # Do not raise exceptions during log handling
     logging.raiseExceptions = False
+    # Write the records pending in the log queue before the handlers are replaced
+    uninstall_queue_logging()
 
     file_path: str = join(prefix_path(), "conf", conf_filename)
     yaml_parser: YAML = YAML()
@@ -162,6 +165,12 @@ def init_logging(conf_filename: str,
                 if logger in client_config_map.logger_override_whitelist:
                     config_dict["loggers"][logger]["level"] = override_log_level
         logging.config.dictConfig(config_dict)
+        queue_config = config_dict.get("queue") or {}
+        if queue_config.get("enabled", False):
+            logger_names = list(config_dict.get("loggers", {}).keys())
+            if "root" in config_dict:
+                logger_names.append("")
+            install_queue_logging(queue_config, logger_names)
 
 
 def get_strategy_list() -> List[str]:
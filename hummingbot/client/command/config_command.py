@@ -74,6 +74,7 @@ client_configs_to_display = ["autofill_import",
                              "gateway_api_host",
                              "gateway_api_port",
                              "rate_oracle_source",
+                             "rate_oracle_connector_prices",
                              "extra_tokens",
                              "fetch_pairs_from_all_exchanges",
                              "global_token",
@@ -89,6 +90,15 @@ client_configs_to_display = ["autofill_import",
                              "market_data_collection_enabled",
                              "market_data_collection_interval",
                              "market_data_collection_depth",
+                             "market_data_order_book_levels",
+                             "performance_monitor",
+                             "performance_monitor_enabled",
+                             "slow_callback_duration",
+                             "task_cpu_sampling",
+                             "metrics_exporter",
+                             "metrics_exporter_enabled",
+                             "metrics_exporter_host",
+                             "metrics_exporter_port",
                              ]
 color_settings_to_display = ["top_pane",
                              "bottom_pane",
@@ -93,11 +93,17 @@ class ExportCommand:
                                  start_timestamp: int,
                                  session: Session,
                                  number_of_rows: Optional[int] = None,
-                                 config_file_path: str = None) -> List[TradeFill]:
+                                 config_file_path: str = None,
+                                 market: Optional[str] = None,
+                                 trading_pair: Optional[str] = None) -> List[TradeFill]:
 
         filters = [TradeFill.timestamp >= start_timestamp]
         if config_file_path is not None:
             filters.append(TradeFill.config_file_path.like(f"%{config_file_path}%"))
+        if market is not None:
+            filters.append(TradeFill.market == market)
+        if trading_pair is not None:
+            filters.append(TradeFill.symbol == trading_pair)
         query: Query = (session
                         .query(TradeFill)
                         .filter(*filters)
@@ -8,7 +8,7 @@ from typing import TYPE_CHECKING, List, Optional, Set, Tuple
 import pandas as pd
 
 from hummingbot.client.command.gateway_command import GatewayCommand
-from hummingbot.client.performance import PerformanceMetrics
+from hummingbot.client.performance import PerformanceLedger, PerformanceMetrics
 from hummingbot.client.settings import MAXIMUM_TRADE_FILLS_DISPLAY_OUTPUT, AllConnectorSettings
 from hummingbot.client.ui.interface_utils import format_df_for_printout
 from hummingbot.core.utils.async_utils import safe_ensure_future
@@ -41,6 +41,15 @@ class HistoryCommand:
             self.notify("\n  Please first import a strategy config file of which to show historical performance.")
             return
         start_time = get_timestamp(days) if days > 0 else self.init_time
+        if days == 0 and self._performance_ledgers_available():
+            ledgers: List[PerformanceLedger] = self.markets_recorder.get_performance_ledgers(int(start_time * 1e3))
+            if not ledgers:
+                self.notify("\n  No past trades to report.")
+                return
+            if verbose:
+                self.list_trades(start_time)
+            safe_ensure_future(self.ledgers_history_report(start_time, ledgers, precision))
+            return
         with self.trade_fill_db.get_new_session() as session:
             trades: List[TradeFill] = self._get_trades_from_session(
                 int(start_time * 1e3),
@@ -53,6 +62,11 @@ class HistoryCommand:
                 self.list_trades(start_time)
             safe_ensure_future(self.history_report(start_time, trades, precision))
 
+    def _performance_ledgers_available(self,  # type: HummingbotApplication
+                                       ) -> bool:
+        return (self.markets_recorder is not None
+                and self.markets_recorder.config_file_path == self.strategy_file_name)
+
     def get_history_trades_json(self,  # type: HummingbotApplication
                                 days: float = 0):
         if self.strategy_file_name is None:
@@ -76,18 +90,57 @@ class HistoryCommand:
         return_pcts = []
         for market, symbol in market_info:
             cur_trades = [t for t in trades if t.market == market and t.symbol == symbol]
-            network_timeout = float(self.client_config_map.commands_timeout.other_commands_timeout)
-            try:
-                cur_balances = await asyncio.wait_for(self.get_current_balances(market), network_timeout)
-            except asyncio.TimeoutError:
-                self.notify(
-                    "\nA network error prevented the balances retrieval to complete. See logs for more details."
-                )
-                raise
+            cur_balances = await self._get_current_balances_with_timeout(market)
             perf = await PerformanceMetrics.create(symbol, cur_trades, cur_balances)
             if display_report:
                 self.report_performance_by_market(market, symbol, perf, precision)
             return_pcts.append(perf.return_pct)
+        return self._report_average_return(return_pcts, display_report)
+
+    async def ledgers_history_report(self,  # type: HummingbotApplication
+                                     start_time: float,
+                                     ledgers: List[PerformanceLedger],
+                                     precision: Optional[int] = None,
+                                     display_report: bool = True) -> Decimal:
+        """
+        Reports the performance from the markets trade fills ledgers, only the derivative markets trade fills are
+        loaded to pair their open and close orders.
+        """
+        if display_report:
+            self.report_header(start_time)
+        return_pcts = []
+        for ledger in ledgers:
+            cur_balances = await self._get_current_balances_with_timeout(ledger.market)
+            if ledger.is_derivative:
+                with self.trade_fill_db.get_new_session() as session:
+                    trades: List[TradeFill] = self._get_trades_from_session(
+                        int(start_time * 1e3),
+                        session=session,
+                        config_file_path=self.strategy_file_name,
+                        market=ledger.market,
+                        trading_pair=ledger.symbol)
+                perf = await PerformanceMetrics.create(ledger.symbol, trades, cur_balances)
+            else:
+                perf = await PerformanceMetrics.create_from_ledger(ledger.symbol, ledger, cur_balances)
+            if display_report:
+                self.report_performance_by_market(ledger.market, ledger.symbol, perf, precision)
+            return_pcts.append(perf.return_pct)
+        return self._report_average_return(return_pcts, display_report)
+
+    async def _get_current_balances_with_timeout(self,  # type: HummingbotApplication
+                                                 market: str):
+        network_timeout = float(self.client_config_map.commands_timeout.other_commands_timeout)
+        try:
+            return await asyncio.wait_for(self.get_current_balances(market), network_timeout)
+        except asyncio.TimeoutError:
+            self.notify(
+                "\nA network error prevented the balances retrieval to complete. See logs for more details."
+            )
+            raise
+
+    def _report_average_return(self,  # type: HummingbotApplication
+                               return_pcts: List[Decimal],
+                               display_report: bool) -> Decimal:
         avg_return = sum(return_pcts) / len(return_pcts) if len(return_pcts) > 0 else s_decimal_0
         if display_report and len(return_pcts) > 1:
             self.notify(f"\nAveraged Return = {avg_return:.2%}")
@@ -208,6 +261,10 @@ class HistoryCommand:
 
         start_time = self.init_time
 
+        if self._performance_ledgers_available():
+            ledgers: List[PerformanceLedger] = self.markets_recorder.get_performance_ledgers(int(start_time * 1e3))
+            return await self.ledgers_history_report(start_time, ledgers, display_report=False)
+
         with self.trade_fill_db.get_new_session() as session:
             trades: List[TradeFill] = self._get_trades_from_session(
                 int(start_time * 1e3),
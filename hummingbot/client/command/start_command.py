@@ -21,6 +21,7 @@ from hummingbot.connector.connector_status import get_connector_status, warning_
 from hummingbot.core.clock import Clock, ClockMode
 from hummingbot.core.rate_oracle.rate_oracle import RateOracle
 from hummingbot.core.utils.async_utils import safe_ensure_future
+from hummingbot.core.utils.loop_monitor import LoopMonitor
 from hummingbot.exceptions import InvalidScriptModule, OracleRateUnavailable
 from hummingbot.strategy.directional_strategy_base import DirectionalStrategyBase
 from hummingbot.strategy.script_strategy_base import ScriptStrategyBase
@@ -191,7 +192,11 @@ class StartCommand(GatewayChainApiManager):
         self._in_start_check = False
 
         # We always start the RateOracle. It is required for PNL calculation.
-        RateOracle.get_instance().start()
+        rate_oracle = RateOracle.get_instance()
+        rate_oracle.start()
+        if self.client_config_map.rate_oracle_connector_prices:
+            for market in self.markets.values():
+                rate_oracle.add_price_connector(market)
         if self._mqtt:
             self._mqtt.patch_loggers()
 
@@ -235,6 +240,9 @@ class StartCommand(GatewayChainApiManager):
             tick_size = self.client_config_map.tick_size
             self.logger().info(f"Creating the clock with tick size: {tick_size}")
             self.clock = Clock(ClockMode.REALTIME, tick_size=tick_size)
+            if self.client_config_map.performance_monitor.performance_monitor_enabled \
+                    or LoopMonitor.get_instance().is_running:
+                self.start_performance_monitor()
             for market in self.markets.values():
                 if market is not None:
                     self.clock.add_iterator(market)
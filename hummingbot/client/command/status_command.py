@@ -18,6 +18,7 @@ from hummingbot.client.settings import ethereum_wallet_required, required_exchan
 from hummingbot.connector.connector_base import ConnectorBase
 from hummingbot.core.network_iterator import NetworkStatus
 from hummingbot.core.utils.async_utils import safe_ensure_future
+from hummingbot.core.utils.loop_monitor import LoopMonitor
 from hummingbot.logger.application_warning import ApplicationWarning
 from hummingbot.user.user_balances import UserBalances
 
@@ -124,10 +125,34 @@ class StatusCommand:
         validation_errors = config_map.validate_model() if isinstance(config_map, ClientConfigAdapter) else []
         return validation_errors
 
+    def start_performance_monitor(self,  # type: HummingbotApplication
+                                  ) -> LoopMonitor:
+        config = self.client_config_map.performance_monitor
+        monitor = LoopMonitor.get_instance()
+        monitor.configure(slow_callback_duration=config.slow_callback_duration,
+                          sample_task_cpu=config.task_cpu_sampling)
+        monitor.start(self.ev_loop)
+        if self.clock is not None:
+            self.clock.loop_monitor = monitor
+        return monitor
+
+    def performance_status(self,  # type: HummingbotApplication
+                           ) -> str:
+        monitor = LoopMonitor.get_instance()
+        if not monitor.is_running:
+            self.start_performance_monitor()
+            return "Performance monitor started. Run `status --perf` again to see the event loop statistics."
+        return monitor.format_status()
+
     def status(self,  # type: HummingbotApplication
-               live: bool = False):
+               live: bool = False,
+               perf: bool = False):
         if threading.current_thread() != threading.main_thread():
-            self.ev_loop.call_soon_threadsafe(self.status, live)
+            self.ev_loop.call_soon_threadsafe(self.status, live, perf)
+            return
+
+        if perf:
+            self.notify(self.performance_status())
             return
 
         safe_ensure_future(self.status_check_all(live=live), loop=self.ev_loop)
@@ -178,11 +178,82 @@ class MarketDataCollectionConfigMap(BaseClientModel):
             ),
         ),
     )
+    market_data_order_book_levels: bool = Field(
+        default=False,
+        client_data=ClientFieldData(
+            prompt=lambda cm: (
+                "Store the order book levels in numeric columns instead of a JSON document? (Yes/No)"
+            ),
+        ),
+    )
 
     class Config:
         title = "market_data_collection"
 
 
+class PerformanceMonitorConfigMap(BaseClientModel):
+    performance_monitor_enabled: bool = Field(
+        default=False,
+        client_data=ClientFieldData(
+            prompt=lambda cm: (
+                "Enable/Disable the event loop performance monitor (loop lag, clock ticks and slow callbacks)"
+            ),
+        ),
+    )
+    slow_callback_duration: float = Field(
+        default=0.1,
+        gt=0,
+        client_data=ClientFieldData(
+            prompt=lambda cm: (
+                "Minimum duration in seconds of the event loop callbacks reported as slow (Default=0.1)"
+            ),
+        ),
+    )
+    task_cpu_sampling: bool = Field(
+        default=False,
+        client_data=ClientFieldData(
+            prompt=lambda cm: (
+                "Record the CPU time spent by each task? (Yes/No)"
+            ),
+        ),
+    )
+
+    class Config:
+        title = "performance_monitor"
+
+
+class MetricsExporterConfigMap(BaseClientModel):
+    metrics_exporter_enabled: bool = Field(
+        default=False,
+        client_data=ClientFieldData(
+            prompt=lambda cm: (
+                "Serve the client metrics in the OpenMetrics format for Prometheus? (Yes/No)"
+            ),
+        ),
+    )
+    metrics_exporter_host: str = Field(
+        default="127.0.0.1",
+        client_data=ClientFieldData(
+            prompt=lambda cm: (
+                "Set the address the metrics exporter listens on (Default=127.0.0.1)"
+            ),
+        ),
+    )
+    metrics_exporter_port: int = Field(
+        default=9464,
+        ge=0,
+        le=65535,
+        client_data=ClientFieldData(
+            prompt=lambda cm: (
+                "Set the port the metrics exporter listens on (Default=9464)"
+            ),
+        ),
+    )
+
+    class Config:
+        title = "metrics_exporter"
+
+
 class ColorConfigMap(BaseClientModel):
     top_pane: str = Field(
         default="#000000",
@@ -433,6 +504,12 @@ class DBMode(BaseClientModel, ABC):
     def get_url(self, db_path: str) -> str:
         ...
 
+    def get_pragmas(self) -> Dict[str, str]:
+        """
+        The PRAGMA statements to run on every new database connection
+        """
+        return {}
+
 
 class DBSqliteMode(DBMode):
     db_engine: str = Field(
@@ -445,12 +522,41 @@ class DBSqliteMode(DBMode):
         ),
     )
 
+    db_performance_profile: bool = Field(
+        default=False,
+        description=("Tunes SQLite for write heavy bots: WAL journal, NORMAL synchronous level,"
+                     " bigger page cache and memory mapped I/O"),
+        client_data=ClientFieldData(
+            prompt=lambda cm: "Would you like to enable the SQLite performance profile? (Yes/No)",
+        ),
+    )
+
     class Config:
         title = "sqlite_db_engine"
 
     def get_url(self, db_path: str) -> str:
         return f"{self.db_engine}:///{db_path}"
 
+    def get_pragmas(self) -> Dict[str, str]:
+        if not self.db_performance_profile:
+            return {}
+        return {
+            "journal_mode": "WAL",
+            "synchronous": "NORMAL",
+            "cache_size": str(-64 * 1024),  # 64 MB, negative values are KiB
+            "mmap_size": str(256 * 1024 * 1024),
+            "temp_store": "MEMORY",
+        }
+
+    @validator("db_performance_profile", pre=True)
+    def validate_db_performance_profile(cls, v: str):
+        """Used for client-friendly error output."""
+        if isinstance(v, str):
+            ret = validate_bool(v)
+            if ret is not None:
+                raise ValueError(ret)
+        return v
+
 
 class DBOtherMode(DBMode):
     db_engine: str = Field(
@@ -1069,6 +1175,17 @@ class ClientConfigMap(BaseClientModel):
             ),
         ),
     )
+    rate_oracle_connector_prices: bool = Field(
+        default=False,
+        description="Price the conversion pairs tracked by the running strategy's connectors from their order books"
+                    "\ninstead of requesting them from the rate oracle source",
+        client_data=ClientFieldData(
+            prompt=lambda cm: (
+                "Do you want the rate oracle to use the order books of the strategy's connectors when possible?"
+                " (Yes/No)"
+            ),
+        ),
+    )
     global_token: GlobalTokenConfigMap = Field(
         default=GlobalTokenConfigMap(),
         description="A universal token which to display tokens values in, e.g. USD,EUR,BTC"
@@ -1117,6 +1234,8 @@ class ClientConfigMap(BaseClientModel):
         ),
     )
     market_data_collection: MarketDataCollectionConfigMap = Field(default=MarketDataCollectionConfigMap())
+    performance_monitor: PerformanceMonitorConfigMap = Field(default=PerformanceMonitorConfigMap())
+    metrics_exporter: MetricsExporterConfigMap = Field(default=MetricsExporterConfigMap())
 
     class Config:
         title = "client_config_map"
@@ -1151,7 +1270,7 @@ class ClientConfigMap(BaseClientModel):
             sub_model = TELEGRAM_MODES[v].construct()
         return sub_model
 
-    @validator("send_error_logs", "fetch_pairs_from_all_exchanges", pre=True)
+    @validator("send_error_logs", "fetch_pairs_from_all_exchanges", "rate_oracle_connector_prices", pre=True)
     def validate_bool(cls, v: str):
         """Used for client-friendly error output."""
         if isinstance(v, str):
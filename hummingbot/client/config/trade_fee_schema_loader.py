@@ -1,4 +1,6 @@
+from copy import deepcopy
 from decimal import Decimal
+from typing import Any, Dict, Optional, Tuple
 
 from hummingbot.client.config.fee_overrides_config_map import fee_overrides_config_map
 from hummingbot.client.settings import AllConnectorSettings
@@ -9,16 +11,54 @@ class TradeFeeSchemaLoader:
     """
     Utility class that contains the requried logic to load fee schemas applying any override the user
     might have configured.
+
+    The configured schema of each exchange is kept until the exchange schema in `AllConnectorSettings` is replaced
+    or one of the exchange fee overrides changes, so fee calculations don't have to superimpose the overrides and
+    validate the schema again on every call.
     """
+    OVERRIDE_SUFFIXES = (
+        "percent_fee_token",
+        "maker_percent_fee",
+        "taker_percent_fee",
+        "buy_percent_fee_deducted_from_returns",
+        "maker_fixed_fees",
+        "taker_fixed_fees",
+    )
+
+    _configured_schemas: Dict[str, Tuple[TradeFeeSchema, Tuple[Any, ...]]] = {}
 
     @classmethod
     def configured_schema_for_exchange(cls, exchange_name: str) -> TradeFeeSchema:
         if exchange_name not in AllConnectorSettings.get_connector_settings():
             raise Exception(f"Invalid connector. {exchange_name} does not exist in AllConnectorSettings")
         trade_fee_schema = AllConnectorSettings.get_connector_settings()[exchange_name].trade_fee_schema
-        trade_fee_schema = cls._superimpose_overrides(exchange_name, trade_fee_schema)
+        override_values = cls._override_values(exchange_name)
+        cached = cls._configured_schemas.get(exchange_name)
+        if cached is None or cached[0] is not trade_fee_schema or cached[1] != override_values:
+            trade_fee_schema = cls._superimpose_overrides(exchange_name, trade_fee_schema)
+            cls._configured_schemas[exchange_name] = (trade_fee_schema, override_values)
         return trade_fee_schema
 
+    @classmethod
+    def invalidate(cls, exchange_name: Optional[str] = None):
+        """
+        Discards the configured schema of the exchange, or of all exchanges when no exchange is specified, so that
+        the overrides are superimposed again on the next call to `configured_schema_for_exchange`.
+        """
+        if exchange_name is None:
+            cls._configured_schemas.clear()
+        else:
+            cls._configured_schemas.pop(exchange_name, None)
+
+    @classmethod
+    def _override_values(cls, exchange: str) -> Tuple[Any, ...]:
+        values = []
+        for suffix in cls.OVERRIDE_SUFFIXES:
+            config_var = fee_overrides_config_map.get(f"{exchange}_{suffix}")
+            # fixed fee overrides are lists that could be modified in place, a copy is kept for the comparison
+            values.append(deepcopy(config_var.value) if config_var is not None else None)
+        return tuple(values)
+
     @classmethod
     def _superimpose_overrides(cls, exchange: str, trade_fee_schema: TradeFeeSchema):
         trade_fee_schema.percent_fee_token = (
@@ -32,6 +32,8 @@ from hummingbot.connector.exchange_base import ExchangeBase
 from hummingbot.connector.markets_recorder import MarketsRecorder
 from hummingbot.core.clock import Clock
 from hummingbot.core.gateway.gateway_status_monitor import GatewayStatusMonitor
+from hummingbot.core.metrics.metrics_exporter import MetricsExporter
+from hummingbot.core.utils.async_utils import safe_ensure_future
 from hummingbot.core.utils.kill_switch import KillSwitch
 from hummingbot.core.utils.trading_pair_fetcher import TradingPairFetcher
 from hummingbot.data_feed.data_feed_base import DataFeedBase
@@ -108,6 +110,7 @@ class HummingbotApplication(*commands):
         self._binance_connector = None
         self._shared_client = None
         self._mqtt: MQTTGateway = None
+        self._metrics_exporter: Optional[MetricsExporter] = None
 
         # gateway variables and monitor
         self._gateway_monitor = GatewayStatusMonitor(self)
@@ -126,6 +129,9 @@ class HummingbotApplication(*commands):
         # MQTT Bridge
         if self.client_config_map.mqtt_bridge.mqtt_autostart:
             self.mqtt_start()
+        # Prometheus metrics exporter
+        if self.client_config_map.metrics_exporter.metrics_exporter_enabled:
+            self.start_metrics_exporter()
 
     @property
     def instance_id(self) -> str:
@@ -166,6 +172,12 @@ class HummingbotApplication(*commands):
     def strategy_config_map(self, config_map: BaseStrategyConfigMap):
         self._strategy_config_map = config_map
 
+    def start_metrics_exporter(self):
+        config = self.client_config_map.metrics_exporter
+        self._metrics_exporter = MetricsExporter(host=config.metrics_exporter_host,
+                                                 port=config.metrics_exporter_port)
+        safe_ensure_future(self._metrics_exporter.start(), loop=self.ev_loop)
+
     def _init_gateway_monitor(self):
         try:
             # Do not start the gateway monitor during unit tests.
@@ -301,7 +313,8 @@ class HummingbotApplication(*commands):
         for connector_name, trading_pairs in self.market_trading_pairs_map.items():
             conn_setting = AllConnectorSettings.get_connector_settings()[connector_name]
 
-            if connector_name.endswith("paper_trade") and conn_setting.type == ConnectorType.Exchange:
+            if (connector_name.endswith("paper_trade")
+                    and conn_setting.type in (ConnectorType.Exchange, ConnectorType.Derivative)):
                 connector = create_paper_trade_market(conn_setting.parent_name, self.client_config_map, trading_pairs)
                 paper_trade_account_balance = self.client_config_map.paper_trade.paper_trade_account_balance
                 if paper_trade_account_balance is not None:
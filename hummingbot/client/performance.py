@@ -15,6 +15,138 @@ s_decimal_0 = Decimal("0")
 s_decimal_nan = Decimal("NaN")
 
 
+class PerformanceLedger:
+    """
+    Running totals of the trade fills of one market and trading pair, used to build the PerformanceMetrics without
+    reprocessing every trade fill. The totals follow the same rules PerformanceMetrics applies to a list of
+    TradeFill records, and the ledger can be serialized to be stored as a checkpoint.
+    """
+    # Trade fills can be recorded out of timestamp order, the ids of the latest fills are kept to skip the fills
+    # already included when replaying the fills recorded after a checkpoint.
+    RECENT_TRADES_WINDOW_MS = 60 * 1000
+
+    def __init__(self, market: str, symbol: str):
+        self.market: str = market
+        self.symbol: str = symbol
+        self.num_buys: int = 0
+        self.num_sells: int = 0
+        self.b_vol_base: Decimal = s_decimal_0
+        self.s_vol_base: Decimal = s_decimal_0
+        self.b_vol_quote: Decimal = s_decimal_0
+        self.s_vol_quote: Decimal = s_decimal_0
+        self.fees: Dict[str, Decimal] = defaultdict(lambda: s_decimal_0)
+        self.start_price: Decimal = s_decimal_nan
+        self.start_timestamp: Optional[int] = None
+        self.last_price: Decimal = s_decimal_nan
+        self.last_timestamp: Optional[int] = None
+        self.recent_trade_ids: Dict[str, int] = {}
+        self.buys_without_position: bool = False
+        self.sells_without_position: bool = False
+
+    @property
+    def num_trades(self) -> int:
+        return self.num_buys + self.num_sells
+
+    @property
+    def is_derivative(self) -> bool:
+        """
+        Derivative trade PnL pairs the open and close orders, so it can't be calculated from the running totals
+        """
+        return ((self.num_buys > 0 and not self.buys_without_position)
+                or (self.num_sells > 0 and not self.sells_without_position))
+
+    @property
+    def replay_start_timestamp(self) -> Optional[int]:
+        """
+        The timestamp from which the recorded trade fills have to be replayed to bring the ledger up to date
+        """
+        if self.last_timestamp is None:
+            return None
+        return self.last_timestamp - self.RECENT_TRADES_WINDOW_MS
+
+    @staticmethod
+    def trade_id(trade: TradeFill) -> str:
+        return f"{trade.order_id}-{trade.exchange_trade_id}"
+
+    def is_trade_included(self, trade: TradeFill) -> bool:
+        if self.last_timestamp is None:
+            return False
+        return trade.timestamp < self.replay_start_timestamp or self.trade_id(trade) in self.recent_trade_ids
+
+    def add_trade(self, trade: TradeFill):
+        amount = Decimal(str(trade.amount))
+        price = Decimal(str(trade.price))
+        is_nil_position = trade.position == PositionAction.NIL.value
+        if trade.trade_type.upper() == TradeType.BUY.name.upper():
+            self.num_buys += 1
+            self.b_vol_base += amount
+            self.b_vol_quote += amount * price * Decimal("-1")
+            self.buys_without_position |= is_nil_position
+        elif trade.trade_type.upper() == TradeType.SELL.name.upper():
+            self.num_sells += 1
+            self.s_vol_base += amount * Decimal("-1")
+            self.s_vol_quote += amount * price
+            self.sells_without_position |= is_nil_position
+
+        fee_percent = trade.trade_fee.get("percent")
+        if fee_percent is not None:
+            fee_percent = Decimal(str(fee_percent))
+            if trade.trade_fee.get("fee_type") == DeductedFromReturnsTradeFee.type_descriptor_for_json():
+                self.s_vol_quote += amount * price * fee_percent * Decimal("-1")
+            self.fees[split_hb_trading_pair(self.symbol)[1]] += price * amount * fee_percent
+        for flat_fee in trade.trade_fee.get("flat_fees", []):
+            self.fees[flat_fee["token"]] += Decimal(flat_fee["amount"])
+
+        if self.start_timestamp is None or trade.timestamp < self.start_timestamp:
+            self.start_timestamp = trade.timestamp
+            self.start_price = price
+        if self.last_timestamp is None or trade.timestamp >= self.last_timestamp:
+            self.last_timestamp = trade.timestamp
+            self.last_price = price
+        self.recent_trade_ids[self.trade_id(trade)] = trade.timestamp
+        self.recent_trade_ids = {trade_id: timestamp for trade_id, timestamp in self.recent_trade_ids.items()
+                                 if timestamp >= self.replay_start_timestamp}
+
+    def to_json(self) -> Dict[str, Any]:
+        return {
+            "market": self.market,
+            "symbol": self.symbol,
+            "num_buys": self.num_buys,
+            "num_sells": self.num_sells,
+            "b_vol_base": str(self.b_vol_base),
+            "s_vol_base": str(self.s_vol_base),
+            "b_vol_quote": str(self.b_vol_quote),
+            "s_vol_quote": str(self.s_vol_quote),
+            "fees": {token: str(amount) for token, amount in self.fees.items()},
+            "start_price": str(self.start_price),
+            "start_timestamp": self.start_timestamp,
+            "last_price": str(self.last_price),
+            "last_timestamp": self.last_timestamp,
+            "recent_trade_ids": self.recent_trade_ids,
+            "buys_without_position": self.buys_without_position,
+            "sells_without_position": self.sells_without_position,
+        }
+
+    @classmethod
+    def from_json(cls, data: Dict[str, Any]) -> "PerformanceLedger":
+        ledger = PerformanceLedger(market=data["market"], symbol=data["symbol"])
+        ledger.num_buys = data["num_buys"]
+        ledger.num_sells = data["num_sells"]
+        ledger.b_vol_base = Decimal(data["b_vol_base"])
+        ledger.s_vol_base = Decimal(data["s_vol_base"])
+        ledger.b_vol_quote = Decimal(data["b_vol_quote"])
+        ledger.s_vol_quote = Decimal(data["s_vol_quote"])
+        ledger.fees.update({token: Decimal(amount) for token, amount in data["fees"].items()})
+        ledger.start_price = Decimal(data["start_price"])
+        ledger.start_timestamp = data["start_timestamp"]
+        ledger.last_price = Decimal(data["last_price"])
+        ledger.last_timestamp = data["last_timestamp"]
+        ledger.recent_trade_ids = dict(data["recent_trade_ids"])
+        ledger.buys_without_position = data["buys_without_position"]
+        ledger.sells_without_position = data["sells_without_position"]
+        return ledger
+
+
 @dataclass
 class PerformanceMetrics:
     _logger = None
@@ -71,6 +203,22 @@ class PerformanceMetrics:
         await performance._initialize_metrics(trading_pair, trades, current_balances)
         return performance
 
+    @classmethod
+    async def create_from_ledger(cls,
+                                 trading_pair: str,
+                                 ledger: PerformanceLedger,
+                                 current_balances: Dict[str, Decimal]) -> 'PerformanceMetrics':
+        """
+        Creates the performance metrics from the running totals of a spot market ledger, the derivative markets
+        metrics have to be created from the list of trades.
+        """
+        if ledger.is_derivative:
+            raise ValueError(f"The performance of the derivative market {ledger.market} can't be calculated from "
+                             f"the trades ledger.")
+        performance = PerformanceMetrics()
+        await performance._initialize_metrics_from_ledger(trading_pair, ledger, current_balances)
+        return performance
+
     @staticmethod
     def position_order(open: list, close: list) -> Tuple[Any, Any]:
         """
@@ -196,6 +344,11 @@ class PerformanceMetrics:
 
             self.s_vol_quote += self._process_deducted_fees_impact_in_quote_vol(trade)
 
+        self._calculate_total_volumes_and_average_prices()
+
+        return buys, sells
+
+    def _calculate_total_volumes_and_average_prices(self):
         self.tot_vol_base = self.b_vol_base + self.s_vol_base
         self.tot_vol_quote = self.b_vol_quote + self.s_vol_quote
 
@@ -206,8 +359,6 @@ class PerformanceMetrics:
         self.avg_b_price = abs(self.avg_b_price)
         self.avg_s_price = abs(self.avg_s_price)
 
-        return buys, sells
-
     def _process_deducted_fees_impact_in_quote_vol(self, trade):
         fee_percent = None
         fee_type = ""
@@ -248,6 +399,9 @@ class PerformanceMetrics:
             for flat_fee in flat_fees:
                 self.fees[flat_fee.token] += flat_fee.amount
 
+        await self._calculate_fee_in_quote(quote)
+
+    async def _calculate_fee_in_quote(self, quote: str):
         for fee_token, fee_amount in self.fees.items():
             if fee_token == quote:
                 self.fee_in_quote += fee_amount
@@ -302,15 +456,65 @@ class PerformanceMetrics:
         self.num_sells = len(sells)
         self.num_trades = self.num_buys + self.num_sells
 
+        await self._calculate_portfolio_values(trading_pair=trading_pair,
+                                               current_balances=current_balances,
+                                               start_price=Decimal(str(trades[0].price)),
+                                               last_price=Decimal(str(trades[-1].price)))
+        self._calculate_trade_pnl(buys, sells)
+
+        await self._calculate_fees(quote, trades)
+
+        self.total_pnl = self.trade_pnl - self.fee_in_quote
+        self.return_pct = self.divide(self.total_pnl, self.hold_value)
+
+    async def _initialize_metrics_from_ledger(self,
+                                              trading_pair: str,
+                                              ledger: PerformanceLedger,
+                                              current_balances: Dict[str, Decimal]):
+        """
+        Calculates PnL, fees, Return % and etc... from the running totals of a spot market
+        :param trading_pair: the trading market to get performance metrics
+        :param ledger: the running totals of the market trade fills
+        :param current_balances: current user account balance
+        """
+        base, quote = split_hb_trading_pair(trading_pair)
+        self.b_vol_base = ledger.b_vol_base
+        self.s_vol_base = ledger.s_vol_base
+        self.b_vol_quote = ledger.b_vol_quote
+        self.s_vol_quote = ledger.s_vol_quote
+        self._calculate_total_volumes_and_average_prices()
+
+        self.num_buys = ledger.num_buys
+        self.num_sells = ledger.num_sells
+        self.num_trades = ledger.num_trades
+
+        await self._calculate_portfolio_values(trading_pair=trading_pair,
+                                               current_balances=current_balances,
+                                               start_price=ledger.start_price,
+                                               last_price=ledger.last_price)
+        self.trade_pnl = self.cur_value - self.hold_value
+
+        self.fees.update(ledger.fees)
+        await self._calculate_fee_in_quote(quote)
+
+        self.total_pnl = self.trade_pnl - self.fee_in_quote
+        self.return_pct = self.divide(self.total_pnl, self.hold_value)
+
+    async def _calculate_portfolio_values(self,
+                                          trading_pair: str,
+                                          current_balances: Dict[str, Decimal],
+                                          start_price: Decimal,
+                                          last_price: Decimal):
+        base, quote = split_hb_trading_pair(trading_pair)
         self.cur_base_bal = current_balances.get(base, s_decimal_0)
         self.cur_quote_bal = current_balances.get(quote, s_decimal_0)
         self.start_base_bal = self.cur_base_bal - self.tot_vol_base
         self.start_quote_bal = self.cur_quote_bal - self.tot_vol_quote
 
-        self.start_price = Decimal(str(trades[0].price))
+        self.start_price = start_price
         self.cur_price = await RateOracle.get_instance().stored_or_live_rate(trading_pair)
         if self.cur_price is None:
-            self.cur_price = Decimal(str(trades[-1].price))
+            self.cur_price = last_price
         self.start_base_ratio_pct = self.divide(self.start_base_bal * self.start_price,
                                                 (self.start_base_bal * self.start_price) + self.start_quote_bal)
         self.cur_base_ratio_pct = self.divide(self.cur_base_bal * self.cur_price,
@@ -318,9 +522,3 @@ class PerformanceMetrics:
 
         self.hold_value = (self.start_base_bal * self.cur_price) + self.start_quote_bal
         self.cur_value = (self.cur_base_bal * self.cur_price) + self.cur_quote_bal
-        self._calculate_trade_pnl(buys, sells)
-
-        await self._calculate_fees(quote, trades)
-
-        self.total_pnl = self.trade_pnl - self.fee_in_quote
-        self.return_pct = self.divide(self.total_pnl, self.hold_value)
@@ -2,9 +2,10 @@ import typing
 from collections import defaultdict
 from copy import copy
 from decimal import Decimal
-from typing import Dict, List
+from typing import Dict, List, Tuple
 
 from hummingbot.core.data_type.order_candidate import OrderCandidate
+from hummingbot.core.data_type.trade_fee import TradeFeeBase
 
 if typing.TYPE_CHECKING:  # avoid circular import problems
     from hummingbot.connector.exchange_base import ExchangeBase
@@ -28,6 +29,7 @@ class BudgetChecker:
         """
         self._exchange = exchange
         self._locked_collateral: Dict[str, Decimal] = defaultdict(lambda: Decimal("0"))
+        self._candidate_fees: Dict[Tuple, TradeFeeBase] = {}
 
     def reset_locked_collateral(self):
         """
@@ -50,10 +52,14 @@ class BudgetChecker:
         :return: The list of adjusted order candidates.
         """
         self.reset_locked_collateral()
-        adjusted_candidates = [
-            self.adjust_candidate_and_lock_available_collateral(order_candidate, all_or_none)
-            for order_candidate in order_candidates
-        ]
+        self._candidate_fees = self._get_candidate_fees(order_candidates)
+        try:
+            adjusted_candidates = [
+                self.adjust_candidate_and_lock_available_collateral(order_candidate, all_or_none)
+                for order_candidate in order_candidates
+            ]
+        finally:
+            self._candidate_fees = {}
         self.reset_locked_collateral()
         return adjusted_candidates
 
@@ -116,9 +122,23 @@ class BudgetChecker:
         :return: The adjusted order candidate.
         """
         order_candidate = copy(order_candidate)
-        order_candidate.populate_collateral_entries(self._exchange)
+        order_candidate.populate_collateral_entries(
+            self._exchange, fee=self._candidate_fees.get(order_candidate.get_fee_key())
+        )
         return order_candidate
 
+    def _get_candidate_fees(self, order_candidates: List[OrderCandidate]) -> Dict[Tuple, TradeFeeBase]:
+        """
+        Calculates the fee once for each group of candidates sharing the same fee parameters (e.g. all the buy
+        levels of a market making proposal).
+        """
+        fees = {}
+        for order_candidate in order_candidates:
+            fee_key = order_candidate.get_fee_key()
+            if fee_key not in fees:
+                fees[fee_key] = order_candidate._get_fee(self._exchange)
+        return fees
+
     def _get_available_balances(self, order_candidate: OrderCandidate) -> Dict[str, Decimal]:
         available_balances = {}
         balance_fn = (
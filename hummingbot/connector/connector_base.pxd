@@ -12,6 +12,15 @@ cdef class ConnectorBase(NetworkIterator):
         public bint _real_time_balance_update
         public dict _in_flight_orders_snapshot
         public double _in_flight_orders_snapshot_timestamp
+        object _filled_balance_deltas
+        dict _filled_balances_since_snapshot
+        double _filled_balances_timestamp
+        object _snapshot_locked_balances_source
+        dict _snapshot_locked_balances
+        object _in_flight_locked_balances_key
+        dict _in_flight_locked_balances
+        long _balance_ledger_version
+        object _balance_ledger_forwarder
         public set _current_trade_fills
         public dict _exchange_order_ids
         public object _trade_fee_schema
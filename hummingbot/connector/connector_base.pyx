@@ -1,5 +1,6 @@
 import asyncio
 import time
+from collections import deque
 from decimal import Decimal
 from typing import Dict, List, Set, Tuple, TYPE_CHECKING, Union
 
@@ -12,6 +13,7 @@ from hummingbot.core.data_type.limit_order import LimitOrder
 from hummingbot.core.data_type.cancellation_result import CancellationResult
 from hummingbot.core.data_type.common import OrderType, TradeType
 from hummingbot.core.data_type.market_order import MarketOrder
+from hummingbot.core.event.event_forwarder import EventForwarder
 from hummingbot.core.event.event_logger import EventLogger
 from hummingbot.core.event.events import MarketEvent, OrderFilledEvent
 from hummingbot.core.network_iterator import NetworkIterator
@@ -43,6 +45,17 @@ cdef class ConnectorBase(NetworkIterator):
         MarketEvent.RangePositionUpdateFailure,
         MarketEvent.RangePositionFeeCollected,
     ]
+    # Events after which the balance locked in the in-flight orders has to be calculated again
+    BALANCE_LEDGER_EVENTS = [
+        MarketEvent.BuyOrderCreated,
+        MarketEvent.SellOrderCreated,
+        MarketEvent.OrderFilled,
+        MarketEvent.BuyOrderCompleted,
+        MarketEvent.SellOrderCompleted,
+        MarketEvent.OrderCancelled,
+        MarketEvent.OrderExpired,
+        MarketEvent.OrderFailure,
+    ]
 
     def __init__(self, client_config_map: "ClientConfigAdapter"):
         super().__init__()
@@ -62,6 +75,20 @@ cdef class ConnectorBase(NetworkIterator):
         # for _in_flight_orders_snapshot and _in_flight_orders_snapshot_timestamp when the update user balances.
         self._in_flight_orders_snapshot = {}  # Dict[order_id:str, InFlightOrderBase]
         self._in_flight_orders_snapshot_timestamp = 0.0
+        # Incremental ledger used to estimate the available balance when there are no real time balance updates.
+        # It keeps the balance changes of the fills received after the snapshot timestamp, and the balances locked
+        # in the snapshot and in the current in-flight orders, so queries don't have to scan the event logs.
+        self._filled_balance_deltas = deque()  # Deque[Tuple[timestamp, base, quote, base_delta, quote_delta]]
+        self._filled_balances_since_snapshot = {}
+        self._filled_balances_timestamp = 0.0
+        self._snapshot_locked_balances_source = None
+        self._snapshot_locked_balances = {}
+        self._in_flight_locked_balances_key = None
+        self._in_flight_locked_balances = {}
+        self._balance_ledger_version = 0
+        self._balance_ledger_forwarder = EventForwarder(self._process_balance_ledger_event)
+        for event_tag in self.BALANCE_LEDGER_EVENTS:
+            self.c_add_listener(event_tag.value, self._balance_ledger_forwarder)
         self._current_trade_fills = set()
         self._exchange_order_ids = dict()
         self._trade_fee_schema = None
@@ -119,14 +146,16 @@ cdef class ConnectorBase(NetworkIterator):
         asset_balances = {}
         if in_flight_orders is None:
             return asset_balances
+        fee_factor = None
         for order in (o for o in in_flight_orders.values() if not (o.is_done or o.is_failure or o.is_cancelled)):
             outstanding_amount = order.amount - order.executed_amount_base
             if order.trade_type is TradeType.BUY:
                 outstanding_value = outstanding_amount * order.price
                 if order.quote_asset not in asset_balances:
                     asset_balances[order.quote_asset] = s_decimal_0
-                fee = self.estimate_fee_pct(True)
-                outstanding_value *= Decimal(1) + fee
+                if fee_factor is None:
+                    fee_factor = Decimal(1) + self.estimate_fee_pct(True)
+                outstanding_value *= fee_factor
                 asset_balances[order.quote_asset] += outstanding_value
             else:
                 if order.base_asset not in asset_balances:
@@ -401,13 +430,59 @@ cdef class ConnectorBase(NetworkIterator):
         _update_balances()
         :returns the real available that accounts for changes in flight orders and filled orders
         """
-        snapshot_bal = self.in_flight_asset_balances(self._in_flight_orders_snapshot).get(currency, s_decimal_0)
-        in_flight_bal = self.in_flight_asset_balances(self.in_flight_orders).get(currency, s_decimal_0)
-        orders_filled_bal = self.order_filled_balances(self._in_flight_orders_snapshot_timestamp).get(currency,
-                                                                                                      s_decimal_0)
+        snapshot_bal = self._get_snapshot_locked_balances().get(currency, s_decimal_0)
+        in_flight_bal = self._get_in_flight_locked_balances().get(currency, s_decimal_0)
+        orders_filled_bal = self._get_filled_balances_since_snapshot().get(currency, s_decimal_0)
         actual_available = available_balance + snapshot_bal - in_flight_bal + orders_filled_bal
         return actual_available
 
+    def _get_snapshot_locked_balances(self) -> Dict[str, Decimal]:
+        # The snapshot is replaced (never updated in place) each time the balances are updated
+        if self._in_flight_orders_snapshot is not self._snapshot_locked_balances_source:
+            self._snapshot_locked_balances = self.in_flight_asset_balances(self._in_flight_orders_snapshot)
+            self._snapshot_locked_balances_source = self._in_flight_orders_snapshot
+        return self._snapshot_locked_balances
+
+    def _get_in_flight_locked_balances(self) -> Dict[str, Decimal]:
+        # Orders are added to or removed from the in-flight orders without events, so the number of orders and the
+        # current tick are part of the key. Any other change in the orders is notified with one of the order events.
+        in_flight_orders = self.in_flight_orders
+        key = (id(in_flight_orders), len(in_flight_orders), self._current_timestamp, self._balance_ledger_version)
+        if key != self._in_flight_locked_balances_key:
+            self._in_flight_locked_balances = self.in_flight_asset_balances(in_flight_orders)
+            self._in_flight_locked_balances_key = key
+        return self._in_flight_locked_balances
+
+    def _get_filled_balances_since_snapshot(self) -> Dict[str, Decimal]:
+        if self._in_flight_orders_snapshot_timestamp != self._filled_balances_timestamp:
+            # A new snapshot has been taken. The fills before it are already part of the snapshot balances.
+            snapshot_timestamp = self._in_flight_orders_snapshot_timestamp
+            self._filled_balance_deltas = deque(
+                delta for delta in self._filled_balance_deltas if delta[0] > snapshot_timestamp)
+            self._filled_balances_since_snapshot = {}
+            for _, base, quote, base_delta, quote_delta in self._filled_balance_deltas:
+                self._add_filled_balance_delta(base, quote, base_delta, quote_delta)
+            self._filled_balances_timestamp = snapshot_timestamp
+        return self._filled_balances_since_snapshot
+
+    def _add_filled_balance_delta(self, base: str, quote: str, base_delta: Decimal, quote_delta: Decimal):
+        balances = self._filled_balances_since_snapshot
+        balances[base] = balances.get(base, s_decimal_0) + base_delta
+        balances[quote] = balances.get(quote, s_decimal_0) + quote_delta
+
+    def _process_balance_ledger_event(self, event):
+        self._balance_ledger_version += 1
+        if isinstance(event, OrderFilledEvent):
+            self._get_filled_balances_since_snapshot()
+            if event.timestamp > self._filled_balances_timestamp:
+                base, quote = split_hb_trading_pair(event.trading_pair)
+                if event.trade_type is TradeType.BUY:
+                    base_delta, quote_delta = event.amount, -(event.price * event.amount)
+                else:
+                    base_delta, quote_delta = -event.amount, event.price * event.amount
+                self._filled_balance_deltas.append((event.timestamp, base, quote, base_delta, quote_delta))
+                self._add_filled_balance_delta(base, quote, base_delta, quote_delta)
+
     cdef object c_get_available_balance(self, str currency):
         return self.get_available_balance(currency)
 
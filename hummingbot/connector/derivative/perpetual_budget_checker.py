@@ -19,8 +19,13 @@ class PerpetualBudgetChecker(BudgetChecker):
         self._validate_perpetual_connector()
 
     def _validate_perpetual_connector(self):
+        from hummingbot.connector.exchange.paper_trade.paper_trade_perpetual_derivative import (
+            PaperTradePerpetualDerivative,
+        )
         from hummingbot.connector.perpetual_derivative_py_base import PerpetualDerivativePyBase
-        if not isinstance(self._exchange, (PerpetualTrading, PerpetualDerivativePyBase)):
+        if not isinstance(
+            self._exchange, (PerpetualTrading, PerpetualDerivativePyBase, PaperTradePerpetualDerivative)
+        ):
             raise TypeError(
                 f"{self.__class__} must be passed an exchange implementing the {PerpetualTrading} interface."
             )
@@ -10,6 +10,7 @@ from hummingbot.connector.exchange.okx.okx_api_user_stream_data_source import Ok
 from hummingbot.connector.exchange.okx.okx_auth import OkxAuth
 from hummingbot.connector.exchange_base import s_decimal_NaN
 from hummingbot.connector.exchange_py_base import ExchangePyBase
+from hummingbot.connector.gateway.common_types import CancelOrderResult, PlaceOrderResult
 from hummingbot.connector.trading_rule import TradingRule
 from hummingbot.connector.utils import combine_to_hb_trading_pair
 from hummingbot.core.data_type.common import OrderType, TradeType
@@ -96,6 +97,14 @@ class OkxExchange(ExchangePyBase):
     def is_trading_required(self) -> bool:
         return self._trading_required
 
+    @property
+    def batch_order_create_max_size(self) -> int:
+        return CONSTANTS.MAX_ORDERS_PER_BATCH
+
+    @property
+    def batch_order_cancel_max_size(self) -> int:
+        return CONSTANTS.MAX_ORDERS_PER_BATCH
+
     def supported_order_types(self):
         return [OrderType.LIMIT, OrderType.LIMIT_MAKER]
 
@@ -232,6 +241,65 @@ class OkxExchange(ExchangePyBase):
 
         return final_result
 
+    async def _place_batch_orders(self, orders: List[InFlightOrder]) -> List[PlaceOrderResult]:
+        data = [
+            {
+                "clOrdId": order.client_order_id,
+                "tdMode": "cash",
+                "ordType": "limit",
+                "side": order.trade_type.name.lower(),
+                "instId": await self.exchange_symbol_associated_to_pair(trading_pair=order.trading_pair),
+                "sz": str(order.amount),
+                "px": str(order.price)
+            }
+            for order in orders
+        ]
+
+        response = await self._api_request(
+            path_url=CONSTANTS.OKX_BATCH_PLACE_ORDER_PATH,
+            method=RESTMethod.POST,
+            data=data,
+            is_auth_required=True,
+            limit_id=CONSTANTS.OKX_BATCH_PLACE_ORDER_PATH,
+        )
+        orders_by_id = {order.client_order_id: order for order in orders}
+        results = []
+        for order_data in response["data"]:
+            order = orders_by_id[order_data["clOrdId"]]
+            exception = None
+            if order_data["sCode"] != "0":
+                exception = IOError(f"Error submitting order {order.client_order_id}: {order_data['sMsg']}")
+            results.append(PlaceOrderResult(
+                update_timestamp=self.current_timestamp,
+                client_order_id=order.client_order_id,
+                exchange_order_id=str(order_data["ordId"]) if exception is None else None,
+                trading_pair=order.trading_pair,
+                exception=exception,
+            ))
+        return results
+
+    async def _place_batch_cancels(self, orders: List[InFlightOrder]) -> List[CancelOrderResult]:
+        data = [{"clOrdId": order.client_order_id, "instId": order.trading_pair} for order in orders]
+        response = await self._api_post(
+            path_url=CONSTANTS.OKX_BATCH_ORDER_CANCEL_PATH,
+            data=data,
+            is_auth_required=True,
+        )
+        orders_by_id = {order.client_order_id: order for order in orders}
+        results = []
+        for cancel_data in response["data"]:
+            order = orders_by_id[cancel_data["clOrdId"]]
+            exception = None
+            # 51400 and 51401 are returned when the order does not exist or has already been cancelled
+            if cancel_data["sCode"] not in ["0", "51400", "51401"]:
+                exception = IOError(f"Error cancelling order {order.client_order_id}: {cancel_data}")
+            results.append(CancelOrderResult(
+                client_order_id=order.client_order_id,
+                trading_pair=order.trading_pair,
+                exception=exception,
+            ))
+        return results
+
     async def _get_last_traded_price(self, trading_pair: str) -> float:
         params = {"instId": await self.exchange_symbol_associated_to_pair(trading_pair=trading_pair)}
 
@@ -1,8 +1,9 @@
 from typing import List
 
 from hummingbot.client.config.config_helpers import ClientConfigAdapter, get_connector_class
-from hummingbot.client.settings import AllConnectorSettings
+from hummingbot.client.settings import AllConnectorSettings, ConnectorType
 from hummingbot.connector.exchange.paper_trade.paper_trade_exchange import PaperTradeExchange
+from hummingbot.connector.exchange.paper_trade.paper_trade_perpetual_derivative import PaperTradePerpetualDerivative
 from hummingbot.core.data_type.order_book_tracker import OrderBookTracker
 
 
@@ -18,6 +19,12 @@ def get_order_book_tracker(connector_name: str, trading_pairs: List[str]) -> Ord
 
 def create_paper_trade_market(exchange_name: str, client_config_map: ClientConfigAdapter, trading_pairs: List[str]):
     tracker = get_order_book_tracker(connector_name=exchange_name, trading_pairs=trading_pairs)
+    if AllConnectorSettings.get_connector_settings()[exchange_name].type == ConnectorType.Derivative:
+        return PaperTradePerpetualDerivative(client_config_map,
+                                             tracker,
+                                             get_connector_class(exchange_name),
+                                             exchange_name=exchange_name,
+                                             trading_pairs=trading_pairs)
     return PaperTradeExchange(client_config_map,
                               tracker,
                               get_connector_class(exchange_name),
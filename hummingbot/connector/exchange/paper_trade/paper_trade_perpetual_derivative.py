@@ -0,0 +1,686 @@
+import asyncio
+import itertools
+from bisect import bisect_left, insort
+from collections import defaultdict, deque
+from decimal import Decimal
+from typing import TYPE_CHECKING, Callable, Deque, Dict, List, Optional, Set, Tuple
+
+from hummingbot.connector.client_order_tracker import ClientOrderTracker
+from hummingbot.connector.connector_metrics_collector import DummyMetricsCollector
+from hummingbot.connector.constants import s_decimal_0, s_decimal_NaN
+from hummingbot.connector.derivative.perpetual_budget_checker import PerpetualBudgetChecker
+from hummingbot.connector.derivative.position import Position
+from hummingbot.connector.exchange_base import ExchangeBase
+from hummingbot.connector.perpetual_trading import PerpetualTrading
+from hummingbot.connector.utils import get_new_client_order_id, split_hb_trading_pair
+from hummingbot.core.data_type.cancellation_result import CancellationResult
+from hummingbot.core.data_type.common import OrderType, PositionAction, PositionMode, PositionSide, TradeType
+from hummingbot.core.data_type.composite_order_book import CompositeOrderBook
+from hummingbot.core.data_type.funding_info import FundingInfo
+from hummingbot.core.data_type.in_flight_order import (
+    InFlightOrder,
+    OrderState,
+    OrderUpdate,
+    PerpetualDerivativeInFlightOrder,
+    TradeUpdate,
+)
+from hummingbot.core.data_type.limit_order import LimitOrder
+from hummingbot.core.data_type.order_book import OrderBook
+from hummingbot.core.data_type.order_book_tracker import OrderBookTracker
+from hummingbot.core.data_type.perpetual_api_order_book_data_source import PerpetualAPIOrderBookDataSource
+from hummingbot.core.data_type.trade_fee import TradeFeeBase
+from hummingbot.core.event.event_forwarder import EventForwarder
+from hummingbot.core.event.events import (
+    AccountEvent,
+    FundingPaymentCompletedEvent,
+    MarketEvent,
+    OrderBookEvent,
+    OrderBookTradeEvent,
+    OrderFilledEvent,
+    PositionModeChangeEvent,
+)
+from hummingbot.core.network_iterator import NetworkStatus
+from hummingbot.core.utils.async_utils import safe_ensure_future
+from hummingbot.core.utils.estimate_fee import build_perpetual_trade_fee
+
+if TYPE_CHECKING:
+    from hummingbot.client.config.config_helpers import ClientConfigAdapter
+
+
+class RestingOrders:
+    """
+    The resting limit orders of one side of a paper trading pair, sorted from the most aggressive price to the least
+    aggressive one (and by arrival for the same price). Matching only walks the orders that cross, so the cost of a
+    tick or a trade does not depend on the number of orders resting away from the top of the book.
+    """
+
+    def __init__(self, is_buy: bool):
+        self._is_buy = is_buy
+        self._entries: List[Tuple[Decimal, int, str]] = []
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def _sort_price(self, price: Decimal) -> Decimal:
+        return -price if self._is_buy else price
+
+    def add(self, price: Decimal, sequence: int, order_id: str):
+        insort(self._entries, (self._sort_price(price), sequence, order_id))
+
+    def remove(self, price: Decimal, sequence: int, order_id: str) -> bool:
+        entry = (self._sort_price(price), sequence, order_id)
+        index = bisect_left(self._entries, entry)
+        if index < len(self._entries) and self._entries[index] == entry:
+            del self._entries[index]
+            return True
+        return False
+
+    def crossed_by(self, price: Decimal, inclusive: bool) -> List[str]:
+        """
+        Returns the ids of the orders a counterparty at the given price would fill, most aggressive first.
+        :param price: the counterparty price (top of the opposite side of the book or a public trade price)
+        :param inclusive: whether orders resting exactly at the price are filled
+        """
+        limit = self._sort_price(price)
+        order_ids = []
+        for sort_price, _, order_id in self._entries:
+            if sort_price < limit or (inclusive and sort_price == limit):
+                order_ids.append(order_id)
+            else:
+                break
+        return order_ids
+
+
+class PaperTradePerpetualDerivative(ExchangeBase):
+    """
+    Simulates a perpetual derivative exchange on top of the order book and funding information streamed by the
+    target connector. Orders are matched against the top of the book on every tick and against the public trades,
+    fills update one-way or hedge positions with the configured leverage, the margin of positions and open orders is
+    locked from the collateral balance, and funding payments are applied when the funding time is reached.
+    """
+
+    VALID_POSITION_ACTIONS = [PositionAction.OPEN, PositionAction.CLOSE]
+
+    def __init__(
+        self,
+        client_config_map: "ClientConfigAdapter",
+        order_book_tracker: OrderBookTracker,
+        target_market: Callable,
+        exchange_name: str,
+        trading_pairs: List[str],
+    ):
+        self._exchange_name = exchange_name
+        order_book_tracker.data_source.order_book_create_function = lambda: CompositeOrderBook()
+        super().__init__(client_config_map)
+        self._set_order_book_tracker(order_book_tracker)
+        self._target_market = target_market
+        self._trading_pairs = trading_pairs
+        self._perpetual_trading = PerpetualTrading(trading_pairs)
+        self._order_tracker = ClientOrderTracker(connector=self)
+        self._budget_checker = PerpetualBudgetChecker(self)
+        self._paper_trade_market_initialized = False
+
+        self._resting_orders: Dict[str, Dict[bool, RestingOrders]] = {}
+        self._queued_market_orders: Deque[str] = deque()
+        self._order_sequences: Dict[str, int] = {}
+        self._order_margins: Dict[str, Decimal] = {}
+        self._locked_order_margin: Dict[str, Decimal] = defaultdict(lambda: s_decimal_0)
+        self._taker_order_ids: Set[str] = set()
+        self._sequence = itertools.count()
+        self._last_funding_payment_timestamp: Dict[str, float] = {}
+        self._funding_info_listener_task: Optional[asyncio.Task] = None
+
+        self._order_book_trade_forwarder = EventForwarder(self._process_order_book_trade)
+        self._market_order_fill_forwarder = EventForwarder(self._record_market_order_fill)
+        self.add_listener(MarketEvent.OrderFilled, self._market_order_fill_forwarder)
+
+        # Trade volume metrics should never be gather for paper trade connector
+        self._trade_volume_metric_collector = DummyMetricsCollector()
+
+    @property
+    def name(self) -> str:
+        return self._exchange_name
+
+    @property
+    def display_name(self) -> str:
+        return f"{self._exchange_name}_PaperTrade"
+
+    @property
+    def trading_pairs(self) -> List[str]:
+        return self._trading_pairs
+
+    @property
+    def order_books(self) -> Dict[str, CompositeOrderBook]:
+        return self.order_book_tracker.order_books
+
+    @property
+    def budget_checker(self) -> PerpetualBudgetChecker:
+        return self._budget_checker
+
+    @property
+    def in_flight_orders(self) -> Dict[str, InFlightOrder]:
+        return self._order_tracker.active_orders
+
+    @property
+    def limit_orders(self) -> List[LimitOrder]:
+        return [
+            order.to_limit_order()
+            for order in self._order_tracker.active_orders.values()
+            if order.order_type.is_limit_type()
+        ]
+
+    @property
+    def status_dict(self) -> Dict[str, bool]:
+        return {
+            "order_books_initialized": self.order_book_tracker.ready,
+            "funding_info": self._perpetual_trading.is_funding_info_initialized(),
+        }
+
+    @property
+    def ready(self) -> bool:
+        if all(self.status_dict.values()):
+            if not self._paper_trade_market_initialized:
+                self.init_paper_trade_market()
+                self._paper_trade_market_initialized = True
+            return True
+        return False
+
+    @property
+    def account_positions(self) -> Dict[str, Position]:
+        return self._perpetual_trading.account_positions
+
+    @property
+    def position_mode(self) -> PositionMode:
+        return self._perpetual_trading.position_mode
+
+    def init_paper_trade_market(self):
+        for order_book in self.order_books.values():
+            order_book.add_listener(OrderBookEvent.TradeEvent, self._order_book_trade_forwarder)
+
+    def split_trading_pair(self, trading_pair: str) -> Tuple[str, str]:
+        return split_hb_trading_pair(trading_pair)
+
+    def supported_order_types(self) -> List[OrderType]:
+        return [OrderType.LIMIT, OrderType.LIMIT_MAKER, OrderType.MARKET]
+
+    def supported_position_modes(self) -> List[PositionMode]:
+        return [PositionMode.ONEWAY, PositionMode.HEDGE]
+
+    def get_buy_collateral_token(self, trading_pair: str) -> str:
+        _, quote = split_hb_trading_pair(trading_pair)
+        return quote
+
+    def get_sell_collateral_token(self, trading_pair: str) -> str:
+        _, quote = split_hb_trading_pair(trading_pair)
+        return quote
+
+    async def start_network(self):
+        await self.stop_network()
+        self.order_book_tracker.start()
+        self._perpetual_trading.start()
+        self._funding_info_listener_task = safe_ensure_future(self._listen_for_funding_info())
+
+    async def stop_network(self):
+        self.order_book_tracker.stop()
+        self._perpetual_trading.stop()
+        if self._funding_info_listener_task is not None:
+            self._funding_info_listener_task.cancel()
+            self._funding_info_listener_task = None
+
+    async def check_network(self) -> NetworkStatus:
+        return NetworkStatus.CONNECTED
+
+    def tick(self, timestamp: float):
+        self._process_market_orders()
+        self._process_crossed_limit_orders()
+        self._process_funding_payments(timestamp)
+        self._update_unrealized_pnl()
+
+    def set_balance(self, currency: str, balance: Decimal):
+        self._account_balances[currency.upper()] = Decimal(balance)
+
+    def get_available_balance(self, currency: str) -> Decimal:
+        """
+        The collateral balance minus the margin of the open positions and of the open orders opening positions.
+        """
+        position_margin = sum(
+            (abs(position.amount) * position.entry_price / Decimal(position.leverage)
+             for position in self.account_positions.values()
+             if self.get_buy_collateral_token(position.trading_pair) == currency),
+            s_decimal_0)
+        return self.get_balance(currency) - position_margin - self._locked_order_margin[currency]
+
+    def get_order_book(self, trading_pair: str) -> OrderBook:
+        if trading_pair not in self.order_books:
+            raise ValueError(f"No order book exists for '{trading_pair}'.")
+        return self.order_books[trading_pair]
+
+    def get_order_price_quantum(self, trading_pair: str, price: Decimal) -> Decimal:
+        return Decimal("1e-10")
+
+    def get_order_size_quantum(self, trading_pair: str, order_size: Decimal) -> Decimal:
+        return Decimal("1e-7")
+
+    def get_position(self, trading_pair: str, side: Optional[PositionSide] = None) -> Optional[Position]:
+        return self._perpetual_trading.get_position(trading_pair, side)
+
+    def get_leverage(self, trading_pair: str) -> int:
+        return self._perpetual_trading.get_leverage(trading_pair)
+
+    def set_leverage(self, trading_pair: str, leverage: int = 1):
+        self._perpetual_trading.set_leverage(trading_pair, leverage)
+        self.logger().info(f"Leverage for {trading_pair} successfully set to {leverage}.")
+
+    def set_position_mode(self, mode: PositionMode):
+        """
+        Changes the position mode. As on most exchanges, the mode can only be changed while there are no open
+        positions or orders.
+        """
+        if mode not in self.supported_position_modes():
+            self.logger().error(f"Position mode {mode} is not supported. Mode not set.")
+            return
+        if mode != self.position_mode and (len(self.account_positions) > 0
+                                           or len(self._order_tracker.active_orders) > 0):
+            for trading_pair in self._trading_pairs:
+                self.trigger_event(
+                    AccountEvent.PositionModeChangeFailed,
+                    PositionModeChangeEvent(
+                        self.current_timestamp,
+                        trading_pair,
+                        mode,
+                        "The position mode can't be changed with open positions or orders.",
+                    ),
+                )
+            return
+        self._perpetual_trading.set_position_mode(mode)
+        for trading_pair in self._trading_pairs:
+            self.trigger_event(
+                AccountEvent.PositionModeChangeSucceeded,
+                PositionModeChangeEvent(self.current_timestamp, trading_pair, mode),
+            )
+
+    def get_funding_info(self, trading_pair: str) -> FundingInfo:
+        return self._perpetual_trading.get_funding_info(trading_pair)
+
+    def get_fee(
+        self,
+        base_currency: str,
+        quote_currency: str,
+        order_type: OrderType,
+        order_side: TradeType,
+        position_action: PositionAction,
+        amount: Decimal,
+        price: Decimal = s_decimal_NaN,
+        is_maker: Optional[bool] = None,
+    ) -> TradeFeeBase:
+        return build_perpetual_trade_fee(
+            self.name,
+            is_maker=is_maker if is_maker is not None else order_type.is_limit_type(),
+            position_action=position_action,
+            base_currency=base_currency,
+            quote_currency=quote_currency,
+            order_type=order_type,
+            order_side=order_side,
+            amount=amount,
+            price=price,
+        )
+
+    def buy(self,
+            trading_pair: str,
+            amount: Decimal,
+            order_type=OrderType.LIMIT,
+            price: Decimal = s_decimal_NaN,
+            **kwargs) -> str:
+        return self._create_order(
+            TradeType.BUY, trading_pair, amount, order_type, price, kwargs.get("position_action", PositionAction.NIL)
+        )
+
+    def sell(self,
+             trading_pair: str,
+             amount: Decimal,
+             order_type=OrderType.LIMIT,
+             price: Decimal = s_decimal_NaN,
+             **kwargs) -> str:
+        return self._create_order(
+            TradeType.SELL, trading_pair, amount, order_type, price, kwargs.get("position_action", PositionAction.NIL)
+        )
+
+    def cancel(self, trading_pair: str, client_order_id: str) -> str:
+        order = self._order_tracker.fetch_tracked_order(client_order_id)
+        if order is not None and order.is_open:
+            self._remove_order(order)
+            self._order_tracker.process_order_update(OrderUpdate(
+                trading_pair=trading_pair,
+                update_timestamp=self.current_timestamp,
+                new_state=OrderState.CANCELED,
+                client_order_id=client_order_id,
+            ))
+        return client_order_id
+
+    async def cancel_all(self, timeout_seconds: float) -> List[CancellationResult]:
+        cancellation_results = []
+        for order in list(self._order_tracker.active_orders.values()):
+            self.cancel(order.trading_pair, order.client_order_id)
+            cancellation_results.append(CancellationResult(order.client_order_id, True))
+        return cancellation_results
+
+    def _create_order(self,
+                      trade_type: TradeType,
+                      trading_pair: str,
+                      amount: Decimal,
+                      order_type: OrderType,
+                      price: Decimal,
+                      position_action: PositionAction) -> str:
+        if trading_pair not in self._trading_pairs:
+            raise ValueError(f"Trading pair '{trading_pair}' does not existing in current data set.")
+
+        is_buy = trade_type is TradeType.BUY
+        order_id = get_new_client_order_id(is_buy=is_buy, trading_pair=trading_pair)
+        sequence = next(self._sequence)
+        order = PerpetualDerivativeInFlightOrder(
+            client_order_id=order_id,
+            exchange_order_id=str(sequence),
+            trading_pair=trading_pair,
+            order_type=order_type,
+            trade_type=trade_type,
+            amount=self.quantize_order_amount(trading_pair, amount),
+            price=self.quantize_order_price(trading_pair, price) if order_type.is_limit_type() else price,
+            creation_timestamp=self.current_timestamp,
+            leverage=self.get_leverage(trading_pair),
+            position=position_action,
+        )
+        self._order_tracker.start_tracking_order(order)
+
+        opposite_price = self.get_price(trading_pair, is_buy)
+        is_crossing = (order_type.is_limit_type()
+                       and not opposite_price.is_nan()
+                       and (order.price >= opposite_price if is_buy else order.price <= opposite_price))
+        reference_price = order.price if order_type.is_limit_type() else opposite_price
+        margin = (order.amount * reference_price / Decimal(order.leverage)
+                  if position_action is PositionAction.OPEN and not reference_price.is_nan()
+                  else s_decimal_0)
+
+        error = self._validate_order(order, margin, reference_price, is_crossing)
+        if error is not None:
+            self.logger().warning(f"{self.display_name} rejected the order {order_id}: {error}")
+            self._order_tracker.process_order_update(OrderUpdate(
+                trading_pair=trading_pair,
+                update_timestamp=self.current_timestamp,
+                new_state=OrderState.FAILED,
+                client_order_id=order_id,
+            ))
+            return order_id
+
+        self._order_sequences[order_id] = sequence
+        self._order_margins[order_id] = margin
+        self._locked_order_margin[self.get_buy_collateral_token(trading_pair)] += margin
+        if order_type is OrderType.MARKET:
+            self._queued_market_orders.append(order_id)
+        else:
+            if is_crossing:
+                self._taker_order_ids.add(order_id)
+            self._resting_orders_for(trading_pair, is_buy).add(order.price, sequence, order_id)
+        self._order_tracker.process_order_update(OrderUpdate(
+            trading_pair=trading_pair,
+            update_timestamp=self.current_timestamp,
+            new_state=OrderState.OPEN,
+            client_order_id=order_id,
+            exchange_order_id=order.exchange_order_id,
+        ))
+        return order_id
+
+    def _validate_order(self,
+                        order: InFlightOrder,
+                        margin: Decimal,
+                        reference_price: Decimal,
+                        is_crossing: bool) -> Optional[str]:
+        if order.position not in self.VALID_POSITION_ACTIONS:
+            return f"invalid position action {order.position}. Must be one of {self.VALID_POSITION_ACTIONS}."
+        if order.amount <= s_decimal_0:
+            return "the order amount must be greater than zero."
+        if reference_price.is_nan():
+            return f"there is no {order.trading_pair} price to execute the order."
+        if order.order_type is OrderType.LIMIT_MAKER and is_crossing:
+            return "the LIMIT_MAKER order would immediately match and take."
+        if order.position is PositionAction.CLOSE:
+            position = self.account_positions.get(self._position_key(order.trading_pair, order.trade_type,
+                                                                     order.position))
+            closable_amount = s_decimal_0
+            if position is not None and (position.amount > s_decimal_0) != (order.trade_type is TradeType.BUY):
+                closable_amount = abs(position.amount)
+            if order.amount > closable_amount:
+                return f"the order would close {order.amount} but the position is {closable_amount}."
+        else:
+            collateral_token = self.get_buy_collateral_token(order.trading_pair)
+            base, quote = split_hb_trading_pair(order.trading_pair)
+            fee = self.get_fee(base, quote, order.order_type, order.trade_type, order.position, order.amount,
+                               reference_price, is_maker=not is_crossing and order.order_type.is_limit_type())
+            fee_amount = fee.fee_amount_in_token(order.trading_pair, reference_price, order.amount,
+                                                 token=collateral_token, exchange=self)
+            available_balance = self.get_available_balance(collateral_token)
+            if margin + fee_amount > available_balance:
+                return (f"insufficient {collateral_token} margin. {margin + fee_amount:.8g} {collateral_token} needed "
+                        f"vs. {available_balance:.8g} {collateral_token} available.")
+        return None
+
+    def _resting_orders_for(self, trading_pair: str, is_buy: bool) -> RestingOrders:
+        if trading_pair not in self._resting_orders:
+            self._resting_orders[trading_pair] = {True: RestingOrders(is_buy=True), False: RestingOrders(is_buy=False)}
+        return self._resting_orders[trading_pair][is_buy]
+
+    def _remove_order(self, order: InFlightOrder):
+        order_id = order.client_order_id
+        sequence = self._order_sequences.pop(order_id, None)
+        if sequence is not None and order.order_type.is_limit_type():
+            self._resting_orders_for(order.trading_pair, order.trade_type is TradeType.BUY).remove(
+                order.price, sequence, order_id)
+        self._taker_order_ids.discard(order_id)
+        margin = self._order_margins.pop(order_id, s_decimal_0)
+        self._locked_order_margin[self.get_buy_collateral_token(order.trading_pair)] -= margin
+
+    def _process_market_orders(self):
+        while len(self._queued_market_orders) > 0:
+            order = self._order_tracker.fetch_tracked_order(self._queued_market_orders.popleft())
+            if order is None or not order.is_open:
+                continue
+            entries = (self.get_order_book(order.trading_pair).ask_entries()
+                       if order.trade_type is TradeType.BUY
+                       else self.get_order_book(order.trading_pair).bid_entries())
+            remaining_amount = order.amount - order.executed_amount_base
+            for entry in entries:
+                if remaining_amount <= s_decimal_0:
+                    break
+                fill_amount = min(remaining_amount, Decimal(str(entry.amount)))
+                self._fill_order(order, Decimal(str(entry.price)), fill_amount, is_taker=True)
+                remaining_amount -= fill_amount
+            if remaining_amount > s_decimal_0:
+                # There is not enough liquidity in the book, the rest of the market order is cancelled
+                self.cancel(order.trading_pair, order.client_order_id)
+
+    def _process_crossed_limit_orders(self):
+        """
+        Fills the limit orders crossed by the opposite side of the order book. This implies someone was ready to fill
+        the order, if it was on the market.
+        """
+        for trading_pair, sides in self._resting_orders.items():
+            for is_buy, resting_orders in sides.items():
+                if len(resting_orders) == 0:
+                    continue
+                opposite_price = self.get_price(trading_pair, is_buy)
+                if opposite_price.is_nan():
+                    continue
+                for order_id in resting_orders.crossed_by(opposite_price, inclusive=True):
+                    order = self._order_tracker.fetch_tracked_order(order_id)
+                    self._fill_order(order,
+                                     order.price,
+                                     order.amount - order.executed_amount_base,
+                                     is_taker=order_id in self._taker_order_ids)
+
+    def _process_order_book_trade(self, trade_event: OrderBookTradeEvent):
+        """
+        Fills the limit orders crossed by a public trade, up to the traded amount and by price-time priority.
+        """
+        if trade_event.trading_pair not in self._resting_orders:
+            return
+        is_maker_buy = trade_event.type is TradeType.SELL
+        resting_orders = self._resting_orders_for(trade_event.trading_pair, is_maker_buy)
+        remaining_amount = Decimal(str(trade_event.amount))
+        for order_id in resting_orders.crossed_by(Decimal(str(trade_event.price)), inclusive=False):
+            if remaining_amount <= s_decimal_0:
+                break
+            order = self._order_tracker.fetch_tracked_order(order_id)
+            fill_amount = min(remaining_amount, order.amount - order.executed_amount_base)
+            self._fill_order(order, order.price, fill_amount, is_taker=order_id in self._taker_order_ids)
+            remaining_amount -= fill_amount
+
+    def _fill_order(self, order: InFlightOrder, price: Decimal, amount: Decimal, is_taker: bool):
+        trading_pair = order.trading_pair
+        base, quote = split_hb_trading_pair(trading_pair)
+        collateral_token = self.get_buy_collateral_token(trading_pair)
+        fee = self.get_fee(base, quote, order.order_type, order.trade_type, order.position, amount, price,
+                           is_maker=not is_taker)
+        fee_amount = fee.fee_amount_in_token(trading_pair, price, amount, token=collateral_token, exchange=self)
+
+        margin = self._order_margins.get(order.client_order_id, s_decimal_0)
+        released_margin = margin * amount / (order.amount - order.executed_amount_base)
+        self._order_margins[order.client_order_id] = margin - released_margin
+        self._locked_order_margin[collateral_token] -= released_margin
+
+        realized_pnl = self._update_position(order, price, amount)
+        self._account_balances[collateral_token] = self.get_balance(collateral_token) + realized_pnl - fee_amount
+
+        self._order_tracker.process_trade_update(TradeUpdate(
+            trade_id=str(next(self._sequence)),
+            client_order_id=order.client_order_id,
+            exchange_order_id=order.exchange_order_id,
+            trading_pair=trading_pair,
+            fill_timestamp=self.current_timestamp,
+            fill_price=price,
+            fill_base_amount=amount,
+            fill_quote_amount=amount * price,
+            fee=fee,
+            is_taker=is_taker,
+        ))
+        if order.executed_amount_base >= order.amount:
+            self._remove_order(order)
+            self._order_tracker.process_order_update(OrderUpdate(
+                trading_pair=trading_pair,
+                update_timestamp=self.current_timestamp,
+                new_state=OrderState.FILLED,
+                client_order_id=order.client_order_id,
+            ))
+
+    def _position_key(self, trading_pair: str, trade_type: TradeType, position_action: PositionAction) -> str:
+        is_long = (trade_type is TradeType.BUY) == (position_action is PositionAction.OPEN)
+        return self._perpetual_trading.position_key(
+            trading_pair, PositionSide.LONG if is_long else PositionSide.SHORT
+        )
+
+    def _update_position(self, order: InFlightOrder, price: Decimal, amount: Decimal) -> Decimal:
+        """
+        Applies a fill to the position it opens or closes.
+        :return: the PnL realized by the fill
+        """
+        position_key = self._position_key(order.trading_pair, order.trade_type, order.position)
+        position = self.account_positions.get(position_key)
+        current_amount = position.amount if position is not None else s_decimal_0
+        entry_price = position.entry_price if position is not None else s_decimal_0
+        amount_change = amount if order.trade_type is TradeType.BUY else -amount
+        new_amount = current_amount + amount_change
+        realized_pnl = s_decimal_0
+
+        if current_amount == s_decimal_0 or (current_amount > s_decimal_0) == (amount_change > s_decimal_0):
+            entry_price = (abs(current_amount) * entry_price + amount * price) / abs(new_amount)
+        else:
+            closed_amount = min(abs(current_amount), amount)
+            direction = Decimal(1) if current_amount > s_decimal_0 else Decimal(-1)
+            realized_pnl = closed_amount * (price - entry_price) * direction
+            if new_amount != s_decimal_0 and (new_amount > s_decimal_0) != (current_amount > s_decimal_0):
+                if self.position_mode is PositionMode.HEDGE:
+                    # A hedge mode position is only closed, the opposite side has its own position
+                    new_amount = s_decimal_0
+                else:
+                    entry_price = price
+
+        if new_amount == s_decimal_0:
+            self._perpetual_trading.remove_position(position_key)
+        else:
+            unrealized_pnl = (self._mark_price(order.trading_pair) - entry_price) * new_amount
+            position_side = PositionSide.LONG if new_amount > s_decimal_0 else PositionSide.SHORT
+            if position is None:
+                self._perpetual_trading.set_position(position_key, Position(
+                    trading_pair=order.trading_pair,
+                    position_side=position_side,
+                    unrealized_pnl=unrealized_pnl,
+                    entry_price=entry_price,
+                    amount=new_amount,
+                    leverage=Decimal(order.leverage),
+                ))
+            else:
+                position.update_position(position_side=position_side,
+                                         unrealized_pnl=unrealized_pnl,
+                                         entry_price=entry_price,
+                                         amount=new_amount,
+                                         leverage=Decimal(order.leverage))
+        return realized_pnl
+
+    def _mark_price(self, trading_pair: str) -> Decimal:
+        try:
+            return self.get_funding_info(trading_pair).mark_price
+        except KeyError:
+            return self.get_mid_price(trading_pair)
+
+    def _update_unrealized_pnl(self):
+        for position in self.account_positions.values():
+            mark_price = self._mark_price(position.trading_pair)
+            if not mark_price.is_nan():
+                position.update_position(unrealized_pnl=(mark_price - position.entry_price) * position.amount)
+
+    def _process_funding_payments(self, timestamp: float):
+        """
+        Applies the funding payments of the positions once the funding time of their trading pair is reached. Long
+        positions pay shorts when the funding rate is positive.
+        """
+        for trading_pair in self._trading_pairs:
+            try:
+                funding_info = self.get_funding_info(trading_pair)
+            except KeyError:
+                continue
+            funding_timestamp = funding_info.next_funding_utc_timestamp
+            if (funding_timestamp > timestamp
+                    or funding_timestamp <= self._last_funding_payment_timestamp.get(trading_pair, 0)):
+                continue
+            self._last_funding_payment_timestamp[trading_pair] = funding_timestamp
+            positions = [position for position in self.account_positions.values()
+                         if position.trading_pair == trading_pair]
+            if len(positions) == 0:
+                continue
+            payment_amount = sum(
+                (-position.amount * funding_info.mark_price * funding_info.rate for position in positions),
+                s_decimal_0)
+            collateral_token = self.get_buy_collateral_token(trading_pair)
+            self._account_balances[collateral_token] = self.get_balance(collateral_token) + payment_amount
+            action = "paid" if payment_amount < s_decimal_0 else "received"
+            self.logger().info(f"Funding payment of {abs(payment_amount)} {action} on {trading_pair} market.")
+            self.trigger_event(
+                MarketEvent.FundingPaymentCompleted,
+                FundingPaymentCompletedEvent(
+                    timestamp=funding_timestamp,
+                    market=self.name,
+                    funding_rate=funding_info.rate,
+                    trading_pair=trading_pair,
+                    amount=payment_amount,
+                ),
+            )
+
+    def _record_market_order_fill(self, fill_event: OrderFilledEvent):
+        if fill_event.order_type is OrderType.MARKET and fill_event.trading_pair in self.order_books:
+            self.order_books[fill_event.trading_pair].record_filled_order(fill_event)
+
+    async def _listen_for_funding_info(self):
+        data_source = self.order_book_tracker.data_source
+        if not isinstance(data_source, PerpetualAPIOrderBookDataSource):
+            return
+        for trading_pair in self._trading_pairs:
+            self._perpetual_trading.initialize_funding_info(await data_source.get_funding_info(trading_pair))
+        await data_source.listen_for_funding_info(output=self._perpetual_trading.funding_info_stream)
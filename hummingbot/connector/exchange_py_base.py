@@ -2,6 +2,7 @@ import asyncio
 import copy
 import logging
 import math
+import time
 from abc import ABC, abstractmethod
 from decimal import Decimal
 from typing import TYPE_CHECKING, Any, AsyncIterable, Callable, Dict, List, Optional, Tuple
@@ -11,6 +12,7 @@ from async_timeout import timeout
 from hummingbot.connector.client_order_tracker import ClientOrderTracker
 from hummingbot.connector.constants import MINUTE, TWELVE_HOURS, s_decimal_0, s_decimal_NaN
 from hummingbot.connector.exchange_base import ExchangeBase
+from hummingbot.connector.gateway.common_types import CancelOrderResult, PlaceOrderResult
 from hummingbot.connector.time_synchronizer import TimeSynchronizer
 from hummingbot.connector.trading_rule import TradingRule
 from hummingbot.connector.utils import get_new_client_order_id
@@ -26,6 +28,7 @@ from hummingbot.core.data_type.order_book_tracker_data_source import OrderBookTr
 from hummingbot.core.data_type.trade_fee import AddedToCostTradeFee
 from hummingbot.core.data_type.user_stream_tracker import UserStreamTracker
 from hummingbot.core.data_type.user_stream_tracker_data_source import UserStreamTrackerDataSource
+from hummingbot.core.metrics.metrics_registry import MetricsRegistry
 from hummingbot.core.network_iterator import NetworkStatus
 from hummingbot.core.utils.async_utils import safe_ensure_future, safe_gather
 from hummingbot.core.web_assistant.auth import AuthBase
@@ -36,6 +39,19 @@ from hummingbot.logger import HummingbotLogger
 if TYPE_CHECKING:
     from hummingbot.client.config.config_helpers import ClientConfigAdapter
 
+ORDER_CREATE_LATENCY = MetricsRegistry.get_instance().histogram(
+    "hummingbot_order_create_latency_seconds",
+    "Round-trip time of the order creation requests.",
+    ["connector"])
+ORDER_CANCEL_LATENCY = MetricsRegistry.get_instance().histogram(
+    "hummingbot_order_cancel_latency_seconds",
+    "Round-trip time of the order cancelation requests.",
+    ["connector"])
+USER_STREAM_EVENT_LAG = MetricsRegistry.get_instance().histogram(
+    "hummingbot_user_stream_event_lag_seconds",
+    "Time between the reception of the last user stream message and the processing of a user stream event.",
+    ["connector"])
+
 
 class ExchangePyBase(ExchangeBase, ABC):
     _logger = None
@@ -83,6 +99,10 @@ class ExchangePyBase(ExchangeBase, ABC):
 
         self._order_tracker: ClientOrderTracker = self._create_order_tracker()
 
+        # Orders waiting to be sent in the next batch request, only used when the exchange has batch endpoints
+        self._orders_queued_for_batch_create: List[Tuple[InFlightOrder, Dict[str, Any]]] = []
+        self._orders_queued_for_batch_cancel: List[Tuple[InFlightOrder, asyncio.Future]] = []
+
     @classmethod
     def logger(cls) -> HummingbotLogger:
         if cls._logger is None:
@@ -187,6 +207,22 @@ class ExchangePyBase(ExchangeBase, ABC):
     def name_cap(self) -> str:
         return self.name.capitalize()
 
+    @property
+    def batch_order_create_max_size(self) -> int:
+        """
+        Maximum number of orders the exchange accepts in a single order creation request. Connectors with a batch
+        creation endpoint override it and implement `_place_batch_orders`.
+        """
+        return 1
+
+    @property
+    def batch_order_cancel_max_size(self) -> int:
+        """
+        Maximum number of orders the exchange accepts in a single order cancelation request. Connectors with a batch
+        cancelation endpoint override it and implement `_place_batch_cancels`.
+        """
+        return 1
+
     @property
     def tracking_states(self) -> Dict[str, any]:
         """
@@ -448,6 +484,13 @@ class ExchangePyBase(ExchangeBase, ABC):
                                   f"created. Increase the amount or the price to be higher than the minimum notional.")
             self._update_order_after_failure(order_id=order_id, trading_pair=trading_pair)
             return
+
+        if self.batch_order_create_max_size > 1:
+            await self._queue_order_creation(order=order, **kwargs)
+        else:
+            await self._place_order_and_handle_failure(order=order, **kwargs)
+
+    async def _place_order_and_handle_failure(self, order: InFlightOrder, **kwargs):
         try:
             await self._place_order_and_process_update(order=order, **kwargs,)
 
@@ -455,17 +498,91 @@ class ExchangePyBase(ExchangeBase, ABC):
             raise
         except Exception as ex:
             self._on_order_failure(
-                order_id=order_id,
-                trading_pair=trading_pair,
-                amount=quantized_amount,
-                trade_type=trade_type,
-                order_type=order_type,
-                price=price,
+                order_id=order.client_order_id,
+                trading_pair=order.trading_pair,
+                amount=order.amount,
+                trade_type=order.trade_type,
+                order_type=order.order_type,
+                price=order.price,
                 exception=ex,
                 **kwargs,
             )
 
+    async def _queue_order_creation(self, order: InFlightOrder, **kwargs):
+        """
+        Adds the order to the next batch creation request. The first order queued sends the request once the orders
+        created in the same cycle have been queued too.
+        """
+        is_first_queued_order = len(self._orders_queued_for_batch_create) == 0
+        self._orders_queued_for_batch_create.append((order, kwargs))
+        if is_first_queued_order:
+            await asyncio.sleep(0)
+            queued_orders = self._orders_queued_for_batch_create
+            self._orders_queued_for_batch_create = []
+            max_size = self.batch_order_create_max_size
+            await safe_gather(*[
+                self._place_queued_orders(queued_orders=queued_orders[index:index + max_size])
+                for index in range(0, len(queued_orders), max_size)
+            ])
+
+    async def _place_queued_orders(self, queued_orders: List[Tuple[InFlightOrder, Dict[str, Any]]]):
+        if len(queued_orders) == 1:
+            order, kwargs = queued_orders[0]
+            await self._place_order_and_handle_failure(order=order, **kwargs)
+            return
+
+        orders = [order for order, _ in queued_orders]
+        try:
+            results = await self._place_batch_orders(orders=orders)
+        except asyncio.CancelledError:
+            raise
+        except Exception as ex:
+            results = [
+                PlaceOrderResult(
+                    update_timestamp=self.current_timestamp,
+                    client_order_id=order.client_order_id,
+                    exchange_order_id=None,
+                    trading_pair=order.trading_pair,
+                    exception=ex,
+                )
+                for order in orders
+            ]
+
+        results_by_order_id = {result.client_order_id: result for result in results}
+        for order, kwargs in queued_orders:
+            result = results_by_order_id.get(order.client_order_id)
+            if result is None:
+                result = PlaceOrderResult(
+                    update_timestamp=self.current_timestamp,
+                    client_order_id=order.client_order_id,
+                    exchange_order_id=None,
+                    trading_pair=order.trading_pair,
+                    exception=IOError(f"The batch order creation response did not include {order.client_order_id}"),
+                )
+            if result.exception is not None:
+                self._on_order_failure(
+                    order_id=order.client_order_id,
+                    trading_pair=order.trading_pair,
+                    amount=order.amount,
+                    trade_type=order.trade_type,
+                    order_type=order.order_type,
+                    price=order.price,
+                    exception=result.exception,
+                    **kwargs,
+                )
+            else:
+                order_update: OrderUpdate = OrderUpdate(
+                    client_order_id=order.client_order_id,
+                    exchange_order_id=str(result.exchange_order_id),
+                    trading_pair=order.trading_pair,
+                    update_timestamp=result.update_timestamp,
+                    new_state=OrderState.OPEN,
+                    misc_updates=result.misc_updates,
+                )
+                self._order_tracker.process_order_update(order_update)
+
     async def _place_order_and_process_update(self, order: InFlightOrder, **kwargs) -> str:
+        start_time = time.perf_counter()
         exchange_order_id, update_timestamp = await self._place_order(
             order_id=order.client_order_id,
             trading_pair=order.trading_pair,
@@ -475,6 +592,7 @@ class ExchangePyBase(ExchangeBase, ABC):
             price=order.price,
             **kwargs,
         )
+        ORDER_CREATE_LATENCY.labels(self.name).observe(time.perf_counter() - start_time)
 
         order_update: OrderUpdate = OrderUpdate(
             client_order_id=order.client_order_id,
@@ -501,7 +619,7 @@ class ExchangePyBase(ExchangeBase, ABC):
         self.logger().network(
             f"Error submitting {trade_type.name.lower()} {order_type.name.upper()} order to {self.name_cap} for "
             f"{amount} {trading_pair} {price}.",
-            exc_info=True,
+            exc_info=exception,
             app_warning_msg=f"Failed to submit {trade_type.name.upper()} order to {self.name_cap}. Check API key and network connection."
         )
         self._update_order_after_failure(order_id=order_id, trading_pair=trading_pair)
@@ -537,7 +655,12 @@ class ExchangePyBase(ExchangeBase, ABC):
                 self.logger().error(f"Failed to cancel order {order.client_order_id}", exc_info=True)
 
     async def _execute_order_cancel_and_process_update(self, order: InFlightOrder) -> bool:
-        cancelled = await self._place_cancel(order.client_order_id, order)
+        if self.batch_order_cancel_max_size > 1:
+            cancelled = await self._queue_order_cancel(order=order)
+        else:
+            start_time = time.perf_counter()
+            cancelled = await self._place_cancel(order.client_order_id, order)
+            ORDER_CANCEL_LATENCY.labels(self.name).observe(time.perf_counter() - start_time)
         if cancelled:
             update_timestamp = self.current_timestamp
             if update_timestamp is None or math.isnan(update_timestamp):
@@ -553,6 +676,67 @@ class ExchangePyBase(ExchangeBase, ABC):
             self._order_tracker.process_order_update(order_update)
         return cancelled
 
+    async def _queue_order_cancel(self, order: InFlightOrder) -> bool:
+        """
+        Adds the order to the next batch cancelation request and waits for the result of its cancelation. The first
+        order queued sends the request once the orders canceled in the same cycle have been queued too.
+        """
+        is_first_queued_order = len(self._orders_queued_for_batch_cancel) == 0
+        cancelation_future = asyncio.get_event_loop().create_future()
+        self._orders_queued_for_batch_cancel.append((order, cancelation_future))
+        if is_first_queued_order:
+            await asyncio.sleep(0)
+            queued_cancels = self._orders_queued_for_batch_cancel
+            self._orders_queued_for_batch_cancel = []
+            max_size = self.batch_order_cancel_max_size
+            try:
+                await safe_gather(*[
+                    self._place_queued_cancels(queued_cancels=queued_cancels[index:index + max_size])
+                    for index in range(0, len(queued_cancels), max_size)
+                ])
+            finally:
+                for _, future in queued_cancels:
+                    if not future.done():
+                        future.cancel()
+        return await cancelation_future
+
+    async def _place_queued_cancels(self, queued_cancels: List[Tuple[InFlightOrder, asyncio.Future]]):
+        if len(queued_cancels) == 1:
+            order, future = queued_cancels[0]
+            try:
+                future.set_result(await self._place_cancel(order.client_order_id, order))
+            except asyncio.CancelledError:
+                raise
+            except Exception as ex:
+                future.set_exception(ex)
+            return
+
+        orders = [order for order, _ in queued_cancels]
+        try:
+            results = await self._place_batch_cancels(orders=orders)
+        except asyncio.CancelledError:
+            raise
+        except Exception as ex:
+            results = [
+                CancelOrderResult(client_order_id=order.client_order_id, trading_pair=order.trading_pair, exception=ex)
+                for order in orders
+            ]
+
+        results_by_order_id = {result.client_order_id: result for result in results}
+        for order, future in queued_cancels:
+            result = results_by_order_id.get(order.client_order_id)
+            if result is None:
+                future.set_exception(
+                    IOError(f"The batch order cancelation response did not include {order.client_order_id}"))
+            elif result.exception is not None:
+                future.set_exception(result.exception)
+            elif result.not_found:
+                self.logger().warning(f"Failed to cancel order {order.client_order_id} (order not found)")
+                await self._order_tracker.process_order_not_found(order.client_order_id)
+                future.set_result(False)
+            else:
+                future.set_result(True)
+
     async def _execute_cancel(self, trading_pair: str, order_id: str) -> str:
         """
         Requests the exchange to cancel an active order
@@ -640,6 +824,28 @@ class ExchangePyBase(ExchangeBase, ABC):
                            ) -> Tuple[str, float]:
         raise NotImplementedError
 
+    async def _place_batch_orders(self, orders: List[InFlightOrder]) -> List[PlaceOrderResult]:
+        """
+        Sends the orders to the exchange in a single request. Only required when `batch_order_create_max_size` is
+        greater than one.
+
+        :param orders: the orders to create, at most `batch_order_create_max_size`
+
+        :return: the creation result of each order
+        """
+        raise NotImplementedError
+
+    async def _place_batch_cancels(self, orders: List[InFlightOrder]) -> List[CancelOrderResult]:
+        """
+        Requests the cancelation of the orders in a single request. Only required when `batch_order_cancel_max_size`
+        is greater than one.
+
+        :param orders: the orders to cancel, at most `batch_order_cancel_max_size`
+
+        :return: the cancelation result of each order
+        """
+        raise NotImplementedError
+
     @abstractmethod
     def _get_fee(self,
                  base_currency: str,
@@ -830,9 +1036,14 @@ class ExchangePyBase(ExchangeBase, ABC):
         """
         Called by _user_stream_event_listener.
         """
+        event_lag_metric = USER_STREAM_EVENT_LAG.labels(self.name)
         while True:
             try:
-                yield await self._user_stream_tracker.user_stream.get()
+                event = await self._user_stream_tracker.user_stream.get()
+                last_recv_time = self._user_stream_tracker.last_recv_time
+                if last_recv_time > 0:
+                    event_lag_metric.observe(time.time() - last_recv_time)
+                yield event
             except asyncio.CancelledError:
                 raise
             except Exception:
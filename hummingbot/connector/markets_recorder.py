@@ -5,13 +5,14 @@ import threading
 import time
 from decimal import Decimal
 from shutil import move
-from typing import Dict, List, Optional, Tuple, Union
+from typing import Any, Dict, List, Optional, Tuple, Union
 
 import pandas as pd
 from sqlalchemy.orm import Query, Session
 
 from hummingbot import data_path
 from hummingbot.client.config.client_config_map import MarketDataCollectionConfigMap
+from hummingbot.client.performance import PerformanceLedger
 from hummingbot.connector.connector_base import ConnectorBase
 from hummingbot.connector.utils import TradeFillOrderDetails
 from hummingbot.core.data_type.common import PriceType
@@ -36,9 +37,11 @@ from hummingbot.core.event.events import (
 from hummingbot.logger import HummingbotLogger
 from hummingbot.model.funding_payment import FundingPayment
 from hummingbot.model.market_data import MarketData
+from hummingbot.model.market_data_level import MarketDataLevel
 from hummingbot.model.market_state import MarketState
 from hummingbot.model.order import Order
 from hummingbot.model.order_status import OrderStatus
+from hummingbot.model.performance_checkpoint import PerformanceCheckpoint
 from hummingbot.model.position_executors import PositionExecutors
 from hummingbot.model.range_position_collected_fees import RangePositionCollectedFees
 from hummingbot.model.range_position_update import RangePositionUpdate
@@ -49,6 +52,7 @@ from hummingbot.model.trade_fill import TradeFill
 class MarketsRecorder:
     _logger = None
     _shared_instance: "MarketsRecorder" = None
+    PERFORMANCE_CHECKPOINT_FILLS = 100
     market_event_tag_map: Dict[int, MarketEvent] = {
         event_obj.value: event_obj
         for event_obj in MarketEvent.__members__.values()
@@ -82,6 +86,9 @@ class MarketsRecorder:
         self._strategy_name: str = strategy_name
         self._market_data_collection_config: MarketDataCollectionConfigMap = market_data_collection
         self._market_data_collection_task: Optional[asyncio.Task] = None
+        # Performance ledgers of the trade fills of this config, by history start timestamp and (market, symbol)
+        self._performance_ledgers: Dict[int, Dict[Tuple[str, str], PerformanceLedger]] = {}
+        self._fills_since_performance_checkpoint: int = 0
         # Internal collection of trade fills in connector will be used for remote/local history reconciliation
         for market in self._markets:
             trade_fills = self.get_trades_for_config(self._config_file_path, 2000)
@@ -129,28 +136,41 @@ class MarketsRecorder:
         while True:
             try:
                 if all(ex.ready for ex in self._markets):
+                    market_data_rows: List[Dict[str, Any]] = []
+                    level_rows: List[Dict[str, Any]] = []
+                    store_levels = self._market_data_collection_config.market_data_order_book_levels
+                    depth = self._market_data_collection_config.market_data_collection_depth + 1
+                    for market in self._markets:
+                        exchange = market.display_name
+                        for trading_pair in market.trading_pairs:
+                            timestamp = self.db_timestamp
+                            order_book = market.get_order_book(trading_pair)
+                            bids = list(order_book.bid_entries())[:depth]
+                            asks = list(order_book.ask_entries())[:depth]
+                            market_data_rows.append({
+                                "timestamp": timestamp,
+                                "exchange": exchange,
+                                "trading_pair": trading_pair,
+                                "mid_price": market.get_price_by_type(trading_pair, PriceType.MidPrice),
+                                "best_bid": market.get_price_by_type(trading_pair, PriceType.BestBid),
+                                "best_ask": market.get_price_by_type(trading_pair, PriceType.BestAsk),
+                                "order_book": None if store_levels else {"bid": bids, "ask": asks},
+                            })
+                            if store_levels:
+                                for side, entries in (("bid", bids), ("ask", asks)):
+                                    level_rows.extend({"exchange": exchange,
+                                                       "trading_pair": trading_pair,
+                                                       "timestamp": timestamp,
+                                                       "side": side,
+                                                       "level": level,
+                                                       "price": entry.price,
+                                                       "amount": entry.amount}
+                                                      for level, entry in enumerate(entries))
                     with self._sql_manager.get_new_session() as session:
                         with session.begin():
-                            for market in self._markets:
-                                exchange = market.display_name
-                                for trading_pair in market.trading_pairs:
-                                    mid_price = market.get_price_by_type(trading_pair, PriceType.MidPrice)
-                                    best_bid = market.get_price_by_type(trading_pair, PriceType.BestBid)
-                                    best_ask = market.get_price_by_type(trading_pair, PriceType.BestAsk)
-                                    order_book = market.get_order_book(trading_pair)
-                                    depth = self._market_data_collection_config.market_data_collection_depth + 1
-                                    market_data = MarketData(
-                                        timestamp=self.db_timestamp,
-                                        exchange=exchange,
-                                        trading_pair=trading_pair,
-                                        mid_price=mid_price,
-                                        best_bid=best_bid,
-                                        best_ask=best_ask,
-                                        order_book={
-                                            "bid": list(order_book.bid_entries())[:depth],
-                                            "ask": list(order_book.ask_entries())[:depth]}
-                                    )
-                                    session.add(market_data)
+                            session.bulk_insert_mappings(MarketData, market_data_rows)
+                            if len(level_rows) > 0:
+                                session.bulk_insert_mappings(MarketDataLevel, level_rows)
             except asyncio.CancelledError:
                 raise
             except Exception as e:
@@ -187,6 +207,10 @@ class MarketsRecorder:
                 market.remove_listener(event_pair[0], event_pair[1])
         if self._market_data_collection_task is not None:
             self._market_data_collection_task.cancel()
+        if len(self._performance_ledgers) > 0:
+            with self._sql_manager.get_new_session() as session:
+                with session.begin():
+                    self.save_performance_checkpoints(session=session)
 
     def store_executor(self, executor: Dict):
         with self._sql_manager.get_new_session() as session:
@@ -247,6 +271,83 @@ class MarketsRecorder:
                                         saved_state=market.tracking_states)
             session.add(market_states)
 
+    def get_performance_ledgers(self, start_timestamp: int) -> List[PerformanceLedger]:
+        """
+        Returns the performance ledgers of the markets traded with this config since the start timestamp (in ms).
+        The ledgers are loaded from the latest checkpoints replaying only the trade fills recorded after them, and
+        are then kept up to date with the fill events.
+        """
+        ledgers: Optional[Dict[Tuple[str, str], PerformanceLedger]] = self._performance_ledgers.get(start_timestamp)
+        if ledgers is None:
+            ledgers = self._load_performance_ledgers(start_timestamp)
+            self._performance_ledgers[start_timestamp] = ledgers
+        return [ledger for ledger in ledgers.values() if ledger.num_trades > 0]
+
+    def _load_performance_ledgers(self, start_timestamp: int) -> Dict[Tuple[str, str], PerformanceLedger]:
+        with self._sql_manager.get_new_session() as session:
+            checkpoints: List[PerformanceCheckpoint] = (session
+                                                        .query(PerformanceCheckpoint)
+                                                        .filter(PerformanceCheckpoint.config_file_path ==
+                                                                self._config_file_path,
+                                                                PerformanceCheckpoint.start_timestamp ==
+                                                                start_timestamp)
+                                                        .all())
+            ledgers: Dict[Tuple[str, str], PerformanceLedger] = {
+                (checkpoint.market, checkpoint.symbol): PerformanceLedger.from_json(checkpoint.ledger)
+                for checkpoint in checkpoints
+            }
+            replay_start_timestamp: int = min(
+                (ledger.replay_start_timestamp for ledger in ledgers.values() if ledger.num_trades > 0),
+                default=start_timestamp)
+            query: Query = (session
+                            .query(TradeFill)
+                            .filter(TradeFill.config_file_path.like(f"%{self._config_file_path}%"),
+                                    TradeFill.timestamp >= max(start_timestamp, replay_start_timestamp))
+                            .order_by(TradeFill.timestamp))
+            for trade_fill in query.yield_per(1000):
+                key: Tuple[str, str] = (trade_fill.market, trade_fill.symbol)
+                if key not in ledgers:
+                    ledgers[key] = PerformanceLedger(market=trade_fill.market, symbol=trade_fill.symbol)
+                if not ledgers[key].is_trade_included(trade_fill):
+                    ledgers[key].add_trade(trade_fill)
+        return ledgers
+
+    def save_performance_checkpoints(self, session: Session):
+        for start_timestamp, ledgers in self._performance_ledgers.items():
+            checkpoints: Dict[Tuple[str, str], PerformanceCheckpoint] = {
+                (checkpoint.market, checkpoint.symbol): checkpoint
+                for checkpoint in (session
+                                   .query(PerformanceCheckpoint)
+                                   .filter(PerformanceCheckpoint.config_file_path == self._config_file_path,
+                                           PerformanceCheckpoint.start_timestamp == start_timestamp))
+            }
+            for key, ledger in ledgers.items():
+                if ledger.num_trades == 0:
+                    continue
+                checkpoint: Optional[PerformanceCheckpoint] = checkpoints.get(key)
+                if checkpoint is not None:
+                    checkpoint.ledger = ledger.to_json()
+                    checkpoint.timestamp = ledger.last_timestamp
+                else:
+                    session.add(PerformanceCheckpoint(config_file_path=self._config_file_path,
+                                                      start_timestamp=start_timestamp,
+                                                      market=ledger.market,
+                                                      symbol=ledger.symbol,
+                                                      timestamp=ledger.last_timestamp,
+                                                      ledger=ledger.to_json()))
+        self._fills_since_performance_checkpoint = 0
+
+    def _update_performance_ledgers(self, trade_fill: TradeFill, session: Session):
+        for start_timestamp, ledgers in self._performance_ledgers.items():
+            if trade_fill.timestamp >= start_timestamp:
+                key: Tuple[str, str] = (trade_fill.market, trade_fill.symbol)
+                if key not in ledgers:
+                    ledgers[key] = PerformanceLedger(market=trade_fill.market, symbol=trade_fill.symbol)
+                ledgers[key].add_trade(trade_fill)
+        self._fills_since_performance_checkpoint += 1
+        if self._fills_since_performance_checkpoint >= self.PERFORMANCE_CHECKPOINT_FILLS:
+            self.save_performance_checkpoints(session=session)
+
     def restore_market_states(self, config_file_path: str, market: ConnectorBase):
         with self._sql_manager.get_new_session() as session:
             market_states: Optional[MarketState] = self.get_market_states(config_file_path, market, session=session)
@@ -362,6 +463,7 @@ class MarketsRecorder:
                 session.add(order_status)
                 session.add(trade_fill_record)
                 self.save_market_states(self._config_file_path, market, session=session)
+                self._update_performance_ledgers(trade_fill_record, session=session)
 
                 market.add_trade_fills_from_market_recorder({TradeFillOrderDetails(trade_fill_record.market,
                                                                                    trade_fill_record.exchange_trade_id,
@@ -6,11 +6,17 @@ from decimal import Decimal
 from typing import List, Tuple
 
 from hummingbot.core.api_throttler.data_types import RateLimit, TaskLog
+from hummingbot.core.metrics.metrics_registry import MetricsRegistry
 from hummingbot.logger.logger import HummingbotLogger
 
 arc_logger = None
 MAX_CAPACITY_REACHED_WARNING_INTERVAL = 30.0
 
+THROTTLER_WAIT_TIME = MetricsRegistry.get_instance().histogram(
+    "hummingbot_throttler_wait_seconds",
+    "Time spent waiting for rate limit capacity before sending a request.",
+    ["limit_id"])
+
 
 class AsyncRequestContextBase(ABC):
     """
@@ -67,6 +73,7 @@ class AsyncRequestContextBase(ABC):
         raise NotImplementedError
 
     async def acquire(self):
+        start_time = time.perf_counter()
         while True:
             async with self._lock:
                 self.flush()
@@ -74,6 +81,7 @@ class AsyncRequestContextBase(ABC):
                 if self.within_capacity():
                     break
             await asyncio.sleep(self._retry_interval)
+        THROTTLER_WAIT_TIME.labels(self._rate_limit.limit_id).observe(time.perf_counter() - start_time)
         async with self._lock:
             now = time.time()
             # Each related limit is represented as it own individual TaskLog
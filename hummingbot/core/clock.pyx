@@ -36,6 +36,7 @@ cdef class Clock:
         self._child_iterators = []
         self._current_context = None
         self._started = False
+        self._loop_monitor = None
 
     @property
     def clock_mode(self) -> ClockMode:
@@ -57,6 +58,17 @@ cdef class Clock:
     def current_timestamp(self) -> float:
         return self._current_tick
 
+    @property
+    def loop_monitor(self):
+        """
+        The LoopMonitor that records the lag and duration of the ticks and the time spent by each time iterator.
+        """
+        return self._loop_monitor
+
+    @loop_monitor.setter
+    def loop_monitor(self, loop_monitor):
+        self._loop_monitor = loop_monitor
+
     def __enter__(self) -> Clock:
         if self._current_context is not None:
             raise EnvironmentError("Clock context is not re-entrant.")
@@ -112,6 +124,14 @@ cdef class Clock:
                 await asyncio.sleep(next_tick_time - now)
                 self._current_tick = next_tick_time
 
+                if self._loop_monitor is not None:
+                    try:
+                        self._monitored_tick(next_tick_time)
+                    except StopIteration:
+                        self.logger().error("Stop iteration triggered in real time mode. This is not expected.")
+                        return
+                    continue
+
                 # Run through all the child iterators.
                 for ci in self._current_context:
                     child_iterator = ci
@@ -127,6 +147,31 @@ cdef class Clock:
                 child_iterator = ci
                 child_iterator._clock = None
 
+    def _monitored_tick(self, double next_tick_time):
+        """
+        Runs a tick through all the child iterators, recording the time spent by each of them in the loop monitor.
+        """
+        cdef:
+            TimeIterator child_iterator
+            double tick_start_time = time.time()
+            double iterator_start_time
+        monitor = self._loop_monitor
+        try:
+            for ci in self._current_context:
+                child_iterator = ci
+                iterator_start_time = time.perf_counter()
+                try:
+                    child_iterator.c_tick(self._current_tick)
+                except StopIteration:
+                    raise
+                except Exception:
+                    self.logger().error(f"Unexpected error running clock tick of {type(child_iterator).__name__}.",
+                                        exc_info=True)
+                finally:
+                    monitor.record_iterator_tick(child_iterator, time.perf_counter() - iterator_start_time)
+        finally:
+            monitor.record_clock_tick(next_tick_time, tick_start_time, time.time(), self._tick_size)
+
     def backtest_til(self, timestamp: float):
         cdef TimeIterator child_iterator
 
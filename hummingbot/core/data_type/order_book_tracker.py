@@ -12,9 +12,15 @@ from hummingbot.core.data_type.order_book import OrderBook
 from hummingbot.core.data_type.order_book_message import OrderBookMessage, OrderBookMessageType
 from hummingbot.core.data_type.order_book_tracker_data_source import OrderBookTrackerDataSource
 from hummingbot.core.event.events import OrderBookTradeEvent
+from hummingbot.core.metrics.metrics_registry import MetricsRegistry
 from hummingbot.core.utils.async_utils import safe_ensure_future
 from hummingbot.logger import HummingbotLogger
 
+ORDER_BOOK_APPLY_LAG = MetricsRegistry.get_instance().histogram(
+    "hummingbot_order_book_apply_lag_seconds",
+    "Time between the exchange timestamp of an order book diff and its application to the local order book.",
+    ["data_source"])
+
 
 class OrderBookTrackerDataSourceType(Enum):
     REMOTE_API = 2
@@ -260,6 +266,7 @@ class OrderBookTracker:
         order_book: OrderBook = self._order_books[trading_pair]
         last_message_timestamp: float = time.time()
         diff_messages_accepted: int = 0
+        apply_lag_metric = ORDER_BOOK_APPLY_LAG.labels(type(self._data_source).__name__)
 
         while True:
             try:
@@ -278,6 +285,10 @@ class OrderBookTracker:
 
                     # Output some statistics periodically.
                     now: float = time.time()
+                    # Messages without exchange timestamp (or with timestamps in milliseconds) are not measured
+                    apply_lag = now - message.timestamp
+                    if apply_lag >= 0:
+                        apply_lag_metric.observe(apply_lag)
                     if int(now / 60.0) > int(last_message_timestamp / 60.0):
                         self.logger().debug(f"Processed {diff_messages_accepted} order book diffs for {trading_pair}.")
                         diff_messages_accepted = 0
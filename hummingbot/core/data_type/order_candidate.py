@@ -2,7 +2,7 @@ import typing
 from collections import defaultdict
 from dataclasses import dataclass, field
 from decimal import Decimal
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
 
 from hummingbot.connector.utils import combine_to_hb_trading_pair, split_hb_trading_pair
 from hummingbot.core.data_type.common import OrderType, PositionAction, TradeType
@@ -70,9 +70,15 @@ class OrderCandidate:
     def set_to_zero(self):
         self._scale_order(scaler=Decimal("0"))
 
-    def populate_collateral_entries(self, exchange: 'ExchangeBase'):
+    def get_fee_key(self) -> Tuple:
+        """
+        Returns the parameters the fee of the candidate depends on. Candidates with the same key share the same fee.
+        """
+        return type(self), self.trading_pair, self.is_maker, self.order_type, self.order_side
+
+    def populate_collateral_entries(self, exchange: 'ExchangeBase', fee: Optional[TradeFeeBase] = None):
         self._populate_order_collateral_entry(exchange)
-        fee = self._get_fee(exchange)
+        fee = fee if fee is not None else self._get_fee(exchange)
         self._populate_percent_fee_collateral_entry(exchange, fee)
         self._populate_fixed_fee_collateral_entries(fee)
         self._populate_potential_returns_entry(exchange)
@@ -347,6 +353,9 @@ class PerpetualOrderCandidate(OrderCandidate):
             else TradeType.SELL
         )
 
+    def get_fee_key(self) -> Tuple:
+        return super().get_fee_key() + (self.position_close,)
+
     def _get_fee(self, exchange: 'ExchangeBase') -> TradeFeeBase:
         base, quote = split_hb_trading_pair(self.trading_pair)
         position_action = PositionAction.CLOSE if self.position_close else PositionAction.OPEN
@@ -0,0 +1,70 @@
+import logging
+from typing import Optional
+
+from aiohttp import web
+
+from hummingbot.core.metrics.metrics_registry import MetricsRegistry
+from hummingbot.logger import HummingbotLogger
+
+me_logger = None
+
+OPENMETRICS_CONTENT_TYPE = "application/openmetrics-text; version=1.0.0; charset=utf-8"
+
+
+class MetricsExporter:
+    """
+    Serves the metrics of the registry in the OpenMetrics text format on `http://<host>:<port>/metrics`, to be
+    scraped by Prometheus.
+    """
+
+    @classmethod
+    def logger(cls) -> HummingbotLogger:
+        global me_logger
+        if me_logger is None:
+            me_logger = logging.getLogger(__name__)
+        return me_logger
+
+    def __init__(self, host: str = "127.0.0.1", port: int = 9464, registry: Optional[MetricsRegistry] = None):
+        self._host = host
+        self._port = port
+        self._registry = registry or MetricsRegistry.get_instance()
+        self._runner: Optional[web.AppRunner] = None
+
+    @property
+    def started(self) -> bool:
+        return self._runner is not None
+
+    @property
+    def port(self) -> int:
+        """
+        The port the exporter listens on, which is the one picked by the OS when the exporter was created with port 0.
+        """
+        if self._runner is not None and len(self._runner.addresses) > 0:
+            return self._runner.addresses[0][1]
+        return self._port
+
+    async def start(self):
+        if self._runner is not None:
+            return
+        app = web.Application()
+        app.router.add_get("/metrics", self._handle_metrics)
+        runner = web.AppRunner(app, access_log=None)
+        await runner.setup()
+        try:
+            await web.TCPSite(runner, self._host, self._port).start()
+        except Exception:
+            await runner.cleanup()
+            self.logger().error(f"Error starting the metrics exporter on {self._host}:{self._port}.", exc_info=True)
+            return
+        self._runner = runner
+        self.logger().info(f"Metrics exporter listening on http://{self._host}:{self.port}/metrics")
+
+    async def stop(self):
+        if self._runner is not None:
+            runner = self._runner
+            self._runner = None
+            await runner.cleanup()
+
+    async def _handle_metrics(self, _: web.Request) -> web.Response:
+        return web.Response(body=self._registry.render().encode("utf-8"),
+                            headers={"Content-Type": OPENMETRICS_CONTENT_TYPE})
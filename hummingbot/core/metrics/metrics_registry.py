@@ -0,0 +1,191 @@
+import threading
+from bisect import bisect_left
+from typing import Dict, List, Optional, Sequence, Tuple, Union
+
+DEFAULT_LATENCY_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+
+def _escape_label_value(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\"", "\\\"").replace("\n", "\\n")
+
+
+def _format_labels(label_names: Sequence[str], label_values: Sequence[str]) -> str:
+    if len(label_names) == 0:
+        return ""
+    pairs = ",".join(f"{name}=\"{_escape_label_value(value)}\"" for name, value in zip(label_names, label_values))
+    return "{" + pairs + "}"
+
+
+def _format_value(value: float) -> str:
+    if value == float("inf"):
+        return "+Inf"
+    return repr(float(value)) if isinstance(value, float) else str(value)
+
+
+class CounterValue:
+    """
+    A counter for one combination of label values.
+    """
+    __slots__ = ("value",)
+
+    def __init__(self):
+        self.value = 0
+
+    def inc(self, amount: Union[int, float] = 1):
+        self.value += amount
+
+
+class HistogramValue:
+    """
+    A histogram for one combination of label values. `counts` holds the number of observations of each bucket (not
+    cumulative), the last one being the +Inf bucket.
+    """
+    __slots__ = ("bounds", "counts", "count", "sum")
+
+    def __init__(self, bounds: Tuple[float, ...]):
+        self.bounds = bounds
+        self.counts = [0] * (len(bounds) + 1)
+        self.count = 0
+        self.sum = 0.0
+
+    def observe(self, value: float):
+        self.counts[bisect_left(self.bounds, value)] += 1
+        self.count += 1
+        self.sum += value
+
+
+class Metric:
+    """
+    A metric family. The values of each combination of label values are created on first use by `labels` and kept,
+    so the hot paths can hold on to them.
+    """
+    metric_type = ""
+
+    def __init__(self, name: str, documentation: str, label_names: Sequence[str] = ()):
+        self.name = name
+        self.documentation = documentation
+        self.label_names: Tuple[str, ...] = tuple(label_names)
+        self._values: Dict[Tuple[str, ...], object] = {}
+        self._lock = threading.Lock()
+
+    def labels(self, *label_values: str):
+        value = self._values.get(label_values)
+        if value is None:
+            key = tuple(str(label_value) for label_value in label_values)
+            if len(key) != len(self.label_names):
+                raise ValueError(f"{self.name} expects the labels {self.label_names}, got {key}.")
+            with self._lock:
+                value = self._values.setdefault(key, self._new_value())
+        return value
+
+    def clear(self):
+        with self._lock:
+            self._values = {}
+
+    def collect(self) -> List[str]:
+        lines = [f"# TYPE {self.name} {self.metric_type}", f"# HELP {self.name} {self.documentation}"]
+        for label_values, value in sorted(self._values.items()):
+            lines.extend(self._samples(label_values, value))
+        return lines
+
+    def _new_value(self):
+        raise NotImplementedError
+
+    def _samples(self, label_values: Tuple[str, ...], value) -> List[str]:
+        raise NotImplementedError
+
+
+class Counter(Metric):
+    metric_type = "counter"
+
+    def inc(self, amount: Union[int, float] = 1):
+        self.labels().inc(amount)
+
+    def _new_value(self) -> CounterValue:
+        return CounterValue()
+
+    def _samples(self, label_values: Tuple[str, ...], value: CounterValue) -> List[str]:
+        return [f"{self.name}_total{_format_labels(self.label_names, label_values)} {_format_value(value.value)}"]
+
+
+class Histogram(Metric):
+    metric_type = "histogram"
+
+    def __init__(self,
+                 name: str,
+                 documentation: str,
+                 label_names: Sequence[str] = (),
+                 buckets: Sequence[float] = DEFAULT_LATENCY_BUCKETS):
+        super().__init__(name, documentation, label_names)
+        self.buckets: Tuple[float, ...] = tuple(sorted(float(bound) for bound in buckets))
+
+    def observe(self, value: float):
+        self.labels().observe(value)
+
+    def _new_value(self) -> HistogramValue:
+        return HistogramValue(self.buckets)
+
+    def _samples(self, label_values: Tuple[str, ...], value: HistogramValue) -> List[str]:
+        lines = []
+        label_names = self.label_names + ("le",)
+        cumulative_count = 0
+        for bound, count in zip(self.buckets + (float("inf"),), list(value.counts)):
+            cumulative_count += count
+            labels = _format_labels(label_names, label_values + (_format_value(bound),))
+            lines.append(f"{self.name}_bucket{labels} {cumulative_count}")
+        labels = _format_labels(self.label_names, label_values)
+        lines.append(f"{self.name}_count{labels} {value.count}")
+        lines.append(f"{self.name}_sum{labels} {_format_value(value.sum)}")
+        return lines
+
+
+class MetricsRegistry:
+    """
+    Registry of the metrics recorded by the client, rendered in the OpenMetrics text format by the metrics exporter.
+
+    Recording a value is a dictionary lookup and an addition (plus a bisection for histograms), so the metrics are
+    always recorded and only the exporter is optional.
+    """
+    _mr_shared_instance: Optional["MetricsRegistry"] = None
+
+    @classmethod
+    def get_instance(cls) -> "MetricsRegistry":
+        if cls._mr_shared_instance is None:
+            cls._mr_shared_instance = MetricsRegistry()
+        return cls._mr_shared_instance
+
+    def __init__(self):
+        self._metrics: Dict[str, Metric] = {}
+        self._lock = threading.Lock()
+
+    @property
+    def metrics(self) -> Dict[str, Metric]:
+        return self._metrics
+
+    def counter(self, name: str, documentation: str, label_names: Sequence[str] = ()) -> Counter:
+        return self._register(Counter(name, documentation, label_names))
+
+    def histogram(self,
+                  name: str,
+                  documentation: str,
+                  label_names: Sequence[str] = (),
+                  buckets: Sequence[float] = DEFAULT_LATENCY_BUCKETS) -> Histogram:
+        return self._register(Histogram(name, documentation, label_names, buckets))
+
+    def render(self) -> str:
+        lines = []
+        for name in sorted(self._metrics):
+            lines.extend(self._metrics[name].collect())
+        lines.append("# EOF")
+        return "\n".join(lines) + "\n"
+
+    def _register(self, metric: Metric):
+        with self._lock:
+            registered = self._metrics.get(metric.name)
+            if registered is None:
+                self._metrics[metric.name] = metric
+                return metric
+            if type(registered) is not type(metric) or registered.label_names != metric.label_names:
+                raise ValueError(f"The metric {metric.name} is already registered as a {registered.metric_type} with "
+                                 f"the labels {registered.label_names}.")
+            return registered
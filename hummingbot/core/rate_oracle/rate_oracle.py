@@ -1,7 +1,8 @@
 import asyncio
 import logging
+import time
 from decimal import Decimal
-from typing import Dict, Optional
+from typing import TYPE_CHECKING, Dict, List, Optional, Set
 
 import hummingbot.client.settings  # noqa
 from hummingbot.connector.utils import combine_to_hb_trading_pair
@@ -14,10 +15,13 @@ from hummingbot.core.rate_oracle.sources.coin_gecko_rate_source import CoinGecko
 from hummingbot.core.rate_oracle.sources.gate_io_rate_source import GateIoRateSource
 from hummingbot.core.rate_oracle.sources.kucoin_rate_source import KucoinRateSource
 from hummingbot.core.rate_oracle.sources.rate_source_base import RateSourceBase
-from hummingbot.core.rate_oracle.utils import find_rate
+from hummingbot.core.rate_oracle.utils import find_rate, find_rate_route_pairs
 from hummingbot.core.utils.async_utils import safe_ensure_future
 from hummingbot.logger import HummingbotLogger
 
+if TYPE_CHECKING:
+    from hummingbot.connector.connector_base import ConnectorBase
+
 RATE_ORACLE_SOURCES = {
     "binance": BinanceRateSource,
     "coin_gecko": CoinGeckoRateSource,
@@ -33,10 +37,21 @@ class RateOracle(NetworkBase):
     RateOracle provides conversion rates for any given pair token symbols in both async and sync fashions.
     It achieves this by query URL on a given source for prices and store them, either in cache or as an object member.
     The find_rate is then used on these prices to find a rate on a given pair.
+
+    Pairs requested through get_pair_rate or rate_async are tracked as subscriptions. Once there is at least one
+    subscription the fetch loop only refreshes the prices needed to resolve the subscribed pairs (served from the
+    order books of registered connectors when possible), and subscriptions not requested for a while are evicted.
+    A snapshot of all the source prices is still refreshed every SNAPSHOT_REFRESH_INTERVAL seconds to resolve pairs
+    requested for the first time.
     """
     _logger: Optional[HummingbotLogger] = None
     _shared_instance: "RateOracle" = None
 
+    FETCH_INTERVAL = 1.0
+    PAIR_SUBSCRIPTION_TTL = 300.0
+    PRICE_TTL = 60.0
+    SNAPSHOT_REFRESH_INTERVAL = 300.0
+
     @classmethod
     def get_instance(cls) -> "RateOracle":
         if cls._shared_instance is None:
@@ -53,6 +68,11 @@ class RateOracle(NetworkBase):
         super().__init__()
         self._source: RateSourceBase = source if source is not None else BinanceRateSource()
         self._prices: Dict[str, Decimal] = {}
+        self._price_timestamps: Dict[str, float] = {}
+        self._snapshot_prices: Dict[str, Decimal] = {}
+        self._snapshot_timestamp: float = 0
+        self._subscribed_pairs: Dict[str, float] = {}
+        self._price_connectors: Dict[str, "ConnectorBase"] = {}
         self._fetch_price_task: Optional[asyncio.Task] = None
         self._ready_event = asyncio.Event()
         self._quote_token = quote_token if quote_token is not None else "USD"
@@ -94,6 +114,9 @@ class RateOracle(NetworkBase):
         if new_token != self._quote_token:
             self._quote_token = new_token
             self._prices = {}
+            self._price_timestamps = {}
+            self._snapshot_prices = {}
+            self._snapshot_timestamp = 0
 
     @property
     def prices(self) -> Dict[str, Decimal]:
@@ -102,6 +125,38 @@ class RateOracle(NetworkBase):
         """
         return self._prices.copy()
 
+    @property
+    def subscribed_pairs(self) -> List[str]:
+        """
+        Trading pairs requested since they were last evicted
+        """
+        return list(self._subscribed_pairs)
+
+    def subscribe_pairs(self, pairs: List[str]):
+        """
+        Marks the pairs as used so that the fetch loop keeps their prices updated.
+
+        :param pairs: A list of trading pairs, e.g. ["BTC-USDT"]
+        """
+        now = self._time()
+        for pair in pairs:
+            self._subscribed_pairs[pair] = now
+
+    def add_price_connector(self, connector: "ConnectorBase"):
+        """
+        Registers a connected connector whose order books are used to price the subscribed pairs it tracks,
+        instead of requesting them from the rate source.
+
+        :param connector: A connector with initialized order books
+        """
+        self._price_connectors[connector.name] = connector
+
+    def remove_price_connector(self, connector: "ConnectorBase"):
+        self._price_connectors.pop(connector.name, None)
+
+    def clear_price_connectors(self):
+        self._price_connectors.clear()
+
     async def start_network(self):
         await self.stop_network()
         self._fetch_price_task = safe_ensure_future(self._fetch_price_loop())
@@ -112,6 +167,11 @@ class RateOracle(NetworkBase):
             self._fetch_price_task = None
         # Reset stored prices so that they are not used if they are not being updated
         self._prices = {}
+        self._price_timestamps = {}
+        self._snapshot_prices = {}
+        self._snapshot_timestamp = 0
+        self._subscribed_pairs = {}
+        self._ready_event.clear()
 
     async def check_network(self) -> NetworkStatus:
         try:
@@ -155,7 +215,12 @@ class RateOracle(NetworkBase):
         :param pair: A trading pair, e.g. BTC-USDT
         :return A conversion rate
         """
-        return find_rate(self._prices, pair)
+        self._subscribed_pairs[pair] = self._time()
+        rate = find_rate(self._prices, pair)
+        if rate is None:
+            # The pair might not have been refreshed yet since it was first requested
+            rate = find_rate(self._snapshot_prices, pair)
+        return rate
 
     async def stored_or_live_rate(self, pair: str) -> Decimal:
         """
@@ -166,9 +231,8 @@ class RateOracle(NetworkBase):
 
         :return A conversion rate
         """
-        if self._prices:
-            rate = self.get_pair_rate(pair)
-        else:
+        rate = self.get_pair_rate(pair) if self._prices else None
+        if rate is None:
             rate = await self.rate_async(pair)
 
         return rate
@@ -180,13 +244,23 @@ class RateOracle(NetworkBase):
         :param pair: A trading pair, e.g. BTC-USDT
         :return A conversion rate
         """
+        self._subscribed_pairs[pair] = self._time()
         prices = await self._source.get_prices(quote_token=self._quote_token)
         return find_rate(prices, pair)
 
     async def _fetch_price_loop(self):
         while True:
             try:
-                self._prices = await self._source.get_prices(quote_token=self._quote_token)
+                self._evict_unused_pairs()
+                snapshot_refresh_interval = (
+                    self.SNAPSHOT_REFRESH_INTERVAL if self._subscribed_pairs else self.FETCH_INTERVAL)
+                if self._time() - self._snapshot_timestamp >= snapshot_refresh_interval:
+                    await self._update_snapshot_prices()
+                if self._subscribed_pairs:
+                    await self._update_subscribed_prices()
+                else:
+                    self._prices = dict(self._snapshot_prices)
+                    self._price_timestamps = {pair: self._snapshot_timestamp for pair in self._prices}
                 if self._prices:
                     self._ready_event.set()
             except asyncio.CancelledError:
@@ -194,4 +268,63 @@ class RateOracle(NetworkBase):
             except Exception:
                 self.logger().network(f"Error fetching new prices from {self.source.name}.", exc_info=True,
                                       app_warning_msg=f"Couldn't fetch newest prices from {self.source.name}.")
-            await asyncio.sleep(1)
+            await asyncio.sleep(self.FETCH_INTERVAL)
+
+    async def _update_snapshot_prices(self):
+        self._snapshot_prices = await self._source.get_prices(quote_token=self._quote_token)
+        self._snapshot_timestamp = self._time()
+
+    async def _update_subscribed_prices(self):
+        subscribed_pairs = list(self._subscribed_pairs)
+        now = self._time()
+        connector_prices = self._connector_prices(
+            find_rate_route_pairs(self._connector_trading_pairs(), subscribed_pairs))
+        missing_pairs = [pair for pair in subscribed_pairs if find_rate(connector_prices, pair) is None]
+        if missing_pairs:
+            source_prices = await self._source.get_prices_for_pairs(
+                trading_pairs=sorted(missing_pairs), quote_token=self._quote_token)
+        else:
+            source_prices = {}
+
+        prices = {pair: price for pair, price in self._prices.items()
+                  if now - self._price_timestamps.get(pair, 0) <= self.PRICE_TTL}
+        timestamps = {pair: self._price_timestamps[pair] for pair in prices}
+        for pair, price in {**source_prices, **connector_prices}.items():
+            prices[pair] = price
+            timestamps[pair] = now
+        self._prices = prices
+        self._price_timestamps = timestamps
+
+    def _evict_unused_pairs(self):
+        now = self._time()
+        expired_pairs = [pair for pair, last_request in self._subscribed_pairs.items()
+                         if now - last_request > self.PAIR_SUBSCRIPTION_TTL]
+        for pair in expired_pairs:
+            del self._subscribed_pairs[pair]
+
+    def _connector_trading_pairs(self) -> Set[str]:
+        trading_pairs = set()
+        for connector in self._price_connectors.values():
+            trading_pairs.update(getattr(connector, "order_books", {}).keys())
+        return trading_pairs
+
+    def _connector_prices(self, trading_pairs: Set[str]) -> Dict[str, Decimal]:
+        prices = {}
+        for connector in self._price_connectors.values():
+            order_books = getattr(connector, "order_books", {})
+            for trading_pair in trading_pairs:
+                if trading_pair in prices or trading_pair not in order_books:
+                    continue
+                try:
+                    price = connector.get_mid_price(trading_pair)
+                except (EnvironmentError, ValueError):
+                    self.logger().debug(f"Order book for {trading_pair} in {connector.name} is not ready to be used "
+                                        f"for rates.")
+                    continue
+                if price is not None and price.is_finite() and price > 0:
+                    prices[trading_pair] = price
+        return prices
+
+    @staticmethod
+    def _time() -> float:
+        return time.time()
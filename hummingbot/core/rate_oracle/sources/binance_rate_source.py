@@ -1,8 +1,9 @@
 from decimal import Decimal
-from typing import TYPE_CHECKING, Dict, Optional
+from typing import TYPE_CHECKING, Any, Dict, List, Optional
 
 from hummingbot.connector.utils import split_hb_trading_pair
 from hummingbot.core.rate_oracle.sources.rate_source_base import RateSourceBase
+from hummingbot.core.rate_oracle.utils import find_rate_route_pairs
 from hummingbot.core.utils import async_ttl_cache
 from hummingbot.core.utils.async_utils import safe_gather
 
@@ -40,6 +41,27 @@ class BinanceRateSource(RateSourceBase):
                 results.update(task_result)
         return results
 
+    @async_ttl_cache(ttl=30, maxsize=16)
+    async def get_prices_for_pairs(self, trading_pairs: List[str], quote_token: Optional[str] = None) -> Dict[str, Decimal]:
+        self._ensure_exchanges()
+        results = {}
+        tasks = [
+            self._get_binance_prices_for_pairs(exchange=self._binance_exchange, trading_pairs=trading_pairs),
+            self._get_binance_prices_for_pairs(
+                exchange=self._binance_us_exchange, trading_pairs=trading_pairs, quote_token="USD"),
+        ]
+        task_results = await safe_gather(*tasks, return_exceptions=True)
+        for task_result in task_results:
+            if isinstance(task_result, Exception):
+                self.logger().error(
+                    msg="Unexpected error while retrieving rates from Binance. Check the log file for more info.",
+                    exc_info=task_result,
+                )
+                break
+            else:
+                results.update(task_result)
+        return results
+
     def _ensure_exchanges(self):
         if self._binance_exchange is None:
             self._binance_exchange = self._build_binance_connector_without_private_keys(domain="com")
@@ -55,6 +77,38 @@ class BinanceRateSource(RateSourceBase):
         :return: A dictionary of trading pairs and prices
         """
         pairs_prices = await exchange.get_all_pairs_prices()
+        return await BinanceRateSource._parse_binance_prices(
+            exchange=exchange, pairs_prices=pairs_prices, quote_token=quote_token)
+
+    @staticmethod
+    async def _get_binance_prices_for_pairs(
+            exchange: 'BinanceExchange', trading_pairs: List[str], quote_token: str = None,
+    ) -> Dict[str, Decimal]:
+        """
+        Fetches binance prices only for the markets required to find the rates of the given trading pairs
+
+        :param exchange: The exchange instance from which to query prices.
+        :param trading_pairs: The trading pairs whose rates are required
+        :param quote_token: A quote symbol, if specified only pairs with the quote symbol are included for prices
+        :return: A dictionary of trading pairs and prices
+        """
+        symbol_map = await exchange.trading_pair_symbol_map()
+        available_pairs = [
+            trading_pair for trading_pair in symbol_map.values()
+            if quote_token is None or split_hb_trading_pair(trading_pair=trading_pair)[1] == quote_token
+        ]
+        route_pairs = find_rate_route_pairs(available_pairs=available_pairs, pairs=trading_pairs)
+        if not route_pairs:
+            return {}
+        symbols = sorted(symbol_map.inverse[trading_pair] for trading_pair in route_pairs)
+        pairs_prices = await exchange.get_pairs_prices(symbols=symbols)
+        return await BinanceRateSource._parse_binance_prices(
+            exchange=exchange, pairs_prices=pairs_prices, quote_token=quote_token)
+
+    @staticmethod
+    async def _parse_binance_prices(
+            exchange: 'BinanceExchange', pairs_prices: List[Dict[str, Any]], quote_token: str = None,
+    ) -> Dict[str, Decimal]:
         results = {}
         for pair_price in pairs_prices:
             try:
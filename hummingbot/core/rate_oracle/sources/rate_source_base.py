@@ -1,8 +1,9 @@
 import logging
 from abc import ABC, abstractmethod
 from decimal import Decimal
-from typing import Dict, Optional
+from typing import Dict, List, Optional
 
+from hummingbot.core.rate_oracle.utils import find_rate_route_pairs
 from hummingbot.logger import HummingbotLogger
 
 
@@ -23,3 +24,15 @@ class RateSourceBase(ABC):
     @abstractmethod
     async def get_prices(self, quote_token: Optional[str] = None) -> Dict[str, Decimal]:
         ...
+
+    async def get_prices_for_pairs(self, trading_pairs: List[str], quote_token: Optional[str] = None) -> Dict[str, Decimal]:
+        """
+        Fetches only the prices required to find the rates of the given trading pairs. Sources able to request a
+        subset of their markets should override this method, by default all prices are fetched and filtered.
+
+        :param trading_pairs: The trading pairs whose rates are required
+        :param quote_token: A quote symbol, if specified only pairs with the quote symbol are included for prices
+        :return: A dictionary of trading pairs and prices
+        """
+        prices = await self.get_prices(quote_token=quote_token)
+        return {pair: prices[pair] for pair in find_rate_route_pairs(available_pairs=prices, pairs=trading_pairs)}
@@ -1,5 +1,5 @@
 from decimal import Decimal
-from typing import Dict
+from typing import Dict, Iterable, List, Set
 
 from hummingbot.connector.utils import combine_to_hb_trading_pair, split_hb_trading_pair
 from hummingbot.core.gateway.utils import unwrap_token_symbol
@@ -35,3 +35,36 @@ def find_rate(prices: Dict[str, Decimal], pair: str) -> Decimal:
         common_denom_pair = combine_to_hb_trading_pair(base=quote, quote=link_quote)
         if common_denom_pair in prices:
             return proxy_price / prices[common_denom_pair]
+
+
+def find_rate_route_pairs(available_pairs: Iterable[str], pairs: Iterable[str]) -> Set[str]:
+    '''
+    Finds the subset of the available trading pairs that find_rate could use to resolve the rates of the given pairs
+    For example, given the available pairs {"HBOT-USDT", "AAVE-USDT", "USDT-GBP", "BTC-USDT"}
+    the route pairs for ["HBOT-GBP"] will be {"HBOT-USDT", "USDT-GBP"}
+    :param available_pairs: The trading pairs for which prices can be obtained
+    :param pairs: The trading pairs whose rates are required
+    '''
+    available_pairs = set(available_pairs)
+    pairs_by_base: Dict[str, List[str]] = {}
+    for available_pair in available_pairs:
+        pairs_by_base.setdefault(available_pair.split("-")[0], []).append(available_pair)
+    route_pairs = set()
+    for pair in pairs:
+        if pair in available_pairs:
+            route_pairs.add(pair)
+            continue
+        base, quote = split_hb_trading_pair(trading_pair=pair)
+        base = unwrap_token_symbol(base)
+        quote = unwrap_token_symbol(quote)
+        reverse_pair = combine_to_hb_trading_pair(base=quote, quote=base)
+        if reverse_pair in available_pairs:
+            route_pairs.add(reverse_pair)
+            continue
+        for base_pair in pairs_by_base.get(base, []):
+            link_quote = split_hb_trading_pair(base_pair)[1]
+            for link_pair in (combine_to_hb_trading_pair(base=link_quote, quote=quote),
+                              combine_to_hb_trading_pair(base=quote, quote=link_quote)):
+                if link_pair in available_pairs:
+                    route_pairs.update((base_pair, link_pair))
+    return route_pairs
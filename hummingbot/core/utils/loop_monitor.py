@@ -0,0 +1,250 @@
+import asyncio
+import logging
+import time
+from collections import deque
+from typing import Any, Callable, Deque, Dict, Optional, Tuple
+
+from hummingbot.logger import HummingbotLogger
+
+lm_logger = None
+
+
+class DurationStats:
+    """
+    Count, last, mean and max of a series of durations, in seconds.
+    """
+    __slots__ = ("count", "total", "last", "max")
+
+    def __init__(self):
+        self.count = 0
+        self.total = 0.0
+        self.last = 0.0
+        self.max = 0.0
+
+    @property
+    def mean(self) -> float:
+        return self.total / self.count if self.count > 0 else 0.0
+
+    def add(self, duration: float):
+        self.count += 1
+        self.total += duration
+        self.last = duration
+        if duration > self.max:
+            self.max = duration
+
+    def to_dict(self) -> Dict[str, float]:
+        return {"count": self.count, "last": self.last, "mean": self.mean, "max": self.max, "total": self.total}
+
+
+def callback_name(callback: Callable) -> str:
+    """
+    Name of the coroutine of a task step, or the qualified name of any other callback.
+    """
+    task = getattr(callback, "__self__", None)
+    if isinstance(task, asyncio.Task):
+        coro = task.get_coro()
+        return getattr(coro, "__qualname__", None) or repr(coro)
+    return getattr(callback, "__qualname__", None) or repr(callback)
+
+
+class LoopMonitor:
+    """
+    Measures the health of the event loop:
+    - loop lag: how late a sleeping sampler task wakes up compared to its scheduled time
+    - clock ticks: how late each tick of the clock starts, the time spent in the c_tick of each time iterator, and the
+      ticks that take longer than the tick size (overruns). Recorded by the clock the monitor is attached to.
+    - slow callbacks: loop callbacks that run longer than `slow_callback_duration`, with the name of their coroutine
+    - task CPU time (optional): CPU time spent by the callbacks of each coroutine
+
+    Callbacks are timed by wrapping `asyncio.Handle._run` while the monitor is running, so nothing is measured when it
+    is stopped.
+    """
+    _lm_shared_instance: Optional["LoopMonitor"] = None
+
+    @classmethod
+    def logger(cls) -> HummingbotLogger:
+        global lm_logger
+        if lm_logger is None:
+            lm_logger = logging.getLogger(__name__)
+        return lm_logger
+
+    @classmethod
+    def get_instance(cls) -> "LoopMonitor":
+        if cls._lm_shared_instance is None:
+            cls._lm_shared_instance = LoopMonitor()
+        return cls._lm_shared_instance
+
+    def __init__(self,
+                 lag_sample_interval: float = 0.5,
+                 slow_callback_duration: float = 0.1,
+                 sample_task_cpu: bool = False,
+                 slow_callbacks_history: int = 20):
+        self._lag_sample_interval = lag_sample_interval
+        self._slow_callback_duration = slow_callback_duration
+        self._sample_task_cpu = sample_task_cpu
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._lag_task: Optional[asyncio.Task] = None
+        self._original_handle_run: Optional[Callable] = None
+        self._start_time = 0.0
+        self.loop_lag = DurationStats()
+        self.tick_lag = DurationStats()
+        self.tick_duration = DurationStats()
+        self.tick_overruns = 0
+        self.iterator_ticks: Dict[str, DurationStats] = {}
+        self.slow_callbacks: Deque[Tuple[float, str, float]] = deque(maxlen=slow_callbacks_history)
+        self.slow_callbacks_count: Dict[str, int] = {}
+        self.task_cpu_time: Dict[str, float] = {}
+
+    @property
+    def is_running(self) -> bool:
+        return self._loop is not None
+
+    @property
+    def slow_callback_duration(self) -> float:
+        return self._slow_callback_duration
+
+    @property
+    def sample_task_cpu(self) -> bool:
+        return self._sample_task_cpu
+
+    def configure(self, slow_callback_duration: float, sample_task_cpu: bool):
+        restart = self.is_running
+        if restart:
+            self.stop()
+        self._slow_callback_duration = slow_callback_duration
+        self._sample_task_cpu = sample_task_cpu
+        if restart:
+            self.start()
+
+    def start(self, loop: Optional[asyncio.AbstractEventLoop] = None):
+        if self.is_running:
+            return
+        self.reset()
+        self._loop = loop or asyncio.get_event_loop()
+        self._start_time = time.time()
+        self._lag_task = self._loop.create_task(self._sample_loop_lag())
+        self._install_handle_timer()
+
+    def stop(self):
+        if self._lag_task is not None:
+            self._lag_task.cancel()
+            self._lag_task = None
+        self._uninstall_handle_timer()
+        self._loop = None
+
+    def reset(self):
+        self.loop_lag = DurationStats()
+        self.tick_lag = DurationStats()
+        self.tick_duration = DurationStats()
+        self.tick_overruns = 0
+        self.iterator_ticks = {}
+        self.slow_callbacks.clear()
+        self.slow_callbacks_count = {}
+        self.task_cpu_time = {}
+        self._start_time = time.time()
+
+    def record_clock_tick(self, scheduled_time: float, start_time: float, end_time: float, tick_size: float):
+        """
+        Called by the clock after each tick.
+        :param scheduled_time: the timestamp of the tick
+        :param start_time: the time at which the clock woke up for the tick
+        :param end_time: the time at which all the time iterators finished their tick
+        :param tick_size: the tick size of the clock
+        """
+        self.tick_lag.add(max(0.0, start_time - scheduled_time))
+        self.tick_duration.add(end_time - start_time)
+        if end_time - scheduled_time > tick_size:
+            self.tick_overruns += 1
+
+    def record_iterator_tick(self, iterator: Any, duration: float):
+        """
+        Called by the clock with the time spent in the c_tick of a time iterator.
+        """
+        name = getattr(iterator, "display_name", None) or type(iterator).__name__
+        stats = self.iterator_ticks.get(name)
+        if stats is None:
+            stats = DurationStats()
+            self.iterator_ticks[name] = stats
+        stats.add(duration)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "running": self.is_running,
+            "duration": time.time() - self._start_time if self.is_running else 0.0,
+            "loop_lag": self.loop_lag.to_dict(),
+            "tick_lag": self.tick_lag.to_dict(),
+            "tick_duration": self.tick_duration.to_dict(),
+            "tick_overruns": self.tick_overruns,
+            "iterator_ticks": {name: stats.to_dict() for name, stats in self.iterator_ticks.items()},
+            "slow_callbacks": [{"timestamp": timestamp, "callback": name, "duration": duration}
+                               for timestamp, name, duration in self.slow_callbacks],
+            "slow_callbacks_count": dict(self.slow_callbacks_count),
+            "task_cpu_time": dict(self.task_cpu_time),
+        }
+
+    def format_status(self, top: int = 10) -> str:
+        if not self.is_running:
+            return "Performance monitor is not running."
+        lines = [f"Performance monitor (last {time.time() - self._start_time:.0f}s):",
+                 "  Event loop lag (ms):    " + self._format_stats(self.loop_lag),
+                 "  Clock tick lag (ms):    " + self._format_stats(self.tick_lag),
+                 "  Clock tick time (ms):   " + self._format_stats(self.tick_duration),
+                 f"  Clock tick overruns:    {self.tick_overruns}"]
+        if len(self.iterator_ticks) > 0:
+            lines.append("  Time iterators c_tick (ms):")
+            for name, stats in sorted(self.iterator_ticks.items(), key=lambda item: -item[1].total)[:top]:
+                lines.append(f"    {name}: " + self._format_stats(stats))
+        lines.append(f"  Slow callbacks (>= {self._slow_callback_duration * 1000:.0f}ms): "
+                     f"{sum(self.slow_callbacks_count.values())}")
+        for name, count in sorted(self.slow_callbacks_count.items(), key=lambda item: -item[1])[:top]:
+            lines.append(f"    {name}: {count}")
+        if self._sample_task_cpu:
+            lines.append("  Task CPU time (s):")
+            for name, cpu_time in sorted(self.task_cpu_time.items(), key=lambda item: -item[1])[:top]:
+                lines.append(f"    {name}: {cpu_time:.3f}")
+        return "\n".join(lines)
+
+    @staticmethod
+    def _format_stats(stats: DurationStats) -> str:
+        return f"last {stats.last * 1000:.1f}  mean {stats.mean * 1000:.1f}  max {stats.max * 1000:.1f}"
+
+    async def _sample_loop_lag(self):
+        while True:
+            scheduled_time = self._loop.time() + self._lag_sample_interval
+            await asyncio.sleep(self._lag_sample_interval)
+            self.loop_lag.add(max(0.0, self._loop.time() - scheduled_time))
+
+    def _record_callback(self, handle: asyncio.Handle, duration: float, cpu_time: Optional[float]):
+        if duration >= self._slow_callback_duration:
+            name = callback_name(handle._callback)
+            self.slow_callbacks.append((time.time(), name, duration))
+            self.slow_callbacks_count[name] = self.slow_callbacks_count.get(name, 0) + 1
+            self.logger().warning(f"Slow callback {name} took {duration:.3f}s.")
+        if cpu_time is not None:
+            name = callback_name(handle._callback)
+            self.task_cpu_time[name] = self.task_cpu_time.get(name, 0.0) + cpu_time
+
+    def _install_handle_timer(self):
+        original_run = asyncio.Handle._run
+        monitor = self
+        perf_counter = time.perf_counter
+        thread_time = time.thread_time
+
+        def _run(handle: asyncio.Handle):
+            if handle._loop is not monitor._loop:
+                return original_run(handle)
+            cpu_start = thread_time() if monitor._sample_task_cpu else None
+            start = perf_counter()
+            original_run(handle)
+            duration = perf_counter() - start
+            cpu_time = thread_time() - cpu_start if cpu_start is not None else None
+            if duration >= monitor._slow_callback_duration or cpu_time is not None:
+                monitor._record_callback(handle, duration, cpu_time)
+
+        self._original_handle_run = original_run
+        asyncio.Handle._run = _run
+
+    def _uninstall_handle_timer(self):
+        if self._original_handle_run is not None:
+            asyncio.Handle._run = self._original_handle_run
+            self._original_handle_run = None
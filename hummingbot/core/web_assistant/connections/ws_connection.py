@@ -2,11 +2,26 @@ import asyncio
 import time
 from json import JSONDecodeError
 from typing import Any, Dict, Mapping, Optional
+from urllib.parse import urlparse
 
 import aiohttp
 
+from hummingbot.core.metrics.metrics_registry import CounterValue, MetricsRegistry
 from hummingbot.core.web_assistant.connections.data_types import WSRequest, WSResponse
 
+WS_CONNECTIONS = MetricsRegistry.get_instance().counter(
+    "hummingbot_ws_connections",
+    "Websocket connections opened, reconnections included.",
+    ["endpoint"])
+WS_MESSAGES = MetricsRegistry.get_instance().counter(
+    "hummingbot_ws_messages",
+    "Websocket messages received.",
+    ["endpoint"])
+WS_RECEIVED_BYTES = MetricsRegistry.get_instance().counter(
+    "hummingbot_ws_received_bytes",
+    "Size of the websocket messages received (characters for text messages).",
+    ["endpoint"])
+
 
 class WSConnection:
     def __init__(self, aiohttp_client_session: aiohttp.ClientSession):
@@ -15,6 +30,8 @@ class WSConnection:
         self._connected = False
         self._message_timeout: Optional[float] = None
         self._last_recv_time = 0
+        self._messages_metric: Optional[CounterValue] = None
+        self._received_bytes_metric: Optional[CounterValue] = None
 
     @property
     def last_recv_time(self) -> float:
@@ -40,6 +57,11 @@ class WSConnection:
         )
         self._message_timeout = message_timeout
         self._connected = True
+        # Only the host is used as label, the path of private streams can contain a listen key
+        endpoint = urlparse(ws_url).hostname or ""
+        WS_CONNECTIONS.labels(endpoint).inc()
+        self._messages_metric = WS_MESSAGES.labels(endpoint)
+        self._received_bytes_metric = WS_RECEIVED_BYTES.labels(endpoint)
 
     async def disconnect(self):
         if self._connection is not None and not self._connection.closed:
@@ -83,6 +105,10 @@ class WSConnection:
     async def _process_message(self, msg: aiohttp.WSMessage) -> Optional[aiohttp.WSMessage]:
         msg = await self._check_msg_types(msg)
         self._update_last_recv_time(msg)
+        if msg is not None and self._messages_metric is not None:
+            self._messages_metric.inc()
+            if isinstance(msg.data, (str, bytes)):
+                self._received_bytes_metric.inc(len(msg.data))
         return msg
 
     async def _check_msg_types(self, msg: aiohttp.WSMessage) -> Optional[aiohttp.WSMessage]:
@@ -8,6 +8,9 @@ CANDLES_ENDPOINT = "/fapi/v1/klines"
 
 WSS_URL = "wss://fstream.binance.com/ws"
 
+# Streams sent in each SUBSCRIBE message when the candles of several pairs share a connection
+MAX_STREAMS_PER_SUBSCRIPTION = 100
+
 INTERVALS = bidict({
     "1m": 60,
     "3m": 180,
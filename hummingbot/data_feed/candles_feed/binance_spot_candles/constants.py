@@ -8,6 +8,9 @@ CANDLES_ENDPOINT = "/api/v3/klines"
 
 WSS_URL = "wss://stream.binance.com:9443/ws"
 
+# Streams sent in each SUBSCRIBE message when the candles of several pairs share a connection
+MAX_STREAMS_PER_SUBSCRIPTION = 100
+
 INTERVALS = bidict({
     "1s": "1s",
     "1m": "1m",
@@ -1,7 +1,7 @@
 import asyncio
 import os
 from collections import deque
-from typing import Optional
+from typing import Any, Dict, List, Optional
 
 import pandas as pd
 from bidict import bidict
@@ -10,8 +10,10 @@ from hummingbot.core.api_throttler.async_throttler import AsyncThrottler
 from hummingbot.core.network_base import NetworkBase
 from hummingbot.core.network_iterator import NetworkStatus
 from hummingbot.core.utils.async_utils import safe_ensure_future
+from hummingbot.core.web_assistant.connections.data_types import WSRequest
 from hummingbot.core.web_assistant.web_assistants_factory import WebAssistantsFactory
 from hummingbot.core.web_assistant.ws_assistant import WSAssistant
+from hummingbot.data_feed.candles_feed.candles_hub import CandlesHub
 
 
 class CandlesBase(NetworkBase):
@@ -48,6 +50,7 @@ class CandlesBase(NetworkBase):
         self._api_factory = WebAssistantsFactory(throttler=async_throttler)
         self._candles = deque(maxlen=max_records)
         self._listen_candles_task: Optional[asyncio.Task] = None
+        self._hub: Optional[CandlesHub] = None
         self._trading_pair = trading_pair
         self._ex_trading_pair = self.get_exchange_trading_pair(trading_pair)
         if interval in self.intervals.keys():
@@ -59,18 +62,27 @@ class CandlesBase(NetworkBase):
 
     async def start_network(self):
         """
-        This method starts the network and starts a task for listen_for_subscriptions.
+        This method starts the network and starts a task for listen_for_subscriptions. When the candles feed supports
+        multiplexing (hub_key is not None) it subscribes to the hub of the exchange instead, which shares one websocket
+        connection between all the candles feeds of the exchange.
         """
         await self.stop_network()
-        self._listen_candles_task = safe_ensure_future(self.listen_for_subscriptions())
+        if self.hub_key is not None:
+            self._hub = CandlesHub.get_instance(self)
+            self._hub.subscribe(self)
+        else:
+            self._listen_candles_task = safe_ensure_future(self.listen_for_subscriptions())
 
     async def stop_network(self):
         """
-        This method stops the network by canceling the _listen_candles_task task.
+        This method stops the network by canceling the _listen_candles_task task or unsubscribing from the hub.
         """
         if self._listen_candles_task is not None:
             self._listen_candles_task.cancel()
             self._listen_candles_task = None
+        if self._hub is not None:
+            self._hub.unsubscribe(self)
+            self._hub = None
 
     @property
     def is_ready(self):
@@ -107,6 +119,33 @@ class CandlesBase(NetworkBase):
     def intervals(self):
         raise NotImplementedError
 
+    @property
+    def hub_key(self) -> Optional[str]:
+        """
+        Key of the CandlesHub shared by the candles feeds that can be multiplexed over the same websocket connection.
+        None when the candles feed opens its own connection.
+        """
+        return None
+
+    @property
+    def stream_name(self) -> str:
+        """
+        Name of the websocket stream of the trading pair and interval, used by the hub to route the messages.
+        """
+        raise NotImplementedError
+
+    def get_stream_name_from_message(self, data: Dict[str, Any]) -> Optional[str]:
+        """
+        Returns the stream name of a websocket message, or None if it is not a candle message.
+        """
+        raise NotImplementedError
+
+    def get_subscription_requests(self, stream_names: List[str]) -> List[WSRequest]:
+        """
+        Returns the websocket requests that subscribe to the given streams over one connection.
+        """
+        raise NotImplementedError
+
     async def check_network(self) -> NetworkStatus:
         raise NotImplementedError
 
@@ -189,6 +228,15 @@ class CandlesBase(NetworkBase):
         raise NotImplementedError
 
     async def _process_websocket_messages(self, websocket_assistant: WSAssistant):
+        async for ws_response in websocket_assistant.iter_messages():
+            data: Dict[str, Any] = ws_response.data
+            if data is not None:  # data will be None when the websocket is disconnected
+                self._process_websocket_message(data)
+
+    def _process_websocket_message(self, data: Dict[str, Any]):
+        """
+        Updates the candles with a message of the websocket stream of the candles feed.
+        """
         raise NotImplementedError
 
     async def _sleep(self, delay):
@@ -0,0 +1,219 @@
+import asyncio
+import logging
+import time
+from typing import TYPE_CHECKING, Dict, List, Optional, Set
+
+from hummingbot.core.api_throttler.async_throttler import AsyncThrottler
+from hummingbot.core.utils.async_utils import safe_ensure_future
+from hummingbot.core.web_assistant.web_assistants_factory import WebAssistantsFactory
+from hummingbot.core.web_assistant.ws_assistant import WSAssistant
+from hummingbot.logger import HummingbotLogger
+
+if TYPE_CHECKING:  # pragma: no cover
+    from hummingbot.data_feed.candles_feed.candles_base import CandlesBase
+
+
+class CandlesHub:
+    """
+    Shares one websocket connection between all the candles feeds of an exchange.
+
+    The candles feeds subscribe their stream (pair and interval) to the hub of their websocket URL instead of opening
+    their own connection. The hub subscribes all the streams over a single connection, routes every message to the
+    feeds of its stream, and gives all of them the same web assistants factory, so the historical candles backfills
+    of all the feeds run concurrently under one throttler.
+    """
+    _logger: Optional[HummingbotLogger] = None
+    _hubs: Dict[str, "CandlesHub"] = {}
+    # Streams subscribed while connected are sent together after this delay, to respect the exchange message limits
+    subscription_batch_delay = 0.2
+
+    @classmethod
+    def logger(cls) -> HummingbotLogger:
+        if cls._logger is None:
+            cls._logger = logging.getLogger(__name__)
+        return cls._logger
+
+    @classmethod
+    def get_instance(cls, candles: "CandlesBase") -> "CandlesHub":
+        hub = cls._hubs.get(candles.hub_key)
+        if hub is None:
+            hub = cls(candles)
+            cls._hubs[candles.hub_key] = hub
+        return hub
+
+    def __init__(self, candles: "CandlesBase"):
+        self._hub_key = candles.hub_key
+        self._wss_url = candles.wss_url
+        self._api_factory = WebAssistantsFactory(throttler=AsyncThrottler(rate_limits=candles.rate_limits))
+        self._subscribers: Dict[str, List["CandlesBase"]] = {}
+        self._subscribed_streams: Set[str] = set()
+        self._pending_streams: Set[str] = set()
+        self._subscribe_task: Optional[asyncio.Task] = None
+        self._not_ready: Set["CandlesBase"] = set()
+        self._ws_assistant: Optional[WSAssistant] = None
+        self._listen_task: Optional[asyncio.Task] = None
+        self._connections_count = 0
+        self._start_time: Optional[float] = None
+        self._startup_time: Optional[float] = None
+
+    @property
+    def api_factory(self) -> WebAssistantsFactory:
+        return self._api_factory
+
+    @property
+    def streams(self) -> List[str]:
+        return list(self._subscribers.keys())
+
+    @property
+    def subscribers_count(self) -> int:
+        return sum(len(subscribers) for subscribers in self._subscribers.values())
+
+    @property
+    def connections_count(self) -> int:
+        """
+        Number of websocket connections opened by the hub since it was created, reconnections included.
+        """
+        return self._connections_count
+
+    @property
+    def startup_time(self) -> Optional[float]:
+        """
+        Seconds from the start of the hub until all its candles feeds were ready, None while they are not.
+        """
+        return self._startup_time
+
+    def subscribe(self, candles: "CandlesBase"):
+        stream = candles.stream_name
+        subscribers = self._subscribers.setdefault(stream, [])
+        if candles in subscribers:
+            return
+        subscribers.append(candles)
+        candles._api_factory = self._api_factory
+        if not candles.is_ready:
+            self._not_ready.add(candles)
+        if self._listen_task is None:
+            self._start_time = time.perf_counter()
+            self._startup_time = None
+            self._listen_task = safe_ensure_future(self.listen_for_subscriptions())
+        elif self._ws_assistant is not None and stream not in self._subscribed_streams:
+            self._pending_streams.add(stream)
+            if self._subscribe_task is None:
+                self._subscribe_task = safe_ensure_future(self._subscribe_pending_streams())
+
+    def unsubscribe(self, candles: "CandlesBase"):
+        stream = candles.stream_name
+        subscribers = self._subscribers.get(stream, [])
+        if candles in subscribers:
+            subscribers.remove(candles)
+        self._not_ready.discard(candles)
+        if len(subscribers) == 0:
+            self._subscribers.pop(stream, None)
+        if len(self._subscribers) == 0:
+            self.stop()
+
+    def stop(self):
+        if self._listen_task is not None:
+            self._listen_task.cancel()
+            self._listen_task = None
+        self._cancel_pending_subscriptions()
+        self._ws_assistant = None
+        self._subscribed_streams.clear()
+        if self._hubs.get(self._hub_key) is self:
+            del self._hubs[self._hub_key]
+
+    def status(self) -> Dict[str, float]:
+        return {
+            "streams": len(self._subscribers),
+            "subscribers": self.subscribers_count,
+            "connections": self._connections_count,
+            "startup_time": self._startup_time,
+        }
+
+    async def listen_for_subscriptions(self):
+        ws: Optional[WSAssistant] = None
+        while True:
+            try:
+                ws = await self._api_factory.get_ws_assistant()
+                await ws.connect(ws_url=self._wss_url, ping_timeout=30)
+                self._connections_count += 1
+                self._ws_assistant = ws
+                self._cancel_pending_subscriptions()
+                await self._subscribe_streams(ws, list(self._subscribers.keys()))
+                await self._process_websocket_messages(ws)
+            except asyncio.CancelledError:
+                raise
+            except ConnectionError as connection_exception:
+                self.logger().warning(f"The candles websocket connection was closed ({connection_exception})")
+            except Exception:
+                self.logger().exception(
+                    "Unexpected error occurred when listening to public klines. Retrying in 1 seconds...",
+                )
+                await self._sleep(1.0)
+            finally:
+                await self._on_stream_interruption(ws)
+                ws = None
+
+    async def _subscribe_streams(self, ws: WSAssistant, streams: List[str]):
+        subscribers = [candles for stream in streams for candles in self._subscribers.get(stream, [])]
+        if len(subscribers) == 0:
+            return
+        for request in subscribers[0].get_subscription_requests(streams):
+            await ws.send(request)
+        self._subscribed_streams.update(streams)
+        self.logger().info(f"Subscribed to {len(streams)} kline streams on {self._wss_url} "
+                           f"({len(self._subscribed_streams)} streams over one connection).")
+
+    async def _subscribe_pending_streams(self):
+        try:
+            await self._sleep(self.subscription_batch_delay)
+            streams = [stream for stream in self._pending_streams if stream in self._subscribers]
+            self._pending_streams.clear()
+            if self._ws_assistant is not None:
+                await self._subscribe_streams(self._ws_assistant, streams)
+        finally:
+            self._subscribe_task = None
+
+    def _cancel_pending_subscriptions(self):
+        if self._subscribe_task is not None:
+            self._subscribe_task.cancel()
+            self._subscribe_task = None
+        self._pending_streams.clear()
+
+    async def _process_websocket_messages(self, ws: WSAssistant):
+        async for ws_response in ws.iter_messages():
+            data = ws_response.data
+            if data is None:
+                continue
+            subscribers = self._subscribers.get(self._stream_name_from_message(data))
+            if subscribers is None:
+                continue
+            for candles in subscribers:
+                candles._process_websocket_message(data)
+            if len(self._not_ready) > 0:
+                self._check_startup()
+
+    def _stream_name_from_message(self, data) -> Optional[str]:
+        for subscribers in self._subscribers.values():
+            return subscribers[0].get_stream_name_from_message(data)
+        return None
+
+    def _check_startup(self):
+        self._not_ready = {candles for candles in self._not_ready if not candles.is_ready}
+        if len(self._not_ready) == 0 and self._startup_time is None and self._start_time is not None:
+            self._startup_time = time.perf_counter() - self._start_time
+            self.logger().info(f"{self.subscribers_count} candles feeds of {len(self._subscribers)} streams ready in "
+                               f"{self._startup_time:.2f}s using {self._connections_count} websocket connection(s).")
+
+    async def _on_stream_interruption(self, ws: Optional[WSAssistant]):
+        self._cancel_pending_subscriptions()
+        self._ws_assistant = None
+        self._subscribed_streams.clear()
+        if ws is not None:
+            await ws.disconnect()
+        for subscribers in self._subscribers.values():
+            for candles in subscribers:
+                candles._candles.clear()
+                self._not_ready.add(candles)
+
+    async def _sleep(self, delay: float):
+        await asyncio.sleep(delay)
@@ -0,0 +1,236 @@
+import logging
+import queue
+import re
+import threading
+from logging.handlers import TimedRotatingFileHandler
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from . import NETWORK
+
+# Formatter fields that need the caller lookup (a stack walk) when the record is created
+CALLER_FIELDS_PATTERN = re.compile(r"%\((pathname|filename|module|lineno|funcName)\)|\{(pathname|filename|module|lineno|"
+                                   r"funcName)[}!:]")
+
+_STOP = object()
+
+
+class BatchedTimedRotatingFileHandler(TimedRotatingFileHandler):
+    """
+    Timed rotating file handler that flushes the file once per batch of records when used by the log queue listener,
+    instead of once per record.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._batching = False
+
+    def start_batch(self):
+        self._batching = True
+
+    def end_batch(self):
+        self._batching = False
+        self.flush()
+
+    def flush(self):
+        if not self._batching:
+            super().flush()
+
+
+class LogRateLimiter:
+    """
+    Limits the records logged by each call site to `burst` records every `interval` seconds.
+
+    The call site of a record is identified by its logger, level and message template, so the caller lookup is not
+    needed and the repeated records of a retry loop are deduplicated. The first record logged by a call site after
+    records were dropped reports how many of them were dropped.
+    """
+
+    def __init__(self, interval: float = 10.0, burst: int = 5, level: int = NETWORK, max_sites: int = 10000):
+        self._interval = interval
+        self._burst = burst
+        self._level = level
+        self._max_sites = max_sites
+        # call site -> [window start, records logged in the window, records dropped in the window]
+        self._sites: Dict[Tuple[str, int, Any], List] = {}
+
+    @property
+    def suppressed_count(self) -> int:
+        return sum(site[2] for site in self._sites.values())
+
+    def allow(self, record: logging.LogRecord) -> bool:
+        if record.levelno < self._level:
+            return True
+        key = (record.name, record.levelno, record.msg if isinstance(record.msg, str) else id(record.msg))
+        site = self._sites.get(key)
+        if site is None or record.created - site[0] >= self._interval:
+            if site is not None and site[2] > 0:
+                record.msg = f"{record.msg} (repeated {site[2]} more times in the last " \
+                             f"{record.created - site[0]:.0f}s)"
+            elif site is None and len(self._sites) >= self._max_sites:
+                self._remove_expired_sites(record.created)
+            self._sites[key] = [record.created, 1, 0]
+            return True
+        if site[1] < self._burst:
+            site[1] += 1
+            return True
+        site[2] += 1
+        return False
+
+    def _remove_expired_sites(self, now: float):
+        self._sites = {key: site for key, site in self._sites.items() if now - site[0] < self._interval}
+        if len(self._sites) >= self._max_sites:
+            self._sites.clear()
+
+
+class LogQueueListener:
+    """
+    Background thread that formats and writes the records enqueued by the QueueLogHandlers, so the event loop thread
+    only creates the records. Records are dispatched in batches of up to `batch_size` records.
+    """
+
+    def __init__(self, batch_size: int = 100):
+        self._batch_size = batch_size
+        self._queue: queue.SimpleQueue = queue.SimpleQueue()
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def is_running(self) -> bool:
+        return self._thread is not None
+
+    def start(self):
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._run, name="hummingbot-logging", daemon=True)
+            self._thread.start()
+
+    def stop(self):
+        """
+        Writes the pending records and stops the thread.
+        """
+        if self._thread is not None:
+            thread = self._thread
+            self._thread = None
+            self._queue.put(_STOP)
+            thread.join()
+
+    def enqueue(self, record: logging.LogRecord, handlers: Tuple[logging.Handler, ...]):
+        if self._thread is None:
+            self.dispatch([(record, handlers)])
+        else:
+            self._queue.put((record, handlers))
+
+    def dispatch(self, batch: Iterable[Tuple[logging.LogRecord, Tuple[logging.Handler, ...]]]):
+        batched_handlers = set()
+        for record, handlers in batch:
+            for handler in handlers:
+                if record.levelno < handler.level:
+                    continue
+                if isinstance(handler, BatchedTimedRotatingFileHandler) and handler not in batched_handlers:
+                    handler.start_batch()
+                    batched_handlers.add(handler)
+                try:
+                    handler.handle(record)
+                except Exception:
+                    handler.handleError(record)
+        for handler in batched_handlers:
+            handler.end_batch()
+
+    def _run(self):
+        while True:
+            batch = [self._queue.get()]
+            while len(batch) < self._batch_size:
+                try:
+                    batch.append(self._queue.get_nowait())
+                except queue.Empty:
+                    break
+            stop = any(item is _STOP for item in batch)
+            self.dispatch(item for item in batch if item is not _STOP)
+            if stop:
+                return
+
+
+class QueueLogHandler(logging.Handler):
+    """
+    Handler that replaces the handlers of a logger: it applies the rate limiter and enqueues the record for the
+    listener, which passes it to the replaced handlers from its own thread.
+    """
+
+    def __init__(self,
+                 listener: LogQueueListener,
+                 handlers: Iterable[logging.Handler],
+                 rate_limiter: Optional[LogRateLimiter] = None):
+        self.handlers = tuple(handlers)
+        super().__init__(level=min((handler.level for handler in self.handlers), default=logging.NOTSET))
+        self._listener = listener
+        self._rate_limiter = rate_limiter
+
+    def emit(self, record: logging.LogRecord):
+        if self._rate_limiter is None or self._rate_limiter.allow(record):
+            self._listener.enqueue(record, self.handlers)
+
+    def close(self):
+        self._listener.stop()
+        super().close()
+
+
+_listener: Optional[LogQueueListener] = None
+_queued_loggers: List[Tuple[logging.Logger, QueueLogHandler]] = []
+_default_srcfile = logging._srcfile
+
+
+def needs_caller_lookup(handlers: Iterable[logging.Handler]) -> bool:
+    for handler in handlers:
+        formatter = handler.formatter
+        if formatter is not None and CALLER_FIELDS_PATTERN.search(formatter._fmt or ""):
+            return True
+    return False
+
+
+def install_queue_logging(config: Dict[str, Any], logger_names: Iterable[str]):
+    """
+    Moves the handlers of the given loggers behind a QueueLogHandler served by one listener thread. Disables the
+    caller lookup of the records when none of the handlers formats caller fields.
+    :param config: the `queue` section of the logging configuration (`batch_size`, `rate_limit_interval`,
+        `rate_limit_burst`, `rate_limit_level`)
+    :param logger_names: names of the configured loggers, "" for the root logger
+    """
+    global _listener
+    uninstall_queue_logging()
+    _listener = LogQueueListener(batch_size=config.get("batch_size", 100))
+    rate_limiter = None
+    if config.get("rate_limit_burst", 0) > 0:
+        rate_limit_level = config.get("rate_limit_level", NETWORK)
+        if isinstance(rate_limit_level, str):
+            rate_limit_level = logging.getLevelName(rate_limit_level)
+        rate_limiter = LogRateLimiter(interval=config.get("rate_limit_interval", 10.0),
+                                      burst=config["rate_limit_burst"],
+                                      level=rate_limit_level)
+    all_handlers = set()
+    for logger in [logging.getLogger(name) for name in logger_names]:
+        handlers = [handler for handler in logger.handlers if not isinstance(handler, logging.NullHandler)]
+        if len(handlers) == 0:
+            continue
+        queue_handler = QueueLogHandler(_listener, handlers, rate_limiter)
+        for handler in handlers:
+            logger.removeHandler(handler)
+        logger.addHandler(queue_handler)
+        _queued_loggers.append((logger, queue_handler))
+        all_handlers.update(handlers)
+    logging._srcfile = _default_srcfile if needs_caller_lookup(all_handlers) else None
+    _listener.start()
+
+
+def uninstall_queue_logging():
+    """
+    Writes the pending records, stops the listener thread and gives the loggers their handlers back.
+    """
+    global _listener
+    if _listener is not None:
+        _listener.stop()
+        _listener = None
+    for logger, queue_handler in _queued_loggers:
+        if queue_handler in logger.handlers:
+            logger.removeHandler(queue_handler)
+            for handler in queue_handler.handlers:
+                logger.addHandler(handler)
+    _queued_loggers.clear()
+    logging._srcfile = _default_srcfile
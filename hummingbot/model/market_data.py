@@ -9,7 +9,7 @@ from hummingbot.model.decimal_type_decorator import SqliteDecimal
 class MarketData(HummingbotBase):
     __tablename__ = "MarketData"
     __table_args__ = (
-        Index("timestamp", "exchange", "trading_pair"),
+        Index("md_exchange_trading_pair_timestamp_index", "exchange", "trading_pair", "timestamp"),
     )
 
     timestamp = Column(SqliteDecimal(6), primary_key=True, nullable=False)
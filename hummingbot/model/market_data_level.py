@@ -0,0 +1,28 @@
+import inspect
+
+from sqlalchemy import BigInteger, Column, Float, Index, Integer, Text
+
+from hummingbot.model import HummingbotBase
+
+
+class MarketDataLevel(HummingbotBase):
+    """
+    An order book level of a market data sample, stored in numeric columns so the samples can be inserted in bulk
+    and range queried by market and timestamp without decoding the MarketData JSON documents.
+    """
+    __tablename__ = "MarketDataLevel"
+    __table_args__ = (
+        Index("mdl_timestamp_index", "timestamp"),
+    )
+
+    exchange = Column(Text, primary_key=True, nullable=False)
+    trading_pair = Column(Text, primary_key=True, nullable=False)
+    timestamp = Column(BigInteger, primary_key=True, nullable=False)
+    side = Column(Text, primary_key=True, nullable=False)
+    level = Column(Integer, primary_key=True, nullable=False)
+    price = Column(Float, nullable=False)
+    amount = Column(Float, nullable=False)
+
+    def __repr__(self) -> str:
+        list_of_fields = [f"{name}: {value}" for name, value in inspect.getmembers(self) if isinstance(value, Column)]
+        return ','.join(list_of_fields)
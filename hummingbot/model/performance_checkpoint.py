@@ -0,0 +1,24 @@
+#!/usr/bin/env python
+
+from sqlalchemy import JSON, BigInteger, Column, Index, Integer, Text
+
+from . import HummingbotBase
+
+
+class PerformanceCheckpoint(HummingbotBase):
+    __tablename__ = "PerformanceCheckpoint"
+    __table_args__ = (Index("pc_config_start_market_symbol_index",
+                            "config_file_path", "start_timestamp", "market", "symbol", unique=True),)
+
+    id = Column(Integer, primary_key=True, nullable=False)
+    config_file_path = Column(Text, nullable=False)
+    start_timestamp = Column(BigInteger, nullable=False)
+    market = Column(Text, nullable=False)
+    symbol = Column(Text, nullable=False)
+    timestamp = Column(BigInteger, nullable=False)
+    ledger = Column(JSON, nullable=False)
+
+    def __repr__(self) -> str:
+        return f"PerformanceCheckpoint(id='{self.id}', config_file_path='{self.config_file_path}', " \
+            f"start_timestamp={self.start_timestamp}, market='{self.market}', symbol='{self.symbol}', " \
+            f"timestamp={self.timestamp}, ledger={self.ledger})"
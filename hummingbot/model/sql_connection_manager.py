@@ -1,14 +1,16 @@
 import logging
+import time
 from enum import Enum
-from os.path import join
-from typing import TYPE_CHECKING, Optional
+from os.path import basename, join, splitext
+from typing import TYPE_CHECKING, Dict, Optional
 
-from sqlalchemy import MetaData, create_engine, inspect
+from sqlalchemy import MetaData, create_engine, event, inspect
 from sqlalchemy.engine.base import Engine
 from sqlalchemy.orm import Query, Session, sessionmaker
 from sqlalchemy.schema import DropConstraint, ForeignKeyConstraint, Table
 
 from hummingbot import data_path
+from hummingbot.core.metrics.metrics_registry import MetricsRegistry
 from hummingbot.logger.logger import HummingbotLogger
 from hummingbot.model import get_declarative_base
 from hummingbot.model.metadata import Metadata as LocalMetadata
@@ -17,6 +19,11 @@ from hummingbot.model.transaction_base import TransactionBase
 if TYPE_CHECKING:
     from hummingbot.client.config.config_helpers import ClientConfigAdapter
 
+DB_WRITE_LATENCY = MetricsRegistry.get_instance().histogram(
+    "hummingbot_db_write_latency_seconds",
+    "Time spent flushing and committing the database transactions.",
+    ["database"])
+
 
 class SQLConnectionType(Enum):
     TRADE_FILLS = 1
@@ -73,6 +80,7 @@ class SQLConnectionManager(TransactionBase):
 
         if connection_type is SQLConnectionType.TRADE_FILLS:
             self._engine: Engine = create_engine(client_config_map.db_mode.get_url(self.db_path))
+            self._set_connection_pragmas(client_config_map.db_mode.get_pragmas())
             self._metadata: MetaData = self.get_declarative_base().metadata
             self._metadata.create_all(self._engine)
 
@@ -92,10 +100,37 @@ class SQLConnectionManager(TransactionBase):
                             conn.execute(DropConstraint(fk_constraint))
 
         self._session_cls = sessionmaker(bind=self._engine)
+        self._observe_write_latency()
 
         if connection_type is SQLConnectionType.TRADE_FILLS and (not called_from_migrator):
             self.check_and_migrate_db(client_config_map)
 
+    def _set_connection_pragmas(self, pragmas: Dict[str, str]):
+        if len(pragmas) == 0 or self._engine.dialect.name != "sqlite":
+            return
+
+        def set_pragmas(dbapi_connection, _):
+            cursor = dbapi_connection.cursor()
+            for name, value in pragmas.items():
+                cursor.execute(f"PRAGMA {name}={value}")
+            cursor.close()
+
+        event.listen(self._engine, "connect", set_pragmas)
+
+    def _observe_write_latency(self):
+        write_latency_metric = DB_WRITE_LATENCY.labels(splitext(basename(self.db_path))[0])
+
+        def before_commit(session: Session):
+            session.info["commit_start_time"] = time.perf_counter()
+
+        def after_commit(session: Session):
+            start_time = session.info.pop("commit_start_time", None)
+            if start_time is not None:
+                write_latency_metric.observe(time.perf_counter() - start_time)
+
+        event.listen(self._session_cls, "before_commit", before_commit)
+        event.listen(self._session_cls, "after_commit", after_commit)
+
     @property
     def engine(self) -> Engine:
         return self._engine
@@ -10,9 +10,11 @@ from hummingbot.core.event.events import (
     BuyOrderCompletedEvent,
     SellOrderCompletedEvent
 )
+from .pmm_script_channel import SharedMarketState
 from .pmm_script_interface import (
     CallLog,
     CallNotify,
+    OnBalances,
     OnCommand,
     OnStatus,
     OnTick,
@@ -30,6 +32,7 @@ class PMMScriptBase:
     def __init__(self):
         self._parent_queue: Queue = None
         self._child_queue: Queue = None
+        self._market_state: Optional[SharedMarketState] = None
         self._queue_check_interval: float = 0.0
         self.mid_prices: List[Decimal] = []
         self.max_mid_prices_length: int = 86400  # 60 * 60 * 24 = 1 day of prices
@@ -41,10 +44,12 @@ class PMMScriptBase:
         # all_available_balances has the same data structure as all_total_balances
         self.all_available_balances: Dict[str, Dict[str, Decimal]] = None
 
-    def assign_init(self, parent_queue: Queue, child_queue: Queue, queue_check_interval: float):
+    def assign_init(self, parent_queue: Queue, child_queue: Queue, queue_check_interval: float,
+                    market_state: Optional[SharedMarketState] = None):
         self._parent_queue = parent_queue
         self._child_queue = child_queue
         self._queue_check_interval = queue_check_interval
+        self._market_state = market_state
 
     @property
     def mid_price(self):
@@ -59,8 +64,15 @@ class PMMScriptBase:
     async def listen_to_parent(self):
         while True:
             try:
+                # The parameters and balances of a tick are queued before the tick is published, so the ticks
+                # published before the queue is found empty are processed with their parameters and balances.
+                last_tick_sequence = self._market_state.sequence if self._market_state is not None else 0
                 if self._parent_queue.empty():
-                    await asyncio.sleep(self._queue_check_interval)
+                    if self._market_state is not None and self._market_state.has_new_ticks():
+                        for _, mid_price in self._market_state.read_new_ticks(last_tick_sequence):
+                            self._process_tick(mid_price)
+                    else:
+                        await asyncio.sleep(self._queue_check_interval)
                     continue
                 item = self._parent_queue.get()
                 # print(f"child gets {str(item)}")
@@ -69,13 +81,15 @@ class PMMScriptBase:
                     asyncio.get_event_loop().stop()
                     break
                 if isinstance(item, OnTick):
-                    self.mid_prices.append(item.mid_price)
-                    if len(self.mid_prices) > self.max_mid_prices_length:
-                        self.mid_prices = self.mid_prices[len(self.mid_prices) - self.max_mid_prices_length:]
                     self.pmm_parameters = item.pmm_parameters
                     self.all_total_balances = item.all_total_balances
                     self.all_available_balances = item.all_available_balances
-                    self.on_tick()
+                    self._process_tick(item.mid_price)
+                elif isinstance(item, PMMParameters):
+                    self.pmm_parameters = item
+                elif isinstance(item, OnBalances):
+                    self.all_total_balances = item.all_total_balances
+                    self.all_available_balances = item.all_available_balances
                 elif isinstance(item, BuyOrderCompletedEvent):
                     self.on_buy_order_completed(item)
                 elif isinstance(item, SellOrderCompletedEvent):
@@ -96,6 +110,12 @@ class PMMScriptBase:
                 tb = "".join(traceback.TracebackException.from_exception(e).format())
                 self._child_queue.put(ScriptError(e, tb))
 
+    def _process_tick(self, mid_price: Decimal):
+        self.mid_prices.append(mid_price)
+        if len(self.mid_prices) > self.max_mid_prices_length:
+            self.mid_prices = self.mid_prices[len(self.mid_prices) - self.max_mid_prices_length:]
+        self.on_tick()
+
     def notify(self, msg: str):
         """
         Notifies the user, the message will appear on top left panel of HB application.
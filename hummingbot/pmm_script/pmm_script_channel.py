@@ -0,0 +1,219 @@
+import os
+import pickle
+import queue
+import struct
+import time
+from decimal import Decimal
+from multiprocessing.shared_memory import SharedMemory
+from typing import Any, List, Optional, Tuple
+
+_POSITION = struct.Struct("Q")
+_LENGTH = struct.Struct("I")
+
+
+class SharedMemoryQueue:
+    """
+    Single producer, single consumer queue of pickled objects in a shared memory ring buffer.
+
+    It has the `put`, `get` and `empty` interface of the multiprocessing queues it replaces between the PMM script
+    iterator and the script process, without the pipe write, locks and feeder thread of a multiprocessing queue:
+    `empty` reads a shared counter, which makes polling the queue cheap. The producer only writes the write position
+    and the consumer only writes the read position, both counting the bytes ever written / read.
+    """
+
+    def __init__(self, capacity: int = 1 << 20):
+        self._capacity = capacity
+        self._shm = SharedMemory(create=True, size=2 * _POSITION.size + capacity)
+        self._owner_pid = os.getpid()
+        self._init_views()
+        _POSITION.pack_into(self._buf, 0, 0)
+        _POSITION.pack_into(self._buf, _POSITION.size, 0)
+
+    def __getstate__(self):
+        return {"name": self._shm.name, "capacity": self._capacity}
+
+    def __setstate__(self, state):
+        self._capacity = state["capacity"]
+        self._shm = SharedMemory(name=state["name"])
+        self._owner_pid = None
+        self._init_views()
+
+    def _init_views(self):
+        self._buf = self._shm.buf
+        self._data_offset = 2 * _POSITION.size
+
+    @property
+    def name(self) -> str:
+        return self._shm.name
+
+    def qsize(self) -> int:
+        return self._write_position() - self._read_position()
+
+    def empty(self) -> bool:
+        return self._write_position() == self._read_position()
+
+    def put(self, item: Any, block: bool = True, timeout: Optional[float] = None):
+        data = pickle.dumps(item, protocol=pickle.HIGHEST_PROTOCOL)
+        size = _LENGTH.size + len(data)
+        if size > self._capacity:
+            raise ValueError(f"The item needs {size} bytes, more than the queue capacity ({self._capacity} bytes).")
+        write_position = self._write_position()
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while self._capacity - (write_position - self._read_position()) < size:
+            if not block or (deadline is not None and time.monotonic() >= deadline):
+                raise queue.Full
+            time.sleep(0.001)
+        self._copy_in(write_position, _LENGTH.pack(len(data)))
+        self._copy_in(write_position + _LENGTH.size, data)
+        # Publish the item once it is fully written
+        _POSITION.pack_into(self._buf, 0, write_position + size)
+
+    def put_nowait(self, item: Any):
+        self.put(item, block=False)
+
+    def get(self, block: bool = True, timeout: Optional[float] = None) -> Any:
+        read_position = self._read_position()
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while self._write_position() == read_position:
+            if not block or (deadline is not None and time.monotonic() >= deadline):
+                raise queue.Empty
+            time.sleep(0.001)
+        length = _LENGTH.unpack(self._copy_out(read_position, _LENGTH.size))[0]
+        data = self._copy_out(read_position + _LENGTH.size, length)
+        _POSITION.pack_into(self._buf, _POSITION.size, read_position + _LENGTH.size + length)
+        return pickle.loads(data)
+
+    def get_nowait(self) -> Any:
+        return self.get(block=False)
+
+    def close(self):
+        """
+        Releases the shared memory, and destroys it in the process that created the queue (not in its forked children).
+        """
+        if self._shm is None:
+            return
+        self._buf = None
+        self._shm.close()
+        if self._owner_pid == os.getpid():
+            self._shm.unlink()
+        self._shm = None
+
+    def _write_position(self) -> int:
+        return _POSITION.unpack_from(self._buf, 0)[0]
+
+    def _read_position(self) -> int:
+        return _POSITION.unpack_from(self._buf, _POSITION.size)[0]
+
+    def _copy_in(self, position: int, data: bytes):
+        offset = position % self._capacity
+        first_part = min(len(data), self._capacity - offset)
+        start = self._data_offset + offset
+        self._buf[start:start + first_part] = data[:first_part]
+        if first_part < len(data):
+            self._buf[self._data_offset:self._data_offset + len(data) - first_part] = data[first_part:]
+
+    def _copy_out(self, position: int, length: int) -> bytes:
+        offset = position % self._capacity
+        first_part = min(length, self._capacity - offset)
+        start = self._data_offset + offset
+        data = bytes(self._buf[start:start + first_part])
+        if first_part < length:
+            data += bytes(self._buf[self._data_offset:self._data_offset + length - first_part])
+        return data
+
+
+class SharedMarketState:
+    """
+    Fixed-layout ring buffer of the market state published by the PMM script iterator on every tick (timestamp and
+    mid price), read by the script process without serialization.
+
+    Each slot holds its tick sequence number, written as 0 while the slot is being updated, so the reader can detect
+    the slots overwritten while it reads them. The mid price is stored as its decimal string to keep its exact value.
+    A reader that falls more than `slots` ticks behind skips the overwritten ticks and counts them in `dropped_ticks`.
+    """
+    MID_PRICE_SIZE = 64
+    _SLOT = struct.Struct(f"Qd{MID_PRICE_SIZE}s")
+
+    def __init__(self, slots: int = 1024):
+        self._slots = slots
+        self._shm = SharedMemory(create=True, size=_POSITION.size + slots * self._SLOT.size)
+        self._owner_pid = os.getpid()
+        self._buf = self._shm.buf
+        _POSITION.pack_into(self._buf, 0, 0)
+        self._sequence = 0
+        self._last_read_sequence = 0
+        self.dropped_ticks = 0
+
+    def __getstate__(self):
+        return {"name": self._shm.name, "slots": self._slots}
+
+    def __setstate__(self, state):
+        self._slots = state["slots"]
+        self._shm = SharedMemory(name=state["name"])
+        self._owner_pid = None
+        self._buf = self._shm.buf
+        self._sequence = _POSITION.unpack_from(self._buf, 0)[0]
+        self._last_read_sequence = 0
+        self.dropped_ticks = 0
+
+    @property
+    def name(self) -> str:
+        return self._shm.name
+
+    @property
+    def sequence(self) -> int:
+        """
+        The sequence number of the last published tick.
+        """
+        return _POSITION.unpack_from(self._buf, 0)[0]
+
+    def has_new_ticks(self) -> bool:
+        return self.sequence != self._last_read_sequence
+
+    def publish(self, timestamp: float, mid_price: Decimal):
+        encoded_price = str(mid_price).encode("ascii")
+        if len(encoded_price) > self.MID_PRICE_SIZE:
+            raise ValueError(f"The mid price {mid_price} does not fit in {self.MID_PRICE_SIZE} characters.")
+        sequence = self._sequence + 1
+        offset = self._slot_offset(sequence)
+        _POSITION.pack_into(self._buf, offset, 0)
+        self._SLOT.pack_into(self._buf, offset, 0, timestamp, encoded_price)
+        _POSITION.pack_into(self._buf, offset, sequence)
+        _POSITION.pack_into(self._buf, 0, sequence)
+        self._sequence = sequence
+
+    def read_new_ticks(self, last_sequence: Optional[int] = None) -> List[Tuple[float, Decimal]]:
+        """
+        Returns the (timestamp, mid price) of the ticks published since the last call, oldest first.
+        :param last_sequence: the sequence number of the last tick to read, the last published tick by default
+        """
+        if last_sequence is None:
+            last_sequence = self.sequence
+        first_sequence = max(self._last_read_sequence + 1, last_sequence - self._slots + 1)
+        self.dropped_ticks += first_sequence - self._last_read_sequence - 1
+        ticks = []
+        for sequence in range(first_sequence, last_sequence + 1):
+            offset = self._slot_offset(sequence)
+            slot_sequence, timestamp, encoded_price = self._SLOT.unpack_from(self._buf, offset)
+            if slot_sequence != sequence or _POSITION.unpack_from(self._buf, offset)[0] != sequence:
+                self.dropped_ticks += 1
+                continue
+            ticks.append((timestamp, Decimal(encoded_price.rstrip(b"\0").decode("ascii"))))
+        self._last_read_sequence = last_sequence
+        return ticks
+
+    def close(self):
+        """
+        Releases the shared memory, and destroys it in the process that created the ring buffer (not in its forked
+        children).
+        """
+        if self._shm is None:
+            return
+        self._buf = None
+        self._shm.close()
+        if self._owner_pid == os.getpid():
+            self._shm.unlink()
+        self._shm = None
+
+    def _slot_offset(self, sequence: int) -> int:
+        return _POSITION.size + (sequence % self._slots) * self._SLOT.size
@@ -112,6 +112,20 @@ class PMMMarketInfo:
         return f"{self.__class__.__name__} {str(self.__dict__)}"
 
 
+class OnBalances:
+    """
+    The balances of all the markets, sent to the script only when they change.
+    """
+    def __init__(self, all_total_balances: Dict[str, Dict[str, Decimal]],
+                 all_available_balances: Dict[str, Dict[str, Decimal]],
+                 ):
+        self.all_total_balances = all_total_balances
+        self.all_available_balances = all_available_balances
+
+    def __repr__(self):
+        return f"{self.__class__.__name__} {str(self.__dict__)}"
+
+
 class OnTick:
     def __init__(self, mid_price: Decimal,
                  pmm_parameters: PMMParameters,
@@ -15,6 +15,9 @@ cdef class PMMScriptIterator(TimeIterator):
         object _script_module
         object _parent_queue
         object _child_queue
+        object _market_state
+        object _last_pmm_parameters
+        object _last_balances
         object _ev_loop
         object _script_process
         object _listen_to_child_task
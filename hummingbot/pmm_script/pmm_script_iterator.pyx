@@ -2,7 +2,8 @@
 
 import asyncio
 import logging
-from multiprocessing import Process, Queue
+import queue
+from multiprocessing import Process
 from pathlib import Path
 from typing import List
 
@@ -16,10 +17,11 @@ from hummingbot.core.event.events import (
 )
 from hummingbot.core.event.event_forwarder import SourceInfoEventForwarder
 from hummingbot.core.utils.async_utils import safe_ensure_future
+from hummingbot.pmm_script.pmm_script_channel import SharedMarketState, SharedMemoryQueue
 from hummingbot.pmm_script.pmm_script_interface import (
     CallLog,
     CallNotify,
-    OnTick,
+    OnBalances,
     OnCommand,
     OnStatus,
     PMMParameters,
@@ -59,13 +61,19 @@ cdef class PMMScriptIterator(TimeIterator):
             (MarketEvent.SellOrderCompleted, self._did_complete_sell_order_forwarder)
         ]
         self._ev_loop = asyncio.get_event_loop()
-        self._parent_queue = Queue()
-        self._child_queue = Queue()
+        # The market state of each tick is published in shared memory, the other messages go through shared memory
+        # queues, and the strategy parameters and balances are only sent when they change.
+        self._parent_queue = SharedMemoryQueue()
+        self._child_queue = SharedMemoryQueue()
+        self._market_state = SharedMarketState()
+        self._last_pmm_parameters = None
+        self._last_balances = None
         self._listen_to_child_task = safe_ensure_future(self.listen_to_child_queue(), loop=self._ev_loop)
 
         self._script_process = Process(
             target=run_pmm_script,
-            args=(str(script_file_path), self._parent_queue, self._child_queue, queue_check_interval,)
+            args=(str(script_file_path), self._parent_queue, self._child_queue, queue_check_interval,
+                  self._market_state,)
         )
         self.logger().info(f"starting PMM script in {script_file_path}")
         self._script_process.start()
@@ -85,10 +93,12 @@ cdef class PMMScriptIterator(TimeIterator):
     cdef c_stop(self, Clock clock):
         TimeIterator.c_stop(self, clock)
         self._parent_queue.put(None)
-        self._child_queue.put(None)
         self._script_process.join()
         if self._listen_to_child_task is not None:
             self._listen_to_child_task.cancel()
+        self._parent_queue.close()
+        self._child_queue.close()
+        self._market_state.close()
 
     cdef c_tick(self, double timestamp):
         TimeIterator.c_tick(self, timestamp)
@@ -99,21 +109,34 @@ cdef class PMMScriptIterator(TimeIterator):
             if attr[:1] != '_':
                 param_value = getattr(self._strategy, attr)
                 setattr(pmm_strategy, attr, param_value)
-        cdef object on_tick = OnTick(self.strategy.get_mid_price(), pmm_strategy,
-                                     self.all_total_balances(), self.all_available_balances())
-        self._parent_queue.put(on_tick)
+        if self._last_pmm_parameters is None or pmm_strategy.__dict__ != self._last_pmm_parameters.__dict__:
+            if self._send_to_script(pmm_strategy):
+                self._last_pmm_parameters = pmm_strategy
+        cdef object balances = (self.all_total_balances(), self.all_available_balances())
+        if balances != self._last_balances:
+            if self._send_to_script(OnBalances(*balances)):
+                self._last_balances = balances
+        self._market_state.publish(timestamp, self.strategy.get_mid_price())
+
+    def _send_to_script(self, item) -> bool:
+        try:
+            self._parent_queue.put_nowait(item)
+            return True
+        except queue.Full:
+            self.logger().warning(f"The PMM script queue is full, {type(item).__name__} not sent to the script.")
+            return False
 
     def _did_complete_buy_order(self,
                                 event_tag: int,
                                 market: ExchangeBase,
                                 event: BuyOrderCompletedEvent):
-        self._parent_queue.put(event)
+        self._send_to_script(event)
 
     def _did_complete_sell_order(self,
                                  event_tag: int,
                                  market: ExchangeBase,
                                  event: SellOrderCompletedEvent):
-        self._parent_queue.put(event)
+        self._send_to_script(event)
 
     async def listen_to_child_queue(self):
         while True:
@@ -141,10 +164,10 @@ cdef class PMMScriptIterator(TimeIterator):
                 self.logger().info("Unexpected error listening to child queue.", exc_info=True)
 
     def request_status(self):
-        self._parent_queue.put(OnStatus())
+        self._send_to_script(OnStatus())
 
     def request_command(self, cmd: str, args: List[str]):
-        self._parent_queue.put(OnCommand(cmd, args))
+        self._send_to_script(OnCommand(cmd, args))
 
     def all_total_balances(self):
         all_bals = {m.name: m.get_all_balances() for m in self._markets}
@@ -4,15 +4,18 @@ import inspect
 import os
 
 from multiprocessing import Queue
+from typing import Optional
 from hummingbot.pmm_script.pmm_script_base import PMMScriptBase
+from hummingbot.pmm_script.pmm_script_channel import SharedMarketState
 from hummingbot.pmm_script.pmm_script_interface import CallNotify, set_child_queue
 
 
-def run_pmm_script(script_file_name: str, parent_queue: Queue, child_queue: Queue, queue_check_interval: float):
+def run_pmm_script(script_file_name: str, parent_queue: Queue, child_queue: Queue, queue_check_interval: float,
+                   market_state: Optional[SharedMarketState] = None):
     try:
         script_class = import_pmm_script_sub_class(script_file_name)
         script = script_class()
-        script.assign_init(parent_queue, child_queue, queue_check_interval)
+        script.assign_init(parent_queue, child_queue, queue_check_interval, market_state)
         set_child_queue(child_queue)
         policy = asyncio.get_event_loop_policy()
         policy.set_event_loop(policy.new_event_loop())
@@ -96,6 +96,7 @@ class ImportCommandMessage(RPCMessage):
 class StatusCommandMessage(RPCMessage):
     class Request(RPCMessage.Request):
         async_backend: Optional[bool] = True
+        perf: Optional[bool] = False
 
     class Response(RPCMessage.Response):
         status: Optional[int] = MQTT_STATUS_CODE.SUCCESS
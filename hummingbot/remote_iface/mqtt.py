@@ -29,6 +29,7 @@ from hummingbot.core.event import events
 from hummingbot.core.event.event_forwarder import SourceInfoEventForwarder
 from hummingbot.core.pubsub import PubSub
 from hummingbot.core.utils.async_utils import call_sync, safe_ensure_future
+from hummingbot.core.utils.loop_monitor import LoopMonitor
 from hummingbot.notifier.notifier_base import NotifierBase
 from hummingbot.remote_iface.messages import (
     MQTT_STATUS_CODE,
@@ -284,6 +285,15 @@ class MQTTCommands:
         response = StatusCommandMessage.Response()
         timeout = 30  # seconds
         try:
+            if msg.perf:
+                monitor = LoopMonitor.get_instance()
+                if monitor.is_running:
+                    response.msg = monitor.format_status()
+                    response.data = monitor.to_dict()
+                else:
+                    self._ev_loop.call_soon_threadsafe(self._hb_app.start_performance_monitor)
+                    response.msg = 'Performance monitor started.'
+                return response
             if self._hb_app.strategy is None:
                 response.status = MQTT_STATUS_CODE.ERROR
                 response.msg = 'No strategy is currently running!'
@@ -0,0 +1,273 @@
+import asyncio
+import heapq
+import itertools
+import logging
+import weakref
+from typing import TYPE_CHECKING, Any, Awaitable, Coroutine, Dict, List, Optional, Tuple
+
+from hummingbot.core.utils.async_utils import safe_ensure_future
+from hummingbot.logger import HummingbotLogger
+
+if TYPE_CHECKING:  # pragma: no cover
+    from hummingbot.smart_components.smart_component_base import SmartComponentBase
+
+
+class ExecutorScheduler:
+    """
+    Runs the control task of all the smart components of an event loop from a single timer.
+
+    Components are kept in a min-heap by due time. The next run of a component is one update interval after the tick
+    that started it, rounded to `tick_resolution`, so components that become due close to each other are started
+    in the same tick instead of each one keeping its own sleep loop with a drifting phase. A component can be
+    re-evaluated immediately with `trigger` (e.g. on a fill), after which it goes back to its interval. Components that
+    are only waiting for events can be taken out of the timer with `suspend_until_triggered`.
+
+    The lag of each tick (how late the earliest due component was started) is tracked to report scheduler overload.
+    """
+    _logger: Optional[HummingbotLogger] = None
+    tick_resolution = 0.01
+    _SUSPENDED = -1
+    _instances: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, ExecutorScheduler]" = weakref.WeakKeyDictionary()
+
+    @classmethod
+    def logger(cls) -> HummingbotLogger:
+        if cls._logger is None:
+            cls._logger = logging.getLogger(__name__)
+        return cls._logger
+
+    @classmethod
+    def get_instance(cls) -> "ExecutorScheduler":
+        loop = asyncio.get_event_loop()
+        instance = cls._instances.get(loop)
+        if instance is None:
+            instance = cls(loop)
+            cls._instances[loop] = instance
+        return instance
+
+    def __init__(self, loop: asyncio.AbstractEventLoop):
+        self._loop = loop
+        self._heap: List[Tuple[float, int, "SmartComponentBase"]] = []
+        self._entries: Dict["SmartComponentBase", int] = {}
+        self._running: Dict["SmartComponentBase", Optional[asyncio.Task]] = {}
+        self._triggered_while_running = set()
+        self._suspended = set()
+        self._sequence = itertools.count()
+        self._wake_event = asyncio.Event()
+        self._scheduler_task: Optional[asyncio.Task] = None
+        self._ticks_count = 0
+        self._last_lag = 0.0
+        self._max_lag = 0.0
+        self._total_lag = 0.0
+
+    @property
+    def components_count(self) -> int:
+        return len(self._entries)
+
+    @property
+    def ticks_count(self) -> int:
+        return self._ticks_count
+
+    @property
+    def last_lag(self) -> float:
+        """
+        Seconds between the due time of the earliest component of the last tick and the start of the tick.
+        """
+        return self._last_lag
+
+    @property
+    def max_lag(self) -> float:
+        return self._max_lag
+
+    @property
+    def average_lag(self) -> float:
+        return self._total_lag / self._ticks_count if self._ticks_count > 0 else 0.0
+
+    def lag_stats(self) -> Dict[str, float]:
+        return {
+            "ticks": self._ticks_count,
+            "last_lag": self._last_lag,
+            "average_lag": self.average_lag,
+            "max_lag": self._max_lag,
+        }
+
+    def reset_lag_stats(self):
+        self._ticks_count = 0
+        self._last_lag = 0.0
+        self._max_lag = 0.0
+        self._total_lag = 0.0
+
+    def is_scheduled(self, component: "SmartComponentBase") -> bool:
+        return component in self._entries
+
+    def add(self, component: "SmartComponentBase"):
+        """
+        Schedules the control task of the component, running it first on the next tick.
+        """
+        self._push(component, self._loop.time())
+        self._ensure_started()
+
+    def remove(self, component: "SmartComponentBase") -> Optional[asyncio.Task]:
+        """
+        Stops scheduling the component.
+        :return: the task running the control task of the component, if it is running
+        """
+        self._entries.pop(component, None)
+        self._triggered_while_running.discard(component)
+        self._suspended.discard(component)
+        return self._running.get(component)
+
+    def trigger(self, component: "SmartComponentBase"):
+        """
+        Runs the control task of the component on the next tick, or right after it finishes if it is running.
+        """
+        if component not in self._entries:
+            return
+        self._suspended.discard(component)
+        if component in self._running:
+            self._triggered_while_running.add(component)
+        else:
+            self._push(component, self._loop.time())
+
+    def suspend_until_triggered(self, component: "SmartComponentBase"):
+        """
+        Stops running the control task of the component every update interval. It is run again only when triggered.
+        If the control task is running, the suspension applies once it finishes.
+        """
+        if component not in self._entries:
+            return
+        self._suspended.add(component)
+        if component not in self._running:
+            self._entries[component] = self._SUSPENDED
+
+    def is_suspended(self, component: "SmartComponentBase") -> bool:
+        return component in self._suspended
+
+    def stop(self):
+        if self._scheduler_task is not None:
+            self._scheduler_task.cancel()
+            self._scheduler_task = None
+        self._heap.clear()
+        self._entries.clear()
+        self._triggered_while_running.clear()
+        self._suspended.clear()
+        self.reset_lag_stats()
+
+    def _push(self, component: "SmartComponentBase", due_time: float):
+        sequence = next(self._sequence)
+        self._entries[component] = sequence
+        heapq.heappush(self._heap, (due_time, sequence, component))
+        if self._heap[0][1] == sequence:
+            self._wake_event.set()
+
+    def _next_due_time(self, component: "SmartComponentBase", tick_time: float, now: float) -> float:
+        due_time = round((tick_time + component.update_interval) / self.tick_resolution) * self.tick_resolution
+        return max(due_time, now)
+
+    def _ensure_started(self):
+        if self._scheduler_task is None or self._scheduler_task.done():
+            self._scheduler_task = safe_ensure_future(self._scheduler_loop(), loop=self._loop)
+
+    def _pop_due_components(self, now: float) -> List["SmartComponentBase"]:
+        due_components = []
+        earliest_due_time = None
+        while len(self._heap) > 0 and self._heap[0][0] <= now:
+            due_time, sequence, component = heapq.heappop(self._heap)
+            if self._entries.get(component) != sequence:
+                continue
+            if earliest_due_time is None:
+                earliest_due_time = due_time
+            due_components.append(component)
+        if earliest_due_time is not None:
+            self._record_lag(now - earliest_due_time)
+        return due_components
+
+    def _record_lag(self, lag: float):
+        self._ticks_count += 1
+        self._last_lag = lag
+        self._total_lag += lag
+        self._max_lag = max(self._max_lag, lag)
+
+    async def _scheduler_loop(self):
+        while True:
+            now = self._loop.time()
+            for component in self._pop_due_components(now):
+                self._start_control_task(component, now)
+            if len(self._entries) == 0:
+                break
+            self._wake_event.clear()
+            if len(self._heap) > 0:
+                wake_handle = self._loop.call_at(self._heap[0][0], self._wake_event.set)
+                await self._wake_event.wait()
+                wake_handle.cancel()
+            else:
+                # Every scheduled component is running its control task, wait until one of them is rescheduled
+                await self._wake_event.wait()
+
+    def _start_control_task(self, component: "SmartComponentBase", tick_time: float):
+        """
+        Runs the control task inside the scheduler tick until it awaits something that is not ready. Only then it is
+        moved to its own task, so control tasks that complete without waiting don't cost a task each.
+        """
+        self._running[component] = None
+        control_task = component.control_task()
+        try:
+            awaited = control_task.send(None)
+        except StopIteration:
+            self._on_control_task_done(component, tick_time)
+        except Exception:
+            self.logger().error(f"Error running the control task of {component}.", exc_info=True)
+            self._on_control_task_done(component, tick_time)
+        else:
+            self._running[component] = self._loop.create_task(
+                self._resume_control_task(component, _StartedCoroutine(control_task, awaited), tick_time))
+
+    async def _resume_control_task(self, component: "SmartComponentBase", control_task: Awaitable, tick_time: float):
+        try:
+            await control_task
+        except asyncio.CancelledError:
+            raise
+        except Exception:
+            self.logger().error(f"Error running the control task of {component}.", exc_info=True)
+        finally:
+            self._on_control_task_done(component, tick_time)
+
+    def _on_control_task_done(self, component: "SmartComponentBase", tick_time: float):
+        self._running.pop(component, None)
+        if component in self._entries:
+            now = self._loop.time()
+            if component in self._triggered_while_running:
+                self._triggered_while_running.discard(component)
+                self._push(component, now)
+            elif component in self._suspended:
+                self._entries[component] = self._SUSPENDED
+            else:
+                self._push(component, self._next_due_time(component, tick_time, now))
+        else:
+            self._wake_event.set()
+
+
+class _StartedCoroutine:
+    """
+    Awaitable that continues a coroutine that was already stepped until its first suspension, forwarding the object it
+    was suspended on to the task that awaits it.
+    """
+
+    def __init__(self, coroutine: Coroutine, awaited: Any):
+        self._coroutine = coroutine
+        self._awaited = awaited
+
+    def __await__(self):
+        to_yield = self._awaited
+        while True:
+            try:
+                sent = yield to_yield
+            except BaseException as exception:
+                try:
+                    to_yield = self._coroutine.throw(exception)
+                except StopIteration as stop:
+                    return stop.value
+            else:
+                try:
+                    to_yield = self._coroutine.send(sent)
+                except StopIteration as stop:
+                    return stop.value
@@ -1,7 +1,7 @@
 import logging
 import math
 from decimal import Decimal
-from typing import Union
+from typing import Optional, Tuple, Union
 
 from hummingbot.core.data_type.common import OrderType, PositionAction, PriceType, TradeType
 from hummingbot.core.data_type.order_candidate import OrderCandidate, PerpetualOrderCandidate
@@ -21,6 +21,7 @@ from hummingbot.smart_components.executors.position_executor.data_types import (
     PositionExecutorStatus,
     TrackedOrder,
 )
+from hummingbot.smart_components.price_barrier_index import PriceBarrierIndex
 from hummingbot.smart_components.smart_component_base import SmartComponentBase
 from hummingbot.strategy.script_strategy_base import ScriptStrategyBase
 
@@ -54,6 +55,7 @@ class PositionExecutor(SmartComponentBase):
         self._take_profit_order: TrackedOrder = TrackedOrder()
         self._trailing_stop_price = Decimal("0")
         self._trailing_stop_activated = False
+        self._barrier_index: Optional[PriceBarrierIndex] = None
         super().__init__(strategy=strategy, connectors=[position_config.exchange], update_interval=update_interval)
 
     @property
@@ -106,13 +108,16 @@ class PositionExecutor(SmartComponentBase):
     def trailing_stop_config(self):
         return self.position_config.trailing_stop
 
+    @property
+    def close_price_type(self) -> PriceType:
+        return PriceType.BestBid if self.side == TradeType.BUY else PriceType.BestAsk
+
     @property
     def close_price(self):
         if self.executor_status == PositionExecutorStatus.NOT_STARTED or self.close_type in [CloseType.EXPIRED, CloseType.INSUFFICIENT_BALANCE]:
             return self.entry_price
         elif self.executor_status == PositionExecutorStatus.ACTIVE_POSITION:
-            price_type = PriceType.BestBid if self.side == TradeType.BUY else PriceType.BestAsk
-            return self.get_price(self.exchange, self.trading_pair, price_type=price_type)
+            return self.get_price(self.exchange, self.trading_pair, price_type=self.close_price_type)
         else:
             return self.close_order.average_executed_price
 
@@ -211,6 +216,7 @@ class PositionExecutor(SmartComponentBase):
         self.check_budget()
 
     def on_stop(self):
+        self.remove_barriers_from_index()
         if self.take_profit_order.order and self.take_profit_order.order.is_open:
             self.logger().info(f"Take profit order status: {self.take_profit_order.order.current_state}")
             self.remove_take_profit()
@@ -220,6 +226,8 @@ class PositionExecutor(SmartComponentBase):
             self.control_open_order()
         elif self.executor_status == PositionExecutorStatus.ACTIVE_POSITION:
             self.control_barriers()
+            if not self.close_order.order_id and self._scheduler is not None and not self.terminated.is_set():
+                self.index_barriers()
 
     def control_open_order(self):
         if not self.open_order.order_id:
@@ -263,6 +271,51 @@ class PositionExecutor(SmartComponentBase):
             if self.position_config.time_limit:
                 self.control_time_limit()
 
+    def get_barrier_levels(self) -> Tuple[Optional[Decimal], Optional[Decimal]]:
+        """
+        Calculates the close price levels at which the barriers have to be evaluated again.
+        :return: the highest level below the price and the lowest level above it (None if there is no level)
+        """
+        is_buy = self.side == TradeType.BUY
+        lower_levels = []
+        upper_levels = []
+        stop_levels, profit_levels = (lower_levels, upper_levels) if is_buy else (upper_levels, lower_levels)
+        if self.position_config.stop_loss:
+            stop_levels.append(self.stop_loss_price)
+            if self.trailing_stop_config:
+                if self._trailing_stop_activated:
+                    trailing_delta = self.trailing_stop_config.trailing_delta
+                    stop_levels.append(self._trailing_stop_price)
+                    profit_levels.append(self._trailing_stop_price / (1 - trailing_delta) if is_buy
+                                         else self._trailing_stop_price / (1 + trailing_delta))
+                else:
+                    side = 1 if is_buy else -1
+                    profit_levels.append(
+                        self.entry_price * (1 + side * self.trailing_stop_config.activation_price_delta))
+        if self.position_config.take_profit and not self.take_profit_order_type.is_limit_type():
+            profit_levels.append(self.take_profit_price)
+        lower = max(lower_levels) if len(lower_levels) > 0 else None
+        upper = min(upper_levels) if len(upper_levels) > 0 else None
+        return lower, upper
+
+    def index_barriers(self):
+        """
+        Registers the barriers in the shared index of the trading pair and waits until the index (or an order event)
+        triggers the control task, instead of evaluating the barriers every update interval.
+        """
+        if self._barrier_index is None:
+            self._barrier_index = PriceBarrierIndex.get_instance(
+                self._strategy, self.connectors[self.exchange], self.trading_pair, self._scheduler)
+        lower, upper = self.get_barrier_levels()
+        end_time = self.end_time if self.position_config.time_limit else None
+        self._barrier_index.register(self, self.close_price_type, lower=lower, upper=upper, end_time=end_time)
+        self._scheduler.suspend_until_triggered(self)
+
+    def remove_barriers_from_index(self):
+        if self._barrier_index is not None:
+            self._barrier_index.remove(self)
+            self._barrier_index = None
+
     def place_close_order(self, close_type: CloseType, price: Decimal = Decimal("NaN")):
         tp_partial_execution = self.take_profit_order.executed_amount_base if self.take_profit_order.executed_amount_base else Decimal("0")
         order_id = self.place_order(
@@ -325,7 +378,9 @@ class PositionExecutor(SmartComponentBase):
 
     def early_stop(self):
         if self.executor_status == PositionExecutorStatus.ACTIVE_POSITION:
+            self.remove_barriers_from_index()
             self.place_close_order(close_type=CloseType.EARLY_STOP)
+            self.trigger_control_task()
         elif self.executor_status == PositionExecutorStatus.NOT_STARTED and self._open_order.order_id:
             self._strategy.cancel(
                 connector_name=self.exchange,
@@ -382,6 +437,7 @@ class PositionExecutor(SmartComponentBase):
             self.place_close_order(self.close_type)
         elif self.take_profit_order.order_id == event.order_id:
             self.take_profit_order.order_id = None
+            self.trigger_control_task()
 
     def to_json(self):
         return {
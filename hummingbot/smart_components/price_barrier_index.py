@@ -0,0 +1,178 @@
+import heapq
+import itertools
+from decimal import Decimal
+from typing import TYPE_CHECKING, Dict, List, Optional, Set, Tuple
+
+from hummingbot.connector.connector_base import ConnectorBase
+from hummingbot.core.data_type.common import PriceType
+from hummingbot.smart_components.executor_scheduler import ExecutorScheduler
+
+if TYPE_CHECKING:  # pragma: no cover
+    from hummingbot.smart_components.smart_component_base import SmartComponentBase
+    from hummingbot.strategy.script_strategy_base import ScriptStrategyBase
+
+
+class _BarrierBook:
+    """
+    Price barriers of the components evaluated with the same price. Barriers above the price are kept in a min-heap
+    and barriers below it in a max-heap, so the crossed ones are found in O(log n) each. Registrations are replaced
+    lazily: heap entries whose sequence is not the current one of their component are skipped.
+    """
+
+    def __init__(self):
+        self._upper: List[Tuple[Decimal, int, "SmartComponentBase"]] = []
+        self._lower: List[Tuple[Decimal, int, "SmartComponentBase"]] = []
+
+    def __len__(self) -> int:
+        return len(self._upper) + len(self._lower)
+
+    def push(self, component: "SmartComponentBase", sequence: int, lower: Optional[Decimal], upper: Optional[Decimal]):
+        if upper is not None:
+            heapq.heappush(self._upper, (upper, sequence, component))
+        if lower is not None:
+            heapq.heappush(self._lower, (-lower, sequence, component))
+
+    def pop_crossed(self, price: Decimal, sequences: Dict["SmartComponentBase", int]) -> Set["SmartComponentBase"]:
+        crossed = set()
+        while len(self._upper) > 0 and self._upper[0][0] <= price:
+            _, sequence, component = heapq.heappop(self._upper)
+            if sequences.get(component) == sequence:
+                crossed.add(component)
+        while len(self._lower) > 0 and -self._lower[0][0] >= price:
+            _, sequence, component = heapq.heappop(self._lower)
+            if sequences.get(component) == sequence:
+                crossed.add(component)
+        return crossed
+
+    def compact(self, sequences: Dict["SmartComponentBase", int]):
+        self._upper = [entry for entry in self._upper if sequences.get(entry[2]) == entry[1]]
+        self._lower = [entry for entry in self._lower if sequences.get(entry[2]) == entry[1]]
+        heapq.heapify(self._upper)
+        heapq.heapify(self._lower)
+
+    def clear(self):
+        self._upper.clear()
+        self._lower.clear()
+
+
+class PriceBarrierIndex:
+    """
+    Shared index of the price and time barriers of the smart components trading a pair on a connector.
+
+    Each component registers the close price levels below and above the current price at which its barriers
+    (stop loss, take profit, trailing stop...) have to be evaluated again, and the time at which its time limit
+    expires. The index is run by the executor scheduler like a component: every update interval it reads the price
+    once per price type and triggers only the components whose barriers were crossed, which are removed from the index
+    until they register again. This makes a pass O(log n + crossed) instead of evaluating every component.
+    """
+    _instances: Dict[Tuple[ConnectorBase, str], "PriceBarrierIndex"] = {}
+
+    @classmethod
+    def get_instance(cls,
+                     strategy: "ScriptStrategyBase",
+                     connector: ConnectorBase,
+                     trading_pair: str,
+                     scheduler: ExecutorScheduler) -> "PriceBarrierIndex":
+        key = (connector, trading_pair)
+        instance = cls._instances.get(key)
+        if instance is None:
+            instance = cls(strategy, connector, trading_pair, scheduler)
+            cls._instances[key] = instance
+        return instance
+
+    def __init__(self,
+                 strategy: "ScriptStrategyBase",
+                 connector: ConnectorBase,
+                 trading_pair: str,
+                 scheduler: ExecutorScheduler):
+        self._strategy = strategy
+        self._connector = connector
+        self._trading_pair = trading_pair
+        self._scheduler = scheduler
+        self.update_interval = float("inf")
+        self._sequence = itertools.count()
+        self._sequences: Dict["SmartComponentBase", int] = {}
+        self._books: Dict[PriceType, _BarrierBook] = {}
+        self._time_limits: List[Tuple[float, int, "SmartComponentBase"]] = []
+
+    @property
+    def trading_pair(self) -> str:
+        return self._trading_pair
+
+    @property
+    def components_count(self) -> int:
+        return len(self._sequences)
+
+    def is_registered(self, component: "SmartComponentBase") -> bool:
+        return component in self._sequences
+
+    def register(self,
+                 component: "SmartComponentBase",
+                 price_type: PriceType,
+                 lower: Optional[Decimal] = None,
+                 upper: Optional[Decimal] = None,
+                 end_time: Optional[float] = None):
+        """
+        Registers the barriers of the component, replacing the ones it had registered before.
+        :param component: the component to trigger when a barrier is crossed
+        :param price_type: the price the barriers are compared with
+        :param lower: the component is triggered when the price is at or below this level
+        :param upper: the component is triggered when the price is at or above this level
+        :param end_time: the component is triggered when the strategy timestamp reaches this time
+        """
+        sequence = next(self._sequence)
+        self._sequences[component] = sequence
+        book = self._books.get(price_type)
+        if book is None:
+            book = _BarrierBook()
+            self._books[price_type] = book
+        book.push(component, sequence, lower, upper)
+        if end_time is not None:
+            heapq.heappush(self._time_limits, (end_time, sequence, component))
+        self.update_interval = min(self.update_interval, component.update_interval)
+        if not self._scheduler.is_scheduled(self):
+            self._scheduler.add(self)
+        if self._entries_count() > 2 * len(self._sequences) + 64:
+            self._compact()
+
+    def remove(self, component: "SmartComponentBase"):
+        self._sequences.pop(component, None)
+        if len(self._sequences) == 0:
+            self._books.clear()
+            self._time_limits.clear()
+            self.update_interval = float("inf")
+            self._scheduler.remove(self)
+            if self._instances.get((self._connector, self._trading_pair)) is self:
+                del self._instances[(self._connector, self._trading_pair)]
+
+    def pop_crossed(self) -> Set["SmartComponentBase"]:
+        """
+        Removes from the index the components with barriers crossed by the current prices and time.
+        """
+        crossed = set()
+        for price_type, book in self._books.items():
+            if len(book) > 0:
+                price = self._connector.get_price_by_type(self._trading_pair, price_type)
+                if price is not None and price.is_finite():
+                    crossed.update(book.pop_crossed(price, self._sequences))
+        timestamp = self._strategy.current_timestamp
+        while len(self._time_limits) > 0 and self._time_limits[0][0] <= timestamp:
+            _, sequence, component = heapq.heappop(self._time_limits)
+            if self._sequences.get(component) == sequence:
+                crossed.add(component)
+        for component in crossed:
+            self.remove(component)
+        return crossed
+
+    async def control_task(self):
+        for component in self.pop_crossed():
+            component.trigger_control_task()
+
+    def _entries_count(self) -> int:
+        return sum(len(book) for book in self._books.values()) + len(self._time_limits)
+
+    def _compact(self):
+        for book in self._books.values():
+            book.compact(self._sequences)
+        self._time_limits = [entry for entry in self._time_limits if self._sequences.get(entry[2]) == entry[1]]
+        heapq.heapify(self._time_limits)
@@ -1,7 +1,7 @@
 import asyncio
 from decimal import Decimal
 from enum import Enum
-from typing import List, Tuple, Union
+from typing import List, Optional, Set, Tuple, Union
 
 from hummingbot.connector.connector_base import ConnectorBase
 from hummingbot.core.data_type.common import OrderType, PositionAction, PriceType, TradeType
@@ -17,6 +17,7 @@ from hummingbot.core.event.events import (
     SellOrderCreatedEvent,
 )
 from hummingbot.core.utils.async_utils import safe_ensure_future
+from hummingbot.smart_components.executor_scheduler import ExecutorScheduler
 from hummingbot.strategy.script_strategy_base import ScriptStrategyBase
 
 
@@ -34,10 +35,11 @@ class SmartComponentBase:
                            connector_name in connectors}
         self._status: SmartComponentStatus = SmartComponentStatus.NOT_STARTED
         self._states: list = []
+        self._order_ids: Set[str] = set()
 
         self._create_buy_order_forwarder = SourceInfoEventForwarder(self.process_order_created_event)
         self._create_sell_order_forwarder = SourceInfoEventForwarder(self.process_order_created_event)
-        self._fill_order_forwarder = SourceInfoEventForwarder(self.process_order_filled_event)
+        self._fill_order_forwarder = SourceInfoEventForwarder(self._process_order_filled_event)
         self._complete_buy_order_forwarder = SourceInfoEventForwarder(self.process_order_completed_event)
         self._complete_sell_order_forwarder = SourceInfoEventForwarder(self.process_order_completed_event)
         self._cancel_order_forwarder = SourceInfoEventForwarder(self.process_order_canceled_event)
@@ -53,6 +55,7 @@ class SmartComponentBase:
             (MarketEvent.OrderFailure, self._failed_order_forwarder),
         ]
         self.register_events()
+        self._scheduler: Optional[ExecutorScheduler] = None
         self.terminated = asyncio.Event()
         safe_ensure_future(self.control_loop())
 
@@ -66,14 +69,29 @@ class SmartComponentBase:
         return order
 
     async def control_loop(self):
+        """
+        Runs the control task every update interval until the component is terminated. The control task is run by the
+        shared executor scheduler, which groups the components that are due at the same time in one tick.
+        """
         self.on_start()
         self._status = SmartComponentStatus.ACTIVE
-        while not self.terminated.is_set():
-            await self.control_task()
-            await asyncio.sleep(self.update_interval)
+        self._scheduler = ExecutorScheduler.get_instance()
+        if not self.terminated.is_set():
+            self._scheduler.add(self)
+            await self.terminated.wait()
+        running_control_task = self._scheduler.remove(self)
+        if running_control_task is not None:
+            await running_control_task
         self._status = SmartComponentStatus.TERMINATED
         self.on_stop()
 
+    def trigger_control_task(self):
+        """
+        Runs the control task as soon as possible instead of waiting for the update interval.
+        """
+        if self._scheduler is not None:
+            self._scheduler.trigger(self)
+
     def on_stop(self):
         pass
 
@@ -109,9 +127,11 @@ class SmartComponentBase:
                     price=Decimal("NaN"),
                     ):
         if side == TradeType.BUY:
-            return self._strategy.buy(connector_name, trading_pair, amount, order_type, price, position_action)
+            order_id = self._strategy.buy(connector_name, trading_pair, amount, order_type, price, position_action)
         else:
-            return self._strategy.sell(connector_name, trading_pair, amount, order_type, price, position_action)
+            order_id = self._strategy.sell(connector_name, trading_pair, amount, order_type, price, position_action)
+        self._order_ids.add(order_id)
+        return order_id
 
     def get_price(self, connector_name: str, trading_pair: str, price_type: PriceType = PriceType.MidPrice):
         return self.connectors[connector_name].get_price_by_type(trading_pair, price_type)
@@ -146,6 +166,14 @@ class SmartComponentBase:
                                      event: OrderCancelledEvent):
         pass
 
+    def _process_order_filled_event(self,
+                                    event_tag: int,
+                                    market: ConnectorBase,
+                                    event: OrderFilledEvent):
+        self.process_order_filled_event(event_tag, market, event)
+        if event.order_id in self._order_ids:
+            self.trigger_control_task()
+
     def process_order_filled_event(self,
                                    event_tag: int,
                                    market: ConnectorBase,
@@ -1,15 +1,18 @@
+from typing import Optional
+
 from hummingbot.smart_components.executors.position_executor.data_types import PositionExecutorStatus
 from hummingbot.smart_components.strategy_frameworks.directional_trading.directional_trading_controller_base import (
     DirectionalTradingControllerBase,
 )
 from hummingbot.smart_components.strategy_frameworks.executor_handler_base import ExecutorHandlerBase
+from hummingbot.smart_components.utils.executor_history_store import ExecutorHistoryStore
 from hummingbot.strategy.script_strategy_base import ScriptStrategyBase
 
 
 class DirectionalTradingExecutorHandler(ExecutorHandlerBase):
     def __init__(self, strategy: ScriptStrategyBase, controller: DirectionalTradingControllerBase,
-                 update_interval: float = 1.0):
-        super().__init__(strategy, controller, update_interval)
+                 update_interval: float = 1.0, executor_store: Optional[ExecutorHistoryStore] = None):
+        super().__init__(strategy, controller, update_interval, executor_store=executor_store)
         self.controller = controller
 
     def on_stop(self):
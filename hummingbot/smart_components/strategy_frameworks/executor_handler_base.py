@@ -2,6 +2,7 @@ import asyncio
 import datetime
 import logging
 from pathlib import Path
+from typing import Optional
 
 import pandas as pd
 
@@ -16,6 +17,7 @@ from hummingbot.smart_components.executors.position_executor.data_types import P
 from hummingbot.smart_components.executors.position_executor.position_executor import PositionExecutor
 from hummingbot.smart_components.strategy_frameworks.controller_base import ControllerBase
 from hummingbot.smart_components.strategy_frameworks.data_types import ExecutorHandlerStatus, OrderLevel
+from hummingbot.smart_components.utils.executor_history_store import ExecutorHistoryStore
 from hummingbot.strategy.script_strategy_base import ScriptStrategyBase
 
 
@@ -29,18 +31,20 @@ class ExecutorHandlerBase:
         return cls._logger
 
     def __init__(self, strategy: ScriptStrategyBase, controller: ControllerBase, update_interval: float = 1.0,
-                 executors_update_interval: float = 1.0):
+                 executors_update_interval: float = 1.0, executor_store: Optional[ExecutorHistoryStore] = None):
         """
         Initialize the ExecutorHandlerBase.
 
         :param strategy: The strategy instance.
         :param controller: The controller instance.
         :param update_interval: Update interval in seconds.
+        :param executor_store: Columnar store for the closed executors, used to query them instead of the database.
         """
         self.strategy = strategy
         self.controller = controller
         self.update_interval = update_interval
         self.executors_update_interval = executors_update_interval
+        self.executor_store = executor_store
         self.terminated = asyncio.Event()
         self.level_executors = {level.level_id: None for level in self.controller.config.order_levels}
         self.status = ExecutorHandlerStatus.NOT_STARTED
@@ -57,6 +61,8 @@ class ExecutorHandlerBase:
     def on_stop(self):
         """Actions to perform on stop."""
         self.controller.stop()
+        if self.executor_store is not None:
+            self.executor_store.flush()
 
     def on_start(self):
         """Actions to perform on start."""
@@ -87,6 +93,8 @@ class ExecutorHandlerBase:
             executor_data["order_level"] = order_level.level_id
             executor_data["controller_name"] = self.controller.config.strategy_name
             MarketsRecorder.get_instance().store_executor(executor_data)
+            if self.executor_store is not None:
+                self.executor_store.append(executor_data)
             self.level_executors[order_level.level_id] = None
 
     def create_executor(self, position_config: PositionConfig, order_level: OrderLevel):
@@ -131,6 +139,10 @@ class ExecutorHandlerBase:
                        position_action=PositionAction.CLOSE)
 
     def get_closed_executors_df(self):
+        if self.executor_store is not None:
+            return self.executor_store.query_df(controller_name=self.controller.config.strategy_name,
+                                                exchange=self.controller.config.exchange,
+                                                trading_pair=self.controller.config.trading_pair)
         executors = MarketsRecorder.get_instance().get_position_executors(
             self.controller.config.strategy_name,
             self.controller.config.exchange,
@@ -1,5 +1,6 @@
 import logging
 from decimal import Decimal
+from typing import Optional
 
 from hummingbot.logger import HummingbotLogger
 from hummingbot.smart_components.executors.position_executor.data_types import PositionExecutorStatus
@@ -7,6 +8,7 @@ from hummingbot.smart_components.strategy_frameworks.executor_handler_base impor
 from hummingbot.smart_components.strategy_frameworks.market_making.market_making_controller_base import (
     MarketMakingControllerBase,
 )
+from hummingbot.smart_components.utils.executor_history_store import ExecutorHistoryStore
 from hummingbot.strategy.script_strategy_base import ScriptStrategyBase
 
 
@@ -20,8 +22,9 @@ class MarketMakingExecutorHandler(ExecutorHandlerBase):
         return cls._logger
 
     def __init__(self, strategy: ScriptStrategyBase, controller: MarketMakingControllerBase,
-                 update_interval: float = 1.0, executors_update_interval: float = 1.0):
-        super().__init__(strategy, controller, update_interval, executors_update_interval)
+                 update_interval: float = 1.0, executors_update_interval: float = 1.0,
+                 executor_store: Optional[ExecutorHistoryStore] = None):
+        super().__init__(strategy, controller, update_interval, executors_update_interval, executor_store)
         self.controller = controller
 
     def on_stop(self):
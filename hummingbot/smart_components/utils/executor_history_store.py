@@ -0,0 +1,231 @@
+import json
+import math
+import os
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterator, List, Optional, Sequence, Tuple
+
+import numpy as np
+import pandas as pd
+
+EXECUTOR_SCHEMA = np.dtype([
+    ("timestamp", "f8"),
+    ("close_timestamp", "f8"),
+    ("order_level", "U64"),
+    ("controller_name", "U64"),
+    ("exchange", "U32"),
+    ("trading_pair", "U32"),
+    ("side", "U8"),
+    ("amount", "f8"),
+    ("entry_price", "f8"),
+    ("close_price", "f8"),
+    ("trade_pnl", "f8"),
+    ("trade_pnl_quote", "f8"),
+    ("cum_fee_quote", "f8"),
+    ("net_pnl_quote", "f8"),
+    ("net_pnl", "f8"),
+    ("executor_status", "U16"),
+    ("close_type", "U16"),
+    ("sl", "f8"),
+    ("tp", "f8"),
+    ("tl", "f8"),
+    ("open_order_type", "U16"),
+    ("take_profit_order_type", "U16"),
+    ("stop_loss_order_type", "U16"),
+    ("time_limit_order_type", "U16"),
+    ("leverage", "i4"),
+])
+
+# Columns with the distinct values of each batch stored in the partition manifest, to skip batches on queries
+INDEXED_COLUMNS = ("controller_name", "exchange", "trading_pair")
+MANIFEST_FILE_NAME = "manifest.jsonl"
+SECONDS_PER_DAY = 86400
+
+
+class ExecutorHistoryStore:
+    """
+    Append-only columnar store of closed executors.
+
+    Executors are kept with a fixed schema (`EXECUTOR_SCHEMA`) and written in batches, in a directory per UTC day of the
+    executor timestamp. Each batch is a directory with one numpy file per column. Each day directory has a manifest with
+    one line per batch, holding the time range and the controllers, exchanges and trading pairs of the batch. Queries
+    only open the days in the requested time range and the batches that can match the requested values, and only
+    memory-map the columns used by the filters and the requested columns.
+    """
+
+    def __init__(self, path: str, batch_size: int = 1000):
+        self._path = Path(path)
+        self._batch_size = batch_size
+        self._pending_rows: List[Tuple] = []
+
+    @property
+    def path(self) -> Path:
+        return self._path
+
+    @property
+    def pending_rows_count(self) -> int:
+        return len(self._pending_rows)
+
+    def append(self, executor_data: Dict[str, Any]):
+        """
+        Adds a closed executor (as returned by `to_json` plus `controller_name` and `order_level`). The rows are written
+        when `batch_size` rows are pending, or on `flush`.
+        """
+        self._pending_rows.append(self._to_row(executor_data))
+        if len(self._pending_rows) >= self._batch_size:
+            self.flush()
+
+    def flush(self):
+        if len(self._pending_rows) == 0:
+            return
+        rows = np.array(self._pending_rows, dtype=EXECUTOR_SCHEMA)
+        self._pending_rows = []
+        days = np.floor(rows["timestamp"] / SECONDS_PER_DAY)
+        for day in np.unique(days):
+            self._write_batch(self._partition_path(day), rows[days == day])
+
+    def query(self,
+              controller_name: Optional[str] = None,
+              exchange: Optional[str] = None,
+              trading_pair: Optional[str] = None,
+              start_time: Optional[float] = None,
+              end_time: Optional[float] = None,
+              columns: Optional[Sequence[str]] = None) -> np.ndarray:
+        """
+        Returns the executors matching all the given values, with `start_time <= timestamp < end_time`, sorted by
+        timestamp. Pending rows are included.
+        :param columns: the columns to return, all of them by default
+        :return: a structured array with the requested columns
+        """
+        columns = list(EXECUTOR_SCHEMA.names) if columns is None else list(columns)
+        filters = {name: value for name, value in (("controller_name", controller_name),
+                                                   ("exchange", exchange),
+                                                   ("trading_pair", trading_pair)) if value is not None}
+        selected = {name: [] for name in set(columns) | {"timestamp"}}
+        for read_column in self._candidate_batches(filters, start_time, end_time):
+            timestamps = read_column("timestamp")
+            mask = np.ones(len(timestamps), dtype=bool)
+            if start_time is not None:
+                mask &= timestamps >= start_time
+            if end_time is not None:
+                mask &= timestamps < end_time
+            for name, value in filters.items():
+                mask &= read_column(name) == value
+            if mask.any():
+                for name in selected:
+                    selected[name].append(read_column(name)[mask])
+        result = np.empty(sum(len(values) for values in selected["timestamp"]),
+                          dtype=[(name, EXECUTOR_SCHEMA[name]) for name in columns])
+        if len(result) > 0:
+            order = np.argsort(np.concatenate(selected["timestamp"]), kind="stable")
+            for name in columns:
+                result[name] = np.concatenate(selected[name])[order]
+        return result
+
+    def query_df(self, **kwargs) -> pd.DataFrame:
+        """
+        Same as `query`, as a DataFrame. Empty text values and NaN close timestamps are returned as None.
+        """
+        df = pd.DataFrame(self.query(**kwargs))
+        for name in df.columns:
+            if df[name].dtype == object:
+                df[name] = df[name].replace("", None)
+        if "close_timestamp" in df.columns:
+            df["close_timestamp"] = df["close_timestamp"].astype(object).where(df["close_timestamp"].notna(), None)
+        return df
+
+    def _candidate_batches(self,
+                           filters: Dict[str, str],
+                           start_time: Optional[float],
+                           end_time: Optional[float]) -> Iterator[Callable[[str], np.ndarray]]:
+        """
+        Yields a column reader for each batch that can have rows matching the filters and the time range.
+        """
+        if self._path.exists():
+            first_day = None if start_time is None else math.floor(start_time / SECONDS_PER_DAY)
+            last_day = None if end_time is None else math.floor(end_time / SECONDS_PER_DAY)
+            for partition_path in sorted(self._path.iterdir()):
+                day = self._partition_day(partition_path)
+                if day is None or (first_day is not None and day < first_day) \
+                        or (last_day is not None and day > last_day):
+                    continue
+                for batch in self._read_manifest(partition_path):
+                    if self._batch_may_match(batch, filters, start_time, end_time):
+                        yield self._batch_column_reader(partition_path / batch["batch"])
+        if len(self._pending_rows) > 0:
+            pending_rows = np.array(self._pending_rows, dtype=EXECUTOR_SCHEMA)
+            yield lambda name: pending_rows[name]
+
+    @staticmethod
+    def _batch_column_reader(batch_path: Path) -> Callable[[str], np.ndarray]:
+        loaded_columns = {}
+
+        def read_column(name: str) -> np.ndarray:
+            if name not in loaded_columns:
+                loaded_columns[name] = np.load(batch_path / f"{name}.npy", mmap_mode="r")
+            return loaded_columns[name]
+
+        return read_column
+
+    @staticmethod
+    def _batch_may_match(batch: Dict[str, Any],
+                         filters: Dict[str, str],
+                         start_time: Optional[float],
+                         end_time: Optional[float]) -> bool:
+        if start_time is not None and batch["max_timestamp"] < start_time:
+            return False
+        if end_time is not None and batch["min_timestamp"] >= end_time:
+            return False
+        return all(value in batch[name] for name, value in filters.items())
+
+    def _write_batch(self, partition_path: Path, rows: np.ndarray):
+        partition_path.mkdir(parents=True, exist_ok=True)
+        batch_name = f"batch_{len(self._read_manifest(partition_path)):06d}"
+        temporary_path = partition_path / f".{batch_name}"
+        temporary_path.mkdir(exist_ok=True)
+        for name in EXECUTOR_SCHEMA.names:
+            np.save(temporary_path / f"{name}.npy", np.ascontiguousarray(rows[name]))
+        os.replace(temporary_path, partition_path / batch_name)
+        batch = {
+            "batch": batch_name,
+            "rows": len(rows),
+            "min_timestamp": float(rows["timestamp"].min()),
+            "max_timestamp": float(rows["timestamp"].max()),
+        }
+        for name in INDEXED_COLUMNS:
+            batch[name] = sorted(set(rows[name].tolist()))
+        with open(partition_path / MANIFEST_FILE_NAME, "a") as manifest_file:
+            manifest_file.write(json.dumps(batch) + "\n")
+
+    @staticmethod
+    def _read_manifest(partition_path: Path) -> List[Dict[str, Any]]:
+        manifest_path = partition_path / MANIFEST_FILE_NAME
+        if not manifest_path.exists():
+            return []
+        with open(manifest_path) as manifest_file:
+            return [json.loads(line) for line in manifest_file if line.strip()]
+
+    def _partition_path(self, day: float) -> Path:
+        return self._path / datetime.fromtimestamp(day * SECONDS_PER_DAY, tz=timezone.utc).strftime("%Y-%m-%d")
+
+    @staticmethod
+    def _partition_day(partition_path: Path) -> Optional[int]:
+        try:
+            date = datetime.strptime(partition_path.name, "%Y-%m-%d").replace(tzinfo=timezone.utc)
+        except ValueError:
+            return None
+        return int(date.timestamp() // SECONDS_PER_DAY)
+
+    @staticmethod
+    def _to_row(executor_data: Dict[str, Any]) -> Tuple:
+        row = []
+        for name in EXECUTOR_SCHEMA.names:
+            value = executor_data.get(name)
+            kind = EXECUTOR_SCHEMA[name].kind
+            if kind == "f":
+                row.append(float("nan") if value is None else float(value))
+            elif kind == "i":
+                row.append(0 if value is None else int(value))
+            else:
+                row.append("" if value is None else str(value))
+        return tuple(row)
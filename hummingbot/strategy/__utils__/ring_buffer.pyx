@@ -1,11 +1,21 @@
 import numpy as np
 import logging
 cimport numpy as np
+from libc.math cimport isfinite, sqrt, NAN
 
 
 pmm_logger = None
 
 cdef class RingBuffer:
+    """
+    Fixed length buffer of the last values added.
+
+    Every value is stored twice, at its position and at its position plus the buffer length, so the values in
+    insertion order are always a contiguous slice of the storage and can be read as a NumPy view without copying.
+    The sum and the sum of squares of the values (shifted by a reference value to keep the variance precise) are
+    updated on every write, so the length, sum, mean and variance are available in O(1). They are recalculated from
+    the stored values each time the buffer wraps around, to keep the floating point error from accumulating.
+    """
     @classmethod
     def logger(cls):
         global pmm_logger
@@ -15,73 +25,129 @@ cdef class RingBuffer:
 
     def __cinit__(self, int length):
         self._length = length
-        self._buffer = np.zeros(length, dtype=np.float64)
+        self._buffer = np.zeros(2 * length, dtype=np.float64)
         self._delimiter = 0
         self._is_full = False
+        self._shift = 0
+        self._shifted_sum = 0
+        self._shifted_sum_squares = 0
+        self._non_finite_count = 0
 
     def __dealloc__(self):
         self._buffer = None
 
     cdef void c_add_value(self, float val):
-        self._buffer[self._delimiter] = val
+        cdef:
+            double value = val
+            double old_value
+        if self.c_is_empty():
+            self._shift = value if isfinite(value) else 0
+        if self._is_full:
+            old_value = self._buffer[self._delimiter]
+            if isfinite(old_value):
+                self._shifted_sum -= old_value - self._shift
+                self._shifted_sum_squares -= (old_value - self._shift) * (old_value - self._shift)
+            else:
+                self._non_finite_count -= 1
+        self._buffer[self._delimiter] = value
+        self._buffer[self._delimiter + self._length] = value
+        if isfinite(value):
+            self._shifted_sum += value - self._shift
+            self._shifted_sum_squares += (value - self._shift) * (value - self._shift)
+        else:
+            self._non_finite_count += 1
         self.c_increment_delimiter()
+        if self._delimiter == 0:
+            self.c_recalculate_sums()
 
     cdef void c_increment_delimiter(self):
         self._delimiter = (self._delimiter + 1) % self._length
         if not self._is_full and self._delimiter == 0:
             self._is_full = True
 
+    cdef void c_recalculate_sums(self):
+        cdef:
+            np.ndarray[np.double_t, ndim=1] values = self.c_get_as_numpy_view()
+            np.ndarray[np.double_t, ndim=1] finite_values = values[np.isfinite(values)]
+        self._non_finite_count = values.size - finite_values.size
+        self._shift = np.mean(finite_values) if finite_values.size > 0 else 0
+        self._shifted_sum = np.sum(finite_values - self._shift)
+        self._shifted_sum_squares = np.sum(np.square(finite_values - self._shift))
+
     cdef bint c_is_empty(self):
         return (not self._is_full) and (0==self._delimiter)
 
     cdef double c_get_last_value(self):
         if self.c_is_empty():
             return np.nan
-        return self._buffer[self._delimiter-1]
+        return self._buffer[self._delimiter - 1 + (self._length if self._delimiter == 0 else 0)]
 
     cdef bint c_is_full(self):
         return self._is_full
 
+    cdef int64_t c_len(self):
+        return self._length if self._is_full else self._delimiter
+
+    cdef double c_sum(self):
+        if self._non_finite_count > 0:
+            return NAN
+        return self._shifted_sum + self._shift * self.c_len()
+
     cdef double c_mean_value(self):
         result = np.nan
-        if self._is_full:
-            result=np.mean(self.c_get_as_numpy_array())
+        if self._is_full and self._non_finite_count == 0:
+            result = self._shift + self._shifted_sum / self._length
         return result
 
     cdef double c_variance(self):
+        cdef double shifted_mean
         result = np.nan
-        if self._is_full:
-            result = np.var(self.c_get_as_numpy_array())
+        if self._is_full and self._non_finite_count == 0:
+            shifted_mean = self._shifted_sum / self._length
+            result = max(self._shifted_sum_squares / self._length - shifted_mean * shifted_mean, 0)
         return result
 
     cdef double c_std_dev(self):
-        result = np.nan
-        if self._is_full:
-            result = np.std(self.c_get_as_numpy_array())
-        return result
+        cdef double variance = self.c_variance()
+        return sqrt(variance)
 
     cdef np.ndarray[np.double_t, ndim=1] c_get_as_numpy_array(self):
-        cdef np.ndarray[np.int16_t, ndim=1] indexes
+        return np.array(self.c_get_as_numpy_view())
 
+    cdef np.ndarray[np.double_t, ndim=1] c_get_as_numpy_view(self):
+        cdef np.ndarray[np.double_t, ndim=1] view
         if not self._is_full:
-            indexes = np.arange(0, stop=self._delimiter, dtype=np.int16)
+            view = np.asarray(self._buffer)[0:self._delimiter]
         else:
-            indexes = np.arange(self._delimiter, stop=self._delimiter + self._length,
-                                dtype=np.int16) % self._length
-        return np.asarray(self._buffer)[indexes]
+            view = np.asarray(self._buffer)[self._delimiter:self._delimiter + self._length]
+        view.flags.writeable = False
+        return view
 
     def __init__(self, length):
         self._length = length
-        self._buffer = np.zeros(length, dtype=np.double)
+        self._buffer = np.zeros(2 * length, dtype=np.double)
         self._delimiter = 0
         self._is_full = False
 
+    def __len__(self):
+        return self.c_len()
+
     def add_value(self, val):
         self.c_add_value(val)
 
     def get_as_numpy_array(self):
+        """
+        Returns a copy of the values in insertion order.
+        """
         return self.c_get_as_numpy_array()
 
+    def get_as_numpy_view(self):
+        """
+        Returns the values in insertion order as a read only view of the buffer storage, without copying them.
+        The view reflects the buffer until the next value is added; use `get_as_numpy_array` to keep the values.
+        """
+        return self.c_get_as_numpy_view()
+
     def get_last_value(self):
         return self.c_get_last_value()
 
@@ -89,6 +155,10 @@ cdef class RingBuffer:
     def is_full(self):
         return self.c_is_full()
 
+    @property
+    def sum(self):
+        return self.c_sum()
+
     @property
     def mean_value(self):
         return self.c_mean_value()
@@ -110,9 +180,13 @@ cdef class RingBuffer:
         data = self.get_as_numpy_array()
 
         self._length = value
-        self._buffer = np.zeros(value, dtype=np.float64)
+        self._buffer = np.zeros(2 * value, dtype=np.float64)
         self._delimiter = 0
         self._is_full = False
+        self._shift = 0
+        self._shifted_sum = 0
+        self._shifted_sum_squares = 0
+        self._non_finite_count = 0
 
         for val in data[-value:]:
             self.add_value(val)
@@ -1,9 +1,8 @@
 import logging
 from abc import ABC, abstractmethod
 
-import numpy as np
-
 from ..ring_buffer import RingBuffer
+from .rolling_stats import RollingStats
 
 pmm_logger = None
 
@@ -19,12 +18,15 @@ class BaseTrailingIndicator(ABC):
     def __init__(self, sampling_length: int = 30, processing_length: int = 15):
         self._sampling_buffer = RingBuffer(sampling_length)
         self._processing_buffer = RingBuffer(processing_length)
+        self._processing_stats = RollingStats(processing_length)
         self._samples_length = 0
 
     def add_sample(self, value: float):
         self._sampling_buffer.add_value(value)
         indicator_value = self._indicator_calculation()
         self._processing_buffer.add_value(indicator_value)
+        # The buffer stores single precision values, the statistics are kept on the stored value
+        self._processing_stats.add(self._processing_buffer.get_last_value())
 
     @abstractmethod
     def _indicator_calculation(self) -> float:
@@ -35,7 +37,14 @@ class BaseTrailingIndicator(ABC):
         Processing of the processing buffer to return final value.
         Default behavior is buffer average
         """
-        return np.mean(self._processing_buffer.get_as_numpy_array())
+        return self._processing_stats.mean
+
+    def _on_sampling_length_changed(self):
+        """
+        Called after the sampling buffer is resized, so that indicators keeping streaming state over the sampling
+        buffer can rebuild it from the buffer contents.
+        """
+        pass
 
     @property
     def current_value(self) -> float:
@@ -51,7 +60,7 @@ class BaseTrailingIndicator(ABC):
 
     @property
     def is_sampling_buffer_changed(self) -> bool:
-        buffer_len = len(self._sampling_buffer.get_as_numpy_array())
+        buffer_len = len(self._sampling_buffer)
         is_changed = self._samples_length != buffer_len
         self._samples_length = buffer_len
         return is_changed
@@ -63,6 +72,7 @@ class BaseTrailingIndicator(ABC):
     @sampling_length.setter
     def sampling_length(self, value):
         self._sampling_buffer.length = value
+        self._on_sampling_length_changed()
 
     @property
     def processing_length(self) -> int:
@@ -71,3 +81,4 @@ class BaseTrailingIndicator(ABC):
     @processing_length.setter
     def processing_length(self, value):
         self._processing_buffer.length = value
+        self._processing_stats.length = value
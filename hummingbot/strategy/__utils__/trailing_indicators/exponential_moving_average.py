@@ -1,5 +1,5 @@
-from base_trailing_indicator import BaseTrailingIndicator
-import pandas as pd
+from .base_trailing_indicator import BaseTrailingIndicator
+from .rolling_stats import RollingEWMA
 
 
 class ExponentialMovingAverageIndicator(BaseTrailingIndicator):
@@ -7,11 +7,15 @@ class ExponentialMovingAverageIndicator(BaseTrailingIndicator):
         if processing_length != 1:
             raise Exception("Exponential moving average processing_length should be 1")
         super().__init__(sampling_length, processing_length)
+        self._ema = RollingEWMA(sampling_length, span=sampling_length)
 
     def _indicator_calculation(self) -> float:
-        ema = pd.Series(self._sampling_buffer.get_as_numpy_array())\
-            .ewm(span=self._sampling_length, adjust=True).mean()
-        return ema[-1]
+        self._ema.add(self._sampling_buffer.get_last_value())
+        return self._ema.value
 
     def _processing_calculation(self) -> float:
         return self._processing_buffer.get_last_value()
+
+    def _on_sampling_length_changed(self):
+        self._ema = RollingEWMA(self.sampling_length, span=self.sampling_length,
+                                values=self._sampling_buffer.get_as_numpy_view())
@@ -1,18 +1,26 @@
 from .base_trailing_indicator import BaseTrailingIndicator
+from .rolling_stats import RollingStats
 import numpy as np
 
 
 class HistoricalVolatilityIndicator(BaseTrailingIndicator):
     def __init__(self, sampling_length: int = 30, processing_length: int = 15):
         super().__init__(sampling_length, processing_length)
+        self._log_returns = RollingStats(sampling_length - 1)
+        self._last_log_price = np.nan
 
     def _indicator_calculation(self) -> float:
-        prices = self._sampling_buffer.get_as_numpy_array()
-        if prices.size > 0:
-            log_returns = np.diff(np.log(prices))
-            return np.var(log_returns)
+        # The variance of the log returns is kept as a rolling statistic over the sampling buffer
+        log_price = np.log(self._sampling_buffer.get_last_value())
+        if not np.isnan(self._last_log_price):
+            self._log_returns.add(log_price - self._last_log_price)
+        self._last_log_price = log_price
+        return self._log_returns.variance
 
     def _processing_calculation(self) -> float:
-        processing_array = self._processing_buffer.get_as_numpy_array()
-        if processing_array.size > 0:
-            return np.sqrt(np.mean(np.nan_to_num(processing_array)))
+        if self._processing_stats.count > 0:
+            return np.sqrt(self._processing_stats.finite_sum / self._processing_stats.count)
+
+    def _on_sampling_length_changed(self):
+        self._log_returns = RollingStats(self.sampling_length - 1,
+                                         np.diff(np.log(self._sampling_buffer.get_as_numpy_view())))
@@ -1,19 +1,30 @@
 from .base_trailing_indicator import BaseTrailingIndicator
+from .rolling_stats import RollingStats
 import numpy as np
 
 
 class InstantVolatilityIndicator(BaseTrailingIndicator):
     def __init__(self, sampling_length: int = 30, processing_length: int = 15):
         super().__init__(sampling_length, processing_length)
+        self._squared_diffs = RollingStats(sampling_length - 1)
+        self._last_sample = np.nan
 
     def _indicator_calculation(self) -> float:
         # The standard deviation should be calculated between ticks and not with a mean of the whole buffer
         # Otherwise if the asset is trending, changing the length of the buffer would result in a greater volatility as more ticks would be further away from the mean
         # which is a nonsense result. If volatility of the underlying doesn't change in fact, changing the length of the buffer shouldn't change the result.
-        np_sampling_buffer = self._sampling_buffer.get_as_numpy_array()
-        vol = np.sqrt(np.sum(np.square(np.diff(np_sampling_buffer))) / np_sampling_buffer.size)
+        # The squared differences between ticks are kept as a rolling sum over the sampling buffer.
+        sample = self._sampling_buffer.get_last_value()
+        if not np.isnan(self._last_sample):
+            self._squared_diffs.add((sample - self._last_sample) ** 2)
+        self._last_sample = sample
+        vol = np.sqrt(self._squared_diffs.finite_sum / len(self._sampling_buffer))
         return vol
 
     def _processing_calculation(self) -> float:
         # Only the last calculated volatlity, not an average of multiple past volatilities
         return self._processing_buffer.get_last_value()
+
+    def _on_sampling_length_changed(self):
+        self._squared_diffs = RollingStats(self.sampling_length - 1,
+                                           np.square(np.diff(self._sampling_buffer.get_as_numpy_view())))
@@ -0,0 +1,154 @@
+import math
+from collections import deque
+from typing import Deque, Iterable
+
+
+class RollingStats:
+    """
+    Keeps the count, sum, mean and population variance of the last `length` values of a stream, updating them in O(1)
+    for each new value (Welford's algorithm, with the inverse update for the values leaving the window).
+    NaN values are counted in the window but kept out of the statistics; `mean`, `sum` and `variance` are NaN while
+    there are NaN values in the window, like their numpy counterparts.
+    """
+
+    def __init__(self, length: int, values: Iterable[float] = ()):
+        self._reset(length, values)
+
+    def _reset(self, length: int, values: Iterable[float]):
+        self._length = max(length, 0)
+        self._values: Deque[float] = deque()
+        self._finite_count = 0
+        self._nan_count = 0
+        self._mean = 0.0
+        self._m2 = 0.0
+        for value in values:
+            self.add(value)
+
+    @property
+    def length(self) -> int:
+        return self._length
+
+    @length.setter
+    def length(self, value: int):
+        values = list(self._values)
+        self._reset(value, values[-value:] if value > 0 else ())
+
+    @property
+    def count(self) -> int:
+        return len(self._values)
+
+    @property
+    def nan_count(self) -> int:
+        return self._nan_count
+
+    @property
+    def is_full(self) -> bool:
+        return len(self._values) == self._length
+
+    @property
+    def finite_sum(self) -> float:
+        """
+        The sum of the values that are not NaN, equivalent to `np.nansum`.
+        """
+        return self._mean * self._finite_count
+
+    @property
+    def sum(self) -> float:
+        return math.nan if self._nan_count > 0 else self.finite_sum
+
+    @property
+    def mean(self) -> float:
+        if self._nan_count > 0 or self._finite_count == 0:
+            return math.nan
+        return self._mean
+
+    @property
+    def variance(self) -> float:
+        if self._nan_count > 0 or self._finite_count == 0:
+            return math.nan
+        return max(self._m2 / self._finite_count, 0.0)
+
+    @property
+    def std_dev(self) -> float:
+        return math.sqrt(self.variance)
+
+    def add(self, value: float) -> float:
+        """
+        Adds a value to the window.
+        :return: the value that left the window, NaN if the window was not full
+        """
+        value = float(value)
+        self._values.append(value)
+        self._add_to_stats(value)
+        evicted = math.nan
+        if len(self._values) > self._length:
+            evicted = self._values.popleft()
+            self._remove_from_stats(evicted)
+        return evicted
+
+    def _add_to_stats(self, value: float):
+        if math.isnan(value):
+            self._nan_count += 1
+            return
+        self._finite_count += 1
+        delta = value - self._mean
+        self._mean += delta / self._finite_count
+        self._m2 += delta * (value - self._mean)
+
+    def _remove_from_stats(self, value: float):
+        if math.isnan(value):
+            self._nan_count -= 1
+            return
+        self._finite_count -= 1
+        if self._finite_count == 0:
+            self._mean = 0.0
+            self._m2 = 0.0
+            return
+        delta = value - self._mean
+        self._mean -= delta / self._finite_count
+        self._m2 -= delta * (value - self._mean)
+
+
+class RollingEWMA:
+    """
+    Exponentially weighted moving average of the last `length` values, with the weights adjusted to the values in the
+    window (like `pandas.Series.ewm(span=span, adjust=True).mean()` over the window), updated in O(1) for each value.
+    """
+
+    def __init__(self, length: int, span: float, values: Iterable[float] = ()):
+        self._span = span
+        self._reset(length, values)
+
+    def _reset(self, length: int, values: Iterable[float]):
+        self._length = max(length, 1)
+        self._decay = 1 - 2 / (self._span + 1)
+        self._evicted_weight = self._decay ** self._length
+        self._values: Deque[float] = deque()
+        self._weighted_sum = 0.0
+        self._weights_sum = 0.0
+        for value in values:
+            self.add(value)
+
+    @property
+    def length(self) -> int:
+        return self._length
+
+    @length.setter
+    def length(self, value: int):
+        self._reset(value, list(self._values)[-value:])
+
+    @property
+    def value(self) -> float:
+        if self._weights_sum == 0:
+            return math.nan
+        return self._weighted_sum / self._weights_sum
+
+    def add(self, value: float):
+        value = float(value)
+        self._values.append(value)
+        self._weighted_sum = self._weighted_sum * self._decay + value
+        self._weights_sum = self._weights_sum * self._decay + 1
+        if len(self._values) > self._length:
+            evicted = self._values.popleft()
+            self._weighted_sum -= evicted * self._evicted_weight
+            self._weights_sum -= self._evicted_weight
@@ -20,6 +20,9 @@ cdef class TradingIntensityIndicator:
         list _last_quotes
         int _sampling_length
         int _samples_length
+        bint _samples_changed
+        bint _fit_in_executor
+        object _fit_future
 
     cdef c_calculate(self, timestamp)
     cdef c_register_trade(self, object trade)
@@ -1,9 +1,11 @@
 # distutils: language=c++
 # distutils: sources=hummingbot/core/cpp/OrderBookEntry.cpp
 
+import asyncio
 import warnings
+from bisect import bisect_right
 from decimal import Decimal
-from typing import Tuple
+from typing import List, Optional, Tuple
 
 import numpy as np
 from scipy.optimize import curve_fit
@@ -17,6 +19,28 @@ from hummingbot.core.event.event_listener cimport EventListener
 from hummingbot.core.event.events import OrderBookEvent
 from hummingbot.strategy.asset_price_delegate import AssetPriceDelegate
 
+
+def fit_intensity(price_levels: List[float],
+                  lambdas: List[float],
+                  alpha: float,
+                  kappa: float) -> Optional[Tuple[float, float]]:
+    """
+    Fits the trading intensity curve `lambda = alpha * exp(-kappa * price_level)` to the consolidated trades, using
+    the previously calculated parameters as initial values.
+    :return: the (alpha, kappa) parameters, or None if the fit did not converge
+    """
+    try:
+        params = curve_fit(lambda t, a, b: a*np.exp(-b*t),
+                           price_levels,
+                           lambdas,
+                           p0=(alpha, kappa),
+                           method='dogbox',
+                           bounds=([0, 0], [np.inf, np.inf]))
+        return params[0][0], params[0][1]
+    except (RuntimeError, ValueError):
+        return None
+
+
 cdef class TradesForwarder(EventListener):
     def __init__(self, indicator: 'TradingIntensityIndicator'):
         self._indicator = indicator
@@ -27,7 +51,18 @@ cdef class TradesForwarder(EventListener):
 
 cdef class TradingIntensityIndicator:
 
-    def __init__(self, order_book: OrderBook, price_delegate: AssetPriceDelegate, sampling_length: int = 30):
+    def __init__(self,
+                 order_book: OrderBook,
+                 price_delegate: AssetPriceDelegate,
+                 sampling_length: int = 30,
+                 fit_in_executor: bool = False):
+        """
+        :param order_book: the order book to sample trades from
+        :param price_delegate: the price delegate for the mid price quotes
+        :param sampling_length: the number of timestamps with trades used for the estimate
+        :param fit_in_executor: if True the curve fit runs in the default executor of the event loop instead of
+        blocking the tick that triggers it, and the estimate is updated when the fit finishes
+        """
         self._alpha = 0
         self._kappa = 0
         self._trade_samples = {}
@@ -39,6 +74,9 @@ cdef class TradingIntensityIndicator:
         self._sampling_length = sampling_length
         self._samples_length = 0
         self._last_quotes = []
+        self._samples_changed = False
+        self._fit_in_executor = fit_in_executor
+        self._fit_future = None
 
         warnings.simplefilter("ignore", OptimizeWarning)
 
@@ -84,18 +122,21 @@ cdef class TradingIntensityIndicator:
         self._last_quotes = [{'timestamp': timestamp, 'price': price}] + self._last_quotes
 
         latest_processed_quote_idx = None
+        # Negated quote timestamps are in ascending order, the quote of a trade is the first one older than the trade
+        negated_quote_timestamps = [-quote["timestamp"] for quote in self._last_quotes]
         for trade in self._current_trade_sample:
-            for i, quote in enumerate(self._last_quotes):
-                if quote["timestamp"] < trade.timestamp:
-                    if latest_processed_quote_idx is None or i < latest_processed_quote_idx:
-                        latest_processed_quote_idx = i
-                    trade = {"price_level": abs(trade.price - float(quote["price"])), "amount": trade.amount}
+            i = bisect_right(negated_quote_timestamps, -trade.timestamp)
+            if i < len(self._last_quotes):
+                quote = self._last_quotes[i]
+                if latest_processed_quote_idx is None or i < latest_processed_quote_idx:
+                    latest_processed_quote_idx = i
+                trade = {"price_level": abs(trade.price - float(quote["price"])), "amount": trade.amount}
 
-                    if quote["timestamp"] + 1 not in self._trade_samples.keys():
-                        self._trade_samples[quote["timestamp"] + 1] = []
+                if quote["timestamp"] + 1 not in self._trade_samples.keys():
+                    self._trade_samples[quote["timestamp"] + 1] = []
 
-                    self._trade_samples[quote["timestamp"] + 1] += [trade]
-                    break
+                self._trade_samples[quote["timestamp"] + 1] += [trade]
+                self._samples_changed = True
 
         # THere are no trades left to process
         self._current_trade_sample = []
@@ -113,7 +154,8 @@ cdef class TradingIntensityIndicator:
                 trade_samples[timestamp] = self._trade_samples[timestamp]
             self._trade_samples = trade_samples
 
-        if self.is_sampling_buffer_full:
+        # The estimate is only refitted when the trade samples change
+        if self.is_sampling_buffer_full and self._samples_changed:
             self.c_estimate_intensity()
 
     def register_trade(self, trade):
@@ -151,16 +193,25 @@ cdef class TradingIntensityIndicator:
         # Adjust to be able to calculate log
         lambdas_adj = [10**-10 if x==0 else x for x in lambdas]
 
+        self._samples_changed = False
+
         # Fit the probability density function; reuse previously calculated parameters as initial values
-        try:
-            params = curve_fit(lambda t, a, b: a*np.exp(-b*t),
-                               price_levels,
-                               lambdas_adj,
-                               p0=(self._alpha, self._kappa),
-                               method='dogbox',
-                               bounds=([0, 0], [np.inf, np.inf]))
-
-            self._kappa = Decimal(str(params[0][1]))
-            self._alpha = Decimal(str(params[0][0]))
-        except (RuntimeError, ValueError) as e:
-            pass
+        if self._fit_in_executor:
+            if self._fit_future is None or self._fit_future.done():
+                self._fit_future = asyncio.get_event_loop().run_in_executor(
+                    None, fit_intensity, price_levels, lambdas_adj, self._alpha, self._kappa)
+                self._fit_future.add_done_callback(self._on_fit_done)
+            else:
+                # A fit is still running, the samples are fitted again on the next calculation
+                self._samples_changed = True
+        else:
+            self._set_intensity(fit_intensity(price_levels, lambdas_adj, self._alpha, self._kappa))
+
+    def _on_fit_done(self, fit_future: asyncio.Future):
+        if not fit_future.cancelled() and fit_future.exception() is None:
+            self._set_intensity(fit_future.result())
+
+    def _set_intensity(self, params: Optional[Tuple[float, float]]):
+        if params is not None:
+            self._alpha = Decimal(str(params[0]))
+            self._kappa = Decimal(str(params[1]))
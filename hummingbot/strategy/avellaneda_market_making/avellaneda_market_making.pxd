@@ -53,6 +53,7 @@ cdef class AvellanedaMarketMakingStrategy(StrategyBase):
         object _avg_vol
         TradingIntensityIndicator _trading_intensity
         bint _should_wait_order_cancel_confirmation
+        object _status_cache
 
     cdef object c_get_mid_price(self)
     cdef _create_proposal_based_on_order_levels(self)
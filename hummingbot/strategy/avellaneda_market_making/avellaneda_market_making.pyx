@@ -22,7 +22,6 @@ from hummingbot.core.data_type.common import (
 from hummingbot.core.data_type.limit_order cimport LimitOrder
 from hummingbot.core.data_type.limit_order import LimitOrder
 from hummingbot.core.network_iterator import NetworkStatus
-from hummingbot.core.utils import map_df_to_str
 from hummingbot.strategy.__utils__.trailing_indicators.instant_volatility import InstantVolatilityIndicator
 from hummingbot.strategy.__utils__.trailing_indicators.trading_intensity import TradingIntensityIndicator
 from hummingbot.strategy.avellaneda_market_making.avellaneda_market_making_config_map_pydantic import (
@@ -47,6 +46,8 @@ from hummingbot.strategy.hanging_orders_tracker import (
 from hummingbot.strategy.market_trading_pair_tuple import MarketTradingPairTuple
 from hummingbot.strategy.order_book_asset_price_delegate import OrderBookAssetPriceDelegate
 from hummingbot.strategy.order_tracker cimport OrderTracker
+from hummingbot.strategy.proposal_levels import quantize_levels
+from hummingbot.strategy.status_rendering import StatusSectionCache, format_table
 from hummingbot.strategy.strategy_base import StrategyBase
 from hummingbot.strategy.utils import order_age
 
@@ -99,6 +100,7 @@ cdef class AvellanedaMarketMakingStrategy(StrategyBase):
         self._last_timestamp = 0
         self._status_report_interval = status_report_interval
         self._last_own_trade_price = Decimal('nan')
+        self._status_cache = StatusSectionCache()
 
         self.c_add_markets([market_info.market])
         self._volatility_buffer_size = 0
@@ -436,6 +438,9 @@ cdef class AvellanedaMarketMakingStrategy(StrategyBase):
             self._ticks_to_be_ready = 0
 
     def pure_mm_assets_df(self, to_show_current_pct: bool) -> pd.DataFrame:
+        return pd.DataFrame(data=self.pure_mm_assets_data(to_show_current_pct))
+
+    def pure_mm_assets_data(self, to_show_current_pct: bool) -> List[List]:
         market, trading_pair, base_asset, quote_asset = self._market_info
         price = self._price_delegate.get_price_by_type(PriceType.MidPrice)
         base_balance = float(market.get_balance(base_asset))
@@ -454,10 +459,13 @@ cdef class AvellanedaMarketMakingStrategy(StrategyBase):
         ]
         if to_show_current_pct:
             data.append(["Current %", f"{base_ratio:.1%}", f"{quote_ratio:.1%}"])
-        df = pd.DataFrame(data=data)
-        return df
+        return data
 
     def active_orders_df(self) -> pd.DataFrame:
+        columns, data = self.active_orders_data()
+        return pd.DataFrame(data=data, columns=columns)
+
+    def active_orders_data(self) -> Tuple[List[str], List[List]]:
         market, trading_pair, base_asset, quote_asset = self._market_info
         price = self.get_price()
         active_orders = self.active_orders
@@ -478,7 +486,7 @@ cdef class AvellanedaMarketMakingStrategy(StrategyBase):
                     level = no_sells - lvl_sell
                     lvl_sell += 1
             spread = 0 if price == 0 else abs(order.price - price) / price
-            age = pd.Timestamp(order_age(order, self._current_timestamp), unit='s').strftime('%H:%M:%S')
+            age = time.strftime('%H:%M:%S', time.gmtime(order_age(order, self._current_timestamp)))
 
             amount_orig = self._config_map.order_amount
             if is_hanging_order:
@@ -494,9 +502,14 @@ cdef class AvellanedaMarketMakingStrategy(StrategyBase):
                 age
             ])
 
-        return pd.DataFrame(data=data, columns=columns)
+        return columns, data
 
     def market_status_data_frame(self, market_trading_pair_tuples: List[MarketTradingPairTuple]) -> pd.DataFrame:
+        markets_columns, markets_data = self.market_status_data(market_trading_pair_tuples)
+        return pd.DataFrame(data=markets_data, columns=markets_columns).replace(np.nan, '', regex=True)
+
+    def market_status_data(self,
+                           market_trading_pair_tuples: List[MarketTradingPairTuple]) -> Tuple[List[str], List[List]]:
         markets_data = []
         markets_columns = ["Exchange", "Market", "Best Bid", "Best Ask", f"MidPrice"]
         markets_columns.append('Reservation Price')
@@ -515,7 +528,7 @@ cdef class AvellanedaMarketMakingStrategy(StrategyBase):
                 round(self._reservation_price, 5),
                 round(self._optimal_spread, 5),
             ])
-        return pd.DataFrame(data=markets_data, columns=markets_columns).replace(np.nan, '', regex=True)
+        return markets_columns, markets_data
 
     def format_status(self) -> str:
         if not self._all_markets_ready:
@@ -525,19 +538,29 @@ cdef class AvellanedaMarketMakingStrategy(StrategyBase):
             list warning_lines = []
         warning_lines.extend(self.network_warning([self._market_info]))
 
-        markets_df = self.market_status_data_frame([self._market_info])
-        lines.extend(["", "  Markets:"] + ["    " + line for line in markets_df.to_string(index=False).split("\n")])
+        markets_columns, markets_data = self.market_status_data([self._market_info])
+        lines.extend(["", "  Markets:"] + ["    " + line for line in format_table(markets_data, markets_columns)])
 
-        assets_df = map_df_to_str(self.pure_mm_assets_df(True))
-        first_col_length = max(*assets_df[0].apply(len))
-        df_lines = assets_df.to_string(index=False, header=False,
-                                       formatters={0: ("{:<" + str(first_col_length) + "}").format}).split("\n")
-        lines.extend(["", "  Assets:"] + ["    " + line for line in df_lines])
+        # The assets and orders sections are rendered again only when the values they show can have changed
+        market, trading_pair, base_asset, quote_asset = self._market_info
+        active_orders = self.active_orders
+        assets_key = (self._price_delegate.get_price_by_type(PriceType.MidPrice),
+                      market.get_balance(base_asset),
+                      market.get_balance(quote_asset),
+                      market.get_available_balance(base_asset),
+                      market.get_available_balance(quote_asset))
+        lines.extend(["", "  Assets:"] + self._status_cache.get_lines("assets", assets_key, self._assets_status_lines))
 
         # See if there are any open orders.
-        if len(self.active_orders) > 0:
-            df = self.active_orders_df()
-            lines.extend(["", "  Orders:"] + ["    " + line for line in df.to_string(index=False).split("\n")])
+        if len(active_orders) > 0:
+            orders_key = (tuple((o.client_order_id, o.price, o.quantity,
+                                 self._hanging_orders_tracker.is_order_id_in_hanging_orders(o.client_order_id))
+                                for o in active_orders),
+                          self.get_price(),
+                          self._config_map.order_amount,
+                          int(self._current_timestamp))
+            lines.extend(["", "  Orders:"] + self._status_cache.get_lines("orders", orders_key,
+                                                                         self._orders_status_lines))
         else:
             lines.extend(["", "  No active maker orders."])
 
@@ -560,6 +583,13 @@ cdef class AvellanedaMarketMakingStrategy(StrategyBase):
 
         return "\n".join(lines)
 
+    def _assets_status_lines(self) -> List[str]:
+        return ["    " + line for line in format_table(self.pure_mm_assets_data(True), left_align_first_column=True)]
+
+    def _orders_status_lines(self) -> List[str]:
+        columns, data = self.active_orders_data()
+        return ["    " + line for line in format_table(data, columns)]
+
     def execute_orders_proposal(self, proposal: Proposal):
         return self.c_execute_orders_proposal(proposal)
 
@@ -880,17 +910,23 @@ cdef class AvellanedaMarketMakingStrategy(StrategyBase):
             ExchangeBase market = self._market_info.market
             list buys = []
             list sells = []
+            str trading_pair = self.trading_pair
         bid_level_spreads, ask_level_spreads = self._get_level_spreads()
-        size = market.c_quantize_order_amount(self.trading_pair, self._config_map.order_amount)
+        size = market.c_quantize_order_amount(trading_pair, self._config_map.order_amount)
         if size > 0:
-            for level in range(self.order_levels):
-                bid_price = market.c_quantize_order_price(self.trading_pair,
-                                                          self._optimal_bid - Decimal(str(bid_level_spreads[level])))
-                ask_price = market.c_quantize_order_price(self.trading_pair,
-                                                          self._optimal_ask + Decimal(str(ask_level_spreads[level])))
-
-                buys.append(PriceSize(bid_price, size))
-                sells.append(PriceSize(ask_price, size))
+            bid_prices = quantize_levels(
+                float(self._optimal_bid) - np.array(bid_level_spreads, dtype=np.float64),
+                lambda price: market.c_get_order_price_quantum(trading_pair, price),
+                lambda level: market.c_quantize_order_price(
+                    trading_pair, self._optimal_bid - Decimal(str(bid_level_spreads[level]))))
+            ask_prices = quantize_levels(
+                float(self._optimal_ask) + np.array(ask_level_spreads, dtype=np.float64),
+                lambda price: market.c_get_order_price_quantum(trading_pair, price),
+                lambda level: market.c_quantize_order_price(
+                    trading_pair, self._optimal_ask + Decimal(str(ask_level_spreads[level]))))
+
+            buys = [PriceSize(bid_price, size) for bid_price in bid_prices]
+            sells = [PriceSize(ask_price, size) for ask_price in ask_prices]
         return buys, sells
 
     def create_proposal_based_on_order_levels(self):
@@ -2,7 +2,7 @@ import logging
 from collections import defaultdict, deque
 from decimal import Decimal
 from enum import Enum
-from functools import lru_cache
+from functools import lru_cache, partial
 from math import ceil, floor
 from typing import Dict, List, Tuple, cast
 
@@ -32,6 +32,7 @@ from hummingbot.strategy.cross_exchange_market_making.cross_exchange_market_maki
 )
 from hummingbot.strategy.maker_taker_market_pair import MakerTakerMarketPair
 from hummingbot.strategy.market_trading_pair_tuple import MarketTradingPairTuple
+from hummingbot.strategy.status_rendering import StatusSectionCache
 from hummingbot.strategy.strategy_py_base import StrategyPyBase
 
 from .order_id_market_pair_tracker import OrderIDMarketPairTracker
@@ -118,6 +119,7 @@ class CrossExchangeMarketMakingStrategy(StrategyPyBase):
 
         self._last_taker_buy_price = None
         self._last_taker_sell_price = None
+        self._status_cache = StatusSectionCache()
 
         self._main_task = None
         self._gateway_quotes_task = None
@@ -305,50 +307,29 @@ class CrossExchangeMarketMakingStrategy(StrategyPyBase):
             else:
                 tracked_maker_orders[market_pair][typed_limit_order.client_order_id] = typed_limit_order
 
+        # The status sections are rendered again only when the prices, rates, balances or orders they show change
+        conversion_rates = tuple(self.get_conversion_rates(market_pair) for market_pair in self._market_pairs.values())
+
         for market_pair in self._market_pairs.values():
             warning_lines.extend(self.network_warning([market_pair.maker, market_pair.taker]))
 
-            if not self.is_gateway_market(market_pair.taker):
-                markets_df = self.market_status_data_frame([market_pair.maker, market_pair.taker])
-            else:
-                markets_df = self.market_status_data_frame([market_pair.maker])
-                # Market status for gateway
-                bid_price = "" if self._last_taker_buy_price is None else self._last_taker_buy_price
-                ask_price = "" if self._last_taker_sell_price is None else self._last_taker_sell_price
-                if self._last_taker_buy_price is not None and self._last_taker_sell_price is not None:
-                    mid_price = (self._last_taker_buy_price + self._last_taker_sell_price) / 2
-                else:
-                    mid_price = ""
-                taker_data = {
-                    "Exchange": market_pair.taker.market.display_name,
-                    "Market": market_pair.taker.trading_pair,
-                    "Best Bid Price": bid_price,
-                    "Best Ask Price": ask_price,
-                    "Mid Price": mid_price
-                }
-                if markets_df is not None:
-                    markets_df = markets_df.append(taker_data, ignore_index=True)
-            lines.extend(["", "  Markets:"] +
-                         ["    " + line for line in str(markets_df).split("\n")])
-
-            oracle_df = self.oracle_status_df()
-            if not oracle_df.empty:
-                lines.extend(["", "  Rate conversion:"] +
-                             ["    " + line for line in str(oracle_df).split("\n")])
-
-            assets_df = self.wallet_balance_data_frame([market_pair.maker, market_pair.taker])
-            lines.extend(["", "  Assets:"] +
-                         ["    " + line for line in str(assets_df).split("\n")])
+            lines.extend(self._status_cache.get_lines(("markets", market_pair),
+                                                      (self._market_pair_status_key(market_pair), conversion_rates),
+                                                      partial(self._market_pair_status_lines, market_pair)))
 
             # See if there're any open orders.
             if market_pair in tracked_maker_orders and len(tracked_maker_orders[market_pair]) > 0:
                 limit_orders = list(tracked_maker_orders[market_pair].values())
                 bid, ask = self.get_top_bid_ask(market_pair)
                 mid_price = (bid + ask) / 2
-                df = LimitOrder.to_pandas(limit_orders, float(mid_price))
-                df_lines = str(df).split("\n")
-                lines.extend(["", "  Active maker market orders:"] +
-                             ["    " + line for line in df_lines])
+                orders_key = (tuple((o.client_order_id, o.price, o.quantity) for o in limit_orders),
+                              mid_price,
+                              int(self.current_timestamp))
+                lines.extend(self._status_cache.get_lines(("orders", market_pair),
+                                                          orders_key,
+                                                          partial(self._active_maker_orders_status_lines,
+                                                                  limit_orders,
+                                                                  mid_price)))
             else:
                 lines.extend(["", "  No active maker market orders."])
 
@@ -359,6 +340,61 @@ class CrossExchangeMarketMakingStrategy(StrategyPyBase):
 
         return "\n".join(lines)
 
+    def _market_pair_status_key(self, market_pair: MakerTakerMarketPair) -> Tuple:
+        key = []
+        for market_info in (market_pair.maker, market_pair.taker):
+            market, trading_pair, base_asset, quote_asset = market_info
+            if market_info is market_pair.taker and self.is_gateway_market(market_info):
+                key.extend([self._last_taker_buy_price, self._last_taker_sell_price])
+            else:
+                key.extend([market.get_price(trading_pair, False), market.get_price(trading_pair, True)])
+            key.extend([market.get_balance(base_asset),
+                        market.get_balance(quote_asset),
+                        market.get_available_balance(base_asset),
+                        market.get_available_balance(quote_asset)])
+        return tuple(key)
+
+    def _market_pair_status_lines(self, market_pair: MakerTakerMarketPair) -> List[str]:
+        lines = []
+        if not self.is_gateway_market(market_pair.taker):
+            markets_df = self.market_status_data_frame([market_pair.maker, market_pair.taker])
+        else:
+            markets_df = self.market_status_data_frame([market_pair.maker])
+            # Market status for gateway
+            bid_price = "" if self._last_taker_buy_price is None else self._last_taker_buy_price
+            ask_price = "" if self._last_taker_sell_price is None else self._last_taker_sell_price
+            if self._last_taker_buy_price is not None and self._last_taker_sell_price is not None:
+                mid_price = (self._last_taker_buy_price + self._last_taker_sell_price) / 2
+            else:
+                mid_price = ""
+            taker_data = {
+                "Exchange": market_pair.taker.market.display_name,
+                "Market": market_pair.taker.trading_pair,
+                "Best Bid Price": bid_price,
+                "Best Ask Price": ask_price,
+                "Mid Price": mid_price
+            }
+            if markets_df is not None:
+                markets_df = markets_df.append(taker_data, ignore_index=True)
+        lines.extend(["", "  Markets:"] +
+                     ["    " + line for line in str(markets_df).split("\n")])
+
+        oracle_df = self.oracle_status_df()
+        if not oracle_df.empty:
+            lines.extend(["", "  Rate conversion:"] +
+                         ["    " + line for line in str(oracle_df).split("\n")])
+
+        assets_df = self.wallet_balance_data_frame([market_pair.maker, market_pair.taker])
+        lines.extend(["", "  Assets:"] +
+                     ["    " + line for line in str(assets_df).split("\n")])
+        return lines
+
+    @staticmethod
+    def _active_maker_orders_status_lines(limit_orders: List[LimitOrder], mid_price: Decimal) -> List[str]:
+        df = LimitOrder.to_pandas(limit_orders, float(mid_price))
+        df_lines = str(df).split("\n")
+        return ["", "  Active maker market orders:"] + ["    " + line for line in df_lines]
+
     def start(self, clock: Clock, timestamp: float):
         super().start(clock, timestamp)
         self._last_timestamp = timestamp
@@ -0,0 +1,39 @@
+from decimal import Decimal
+from typing import Callable, List
+
+import numpy as np
+
+# Relative precision kept by the float64 level calculations. Quanta finer than that are quantized with Decimal.
+FLOAT_RESOLUTION = 1e-12
+
+
+def quantize_levels(values: np.ndarray,
+                    get_quantum: Callable[[Decimal], Decimal],
+                    quantize_level: Callable[[int], Decimal]) -> List[Decimal]:
+    """
+    Rounds down the prices or sizes of all the levels of a proposal side to the market quantum in one pass.
+    The level values are calculated as float64 arrays and converted to Decimal only after quantization, so the
+    result matches the Decimal calculation within the quantum precision.
+    The quantum is looked up only for the smallest and the largest value. When they differ, when the quantum is finer
+    than the float64 resolution of the values or when there are non positive values, each level is quantized with
+    `quantize_level` instead.
+    :param values: the level prices or sizes
+    :param get_quantum: returns the market quantum for a value
+    :param quantize_level: calculates and quantizes the value of a level (by index) with Decimal
+    :return: the quantized values
+    """
+    if len(values) == 0:
+        return []
+    low = float(values.min())
+    high = float(values.max())
+    quantum = None
+    if np.isfinite(low) and np.isfinite(high) and low > 0:
+        quantum = get_quantum(Decimal(repr(high)))
+        if (quantum != get_quantum(Decimal(repr(low)))
+                or not quantum.is_finite()
+                or float(quantum) < high * FLOAT_RESOLUTION):
+            quantum = None
+    if quantum is None:
+        return [quantize_level(level) for level in range(len(values))]
+    steps = np.floor(values / float(quantum) * (1 + FLOAT_RESOLUTION))
+    return [Decimal(int(step)) * quantum for step in steps]
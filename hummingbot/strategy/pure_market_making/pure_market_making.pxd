@@ -58,9 +58,11 @@ cdef class PureMarketMakingStrategy(StrategyBase):
         bint _should_wait_order_cancel_confirmation
 
         object _moving_price_band
+        object _status_cache
 
     cdef object c_get_mid_price(self)
     cdef object c_create_base_proposal(self)
+    cdef list c_create_level_price_sizes(self, object reference_price, object spread, int levels, bint is_buy)
     cdef tuple c_get_adjusted_available_balance(self, list orders)
     cdef c_apply_order_levels_modifiers(self, object proposal)
     cdef c_apply_price_band(self, object proposal)
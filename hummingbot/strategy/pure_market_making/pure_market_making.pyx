@@ -1,7 +1,8 @@
 import logging
+import time
 from decimal import Decimal
 from math import ceil, floor
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
 
 import numpy as np
 import pandas as pd
@@ -13,12 +14,13 @@ from hummingbot.core.data_type.common import OrderType, PriceType, TradeType
 from hummingbot.core.data_type.limit_order cimport LimitOrder
 from hummingbot.core.data_type.limit_order import LimitOrder
 from hummingbot.core.network_iterator import NetworkStatus
-from hummingbot.core.utils import map_df_to_str
 from hummingbot.strategy.asset_price_delegate cimport AssetPriceDelegate
 from hummingbot.strategy.asset_price_delegate import AssetPriceDelegate
 from hummingbot.strategy.hanging_orders_tracker import CreatedPairOfOrders, HangingOrdersTracker
 from hummingbot.strategy.market_trading_pair_tuple import MarketTradingPairTuple
 from hummingbot.strategy.order_book_asset_price_delegate cimport OrderBookAssetPriceDelegate
+from hummingbot.strategy.proposal_levels import quantize_levels
+from hummingbot.strategy.status_rendering import StatusSectionCache, format_table
 from hummingbot.strategy.strategy_base import StrategyBase
 from hummingbot.strategy.utils import order_age
 from .data_types import PriceSize, Proposal
@@ -125,6 +127,7 @@ cdef class PureMarketMakingStrategy(StrategyBase):
         self._price_floor = price_floor
         self._ping_pong_enabled = ping_pong_enabled
         self._ping_pong_warning_lines = []
+        self._status_cache = StatusSectionCache()
         self._hb_app_notification = hb_app_notification
         self._order_override = order_override
         self._split_order_levels_enabled=split_order_levels_enabled
@@ -493,6 +496,9 @@ cdef class PureMarketMakingStrategy(StrategyBase):
         self._inventory_cost_price_delegate = value
 
     def inventory_skew_stats_data_frame(self) -> Optional[pd.DataFrame]:
+        return pd.DataFrame(data=self.inventory_skew_stats_data())
+
+    def inventory_skew_stats_data(self) -> List[List]:
         cdef:
             ExchangeBase market = self._market_info.market
 
@@ -538,7 +544,7 @@ cdef class PureMarketMakingStrategy(StrategyBase):
             float(target_base_ratio),
             float(base_asset_range)
         )
-        inventory_skew_df = pd.DataFrame(data=[
+        return [
             [f"Target Value ({self.quote_asset})", f"{target_base_amount_in_quote:.4f}",
              f"{target_quote_amount:.4f}"],
             ["Current %", f"{base_asset_ratio:.1%}", f"{quote_asset_ratio:.1%}"],
@@ -546,10 +552,12 @@ cdef class PureMarketMakingStrategy(StrategyBase):
             ["Inventory Range", f"{low_water_mark_ratio:.1%} - {high_water_mark_ratio:.1%}",
              f"{1 - high_water_mark_ratio:.1%} - {1 - low_water_mark_ratio:.1%}"],
             ["Order Adjust %", f"{bid_ask_ratios.bid_ratio:.1%}", f"{bid_ask_ratios.ask_ratio:.1%}"]
-        ])
-        return inventory_skew_df
+        ]
 
     def pure_mm_assets_df(self, to_show_current_pct: bool) -> pd.DataFrame:
+        return pd.DataFrame(data=self.pure_mm_assets_data(to_show_current_pct))
+
+    def pure_mm_assets_data(self, to_show_current_pct: bool) -> List[List]:
         market, trading_pair, base_asset, quote_asset = self._market_info
         price = self._market_info.get_mid_price()
         base_balance = float(market.get_balance(base_asset))
@@ -568,10 +576,13 @@ cdef class PureMarketMakingStrategy(StrategyBase):
         ]
         if to_show_current_pct:
             data.append(["Current %", f"{base_ratio:.1%}", f"{quote_ratio:.1%}"])
-        df = pd.DataFrame(data=data)
-        return df
+        return data
 
     def active_orders_df(self) -> pd.DataFrame:
+        columns, data = self.active_orders_data()
+        return pd.DataFrame(data=data, columns=columns)
+
+    def active_orders_data(self) -> Tuple[List[str], List[List]]:
         market, trading_pair, base_asset, quote_asset = self._market_info
         price = self.get_price()
         active_orders = self.active_orders
@@ -598,7 +609,7 @@ cdef class PureMarketMakingStrategy(StrategyBase):
                 amount_orig = self._order_amount + ((level_for_calculation - 1) * self._order_level_amount)
                 level = "hang"
             spread = 0 if price == 0 else abs(order.price - price)/price
-            age = pd.Timestamp(order_age(order, self._current_timestamp), unit='s').strftime('%H:%M:%S')
+            age = time.strftime('%H:%M:%S', time.gmtime(order_age(order, self._current_timestamp)))
             data.append([
                 level,
                 "buy" if order.is_buy else "sell",
@@ -609,9 +620,14 @@ cdef class PureMarketMakingStrategy(StrategyBase):
                 age
             ])
 
-        return pd.DataFrame(data=data, columns=columns)
+        return columns, data
 
     def market_status_data_frame(self, market_trading_pair_tuples: List[MarketTradingPairTuple]) -> pd.DataFrame:
+        markets_columns, markets_data = self.market_status_data(market_trading_pair_tuples)
+        return pd.DataFrame(data=markets_data, columns=markets_columns).replace(np.nan, '', regex=True)
+
+    def market_status_data(self,
+                           market_trading_pair_tuples: List[MarketTradingPairTuple]) -> Tuple[List[str], List[List]]:
         markets_data = []
         markets_columns = ["Exchange", "Market", "Best Bid", "Best Ask", f"Ref Price ({self._price_type.name})"]
         if self._price_type is PriceType.LastOwnTrade and self._last_own_trade_price.is_nan():
@@ -643,7 +659,7 @@ cdef class PureMarketMakingStrategy(StrategyBase):
                 float(ask_price),
                 float(ref_price)
             ])
-        return pd.DataFrame(data=markets_data, columns=markets_columns).replace(np.nan, '', regex=True)
+        return markets_columns, markets_data
 
     def format_status(self) -> str:
         if not self._all_markets_ready:
@@ -654,24 +670,33 @@ cdef class PureMarketMakingStrategy(StrategyBase):
         warning_lines.extend(self._ping_pong_warning_lines)
         warning_lines.extend(self.network_warning([self._market_info]))
 
-        markets_df = map_df_to_str(self.market_status_data_frame([self._market_info]))
-        lines.extend(["", "  Markets:"] + ["    " + line for line in markets_df.to_string(index=False).split("\n")])
-
-        assets_df = map_df_to_str(self.pure_mm_assets_df(not self._inventory_skew_enabled))
-        # append inventory skew stats.
-        if self._inventory_skew_enabled:
-            inventory_skew_df = map_df_to_str(self.inventory_skew_stats_data_frame())
-            assets_df = assets_df.append(inventory_skew_df)
+        markets_columns, markets_data = self.market_status_data([self._market_info])
+        lines.extend(["", "  Markets:"] + ["    " + line for line in format_table(markets_data, markets_columns)])
 
-        first_col_length = max(*assets_df[0].apply(len))
-        df_lines = assets_df.to_string(index=False, header=False,
-                                       formatters={0: ("{:<" + str(first_col_length) + "}").format}).split("\n")
-        lines.extend(["", "  Assets:"] + ["    " + line for line in df_lines])
+        # The assets and orders sections are rendered again only when the values they show can have changed
+        market, trading_pair, base_asset, quote_asset = self._market_info
+        active_orders = self.active_orders
+        price = self.get_price()
+        params_key = (self._order_amount, self._order_level_amount, self._order_levels, self._inventory_skew_enabled,
+                      self._inventory_target_base_pct, self._inventory_range_multiplier)
+        orders_key = tuple((o.client_order_id, o.price, o.quantity,
+                            self._hanging_orders_tracker.is_order_id_in_hanging_orders(o.client_order_id))
+                           for o in active_orders)
+        assets_key = (price,
+                      self._market_info.get_mid_price(),
+                      market.get_balance(base_asset),
+                      market.get_balance(quote_asset),
+                      market.get_available_balance(base_asset),
+                      market.get_available_balance(quote_asset),
+                      params_key,
+                      orders_key)
+        lines.extend(["", "  Assets:"] + self._status_cache.get_lines("assets", assets_key, self._assets_status_lines))
 
         # See if there're any open orders.
-        if len(self.active_orders) > 0:
-            df = map_df_to_str(self.active_orders_df())
-            lines.extend(["", "  Orders:"] + ["    " + line for line in df.to_string(index=False).split("\n")])
+        if len(active_orders) > 0:
+            orders_key = (orders_key, price, params_key, int(self._current_timestamp))
+            lines.extend(["", "  Orders:"] + self._status_cache.get_lines("orders", orders_key,
+                                                                         self._orders_status_lines))
         else:
             lines.extend(["", "  No active maker orders."])
 
@@ -682,6 +707,17 @@ cdef class PureMarketMakingStrategy(StrategyBase):
 
         return "\n".join(lines)
 
+    def _assets_status_lines(self) -> List[str]:
+        assets_data = self.pure_mm_assets_data(not self._inventory_skew_enabled)
+        # append inventory skew stats.
+        if self._inventory_skew_enabled:
+            assets_data.extend(self.inventory_skew_stats_data())
+        return ["    " + line for line in format_table(assets_data, left_align_first_column=True)]
+
+    def _orders_status_lines(self) -> List[str]:
+        columns, data = self.active_orders_data()
+        return ["    " + line for line in format_table(data, columns)]
+
     # The following exposed Python functions are meant for unit tests
     # ---------------------------------------------------------------
     def execute_orders_proposal(self, proposal: Proposal):
@@ -802,24 +838,44 @@ cdef class PureMarketMakingStrategy(StrategyBase):
                             sells.append(PriceSize(price, size))
         else:
             if not buy_reference_price.is_nan():
-                for level in range(0, self._buy_levels):
-                    price = buy_reference_price * (Decimal("1") - self._bid_spread - (level * self._order_level_spread))
-                    price = market.c_quantize_order_price(self.trading_pair, price)
-                    size = self._order_amount + (self._order_level_amount * level)
-                    size = market.c_quantize_order_amount(self.trading_pair, size)
-                    if size > 0:
-                        buys.append(PriceSize(price, size))
+                buys = self.c_create_level_price_sizes(buy_reference_price, self._bid_spread, self._buy_levels, True)
             if not sell_reference_price.is_nan():
-                for level in range(0, self._sell_levels):
-                    price = sell_reference_price * (Decimal("1") + self._ask_spread + (level * self._order_level_spread))
-                    price = market.c_quantize_order_price(self.trading_pair, price)
-                    size = self._order_amount + (self._order_level_amount * level)
-                    size = market.c_quantize_order_amount(self.trading_pair, size)
-                    if size > 0:
-                        sells.append(PriceSize(price, size))
+                sells = self.c_create_level_price_sizes(sell_reference_price, self._ask_spread, self._sell_levels, False)
 
         return Proposal(buys, sells)
 
+    cdef list c_create_level_price_sizes(self, object reference_price, object spread, int levels, bint is_buy):
+        """
+        Creates the order levels of one side of the proposal, calculating the prices and sizes of all the levels
+        as arrays and quantizing them in one pass.
+        """
+        cdef:
+            ExchangeBase market = self._market_info.market
+            str trading_pair = self.trading_pair
+            object level_spread = self._order_level_spread
+
+        level_steps = np.arange(levels, dtype=np.float64)
+        level_spreads = float(spread) + level_steps * float(level_spread)
+        if is_buy:
+            prices = quantize_levels(
+                float(reference_price) * (1 - level_spreads),
+                lambda price: market.c_get_order_price_quantum(trading_pair, price),
+                lambda level: market.c_quantize_order_price(
+                    trading_pair, reference_price * (Decimal("1") - spread - (level * level_spread))))
+        else:
+            prices = quantize_levels(
+                float(reference_price) * (1 + level_spreads),
+                lambda price: market.c_get_order_price_quantum(trading_pair, price),
+                lambda level: market.c_quantize_order_price(
+                    trading_pair, reference_price * (Decimal("1") + spread + (level * level_spread))))
+        sizes = quantize_levels(
+            float(self._order_amount) + level_steps * float(self._order_level_amount),
+            lambda size: market.c_get_order_size_quantum(trading_pair, size),
+            lambda level: market.c_quantize_order_amount(
+                trading_pair, self._order_amount + (self._order_level_amount * level)))
+
+        return [PriceSize(price, size) for price, size in zip(prices, sizes) if size > 0]
+
     cdef tuple c_get_adjusted_available_balance(self, list orders):
         """
         Calculates the available balance, plus the amount attributed to orders.
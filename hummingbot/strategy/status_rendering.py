@@ -0,0 +1,65 @@
+import math
+from typing import Any, Callable, Dict, Hashable, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+
+def format_cell(value: Any) -> str:
+    """
+    Formats a status table cell the same way `map_df_to_str` formats a DataFrame cell, with NaN shown as empty
+    """
+    if isinstance(value, float):
+        if math.isnan(value):
+            return ""
+        return np.format_float_positional(value, trim="-")
+    return str(value)
+
+
+def format_table(rows: Sequence[Sequence[Any]],
+                 columns: Optional[Sequence[str]] = None,
+                 left_align_first_column: bool = False) -> List[str]:
+    """
+    Renders rows as plain text table lines with the layout of `DataFrame.to_string(index=False)`: right aligned
+    columns separated by a space, optionally with the first column left aligned.
+    :param rows: the table rows
+    :param columns: the header names, no header line is rendered when not specified
+    :param left_align_first_column: left aligns the first column, used for the label column of the asset tables
+    :return: the table lines
+    """
+    str_rows = [[format_cell(cell) for cell in row] for row in rows]
+    if columns is not None:
+        str_rows.insert(0, [str(column) for column in columns])
+    if len(str_rows) == 0:
+        return []
+    widths = [max(len(row[i]) for row in str_rows) for i in range(len(str_rows[0]))]
+    lines = []
+    for row in str_rows:
+        cells = [cell.rjust(width) for cell, width in zip(row, widths)]
+        if left_align_first_column:
+            cells[0] = row[0].ljust(widths[0])
+        lines.append(" ".join(cells))
+    return lines
+
+
+class StatusSectionCache:
+    """
+    Keeps the rendered lines of the status sections of a strategy. A section is rendered again only when its key,
+    built from the values the section depends on (top of book, balances, active orders...), changes.
+    """
+
+    def __init__(self):
+        self._sections: Dict[Hashable, Tuple[Hashable, List[str]]] = {}
+
+    def get_lines(self, section: Hashable, key: Hashable, render: Callable[[], List[str]]) -> List[str]:
+        cached = self._sections.get(section)
+        if cached is not None and cached[0] == key:
+            return cached[1]
+        lines = render()
+        self._sections[section] = (key, lines)
+        return lines
+
+    def invalidate(self, section: Optional[Hashable] = None):
+        if section is None:
+            self._sections.clear()
+        else:
+            self._sections.pop(section, None)
@@ -0,0 +1,93 @@
+#!/usr/bin/env python
+
+"""
+Measures the event loop lag caused by a storm of network error logs, with the handlers called on the event loop
+thread and with the handlers behind the log queue (with and without rate limiting).
+
+Usage: python test/debug/benchmark_log_storm.py [records per tick]
+"""
+
+import asyncio
+import logging
+import os
+import statistics
+import sys
+import tempfile
+import time
+from typing import Dict, List
+
+from hummingbot.logger import NETWORK
+from hummingbot.logger.queue_logging import (
+    BatchedTimedRotatingFileHandler,
+    install_queue_logging,
+    uninstall_queue_logging,
+)
+
+LOGGER_NAME = "hummingbot.connector.benchmark"
+FORMAT = "%(asctime)s - %(process)d - %(name)s - %(levelname)s - %(message)s"
+TICK = 0.01
+DURATION = 3.0
+
+
+def configure_handlers(log_dir: str):
+    logger = logging.getLogger(LOGGER_NAME)
+    logger.handlers = []
+    logger.propagate = False
+    logger.setLevel(NETWORK)
+    file_handler = BatchedTimedRotatingFileHandler(os.path.join(log_dir, "logs.log"), when="D", encoding="utf8")
+    console_handler = logging.StreamHandler(open(os.devnull, "w"))
+    for handler in (file_handler, console_handler):
+        handler.setFormatter(logging.Formatter(FORMAT))
+        logger.addHandler(handler)
+    return logger
+
+
+async def log_storm(logger: logging.Logger, records_per_tick: int):
+    end = time.perf_counter() + DURATION
+    while time.perf_counter() < end:
+        for i in range(records_per_tick):
+            try:
+                raise ConnectionError("Cannot connect to host api.exchange.com:443")
+            except ConnectionError:
+                logger.network(f"Error fetching balances. Retrying in 1 second. (order {i % 10})", exc_info=True)
+        await asyncio.sleep(TICK)
+
+
+async def measure_lag() -> List[float]:
+    lags = []
+    end = time.perf_counter() + DURATION
+    while time.perf_counter() < end:
+        start = time.perf_counter()
+        await asyncio.sleep(TICK)
+        lags.append(time.perf_counter() - start - TICK)
+    return lags
+
+
+def run(mode: str, records_per_tick: int) -> Dict[str, float]:
+    with tempfile.TemporaryDirectory() as log_dir:
+        logger = configure_handlers(log_dir)
+        if mode != "direct":
+            install_queue_logging({"rate_limit_burst": 5 if mode == "queue + rate limit" else 0}, [LOGGER_NAME])
+
+        async def main():
+            lags, _ = await asyncio.gather(measure_lag(), log_storm(logger, records_per_tick))
+            return lags
+
+        lags = asyncio.run(main())
+        uninstall_queue_logging()
+        for handler in logger.handlers:
+            handler.close()
+    lags_ms = sorted(lag * 1000 for lag in lags)
+    return {
+        "mean": statistics.mean(lags_ms),
+        "p99": lags_ms[int(len(lags_ms) * 0.99)],
+        "max": lags_ms[-1],
+    }
+
+
+if __name__ == "__main__":
+    records = int(sys.argv[1]) if len(sys.argv) > 1 else 50
+    print(f"Event loop lag (ms) with {records} network error logs every {TICK * 1000:.0f}ms:")
+    for mode in ("direct", "queue", "queue + rate limit"):
+        stats = run(mode, records)
+        print(f"{mode:>20}: mean {stats['mean']:6.2f}  p99 {stats['p99']:6.2f}  max {stats['max']:6.2f}")
@@ -0,0 +1,95 @@
+#!/usr/bin/env python
+
+"""
+Measures the cost of sending a tick to a PMM script process on the strategy side, and the latency until the script
+process receives it, with the OnTick messages of a multiprocessing queue and with the shared memory market state.
+
+Usage: python test/debug/benchmark_pmm_script_ipc.py [ticks]
+"""
+
+import multiprocessing as mp
+import statistics
+import sys
+import time
+from decimal import Decimal
+from typing import Dict, List
+
+from hummingbot.pmm_script.pmm_script_channel import SharedMarketState
+from hummingbot.pmm_script.pmm_script_interface import OnTick, PMMParameters
+
+TICK_INTERVAL = 0.001
+
+
+def balances() -> Dict[str, Dict[str, Decimal]]:
+    return {exchange: {token: Decimal("1234.5678") for token in ("BTC", "ETH", "USDT", "BNB")}
+            for exchange in ("binance", "kucoin")}
+
+
+def receive_on_ticks(ticks_queue: mp.Queue, results: mp.Queue, ticks: int):
+    latencies = []
+    while len(latencies) < ticks:
+        if ticks_queue.empty():
+            continue
+        tick = ticks_queue.get()
+        latencies.append(time.perf_counter() - tick.sent_at)
+    results.put(latencies)
+
+
+def receive_market_state(market_state: SharedMarketState, results: mp.Queue, ticks: int):
+    latencies = []
+    while len(latencies) < ticks:
+        if not market_state.has_new_ticks():
+            continue
+        for timestamp, _ in market_state.read_new_ticks():
+            latencies.append(time.perf_counter() - timestamp)
+    results.put(latencies)
+    market_state.close()
+
+
+def send_on_ticks(ticks: int) -> Dict[str, List[float]]:
+    ticks_queue, results = mp.Queue(), mp.Queue()
+    process = mp.Process(target=receive_on_ticks, args=(ticks_queue, results, ticks))
+    process.start()
+    parameters, total_balances, available_balances = PMMParameters(), balances(), balances()
+    costs = []
+    for i in range(ticks):
+        start = time.perf_counter()
+        tick = OnTick(Decimal("100") + Decimal(i) / 1000, parameters, total_balances, available_balances)
+        tick.sent_at = start
+        ticks_queue.put(tick)
+        costs.append(time.perf_counter() - start)
+        time.sleep(TICK_INTERVAL)
+    latencies = results.get()
+    process.join()
+    return {"cost": costs, "latency": latencies}
+
+
+def send_market_state(ticks: int) -> Dict[str, List[float]]:
+    market_state, results = SharedMarketState(), mp.Queue()
+    process = mp.Process(target=receive_market_state, args=(market_state, results, ticks))
+    process.start()
+    costs = []
+    for i in range(ticks):
+        start = time.perf_counter()
+        market_state.publish(start, Decimal("100") + Decimal(i) / 1000)
+        costs.append(time.perf_counter() - start)
+        time.sleep(TICK_INTERVAL)
+    latencies = results.get()
+    process.join()
+    market_state.close()
+    return {"cost": costs, "latency": latencies}
+
+
+def summary(values: List[float]) -> str:
+    values_us = sorted(value * 1e6 for value in values)
+    return (f"mean {statistics.mean(values_us):8.1f}  p50 {values_us[len(values_us) // 2]:8.1f}  "
+            f"p99 {values_us[int(len(values_us) * 0.99)]:8.1f}")
+
+
+if __name__ == "__main__":
+    ticks_count = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+    print(f"{ticks_count} ticks every {TICK_INTERVAL * 1000:.0f}ms, in microseconds:")
+    for name, send in (("OnTick queue", send_on_ticks), ("shared market state", send_market_state)):
+        stats = send(ticks_count)
+        print(f"{name:>20}: strategy cost {summary(stats['cost'])}")
+        print(f"{'':>20}  delivery      {summary(stats['latency'])}")
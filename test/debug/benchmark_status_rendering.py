@@ -0,0 +1,83 @@
+#!/usr/bin/env python
+
+"""
+Compares the pure market making status rendering based on pandas DataFrames with the cached plain text rendering
+used by `format_status`.
+
+Usage: python test/debug/benchmark_status_rendering.py [iterations]
+"""
+
+import sys
+import timeit
+from decimal import Decimal
+
+import pandas as pd
+
+from hummingbot.client.config.client_config_map import ClientConfigMap
+from hummingbot.client.config.config_helpers import ClientConfigAdapter
+from hummingbot.connector.exchange.paper_trade.paper_trade_exchange import QuantizationParams
+from hummingbot.connector.test_support.mock_paper_exchange import MockPaperExchange
+from hummingbot.core.clock import Clock, ClockMode
+from hummingbot.core.utils import map_df_to_str
+from hummingbot.strategy.market_trading_pair_tuple import MarketTradingPairTuple
+from hummingbot.strategy.pure_market_making.pure_market_making import PureMarketMakingStrategy
+
+TRADING_PAIR = "HBOT-ETH"
+
+
+def create_strategy() -> PureMarketMakingStrategy:
+    start_timestamp = pd.Timestamp("2019-01-01", tz="UTC").timestamp()
+    clock = Clock(ClockMode.BACKTEST, 1, start_timestamp, start_timestamp + 3600)
+    market = MockPaperExchange(client_config_map=ClientConfigAdapter(ClientConfigMap()))
+    market.set_balanced_order_book(TRADING_PAIR, mid_price=100, min_price=1, max_price=200,
+                                   price_step_size=1, volume_step_size=10)
+    market.set_balance("HBOT", 50)
+    market.set_balance("ETH", 5000)
+    market.set_quantization_param(QuantizationParams(TRADING_PAIR, 6, 6, 6, 6))
+    market_info = MarketTradingPairTuple(market, TRADING_PAIR, "HBOT", "ETH")
+    strategy = PureMarketMakingStrategy()
+    strategy.init_params(market_info,
+                         bid_spread=Decimal("0.01"),
+                         ask_spread=Decimal("0.01"),
+                         order_amount=Decimal("1"),
+                         order_levels=5,
+                         order_level_spread=Decimal("0.01"),
+                         order_level_amount=Decimal("1"),
+                         order_refresh_time=60.0,
+                         filled_order_delay=60.0,
+                         inventory_skew_enabled=True,
+                         inventory_target_base_pct=Decimal("0.5"),
+                         inventory_range_multiplier=Decimal("2"))
+    clock.add_iterator(market)
+    clock.add_iterator(strategy)
+    clock.backtest_til(start_timestamp + 10)
+    return strategy
+
+
+def data_frame_status(strategy: PureMarketMakingStrategy) -> str:
+    lines = []
+    markets_df = map_df_to_str(strategy.market_status_data_frame([strategy.market_info]))
+    lines.extend(["", "  Markets:"] + ["    " + line for line in markets_df.to_string(index=False).split("\n")])
+    assets_df = pd.concat([map_df_to_str(strategy.pure_mm_assets_df(False)),
+                           map_df_to_str(strategy.inventory_skew_stats_data_frame())])
+    first_col_length = max(*assets_df[0].apply(len))
+    df_lines = assets_df.to_string(index=False, header=False,
+                                   formatters={0: ("{:<" + str(first_col_length) + "}").format}).split("\n")
+    lines.extend(["", "  Assets:"] + ["    " + line for line in df_lines])
+    orders_df = map_df_to_str(strategy.active_orders_df())
+    lines.extend(["", "  Orders:"] + ["    " + line for line in orders_df.to_string(index=False).split("\n")])
+    return "\n".join(lines)
+
+
+def main():
+    iterations = int(sys.argv[1]) if len(sys.argv) > 1 else 1000
+    strategy = create_strategy()
+    data_frame_time = timeit.timeit(lambda: data_frame_status(strategy), number=iterations)
+    cached_time = timeit.timeit(strategy.format_status, number=iterations)
+    print(f"Active orders: {len(strategy.active_orders)}, iterations: {iterations}")
+    print(f"DataFrame rendering: {data_frame_time / iterations * 1e3:.3f} ms per status")
+    print(f"Cached rendering:    {cached_time / iterations * 1e3:.3f} ms per status")
+
+
+if __name__ == "__main__":
+    main()
@@ -87,6 +87,7 @@ class ConfigCommandTest(unittest.TestCase):
                            "    | ∟ gateway_api_host                | localhost            |\n"
                            "    | ∟ gateway_api_port                | 15888                |\n"
                            "    | rate_oracle_source                | binance              |\n"
+                           "    | rate_oracle_connector_prices      | False                |\n"
                            "    | global_token                      |                      |\n"
                            "    | ∟ global_token_name               | USDT                 |\n"
                            "    | ∟ global_token_symbol             | $                    |\n"
@@ -100,6 +101,15 @@ class ConfigCommandTest(unittest.TestCase):
                            "    | ∟ market_data_collection_enabled  | True                 |\n"
                            "    | ∟ market_data_collection_interval | 60                   |\n"
                            "    | ∟ market_data_collection_depth    | 20                   |\n"
+                           "    | ∟ market_data_order_book_levels   | False                |\n"
+                           "    | performance_monitor               |                      |\n"
+                           "    | ∟ performance_monitor_enabled     | False                |\n"
+                           "    | ∟ slow_callback_duration          | 0.1                  |\n"
+                           "    | ∟ task_cpu_sampling               | False                |\n"
+                           "    | metrics_exporter                  |                      |\n"
+                           "    | ∟ metrics_exporter_enabled        | False                |\n"
+                           "    | ∟ metrics_exporter_host           | 127.0.0.1            |\n"
+                           "    | ∟ metrics_exporter_port           | 9464                 |\n"
                            "    +-----------------------------------+----------------------+")
 
         self.assertEqual(df_str_expected, captures[1])
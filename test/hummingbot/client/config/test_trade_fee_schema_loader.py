@@ -0,0 +1,70 @@
+import unittest
+from decimal import Decimal
+
+from hummingbot.client.config.fee_overrides_config_map import fee_overrides_config_map, fee_overrides_dict
+from hummingbot.client.config.trade_fee_schema_loader import TradeFeeSchemaLoader
+from hummingbot.client.settings import AllConnectorSettings, ConnectorSetting, ConnectorType
+from hummingbot.core.data_type.trade_fee import TokenAmount, TradeFeeSchema
+
+
+class TradeFeeSchemaLoaderTest(unittest.TestCase):
+    exchange = "mock_fee_exchange"
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.schema = TradeFeeSchema(maker_percent_fee_decimal=Decimal("0.001"),
+                                     taker_percent_fee_decimal=Decimal("0.002"))
+        self.set_connector_schema(self.schema)
+        fee_overrides_config_map.update(fee_overrides_dict())
+        TradeFeeSchemaLoader.invalidate()
+
+    def tearDown(self) -> None:
+        AllConnectorSettings.get_connector_settings().pop(self.exchange, None)
+        for suffix in TradeFeeSchemaLoader.OVERRIDE_SUFFIXES:
+            fee_overrides_config_map.pop(f"{self.exchange}_{suffix}", None)
+        TradeFeeSchemaLoader.invalidate()
+        super().tearDown()
+
+    def set_connector_schema(self, schema: TradeFeeSchema):
+        AllConnectorSettings.get_connector_settings()[self.exchange] = ConnectorSetting(
+            self.exchange,
+            type=ConnectorType.Exchange,
+            example_pair="COINALPHA-HBOT",
+            centralised=True,
+            use_ethereum_wallet=False,
+            trade_fee_schema=schema,
+            config_keys={},
+            is_sub_domain=False,
+            parent_name="",
+            domain_parameter="",
+            use_eth_gas_lookup=False,
+        )
+
+    def test_configured_schema_is_kept_while_overrides_do_not_change(self):
+        schema = TradeFeeSchemaLoader.configured_schema_for_exchange(self.exchange)
+        schema.maker_fixed_fees = "not validated again"
+
+        self.assertIs(schema, TradeFeeSchemaLoader.configured_schema_for_exchange(self.exchange))
+        self.assertEqual("not validated again", schema.maker_fixed_fees)
+
+    def test_configured_schema_is_rebuilt_when_an_override_changes(self):
+        schema = TradeFeeSchemaLoader.configured_schema_for_exchange(self.exchange)
+        self.assertEqual(Decimal("0.001"), schema.maker_percent_fee_decimal)
+
+        fee_overrides_config_map[f"{self.exchange}_maker_percent_fee"].value = Decimal("0.5")
+        fee_overrides_config_map[f"{self.exchange}_maker_fixed_fees"].value = [["HBOT", Decimal("1")]]
+        schema = TradeFeeSchemaLoader.configured_schema_for_exchange(self.exchange)
+
+        self.assertEqual(Decimal("0.005"), schema.maker_percent_fee_decimal)
+        self.assertEqual([TokenAmount("HBOT", Decimal("1"))], schema.maker_fixed_fees)
+
+    def test_configured_schema_is_rebuilt_when_the_connector_schema_is_replaced(self):
+        TradeFeeSchemaLoader.configured_schema_for_exchange(self.exchange)
+        new_schema = TradeFeeSchema(maker_percent_fee_decimal=Decimal("0.003"),
+                                    taker_percent_fee_decimal=Decimal("0.004"))
+        self.set_connector_schema(new_schema)
+
+        schema = TradeFeeSchemaLoader.configured_schema_for_exchange(self.exchange)
+
+        self.assertIs(new_schema, schema)
+        self.assertEqual(Decimal("0.003"), schema.maker_percent_fee_decimal)
@@ -5,7 +5,7 @@ from decimal import Decimal
 from typing import Awaitable
 from unittest.mock import MagicMock, patch
 
-from hummingbot.client.performance import PerformanceMetrics
+from hummingbot.client.performance import PerformanceLedger, PerformanceMetrics
 from hummingbot.core.data_type.common import OrderType, PositionAction, TradeType
 from hummingbot.core.data_type.trade import Trade
 from hummingbot.core.data_type.trade_fee import AddedToCostTradeFee, DeductedFromReturnsTradeFee, TokenAmount
@@ -36,6 +36,25 @@ class PerformanceMetricsUnitTest(unittest.TestCase):
 
         return trade
 
+    def trade_fill(self, order_id, trade_type, price, amount, timestamp, fee, position=PositionAction.NIL.value):
+        return TradeFill(
+            config_file_path="some-strategy.yml",
+            strategy="pure_market_making",
+            market="binance",
+            symbol=trading_pair,
+            base_asset=base,
+            quote_asset=quote,
+            timestamp=timestamp,
+            order_id=order_id,
+            trade_type=trade_type,
+            order_type="LIMIT",
+            price=price,
+            amount=amount,
+            trade_fee=fee.to_json(),
+            exchange_trade_id=f"exchange{order_id}",
+            position=position,
+        )
+
     def async_run_with_timeout(self, coroutine: Awaitable, timeout: int = 1):
         ret = asyncio.get_event_loop().run_until_complete(asyncio.wait_for(coroutine, timeout))
         return ret
@@ -341,3 +360,62 @@ class PerformanceMetricsUnitTest(unittest.TestCase):
         performance_metric = PerformanceMetrics()
         returned_impact = performance_metric._process_deducted_fees_impact_in_quote_vol(dummy_trade)
         self.assertEqual(returned_impact, Decimal("-100.0"))
+
+    def test_performance_metrics_from_ledger_match_metrics_from_trades(self):
+        rate_oracle = RateOracle()
+        rate_oracle._prices[trading_pair] = Decimal("110")
+        rate_oracle._prices[f"BNB-{quote}"] = Decimal("300")
+        RateOracle._shared_instance = rate_oracle
+
+        trades = [
+            self.trade_fill("someId0", "BUY", price=100, amount=10, timestamp=1000,
+                            fee=AddedToCostTradeFee(percent=Decimal("0.001"),
+                                                    flat_fees=[TokenAmount("BNB", Decimal("0.01"))])),
+            self.trade_fill("someId1", "SELL", price=120, amount=15, timestamp=2000,
+                            fee=DeductedFromReturnsTradeFee(percent=Decimal("0.002"))),
+            self.trade_fill("someId2", "BUY", price=105, amount=2, timestamp=3000,
+                            fee=AddedToCostTradeFee(flat_fees=[TokenAmount(quote, Decimal("0.5"))])),
+        ]
+        cur_bals = {base: Decimal("100"), quote: Decimal("10000")}
+        ledger = PerformanceLedger(market="binance", symbol=trading_pair)
+        for trade in trades:
+            ledger.add_trade(trade)
+
+        expected = self.async_run_with_timeout(PerformanceMetrics.create(trading_pair, trades, cur_bals))
+        metrics = self.async_run_with_timeout(PerformanceMetrics.create_from_ledger(trading_pair, ledger, cur_bals))
+
+        self.assertFalse(ledger.is_derivative)
+        self.assertEqual(expected, metrics)
+
+    def test_performance_ledger_json_round_trip_skips_included_trades(self):
+        fee = AddedToCostTradeFee(percent=Decimal("0.001"), flat_fees=[TokenAmount("BNB", Decimal("0.01"))])
+        trades = [
+            self.trade_fill("someId0", "BUY", price=100, amount=10, timestamp=1000, fee=fee),
+            self.trade_fill("someId1", "SELL", price=120, amount=15, timestamp=2000, fee=fee),
+        ]
+        ledger = PerformanceLedger(market="binance", symbol=trading_pair)
+        for trade in trades:
+            ledger.add_trade(trade)
+
+        restored = PerformanceLedger.from_json(ledger.to_json())
+
+        self.assertEqual(ledger.to_json(), restored.to_json())
+        self.assertEqual(2, restored.num_trades)
+        self.assertEqual(Decimal("0.02"), restored.fees["BNB"])
+        self.assertTrue(restored.is_trade_included(trades[0]))
+        self.assertTrue(restored.is_trade_included(trades[1]))
+        late_trade = self.trade_fill("someId2", "BUY", price=110, amount=1, timestamp=1500, fee=fee)
+        self.assertFalse(restored.is_trade_included(late_trade))
+        old_trade = self.trade_fill("someId3", "BUY", price=110, amount=1,
+                                    timestamp=2000 - PerformanceLedger.RECENT_TRADES_WINDOW_MS - 1, fee=fee)
+        self.assertTrue(restored.is_trade_included(old_trade))
+
+    def test_performance_metrics_from_derivative_ledger_fails(self):
+        fee = AddedToCostTradeFee(percent=Decimal("0.001"))
+        ledger = PerformanceLedger(market="binance_perpetual", symbol=trading_pair)
+        ledger.add_trade(self.trade_fill("someId0", "BUY", price=100, amount=10, timestamp=1000, fee=fee,
+                                         position=PositionAction.OPEN.value))
+
+        self.assertTrue(ledger.is_derivative)
+        with self.assertRaises(ValueError):
+            self.async_run_with_timeout(PerformanceMetrics.create_from_ledger(trading_pair, ledger, {}))
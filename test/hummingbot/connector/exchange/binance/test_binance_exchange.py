@@ -1099,6 +1099,26 @@ class BinanceExchangeTests(AbstractExchangeConnectorTests.ExchangeConnectorTests
                             "Error: {'code':-1021,'msg':'Other error.'}")
         self.assertFalse(self.exchange._is_request_exception_related_to_time_synchronizer(exception))
 
+    @aioresponses()
+    def test_get_pairs_prices_requests_only_given_symbols(self, mock_api):
+        url = web_utils.public_rest_url(path_url=CONSTANTS.TICKER_BOOK_PATH_URL)
+        regex_url = re.compile(f"^{url}".replace(".", r"\.").replace("?", r"\?"))
+        symbol = self.exchange_symbol_for_tokens(self.base_asset, self.quote_asset)
+        response = [{
+            "symbol": symbol,
+            "bidPrice": "4.00000000",
+            "bidQty": "431.00000000",
+            "askPrice": "4.00000200",
+            "askQty": "9.00000000",
+        }]
+        mock_api.get(regex_url, body=json.dumps(response))
+
+        prices = self.async_run_with_timeout(self.exchange.get_pairs_prices(symbols=[symbol]))
+
+        self.assertEqual(response, prices)
+        request = self._all_executed_requests(mock_api, url)[0]
+        self.assertEqual(json.dumps([symbol], separators=(",", ":")), request.kwargs["params"]["symbols"])
+
     @aioresponses()
     def test_place_order_manage_server_overloaded_error_unkown_order(self, mock_api):
         self.exchange._set_current_timestamp(1640780000)
@@ -542,12 +542,28 @@ class OkxExchangeTests(AbstractExchangeConnectorTests.ExchangeConnectorTests):
         """
         :return: a list of all configured URLs for the cancelations
         """
-        all_urls = []
-        url = self.configure_successful_cancelation_response(order=successful_order, mock_api=mock_api)
-        all_urls.append(url)
-        url = self.configure_erroneous_cancelation_response(order=erroneous_order, mock_api=mock_api)
-        all_urls.append(url)
-        return all_urls
+        # Both cancelations are sent in a single batch request
+        url = web_utils.private_rest_url(path_url=CONSTANTS.OKX_BATCH_ORDER_CANCEL_PATH)
+        response = {
+            "code": "2",
+            "msg": "",
+            "data": [
+                {
+                    "clOrdId": successful_order.client_order_id,
+                    "ordId": successful_order.exchange_order_id,
+                    "sCode": "0",
+                    "sMsg": ""
+                },
+                {
+                    "clOrdId": erroneous_order.client_order_id,
+                    "ordId": erroneous_order.exchange_order_id,
+                    "sCode": "1",
+                    "sMsg": "Error"
+                }
+            ]
+        }
+        mock_api.post(url, body=json.dumps(response))
+        return [url]
 
     def configure_order_not_found_error_cancelation_response(
             self, order: InFlightOrder, mock_api: aioresponses,
@@ -1182,3 +1198,42 @@ class OkxExchangeTests(AbstractExchangeConnectorTests.ExchangeConnectorTests):
             else:
                 self.assertIn(order.client_order_id, self.exchange.in_flight_orders)
                 self.assertTrue(order.is_pending_cancel_confirmation)
+
+    @aioresponses()
+    def test_orders_created_in_the_same_cycle_are_sent_in_one_batch_request(self, mock_api):
+        self._simulate_trading_rules_initialized()
+        request_sent_event = asyncio.Event()
+        self.exchange._set_current_timestamp(1640780000)
+
+        url = web_utils.private_rest_url(path_url=CONSTANTS.OKX_BATCH_PLACE_ORDER_PATH)
+        buy_order_id = self.client_order_id_prefix + "1"
+        sell_order_id = self.client_order_id_prefix + "2"
+        creation_response = {
+            "code": "2",
+            "msg": "",
+            "data": [
+                {"clOrdId": buy_order_id, "ordId": "EOID1", "tag": "", "sCode": "0", "sMsg": ""},
+                {"clOrdId": sell_order_id, "ordId": "", "tag": "", "sCode": "51008", "sMsg": "Insufficient balance"},
+            ]
+        }
+        mock_api.post(url,
+                      body=json.dumps(creation_response),
+                      callback=lambda *args, **kwargs: request_sent_event.set())
+
+        with patch("hummingbot.connector.exchange_py_base.get_new_client_order_id") as mocked_order_id:
+            mocked_order_id.side_effect = [buy_order_id, sell_order_id]
+            self.exchange.buy(self.trading_pair, Decimal("100"), OrderType.LIMIT, Decimal("10000"))
+            self.exchange.sell(self.trading_pair, Decimal("100"), OrderType.LIMIT, Decimal("11000"))
+        self.async_run_with_timeout(request_sent_event.wait())
+
+        order_request = self._all_executed_requests(mock_api, url)[0]
+        self.validate_auth_credentials_present(order_request)
+        request_data = json.loads(order_request.kwargs["data"])
+        self.assertEqual([buy_order_id, sell_order_id], [order_data["clOrdId"] for order_data in request_data])
+        self.assertEqual(["buy", "sell"], [order_data["side"] for order_data in request_data])
+
+        self.assertEqual("EOID1", self.exchange.in_flight_orders[buy_order_id].exchange_order_id)
+        self.assertEqual(1, len(self.buy_order_created_logger.event_log))
+        self.assertNotIn(sell_order_id, self.exchange.in_flight_orders)
+        self.assertEqual(1, len(self.order_failure_logger.event_log))
+        self.assertEqual(sell_order_id, self.order_failure_logger.event_log[0].order_id)
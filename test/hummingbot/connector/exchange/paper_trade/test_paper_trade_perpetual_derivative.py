@@ -0,0 +1,181 @@
+import asyncio
+from decimal import Decimal
+from typing import Awaitable
+from unittest import TestCase
+
+from hummingbot.client.config.client_config_map import ClientConfigMap
+from hummingbot.client.config.config_helpers import ClientConfigAdapter
+from hummingbot.connector.derivative.binance_perpetual.binance_perpetual_api_order_book_data_source import (
+    BinancePerpetualAPIOrderBookDataSource,
+)
+from hummingbot.connector.exchange.paper_trade import create_paper_trade_market
+from hummingbot.connector.exchange.paper_trade.paper_trade_perpetual_derivative import PaperTradePerpetualDerivative
+from hummingbot.core.data_type.common import OrderType, PositionAction, PositionMode, PositionSide, TradeType
+from hummingbot.core.data_type.composite_order_book import CompositeOrderBook
+from hummingbot.core.data_type.funding_info import FundingInfo
+from hummingbot.core.data_type.order_book_row import OrderBookRow
+from hummingbot.core.event.event_logger import EventLogger
+from hummingbot.core.event.events import (
+    AccountEvent,
+    BuyOrderCompletedEvent,
+    FundingPaymentCompletedEvent,
+    MarketEvent,
+    MarketOrderFailureEvent,
+    OrderBookTradeEvent,
+    OrderFilledEvent,
+    PositionModeChangeEvent,
+)
+
+
+class PaperTradePerpetualDerivativeTests(TestCase):
+    start_timestamp = 1640000000.0
+    trading_pair = "COINALPHA-HBOT"
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.connector: PaperTradePerpetualDerivative = create_paper_trade_market(
+            exchange_name="binance_perpetual",
+            client_config_map=ClientConfigAdapter(ClientConfigMap()),
+            trading_pairs=[self.trading_pair])
+        self.connector.set_balance("HBOT", Decimal("1000"))
+        self.order_book = CompositeOrderBook()
+        self.connector.order_book_tracker._order_books[self.trading_pair] = self.order_book
+        self.set_book(bid=Decimal("99"), ask=Decimal("101"))
+        self.connector._perpetual_trading.initialize_funding_info(FundingInfo(
+            trading_pair=self.trading_pair,
+            index_price=Decimal("100"),
+            mark_price=Decimal("100"),
+            next_funding_utc_timestamp=int(self.start_timestamp + 10),
+            rate=Decimal("0.0001"),
+        ))
+        self.connector.init_paper_trade_market()
+
+        self.connector._set_current_timestamp(self.start_timestamp)
+
+        self.event_logger = EventLogger()
+        for event_tag in [MarketEvent.OrderFilled,
+                          MarketEvent.BuyOrderCompleted,
+                          MarketEvent.OrderFailure,
+                          MarketEvent.FundingPaymentCompleted,
+                          AccountEvent.PositionModeChangeSucceeded,
+                          AccountEvent.PositionModeChangeFailed]:
+            self.connector.add_listener(event_tag, self.event_logger)
+
+    def async_run_with_timeout(self, coroutine: Awaitable, timeout: int = 1):
+        ret = asyncio.get_event_loop().run_until_complete(asyncio.wait_for(coroutine, timeout))
+        return ret
+
+    def set_book(self, bid: Decimal, ask: Decimal, ask_amount: Decimal = Decimal("10")):
+        self.order_book.apply_snapshot(
+            [OrderBookRow(float(bid), 10.0, 1)], [OrderBookRow(float(ask), float(ask_amount), 1)], 1)
+
+    def tick(self, seconds: float = 1):
+        timestamp = self.connector.current_timestamp + seconds
+        self.connector._set_current_timestamp(timestamp)
+        self.connector.tick(timestamp)
+        self.async_run_with_timeout(asyncio.sleep(0.01))
+
+    def events(self, event_class):
+        return [event for event in self.event_logger.event_log if isinstance(event, event_class)]
+
+    def test_create_paper_trade_market_for_perpetual_connector(self):
+        self.assertIsInstance(self.connector, PaperTradePerpetualDerivative)
+        self.assertEqual(BinancePerpetualAPIOrderBookDataSource, type(self.connector.order_book_tracker.data_source))
+        self.assertEqual("binance_perpetual_PaperTrade", self.connector.display_name)
+
+    def test_limit_order_fills_when_book_crosses_and_opens_position(self):
+        self.connector.set_leverage(self.trading_pair, 10)
+        order_id = self.connector.buy(
+            self.trading_pair, Decimal("2"), OrderType.LIMIT, Decimal("100"), position_action=PositionAction.OPEN)
+        self.tick()
+
+        self.assertEqual(0, len(self.events(OrderFilledEvent)))
+        self.assertEqual(Decimal("980"), self.connector.get_available_balance("HBOT"))
+
+        self.set_book(bid=Decimal("99"), ask=Decimal("100"))
+        self.tick()
+
+        fill = self.events(OrderFilledEvent)[0]
+        self.assertEqual(order_id, fill.order_id)
+        self.assertEqual(Decimal("100"), fill.price)
+        self.assertEqual(1, len(self.events(BuyOrderCompletedEvent)))
+        position = self.connector.get_position(self.trading_pair)
+        self.assertEqual(Decimal("2"), position.amount)
+        self.assertEqual(Decimal("100"), position.entry_price)
+        self.assertEqual(PositionSide.LONG, position.position_side)
+        maker_fee = Decimal("200") * Decimal("0.0002")
+        self.assertEqual(Decimal("1000") - maker_fee, self.connector.get_balance("HBOT"))
+        self.assertEqual(Decimal("980") - maker_fee, self.connector.get_available_balance("HBOT"))
+
+    def test_closing_position_realizes_pnl(self):
+        self.order_book.apply_snapshot(
+            [OrderBookRow(99.0, 10.0, 1)], [OrderBookRow(101.0, 1.0, 1), OrderBookRow(102.0, 5.0, 1)], 1)
+        self.connector.buy(self.trading_pair, Decimal("2"), OrderType.MARKET, position_action=PositionAction.OPEN)
+        self.tick()
+
+        self.assertEqual(Decimal("101.5"), self.connector.get_position(self.trading_pair).entry_price)
+        self.assertEqual(2, len(self.events(OrderFilledEvent)))
+
+        self.connector.sell(self.trading_pair, Decimal("2"), OrderType.MARKET, position_action=PositionAction.CLOSE)
+        self.tick()
+
+        self.assertIsNone(self.connector.get_position(self.trading_pair))
+        taker_fees = (Decimal("203") + Decimal("198")) * Decimal("0.0004")
+        self.assertEqual(Decimal("1000") - Decimal("5") - taker_fees, self.connector.get_balance("HBOT"))
+        self.assertEqual(self.connector.get_balance("HBOT"), self.connector.get_available_balance("HBOT"))
+
+    def test_public_trades_fill_orders_by_price_time_priority(self):
+        first_order_id = self.connector.buy(
+            self.trading_pair, Decimal("1"), OrderType.LIMIT, Decimal("100"), position_action=PositionAction.OPEN)
+        second_order_id = self.connector.buy(
+            self.trading_pair, Decimal("1"), OrderType.LIMIT, Decimal("100"), position_action=PositionAction.OPEN)
+        self.tick()
+
+        self.order_book.apply_trade(OrderBookTradeEvent(
+            self.trading_pair, self.start_timestamp + 1, TradeType.SELL, 99.5, 1.5))
+        self.async_run_with_timeout(asyncio.sleep(0.01))
+
+        fills = self.events(OrderFilledEvent)
+        self.assertEqual([(first_order_id, Decimal("1")), (second_order_id, Decimal("0.5"))],
+                         [(fill.order_id, fill.amount) for fill in fills])
+        self.assertEqual(Decimal("1.5"), self.connector.get_position(self.trading_pair).amount)
+        self.assertIn(second_order_id, self.connector.in_flight_orders)
+
+    def test_hedge_mode_keeps_long_and_short_positions(self):
+        self.connector.set_position_mode(PositionMode.HEDGE)
+        self.assertEqual(PositionMode.HEDGE, self.events(PositionModeChangeEvent)[0].position_mode)
+
+        self.connector.buy(self.trading_pair, Decimal("1"), OrderType.MARKET, position_action=PositionAction.OPEN)
+        self.connector.sell(self.trading_pair, Decimal("1"), OrderType.MARKET, position_action=PositionAction.OPEN)
+        self.tick()
+
+        self.assertEqual(Decimal("1"), self.connector.get_position(self.trading_pair, PositionSide.LONG).amount)
+        self.assertEqual(Decimal("-1"), self.connector.get_position(self.trading_pair, PositionSide.SHORT).amount)
+
+        self.connector.set_position_mode(PositionMode.ONEWAY)
+
+        self.assertEqual(PositionMode.HEDGE, self.connector.position_mode)
+        self.assertIsNotNone(self.events(PositionModeChangeEvent)[-1].message)
+
+    def test_funding_payment_applied_at_funding_time(self):
+        self.connector.buy(self.trading_pair, Decimal("1"), OrderType.MARKET, position_action=PositionAction.OPEN)
+        self.tick()
+        balance = self.connector.get_balance("HBOT")
+
+        self.tick(10)
+        self.tick()
+
+        payments = self.events(FundingPaymentCompletedEvent)
+        self.assertEqual(1, len(payments))
+        self.assertEqual(Decimal("-0.01"), payments[0].amount)
+        self.assertEqual(balance - Decimal("0.01"), self.connector.get_balance("HBOT"))
+
+    def test_orders_rejected_without_margin_or_position(self):
+        self.connector.buy(self.trading_pair, Decimal("20"), OrderType.LIMIT, Decimal("100"),
+                           position_action=PositionAction.OPEN)
+        self.connector.sell(self.trading_pair, Decimal("1"), OrderType.MARKET, position_action=PositionAction.CLOSE)
+        self.tick()
+
+        self.assertEqual(2, len(self.events(MarketOrderFailureEvent)))
+        self.assertEqual(0, len(self.connector.in_flight_orders))
+        self.assertEqual(Decimal("1000"), self.connector.get_available_balance("HBOT"))
@@ -1,5 +1,6 @@
 import unittest
 from decimal import Decimal
+from unittest.mock import patch
 
 from hummingbot.client.config.client_config_map import ClientConfigMap
 from hummingbot.client.config.config_helpers import ClientConfigAdapter
@@ -10,6 +11,7 @@ from hummingbot.connector.utils import combine_to_hb_trading_pair
 from hummingbot.core.data_type.common import OrderType, TradeType
 from hummingbot.core.data_type.order_candidate import OrderCandidate
 from hummingbot.core.data_type.trade_fee import TokenAmount, TradeFeeSchema
+from hummingbot.core.utils.estimate_fee import build_trade_fee
 
 
 class BudgetCheckerTest(unittest.TestCase):
@@ -580,3 +582,31 @@ class BudgetCheckerTest(unittest.TestCase):
 
         self.assertEqual(Decimal("7"), first_adjusted_candidate.amount)
         self.assertEqual(Decimal("5"), second_adjusted_candidate.amount)
+
+    def test_adjust_candidates_calculates_the_fee_once_per_side_of_a_proposal(self):
+        self.exchange.set_balance(self.base_asset, Decimal("1000"))
+        self.exchange.set_balance(self.quote_asset, Decimal("1000"))
+        levels = 40
+        order_candidates = [
+            OrderCandidate(
+                trading_pair=self.trading_pair,
+                is_maker=True,
+                order_type=OrderType.LIMIT,
+                order_side=side,
+                amount=Decimal("1"),
+                price=Decimal("2") + (Decimal("0.01") * level if side == TradeType.SELL else -Decimal("0.01") * level),
+            )
+            for level in range(levels // 2)
+            for side in (TradeType.BUY, TradeType.SELL)
+        ]
+
+        with patch("hummingbot.core.data_type.order_candidate.build_trade_fee",
+                   wraps=build_trade_fee) as build_trade_fee_mock:
+            adjusted_candidates = self.budget_checker.adjust_candidates(order_candidates, all_or_none=True)
+
+        self.assertEqual(2, build_trade_fee_mock.call_count)
+        self.assertEqual(levels, len(adjusted_candidates))
+        for order_candidate, adjusted_candidate in zip(order_candidates, adjusted_candidates):
+            self.assertEqual(order_candidate.amount, adjusted_candidate.amount)
+            expected_fee = order_candidate.amount * order_candidate.price * Decimal("0.01")
+            self.assertEqual(expected_fee, adjusted_candidate.percent_fee_value.amount)
@@ -23,7 +23,9 @@ from hummingbot.core.event.events import (
 )
 from hummingbot.logger import HummingbotLogger
 from hummingbot.model.market_data import MarketData
+from hummingbot.model.market_data_level import MarketDataLevel
 from hummingbot.model.order import Order
+from hummingbot.model.performance_checkpoint import PerformanceCheckpoint
 from hummingbot.model.sql_connection_manager import SQLConnectionManager, SQLConnectionType
 from hummingbot.model.trade_fill import TradeFill
 from hummingbot.smart_components.executors.position_executor.data_types import PositionConfig
@@ -284,6 +286,76 @@ class MarketsRecorderTests(TestCase):
         self.assertEqual(self.config_file_path, trade_fills[0].config_file_path)
         self.assertEqual(fill_event.order_id, trade_fills[0].order_id)
 
+    def test_performance_ledgers_updated_with_fills_and_restored_from_checkpoint(self):
+        market_data_collection = MarketDataCollectionConfigMap(
+            market_data_collection_enabled=False,
+            market_data_collection_interval=60,
+            market_data_collection_depth=20,
+        )
+        recorder = MarketsRecorder(
+            sql=self.manager,
+            markets=[self],
+            config_file_path=self.config_file_path,
+            strategy_name=self.strategy_name,
+            market_data_collection=market_data_collection,
+        )
+        self.assertEqual([], recorder.get_performance_ledgers(start_timestamp=0))
+
+        buy_fill_event = OrderFilledEvent(
+            timestamp=1642020000,
+            order_id="OID1",
+            trading_pair=self.trading_pair,
+            trade_type=TradeType.BUY,
+            order_type=OrderType.LIMIT,
+            price=Decimal(1010),
+            amount=Decimal(2),
+            trade_fee=AddedToCostTradeFee(percent=Decimal("0.01")),
+            exchange_trade_id="TradeId1"
+        )
+        recorder._did_fill_order(MarketEvent.OrderFilled.value, self, buy_fill_event)
+
+        ledgers = recorder.get_performance_ledgers(start_timestamp=0)
+        self.assertEqual(1, len(ledgers))
+        self.assertEqual((self.display_name, self.trading_pair), (ledgers[0].market, ledgers[0].symbol))
+        self.assertEqual(1, ledgers[0].num_buys)
+        self.assertEqual(Decimal("-2020"), ledgers[0].b_vol_quote)
+
+        with self.manager.get_new_session() as session:
+            with session.begin():
+                recorder.save_performance_checkpoints(session=session)
+
+        sell_fill_event = OrderFilledEvent(
+            timestamp=1642030000,
+            order_id="OID2",
+            trading_pair=self.trading_pair,
+            trade_type=TradeType.SELL,
+            order_type=OrderType.LIMIT,
+            price=Decimal(1020),
+            amount=Decimal(1),
+            trade_fee=AddedToCostTradeFee(percent=Decimal("0.01")),
+            exchange_trade_id="TradeId2"
+        )
+        recorder._did_fill_order(MarketEvent.OrderFilled.value, self, sell_fill_event)
+
+        with self.manager.get_new_session() as session:
+            checkpoints = session.query(PerformanceCheckpoint).all()
+        self.assertEqual(1, len(checkpoints))
+        self.assertEqual(1, checkpoints[0].ledger["num_buys"])
+
+        restored_recorder = MarketsRecorder(
+            sql=self.manager,
+            markets=[self],
+            config_file_path=self.config_file_path,
+            strategy_name=self.strategy_name,
+            market_data_collection=market_data_collection,
+        )
+        restored_ledgers = restored_recorder.get_performance_ledgers(start_timestamp=0)
+
+        self.assertEqual(1, len(restored_ledgers))
+        self.assertEqual(2, restored_ledgers[0].num_trades)
+        self.assertEqual(recorder.get_performance_ledgers(start_timestamp=0)[0].to_json(),
+                         restored_ledgers[0].to_json())
+
     def test_trade_fee_in_quote_not_available(self):
         recorder = MarketsRecorder(
             sql=self.manager,
@@ -437,6 +509,41 @@ class MarketsRecorderTests(TestCase):
         self.assertEqual(market_data[0].best_bid, Decimal("99"))
         self.assertEqual(market_data[0].mid_price, Decimal("100"))
 
+    @patch("hummingbot.connector.markets_recorder.MarketsRecorder._sleep")
+    def test_market_data_collection_stores_order_book_levels(self, sleep_mock):
+        sleep_mock.side_effect = [asyncio.CancelledError]
+        recorder = MarketsRecorder(
+            sql=self.manager,
+            markets=[self],
+            config_file_path=self.config_file_path,
+            strategy_name=self.strategy_name,
+            market_data_collection=MarketDataCollectionConfigMap(
+                market_data_collection_enabled=True,
+                market_data_collection_interval=1,
+                market_data_collection_depth=2,
+                market_data_order_book_levels=True,
+            ),
+        )
+        order_book = OrderBook(dex=False)
+        bids_array = np.array([[1, 1, 1], [2, 1, 2], [3, 1, 3], [0.5, 1, 3]], dtype=np.float64)
+        asks_array = np.array([[4, 1, 1], [5, 1, 2], [6, 1, 3], [7, 1, 4]], dtype=np.float64)
+        order_book.apply_numpy_snapshot(bids_array, asks_array)
+        with patch.object(self, "get_price_by_type", return_value=Decimal("100")), \
+                patch.object(self, "get_order_book", return_value=order_book):
+            with self.assertRaises(asyncio.CancelledError):
+                self.async_run_with_timeout(recorder._record_market_data())
+
+        with self.manager.get_new_session() as session:
+            market_data = session.query(MarketData).all()
+            levels = session.query(MarketDataLevel).order_by(MarketDataLevel.side, MarketDataLevel.level).all()
+        self.assertEqual(1, len(market_data))
+        self.assertIsNone(market_data[0].order_book)
+        self.assertEqual(6, len(levels))
+        self.assertEqual([("ask", 0, 4.0), ("ask", 1, 5.0), ("ask", 2, 6.0), ("bid", 0, 3.0), ("bid", 1, 2.0),
+                          ("bid", 2, 1.0)],
+                         [(level.side, level.level, level.price) for level in levels])
+        self.assertTrue(all(level.timestamp == int(market_data[0].timestamp) for level in levels))
+
     def test_store_position_executor(self):
         recorder = MarketsRecorder(
             sql=self.manager,
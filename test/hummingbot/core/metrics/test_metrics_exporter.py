@@ -0,0 +1,59 @@
+import asyncio
+import unittest
+from typing import Awaitable
+
+import aiohttp
+
+from hummingbot.core.metrics.metrics_exporter import OPENMETRICS_CONTENT_TYPE, MetricsExporter
+from hummingbot.core.metrics.metrics_registry import MetricsRegistry
+
+
+class MetricsExporterTest(unittest.TestCase):
+    def setUp(self) -> None:
+        super().setUp()
+        self.ev_loop = asyncio.new_event_loop()
+        self.registry = MetricsRegistry()
+        self.exporter = MetricsExporter(port=0, registry=self.registry)
+
+    def tearDown(self) -> None:
+        self.async_run_with_timeout(self.exporter.stop())
+        self.ev_loop.close()
+        super().tearDown()
+
+    def async_run_with_timeout(self, coroutine: Awaitable, timeout: float = 5):
+        return self.ev_loop.run_until_complete(asyncio.wait_for(coroutine, timeout))
+
+    async def get(self, path: str):
+        async with aiohttp.ClientSession() as session:
+            async with session.get(f"http://127.0.0.1:{self.exporter.port}{path}") as response:
+                return response.status, response.headers["Content-Type"], await response.text()
+
+    def test_metrics_are_served(self):
+        self.registry.counter("hummingbot_ws_messages", "Websocket messages received.", ["endpoint"]).labels(
+            "stream.binance.com").inc(5)
+        self.async_run_with_timeout(self.exporter.start())
+
+        self.assertTrue(self.exporter.started)
+        self.assertNotEqual(0, self.exporter.port)
+
+        status, content_type, body = self.async_run_with_timeout(self.get("/metrics"))
+
+        self.assertEqual(200, status)
+        self.assertEqual(OPENMETRICS_CONTENT_TYPE, content_type)
+        self.assertIn("hummingbot_ws_messages_total{endpoint=\"stream.binance.com\"} 5\n", body)
+        self.assertTrue(body.endswith("# EOF\n"))
+
+        status, _, _ = self.async_run_with_timeout(self.get("/other"))
+
+        self.assertEqual(404, status)
+
+    def test_stop(self):
+        self.async_run_with_timeout(self.exporter.start())
+        port = self.exporter.port
+        self.async_run_with_timeout(self.exporter.stop())
+
+        self.assertFalse(self.exporter.started)
+        with self.assertRaises(aiohttp.ClientConnectionError):
+            self.async_run_with_timeout(self.get("/metrics"))
+        self.assertEqual(0, self.exporter.port)
+        self.assertNotEqual(0, port)
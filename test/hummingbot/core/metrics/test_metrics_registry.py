@@ -0,0 +1,76 @@
+import unittest
+
+from hummingbot.core.metrics.metrics_registry import MetricsRegistry
+
+
+class MetricsRegistryTest(unittest.TestCase):
+    def setUp(self) -> None:
+        super().setUp()
+        self.registry = MetricsRegistry()
+
+    def test_counter(self):
+        counter = self.registry.counter("hummingbot_ws_messages", "Websocket messages received.", ["endpoint"])
+        counter.labels("stream.binance.com").inc()
+        counter.labels("stream.binance.com").inc(2)
+        counter.labels("ws.okx.com").inc()
+
+        self.assertEqual(3, counter.labels("stream.binance.com").value)
+        self.assertEqual(
+            "# TYPE hummingbot_ws_messages counter\n"
+            "# HELP hummingbot_ws_messages Websocket messages received.\n"
+            "hummingbot_ws_messages_total{endpoint=\"stream.binance.com\"} 3\n"
+            "hummingbot_ws_messages_total{endpoint=\"ws.okx.com\"} 1\n"
+            "# EOF\n",
+            self.registry.render())
+
+    def test_histogram(self):
+        histogram = self.registry.histogram("hummingbot_order_create_latency_seconds",
+                                            "Round-trip time of the order creation requests.",
+                                            ["connector"],
+                                            buckets=[0.1, 0.5])
+        for value in (0.05, 0.1, 0.3, 2.0):
+            histogram.labels("binance").observe(value)
+
+        self.assertEqual(
+            "# TYPE hummingbot_order_create_latency_seconds histogram\n"
+            "# HELP hummingbot_order_create_latency_seconds Round-trip time of the order creation requests.\n"
+            "hummingbot_order_create_latency_seconds_bucket{connector=\"binance\",le=\"0.1\"} 2\n"
+            "hummingbot_order_create_latency_seconds_bucket{connector=\"binance\",le=\"0.5\"} 3\n"
+            "hummingbot_order_create_latency_seconds_bucket{connector=\"binance\",le=\"+Inf\"} 4\n"
+            "hummingbot_order_create_latency_seconds_count{connector=\"binance\"} 4\n"
+            "hummingbot_order_create_latency_seconds_sum{connector=\"binance\"} 2.45\n"
+            "# EOF\n",
+            self.registry.render())
+
+    def test_metrics_without_labels(self):
+        counter = self.registry.counter("hummingbot_events", "Events.")
+        histogram = self.registry.histogram("hummingbot_latency_seconds", "Latency.", buckets=[1])
+        counter.inc()
+        histogram.observe(0.5)
+
+        rendered = self.registry.render()
+
+        self.assertIn("hummingbot_events_total 1\n", rendered)
+        self.assertIn("hummingbot_latency_seconds_bucket{le=\"1.0\"} 1\n", rendered)
+        self.assertIn("hummingbot_latency_seconds_sum 0.5\n", rendered)
+
+    def test_label_values_are_escaped(self):
+        counter = self.registry.counter("hummingbot_events", "Events.", ["source"])
+        counter.labels("a \"quoted\"\\source\n").inc()
+
+        self.assertIn("hummingbot_events_total{source=\"a \\\"quoted\\\"\\\\source\\n\"} 1\n", self.registry.render())
+
+    def test_metrics_are_registered_once(self):
+        counter = self.registry.counter("hummingbot_events", "Events.", ["source"])
+
+        self.assertIs(counter, self.registry.counter("hummingbot_events", "Events.", ["source"]))
+        with self.assertRaises(ValueError):
+            self.registry.histogram("hummingbot_events", "Events.", ["source"])
+        with self.assertRaises(ValueError):
+            self.registry.counter("hummingbot_events", "Events.", ["connector", "source"])
+
+    def test_wrong_number_of_label_values_raises(self):
+        counter = self.registry.counter("hummingbot_events", "Events.", ["source"])
+
+        with self.assertRaises(ValueError):
+            counter.labels("binance", "spot")
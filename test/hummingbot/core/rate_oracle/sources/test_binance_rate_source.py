@@ -1,5 +1,6 @@
 import asyncio
 import json
+import re
 import unittest
 from decimal import Decimal
 from typing import Awaitable
@@ -107,3 +108,45 @@ class BinanceRateSourceTest(unittest.TestCase):
         self.assertEqual(expected_rate, prices[self.trading_pair])
         self.assertIn(self.us_trading_pair, prices)
         self.assertNotIn(self.ignored_trading_pair, prices)
+
+    @aioresponses()
+    def test_get_binance_prices_for_pairs(self, mock_api):
+        expected_rate = Decimal("10")
+        self.setup_binance_responses(mock_api=mock_api, expected_rate=expected_rate)
+        binance_prices_global_url = web_utils.public_rest_url(path_url=CONSTANTS.TICKER_BOOK_PATH_URL)
+        binance_prices_us_url = web_utils.public_rest_url(path_url=CONSTANTS.TICKER_BOOK_PATH_URL, domain="us")
+        mock_api.get(
+            re.compile(f"^{binance_prices_global_url}".replace(".", r"\.").replace("?", r"\?")),
+            body=json.dumps([{
+                "symbol": self.binance_pair,
+                "bidPrice": str(expected_rate - Decimal("0.1")),
+                "bidQty": "0.50000000",
+                "askPrice": str(expected_rate + Decimal("0.1")),
+                "askQty": "0.14500000",
+            }]))
+        mock_api.get(
+            re.compile(f"^{binance_prices_us_url}".replace(".", r"\.").replace("?", r"\?")),
+            body=json.dumps([{
+                "symbol": self.binance_us_pair,
+                "bidPrice": "20862.0000",
+                "bidQty": "0.50000000",
+                "askPrice": "20865.6100",
+                "askQty": "0.14500000",
+            }]))
+
+        rate_source = BinanceRateSource()
+        prices = self.async_run_with_timeout(
+            rate_source.get_prices_for_pairs(trading_pairs=[self.trading_pair, self.us_trading_pair]))
+
+        self.assertEqual({self.trading_pair, self.us_trading_pair}, set(prices))
+        self.assertEqual(expected_rate, prices[self.trading_pair])
+        requested_symbols = [
+            request.kwargs["params"]["symbols"]
+            for (method, url), requests in mock_api.requests.items()
+            if url.path.endswith(CONSTANTS.TICKER_BOOK_PATH_URL)
+            for request in requests
+            if request.kwargs.get("params") is not None
+        ]
+        self.assertIn(
+            json.dumps(sorted([self.binance_pair, self.binance_us_pair]), separators=(",", ":")), requested_symbols)
+        self.assertIn(json.dumps([self.binance_us_pair], separators=(",", ":")), requested_symbols)
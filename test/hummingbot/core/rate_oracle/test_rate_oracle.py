@@ -3,6 +3,7 @@ import unittest
 from copy import deepcopy
 from decimal import Decimal
 from typing import Awaitable, Dict, Optional
+from unittest.mock import MagicMock, patch
 
 from hummingbot.client.config.client_config_map import ClientConfigMap
 from hummingbot.client.config.config_helpers import ClientConfigAdapter
@@ -10,7 +11,7 @@ from hummingbot.connector.utils import combine_to_hb_trading_pair
 from hummingbot.core.rate_oracle.rate_oracle import RateOracle
 from hummingbot.core.rate_oracle.sources.coin_gecko_rate_source import CoinGeckoRateSource
 from hummingbot.core.rate_oracle.sources.rate_source_base import RateSourceBase
-from hummingbot.core.rate_oracle.utils import find_rate
+from hummingbot.core.rate_oracle.utils import find_rate, find_rate_route_pairs
 
 
 class DummyRateSource(RateSourceBase):
@@ -101,3 +102,103 @@ class RateOracleTest(unittest.TestCase):
         config_map.global_token.global_token_name = "EUR"
 
         self.assertEqual(0, len(rate_oracle.prices))
+
+    def test_find_rate_route_pairs(self):
+        available_pairs = {"HBOT-USDT", "AAVE-USDT", "USDT-GBP", "BTC-USDT", "ETH-BTC"}
+
+        self.assertEqual({"HBOT-USDT"}, find_rate_route_pairs(available_pairs, ["HBOT-USDT"]))
+        self.assertEqual({"HBOT-USDT"}, find_rate_route_pairs(available_pairs, ["USDT-HBOT"]))
+        self.assertEqual({"HBOT-USDT", "AAVE-USDT"}, find_rate_route_pairs(available_pairs, ["HBOT-AAVE"]))
+        self.assertEqual({"HBOT-USDT", "USDT-GBP"}, find_rate_route_pairs(available_pairs, ["HBOT-GBP"]))
+        self.assertEqual(set(), find_rate_route_pairs(available_pairs, ["ZBOT-USDT"]))
+
+    def test_get_prices_for_pairs_only_returns_route_prices(self):
+        prices = {"HBOT-USDT": Decimal("100"), "AAVE-USDT": Decimal("50"), "USDT-GBP": Decimal("0.75")}
+        source = DummyRateSource(price_dict=prices)
+
+        route_prices = self.async_run_with_timeout(source.get_prices_for_pairs(trading_pairs=["HBOT-GBP"]))
+
+        self.assertEqual({"HBOT-USDT": Decimal("100"), "USDT-GBP": Decimal("0.75")}, route_prices)
+        self.assertEqual(Decimal("75"), find_rate(route_prices, "HBOT-GBP"))
+
+    def test_rate_async_subscribes_pair(self):
+        rate_oracle = RateOracle(source=DummyRateSource(price_dict={self.trading_pair: Decimal("10")}))
+
+        self.async_run_with_timeout(rate_oracle.rate_async(self.trading_pair))
+
+        self.assertEqual([self.trading_pair], rate_oracle.subscribed_pairs)
+
+    def test_fetch_loop_only_refreshes_subscribed_pairs_after_ready(self):
+        prices = {self.trading_pair: Decimal("10"), "AAVE-USDT": Decimal("50")}
+        rate_oracle = RateOracle(source=DummyRateSource(price_dict=prices))
+        rate_oracle._prices = dict(prices)
+        rate_oracle._price_timestamps = {pair: 0 for pair in prices}
+        rate_oracle._ready_event.set()
+        rate_oracle.subscribe_pairs([self.trading_pair])
+        rate_oracle._source._price_dict[self.trading_pair] = Decimal("11")
+
+        self.async_run_with_timeout(rate_oracle._update_subscribed_prices())
+
+        self.assertEqual({self.trading_pair: Decimal("11")}, rate_oracle.prices)
+
+    def test_unused_pairs_are_evicted(self):
+        rate_oracle = RateOracle(source=DummyRateSource(price_dict={}))
+        rate_oracle.subscribe_pairs([self.trading_pair])
+        rate_oracle._subscribed_pairs[self.trading_pair] -= RateOracle.PAIR_SUBSCRIPTION_TTL + 1
+
+        rate_oracle._evict_unused_pairs()
+
+        self.assertEqual([], rate_oracle.subscribed_pairs)
+
+    def test_subscribed_pairs_priced_from_connector_order_book(self):
+        source = DummyRateSource(price_dict={self.trading_pair: Decimal("10")})
+        rate_oracle = RateOracle(source=source)
+        connector = MagicMock()
+        connector.name = "test_exchange"
+        connector.order_books = {self.trading_pair: MagicMock()}
+        connector.get_mid_price.return_value = Decimal("12")
+        rate_oracle.add_price_connector(connector)
+        rate_oracle.subscribe_pairs([self.trading_pair])
+
+        with patch.object(source, "get_prices_for_pairs") as get_prices_for_pairs_mock:
+            self.async_run_with_timeout(rate_oracle._update_subscribed_prices())
+
+        get_prices_for_pairs_mock.assert_not_called()
+        self.assertEqual(Decimal("12"), rate_oracle.get_pair_rate(self.trading_pair))
+
+    def test_get_pair_rate_falls_back_to_snapshot_for_new_pairs(self):
+        rate_oracle = RateOracle(source=DummyRateSource(price_dict={}))
+        rate_oracle._prices = {"AAVE-USDT": Decimal("50")}
+        rate_oracle._snapshot_prices = {self.trading_pair: Decimal("10"), "AAVE-USDT": Decimal("50")}
+
+        rate = rate_oracle.get_pair_rate(self.trading_pair)
+
+        self.assertEqual(Decimal("10"), rate)
+        self.assertIn(self.trading_pair, rate_oracle.subscribed_pairs)
+
+    def test_stored_or_live_rate_requests_live_rate_when_stored_rate_missing(self):
+        rate_oracle = RateOracle(source=DummyRateSource(price_dict={self.trading_pair: Decimal("10")}))
+        rate_oracle._prices = {"AAVE-USDT": Decimal("50")}
+
+        rate = self.async_run_with_timeout(rate_oracle.stored_or_live_rate(self.trading_pair))
+
+        self.assertEqual(Decimal("10"), rate)
+
+    def test_restart_fetches_full_prices_again(self):
+        expected_rate = Decimal("10")
+        rate_oracle = RateOracle(source=DummyRateSource(price_dict={self.trading_pair: expected_rate}))
+        rate_oracle.start()
+        self.async_run_with_timeout(rate_oracle.get_ready())
+        rate_oracle.get_pair_rate(self.trading_pair)
+
+        self.async_run_with_timeout(rate_oracle.stop_network())
+
+        self.assertFalse(rate_oracle._ready_event.is_set())
+        self.assertEqual([], rate_oracle.subscribed_pairs)
+
+        rate_oracle._source._price_dict["AAVE-USDT"] = Decimal("50")
+        self.async_run_with_timeout(rate_oracle.start_network())
+        self.async_run_with_timeout(rate_oracle.get_ready())
+
+        self.assertEqual(Decimal("50"), rate_oracle.get_pair_rate("AAVE-USDT"))
+        self.async_run_with_timeout(rate_oracle.stop_network())
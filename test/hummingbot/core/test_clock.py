@@ -2,6 +2,7 @@ import unittest
 import asyncio
 import pandas as pd
 import time
+from unittest.mock import MagicMock
 
 from hummingbot.core.clock import (
     Clock,
@@ -124,3 +125,21 @@ class ClockUnitTest(unittest.TestCase):
         self.clock_backtest.backtest_til(self.backtest_start_timestamp + self.tick_size)
         self.assertGreater(self.clock_backtest.current_timestamp, self.clock_backtest.start_time)
         self.assertLess(self.clock_backtest.current_timestamp, self.backtest_end_timestamp)
+
+    def test_run_til_records_ticks_in_loop_monitor(self):
+        clock = Clock(ClockMode.REALTIME, 0.1)
+        time_iterator: TimeIterator = TimeIterator()
+        clock.add_iterator(time_iterator)
+        clock.loop_monitor = MagicMock()
+
+        with clock:
+            self.ev_loop.run_until_complete(clock.run_til(time.time() + 0.35))
+
+        self.assertGreaterEqual(clock.loop_monitor.record_clock_tick.call_count, 2)
+        self.assertEqual(clock.loop_monitor.record_clock_tick.call_count,
+                         clock.loop_monitor.record_iterator_tick.call_count)
+        self.assertIs(time_iterator, clock.loop_monitor.record_iterator_tick.call_args[0][0])
+        scheduled_time, start_time, end_time, tick_size = clock.loop_monitor.record_clock_tick.call_args[0]
+        self.assertEqual(0.1, tick_size)
+        self.assertLessEqual(scheduled_time, start_time)
+        self.assertLessEqual(start_time, end_time)
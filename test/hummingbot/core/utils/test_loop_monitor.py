@@ -0,0 +1,124 @@
+import asyncio
+import time
+import unittest
+
+from hummingbot.core.utils.loop_monitor import DurationStats, LoopMonitor, callback_name
+
+
+class TimeIteratorMock:
+    display_name = "binance"
+
+
+class LoopMonitorTest(unittest.TestCase):
+    def setUp(self) -> None:
+        super().setUp()
+        self.ev_loop = asyncio.new_event_loop()
+        self.original_handle_run = asyncio.Handle._run
+        self.monitor = LoopMonitor(lag_sample_interval=0.02, slow_callback_duration=0.05)
+
+    def tearDown(self) -> None:
+        self.monitor.stop()
+        self.ev_loop.run_until_complete(asyncio.sleep(0))
+        self.ev_loop.close()
+        super().tearDown()
+
+    def run_for(self, duration: float):
+        self.ev_loop.run_until_complete(asyncio.sleep(duration))
+
+    def test_duration_stats(self):
+        stats = DurationStats()
+        for duration in (0.1, 0.3, 0.2):
+            stats.add(duration)
+
+        self.assertEqual(3, stats.count)
+        self.assertAlmostEqual(0.2, stats.mean)
+        self.assertEqual(0.3, stats.max)
+        self.assertEqual(0.2, stats.last)
+
+    def test_callbacks_are_only_timed_while_running(self):
+        self.monitor.start(self.ev_loop)
+
+        self.assertIsNot(self.original_handle_run, asyncio.Handle._run)
+
+        self.monitor.stop()
+
+        self.assertIs(self.original_handle_run, asyncio.Handle._run)
+        self.assertFalse(self.monitor.is_running)
+
+    def test_loop_lag_is_recorded(self):
+        self.monitor.start(self.ev_loop)
+        self.run_for(0.03)
+        self.ev_loop.call_soon(time.sleep, 0.06)
+        self.run_for(0.05)
+
+        self.assertGreater(self.monitor.loop_lag.count, 1)
+        self.assertGreaterEqual(self.monitor.loop_lag.max, 0.02)
+
+    def test_slow_callbacks_are_reported_with_their_coroutine_name(self):
+        async def blocking_coroutine():
+            time.sleep(0.06)
+
+        async def fast_coroutine():
+            await asyncio.sleep(0)
+
+        async def run():
+            await asyncio.gather(blocking_coroutine(), fast_coroutine())
+
+        self.monitor.start(self.ev_loop)
+        self.ev_loop.run_until_complete(run())
+
+        names = list(self.monitor.slow_callbacks_count.keys())
+        self.assertEqual(1, len(names))
+        self.assertTrue(names[0].endswith("blocking_coroutine"))
+        self.assertGreaterEqual(self.monitor.slow_callbacks[0][2], 0.06)
+        self.assertEqual({}, self.monitor.task_cpu_time)
+
+    def test_task_cpu_time_is_sampled_when_enabled(self):
+        async def busy_coroutine():
+            end = time.perf_counter() + 0.02
+            while time.perf_counter() < end:
+                pass
+
+        self.monitor.configure(slow_callback_duration=1, sample_task_cpu=True)
+        self.monitor.start(self.ev_loop)
+        self.ev_loop.run_until_complete(busy_coroutine())
+
+        cpu_times = {name: cpu_time for name, cpu_time in self.monitor.task_cpu_time.items()
+                     if name.endswith("busy_coroutine")}
+        self.assertEqual(1, len(cpu_times))
+        self.assertGreater(list(cpu_times.values())[0], 0)
+
+    def test_clock_ticks_are_recorded(self):
+        self.monitor.record_iterator_tick(TimeIteratorMock(), 0.02)
+        self.monitor.record_iterator_tick(object(), 0.01)
+        self.monitor.record_clock_tick(scheduled_time=100, start_time=100.1, end_time=100.2, tick_size=1)
+        self.monitor.record_clock_tick(scheduled_time=101, start_time=101.5, end_time=102.1, tick_size=1)
+
+        self.assertEqual({"binance", "object"}, set(self.monitor.iterator_ticks.keys()))
+        self.assertEqual(0.02, self.monitor.iterator_ticks["binance"].last)
+        self.assertAlmostEqual(0.5, self.monitor.tick_lag.max)
+        self.assertAlmostEqual(0.6, self.monitor.tick_duration.max)
+        self.assertEqual(1, self.monitor.tick_overruns)
+
+    def test_status(self):
+        self.assertEqual("Performance monitor is not running.", self.monitor.format_status())
+
+        self.monitor.start(self.ev_loop)
+        self.monitor.record_iterator_tick(TimeIteratorMock(), 0.02)
+        status = self.monitor.format_status()
+        data = self.monitor.to_dict()
+
+        self.assertIn("Event loop lag (ms):", status)
+        self.assertIn("    binance: last 20.0  mean 20.0  max 20.0", status)
+        self.assertTrue(data["running"])
+        self.assertEqual(1, data["iterator_ticks"]["binance"]["count"])
+
+    def test_callback_name(self):
+        async def coroutine():
+            pass
+
+        task = self.ev_loop.create_task(coroutine())
+        self.ev_loop.run_until_complete(task)
+
+        self.assertTrue(callback_name(task.get_loop).endswith("coroutine"))
+        self.assertEqual("LoopMonitorTest.test_callback_name", callback_name(LoopMonitorTest.test_callback_name))
@@ -8,7 +8,12 @@ import aiohttp
 
 from hummingbot.connector.test_support.network_mocking_assistant import NetworkMockingAssistant
 from hummingbot.core.web_assistant.connections.data_types import WSJSONRequest, WSResponse
-from hummingbot.core.web_assistant.connections.ws_connection import WSConnection
+from hummingbot.core.web_assistant.connections.ws_connection import (
+    WS_CONNECTIONS,
+    WS_MESSAGES,
+    WS_RECEIVED_BYTES,
+    WSConnection,
+)
 
 
 class WSConnectionTest(unittest.TestCase):
@@ -121,6 +126,22 @@ class WSConnectionTest(unittest.TestCase):
         self.assertEqual(data, response.data)
         self.assertNotEqual(0, self.ws_connection.last_recv_time)
 
+    @patch("aiohttp.client.ClientSession.ws_connect", new_callable=AsyncMock)
+    def test_receive_records_metrics_by_host(self, ws_connect_mock):
+        ws_connect_mock.return_value = self.mocking_assistant.create_websocket_mock()
+        connections = WS_CONNECTIONS.labels("metrics.host").value
+        messages = WS_MESSAGES.labels("metrics.host").value
+        received_bytes = WS_RECEIVED_BYTES.labels("metrics.host").value
+        self.async_run_with_timeout(self.ws_connection.connect("wss://metrics.host:9443/ws/listenKey"))
+        self.mocking_assistant.add_websocket_aiohttp_message(ws_connect_mock.return_value, message="", message_type=aiohttp.WSMsgType.PONG)
+        self.mocking_assistant.add_websocket_aiohttp_message(ws_connect_mock.return_value, message=json.dumps({"one": 1}))
+
+        self.async_run_with_timeout(self.ws_connection.receive())
+
+        self.assertEqual(connections + 1, WS_CONNECTIONS.labels("metrics.host").value)
+        self.assertEqual(messages + 1, WS_MESSAGES.labels("metrics.host").value)
+        self.assertEqual(received_bytes + len(json.dumps({"one": 1})), WS_RECEIVED_BYTES.labels("metrics.host").value)
+
     @patch("aiohttp.client.ClientSession.ws_connect", new_callable=AsyncMock)
     def test_receive_disconnects_and_raises_on_aiohttp_closed(self, ws_connect_mock):
         ws_connect_mock.return_value = self.mocking_assistant.create_websocket_mock()
@@ -0,0 +1,160 @@
+import asyncio
+import json
+import unittest
+from typing import Awaitable
+from unittest.mock import AsyncMock, patch
+
+from hummingbot.connector.test_support.network_mocking_assistant import NetworkMockingAssistant
+from hummingbot.data_feed.candles_feed.binance_perpetual_candles import BinancePerpetualCandles
+from hummingbot.data_feed.candles_feed.binance_spot_candles import BinanceSpotCandles, constants as CONSTANTS
+from hummingbot.data_feed.candles_feed.candles_hub import CandlesHub
+
+
+class TestCandlesHub(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls) -> None:
+        super().setUpClass()
+        cls.ev_loop = asyncio.get_event_loop()
+        cls.interval = "1m"
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.mocking_assistant = NetworkMockingAssistant()
+        self.btc_feed = BinanceSpotCandles(trading_pair="BTC-USDT", interval=self.interval, max_records=1)
+        self.eth_feed = BinanceSpotCandles(trading_pair="ETH-USDT", interval=self.interval, max_records=1)
+        self.other_btc_feed = BinanceSpotCandles(trading_pair="BTC-USDT", interval=self.interval, max_records=1)
+        self.feeds = [self.btc_feed, self.eth_feed, self.other_btc_feed]
+
+    def tearDown(self) -> None:
+        for feed in self.feeds:
+            self.async_run_with_timeout(feed.stop_network())
+        for hub in list(CandlesHub._hubs.values()):
+            hub.stop()
+        super().tearDown()
+
+    def async_run_with_timeout(self, coroutine: Awaitable, timeout: int = 1):
+        ret = self.ev_loop.run_until_complete(asyncio.wait_for(coroutine, timeout))
+        return ret
+
+    def start_feeds(self):
+        self.async_run_with_timeout(asyncio.gather(*[feed.start_network() for feed in self.feeds]))
+
+    @staticmethod
+    def get_candles_ws_data_mock(symbol: str, timestamp: int = 123400000):
+        return {
+            "e": "kline",
+            "E": 123456789,
+            "s": symbol,
+            "k": {"t": timestamp,
+                  "T": timestamp + 59999,
+                  "s": symbol,
+                  "i": "1m",
+                  "o": "0.0010",
+                  "c": "0.0020",
+                  "h": "0.0025",
+                  "l": "0.0015",
+                  "v": "1000",
+                  "n": 100,
+                  "x": False,
+                  "q": "1.0000",
+                  "V": "500",
+                  "Q": "0.500",
+                  "B": "123456"
+                  }
+        }
+
+    @patch("aiohttp.ClientSession.ws_connect", new_callable=AsyncMock)
+    def test_feeds_of_an_exchange_share_one_connection(self, ws_connect_mock):
+        ws_connect_mock.return_value = self.mocking_assistant.create_websocket_mock()
+        self.mocking_assistant.add_websocket_aiohttp_message(
+            websocket_mock=ws_connect_mock.return_value,
+            message=json.dumps({"result": None, "id": 1}))
+
+        self.start_feeds()
+        self.mocking_assistant.run_until_all_aiohttp_messages_delivered(ws_connect_mock.return_value)
+
+        hub = CandlesHub._hubs[CONSTANTS.WSS_URL]
+        sent_subscription_messages = self.mocking_assistant.json_messages_sent_through_websocket(
+            websocket_mock=ws_connect_mock.return_value)
+        ws_connect_mock.assert_called_once()
+        self.assertEqual(1, hub.connections_count)
+        self.assertEqual(3, hub.subscribers_count)
+        self.assertEqual([{"method": "SUBSCRIBE", "params": ["btcusdt@kline_1m", "ethusdt@kline_1m"], "id": 1}],
+                         sent_subscription_messages)
+        for feed in self.feeds:
+            self.assertIs(hub.api_factory, feed._api_factory)
+
+    @patch("hummingbot.data_feed.candles_feed.binance_spot_candles.BinanceSpotCandles.fill_historical_candles",
+           new_callable=AsyncMock)
+    @patch("aiohttp.ClientSession.ws_connect", new_callable=AsyncMock)
+    def test_messages_are_routed_to_the_feeds_of_their_stream(self, ws_connect_mock, _):
+        ws_connect_mock.return_value = self.mocking_assistant.create_websocket_mock()
+        self.mocking_assistant.add_websocket_aiohttp_message(
+            websocket_mock=ws_connect_mock.return_value,
+            message=json.dumps(self.get_candles_ws_data_mock("BTCUSDT")))
+
+        self.start_feeds()
+        self.mocking_assistant.run_until_all_aiohttp_messages_delivered(ws_connect_mock.return_value)
+
+        self.assertEqual(1, self.btc_feed.candles_df.shape[0])
+        self.assertEqual(1, self.other_btc_feed.candles_df.shape[0])
+        self.assertTrue(self.eth_feed.candles_df.empty)
+        self.assertIsNone(CandlesHub._hubs[CONSTANTS.WSS_URL].startup_time)
+
+        self.mocking_assistant.add_websocket_aiohttp_message(
+            websocket_mock=ws_connect_mock.return_value,
+            message=json.dumps(self.get_candles_ws_data_mock("ETHUSDT")))
+        self.mocking_assistant.run_until_all_aiohttp_messages_delivered(ws_connect_mock.return_value)
+
+        self.assertEqual(1, self.eth_feed.candles_df.shape[0])
+        self.assertIsNotNone(CandlesHub._hubs[CONSTANTS.WSS_URL].startup_time)
+
+    @patch("aiohttp.ClientSession.ws_connect", new_callable=AsyncMock)
+    def test_feeds_started_after_the_connection_are_subscribed_together(self, ws_connect_mock):
+        ws_connect_mock.return_value = self.mocking_assistant.create_websocket_mock()
+        self.mocking_assistant.add_websocket_aiohttp_message(
+            websocket_mock=ws_connect_mock.return_value,
+            message=json.dumps({"result": None, "id": 1}))
+        self.async_run_with_timeout(self.btc_feed.start_network())
+        self.mocking_assistant.run_until_all_aiohttp_messages_delivered(ws_connect_mock.return_value)
+
+        feeds = [BinanceSpotCandles(trading_pair=f"{base}-USDT", interval=self.interval) for base in ("ETH", "SOL")]
+        self.feeds.extend(feeds)
+        for feed in feeds:
+            self.async_run_with_timeout(feed.start_network())
+        self.async_run_with_timeout(asyncio.sleep(CandlesHub.subscription_batch_delay + 0.1))
+
+        sent_subscription_messages = self.mocking_assistant.json_messages_sent_through_websocket(
+            websocket_mock=ws_connect_mock.return_value)
+        self.assertEqual([["btcusdt@kline_1m"], ["ethusdt@kline_1m", "solusdt@kline_1m"]],
+                         [sorted(message["params"]) for message in sent_subscription_messages])
+        ws_connect_mock.assert_called_once()
+
+    @patch("aiohttp.ClientSession.ws_connect", new_callable=AsyncMock)
+    def test_hubs_are_kept_per_exchange_and_stopped_without_feeds(self, ws_connect_mock):
+        ws_connect_mock.return_value = self.mocking_assistant.create_websocket_mock()
+        perpetual_feed = BinancePerpetualCandles(trading_pair="BTC-USDT", interval=self.interval)
+        self.feeds.append(perpetual_feed)
+        self.start_feeds()
+
+        self.assertEqual(2, len(CandlesHub._hubs))
+        spot_hub = CandlesHub._hubs[CONSTANTS.WSS_URL]
+        self.assertEqual(["btcusdt@kline_1m", "ethusdt@kline_1m"], spot_hub.streams)
+
+        self.async_run_with_timeout(self.btc_feed.stop_network())
+        self.assertEqual(["btcusdt@kline_1m", "ethusdt@kline_1m"], spot_hub.streams)
+        self.async_run_with_timeout(self.other_btc_feed.stop_network())
+        self.async_run_with_timeout(self.eth_feed.stop_network())
+
+        self.assertNotIn(CONSTANTS.WSS_URL, CandlesHub._hubs)
+        self.assertEqual(1, len(CandlesHub._hubs))
+
+    def test_subscription_requests_are_sent_in_chunks(self):
+        stream_names = [f"pair{i}usdt@kline_1m" for i in range(CONSTANTS.MAX_STREAMS_PER_SUBSCRIPTION + 1)]
+
+        requests = self.btc_feed.get_subscription_requests(stream_names)
+
+        self.assertEqual(2, len(requests))
+        self.assertEqual(stream_names[:-1], requests[0].payload["params"])
+        self.assertEqual([stream_names[-1]], requests[1].payload["params"])
+        self.assertEqual(2, requests[1].payload["id"])
@@ -0,0 +1,165 @@
+import logging
+import tempfile
+import threading
+import unittest
+from pathlib import Path
+
+from hummingbot.logger import NETWORK
+from hummingbot.logger.queue_logging import (
+    BatchedTimedRotatingFileHandler,
+    LogQueueListener,
+    LogRateLimiter,
+    QueueLogHandler,
+    install_queue_logging,
+    uninstall_queue_logging,
+)
+
+
+class RecordingHandler(logging.Handler):
+    def __init__(self, level: int = logging.NOTSET):
+        super().__init__(level)
+        self.records = []
+        self.threads = set()
+
+    def emit(self, record: logging.LogRecord):
+        self.records.append(record)
+        self.threads.add(threading.current_thread().name)
+
+
+def make_record(msg: str, created: float, level: int = logging.ERROR, name: str = "hummingbot.connector"):
+    record = logging.LogRecord(name, level, "", 0, msg, None, None)
+    record.created = created
+    return record
+
+
+class LogRateLimiterTest(unittest.TestCase):
+    def test_records_over_the_burst_are_dropped_and_reported(self):
+        rate_limiter = LogRateLimiter(interval=10, burst=2)
+
+        allowed = [rate_limiter.allow(make_record("Error fetching balances.", created=i)) for i in range(5)]
+
+        self.assertEqual([True, True, False, False, False], allowed)
+        self.assertEqual(3, rate_limiter.suppressed_count)
+
+        record = make_record("Error fetching balances.", created=12)
+
+        self.assertTrue(rate_limiter.allow(record))
+        self.assertEqual("Error fetching balances. (repeated 3 more times in the last 12s)", record.getMessage())
+        self.assertEqual(0, rate_limiter.suppressed_count)
+
+    def test_call_sites_are_limited_separately(self):
+        rate_limiter = LogRateLimiter(interval=10, burst=1)
+
+        self.assertTrue(rate_limiter.allow(make_record("Error fetching balances.", created=0)))
+        self.assertTrue(rate_limiter.allow(make_record("Error fetching orders.", created=0)))
+        self.assertTrue(rate_limiter.allow(make_record("Error fetching balances.", created=0, level=logging.WARNING)))
+        self.assertTrue(rate_limiter.allow(make_record("Error fetching balances.", created=0, name="hummingbot.client")))
+        self.assertFalse(rate_limiter.allow(make_record("Error fetching balances.", created=1)))
+
+    def test_records_below_the_level_are_not_limited(self):
+        rate_limiter = LogRateLimiter(interval=10, burst=1, level=NETWORK)
+
+        self.assertTrue(all(rate_limiter.allow(make_record("Order book snapshot.", created=i, level=logging.DEBUG))
+                            for i in range(5)))
+
+    def test_expired_call_sites_are_removed(self):
+        rate_limiter = LogRateLimiter(interval=10, burst=1, max_sites=3)
+        for i in range(3):
+            rate_limiter.allow(make_record(f"Message {i}", created=i))
+
+        rate_limiter.allow(make_record("Message 3", created=11))
+
+        self.assertEqual(["Message 2", "Message 3"], [key[2] for key in rate_limiter._sites])
+
+
+class LogQueueListenerTest(unittest.TestCase):
+    def setUp(self) -> None:
+        self.listener = LogQueueListener(batch_size=10)
+        self.listener.start()
+
+    def tearDown(self) -> None:
+        self.listener.stop()
+
+    def test_records_are_handled_by_the_listener_thread(self):
+        handler = RecordingHandler()
+        warning_handler = RecordingHandler(level=logging.WARNING)
+        queue_handler = QueueLogHandler(self.listener, [handler, warning_handler])
+
+        for i in range(25):
+            queue_handler.handle(make_record(f"Message {i}", created=i, level=logging.INFO))
+        queue_handler.handle(make_record("Warning", created=25, level=logging.WARNING))
+        self.listener.stop()
+
+        self.assertEqual([f"Message {i}" for i in range(25)] + ["Warning"],
+                         [record.getMessage() for record in handler.records])
+        self.assertEqual(["Warning"], [record.getMessage() for record in warning_handler.records])
+        self.assertEqual({"hummingbot-logging"}, handler.threads)
+        self.assertEqual(logging.NOTSET, queue_handler.level)
+
+    def test_records_are_handled_synchronously_when_stopped(self):
+        handler = RecordingHandler()
+        queue_handler = QueueLogHandler(self.listener, [handler], LogRateLimiter(interval=10, burst=1))
+        self.listener.stop()
+
+        queue_handler.handle(make_record("Message", created=0))
+        queue_handler.handle(make_record("Message", created=1))
+
+        self.assertEqual(1, len(handler.records))
+        self.assertEqual({threading.current_thread().name}, handler.threads)
+
+    def test_file_handler_is_flushed_once_per_batch(self):
+        with tempfile.TemporaryDirectory() as temp_dir:
+            file_handler = BatchedTimedRotatingFileHandler(Path(temp_dir) / "logs.log", when="D")
+            flushes = []
+            original_flush = file_handler.stream.flush
+            file_handler.stream.flush = lambda: flushes.append(1) or original_flush()
+
+            self.listener.dispatch([(make_record(f"Message {i}", created=i), (file_handler,)) for i in range(10)])
+
+            self.assertEqual(1, len(flushes))
+            self.assertEqual(10, len((Path(temp_dir) / "logs.log").read_text().splitlines()))
+            file_handler.close()
+
+
+class InstallQueueLoggingTest(unittest.TestCase):
+    logger_name = "hummingbot.test_queue_logging"
+
+    def setUp(self) -> None:
+        self.logger = logging.getLogger(self.logger_name)
+        self.handler = RecordingHandler()
+        self.handler.setFormatter(logging.Formatter("%(asctime)s - %(name)s - %(levelname)s - %(message)s"))
+        self.original_handlers = self.logger.handlers
+        self.logger.handlers = [self.handler]
+        self.logger.setLevel(logging.INFO)
+        self.logger.propagate = False
+        self.default_srcfile = logging._srcfile
+
+    def tearDown(self) -> None:
+        uninstall_queue_logging()
+        self.logger.handlers = self.original_handlers
+
+    def test_handlers_are_moved_behind_the_queue(self):
+        install_queue_logging({"rate_limit_burst": 2}, [self.logger_name])
+
+        self.assertEqual(1, len(self.logger.handlers))
+        self.assertIsInstance(self.logger.handlers[0], QueueLogHandler)
+        self.assertIsNone(logging._srcfile)
+
+        for _ in range(4):
+            self.logger.error("Error fetching balances.")
+        uninstall_queue_logging()
+
+        self.assertEqual([self.handler], self.logger.handlers)
+        self.assertEqual(self.default_srcfile, logging._srcfile)
+        self.assertEqual(2, len(self.handler.records))
+        self.assertEqual({"hummingbot-logging"}, self.handler.threads)
+
+    def test_caller_lookup_is_kept_when_a_formatter_needs_it(self):
+        self.handler.setFormatter(logging.Formatter("%(filename)s:%(lineno)d - %(message)s"))
+
+        install_queue_logging({}, [self.logger_name])
+        self.logger.info("Message")
+        uninstall_queue_logging()
+
+        self.assertEqual(self.default_srcfile, logging._srcfile)
+        self.assertEqual("test_queue_logging.py", self.handler.records[0].filename)
@@ -0,0 +1,40 @@
+import tempfile
+from pathlib import Path
+from unittest import TestCase
+
+from hummingbot.client.config.client_config_map import ClientConfigMap, DBSqliteMode
+from hummingbot.client.config.config_helpers import ClientConfigAdapter
+from hummingbot.model.sql_connection_manager import SQLConnectionManager, SQLConnectionType
+
+
+class SQLConnectionManagerTests(TestCase):
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.db_path = str(Path(self.temp_dir.name) / "test_db.sqlite")
+
+    def tearDown(self) -> None:
+        self.temp_dir.cleanup()
+        super().tearDown()
+
+    def get_pragma(self, manager: SQLConnectionManager, name: str):
+        with manager.engine.connect() as connection:
+            return connection.exec_driver_sql(f"PRAGMA {name}").scalar()
+
+    def test_default_sqlite_settings(self):
+        client_config_map = ClientConfigAdapter(ClientConfigMap())
+        manager = SQLConnectionManager(client_config_map, SQLConnectionType.TRADE_FILLS, db_path=self.db_path)
+
+        self.assertEqual("delete", self.get_pragma(manager, "journal_mode"))
+        self.assertEqual(2, self.get_pragma(manager, "synchronous"))  # FULL
+
+    def test_sqlite_performance_profile(self):
+        client_config_map = ClientConfigAdapter(ClientConfigMap())
+        client_config_map.db_mode = DBSqliteMode(db_performance_profile=True)
+        manager = SQLConnectionManager(client_config_map, SQLConnectionType.TRADE_FILLS, db_path=self.db_path)
+
+        self.assertEqual("wal", self.get_pragma(manager, "journal_mode"))
+        self.assertEqual(1, self.get_pragma(manager, "synchronous"))  # NORMAL
+        self.assertEqual(-64 * 1024, self.get_pragma(manager, "cache_size"))
+        self.assertEqual(2, self.get_pragma(manager, "temp_store"))  # MEMORY
@@ -0,0 +1,176 @@
+import asyncio
+import pickle
+import queue
+import unittest
+from decimal import Decimal
+from multiprocessing import Process
+
+from hummingbot.pmm_script.pmm_script_base import PMMScriptBase
+from hummingbot.pmm_script.pmm_script_channel import SharedMarketState, SharedMemoryQueue
+from hummingbot.pmm_script.pmm_script_interface import OnBalances, PMMParameters
+
+
+def echo_items(input_queue: SharedMemoryQueue, output_queue: SharedMemoryQueue):
+    while True:
+        item = input_queue.get(timeout=5)
+        output_queue.put(item)
+        if item is None:
+            break
+    input_queue.close()
+
+
+class RecordingScript(PMMScriptBase):
+    def __init__(self):
+        super().__init__()
+        self.ticks = []
+
+    def on_tick(self):
+        self.ticks.append((self.mid_price, self.pmm_parameters.bid_spread, self.all_total_balances))
+
+
+class SharedMemoryQueueTest(unittest.TestCase):
+    def setUp(self) -> None:
+        super().setUp()
+        self.queue = SharedMemoryQueue(capacity=64)
+
+    def tearDown(self) -> None:
+        self.queue.close()
+        super().tearDown()
+
+    def test_items_wrap_around_the_buffer(self):
+        received = []
+        for i in range(50):
+            self.queue.put({"order_id": f"OID-{i}"})
+            received.append(self.queue.get())
+
+        self.assertEqual([{"order_id": f"OID-{i}"} for i in range(50)], received)
+        self.assertTrue(self.queue.empty())
+
+    def test_full_and_empty(self):
+        self.assertTrue(self.queue.empty())
+        with self.assertRaises(queue.Empty):
+            self.queue.get_nowait()
+        with self.assertRaises(queue.Empty):
+            self.queue.get(timeout=0.01)
+
+        self.queue.put_nowait("x" * 20)
+        self.assertFalse(self.queue.empty())
+        with self.assertRaises(queue.Full):
+            self.queue.put_nowait("x" * 20)
+        with self.assertRaises(ValueError):
+            self.queue.put("x" * 100)
+
+        self.assertEqual("x" * 20, self.queue.get())
+        self.queue.put_nowait("x" * 20)
+
+    def test_queue_is_shared_with_another_process(self):
+        output_queue = SharedMemoryQueue()
+        # The forked process closes its copy of the queue, which must not destroy the shared memory
+        process = Process(target=echo_items, args=(self.queue, output_queue))
+        process.start()
+        items = [Decimal("1.5"), "order", {"BTC": Decimal("0.1")}, None]
+        for item in items:
+            self.queue.put(item)
+        received = [output_queue.get(timeout=5) for _ in items]
+        process.join(5)
+        output_queue.close()
+
+        self.assertEqual(items, received)
+        self.assertEqual(0, process.exitcode)
+        self.queue.put("after the process exits")
+        self.assertEqual("after the process exits", self.queue.get())
+
+    def test_pickled_queue_attaches_to_the_same_memory(self):
+        attached_queue = pickle.loads(pickle.dumps(self.queue))
+        self.queue.put("order")
+
+        self.assertEqual("order", attached_queue.get_nowait())
+        self.assertTrue(self.queue.empty())
+        attached_queue.close()
+
+
+class SharedMarketStateTest(unittest.TestCase):
+    def setUp(self) -> None:
+        super().setUp()
+        self.market_state = SharedMarketState(slots=4)
+        self.reader = pickle.loads(pickle.dumps(self.market_state))
+
+    def tearDown(self) -> None:
+        self.reader.close()
+        self.market_state.close()
+        super().tearDown()
+
+    def test_ticks_are_read_in_order(self):
+        self.assertFalse(self.reader.has_new_ticks())
+
+        self.market_state.publish(1000.0, Decimal("100.123456789"))
+        self.market_state.publish(1001.0, Decimal("100.2"))
+
+        self.assertTrue(self.reader.has_new_ticks())
+        self.assertEqual([(1000.0, Decimal("100.123456789")), (1001.0, Decimal("100.2"))],
+                         self.reader.read_new_ticks())
+        self.assertFalse(self.reader.has_new_ticks())
+        self.assertEqual([], self.reader.read_new_ticks())
+
+    def test_ticks_can_be_read_up_to_a_sequence(self):
+        for i in range(3):
+            self.market_state.publish(1000.0 + i, Decimal(i))
+
+        self.assertEqual([(1000.0, Decimal(0)), (1001.0, Decimal(1))], self.reader.read_new_ticks(last_sequence=2))
+        self.assertEqual([(1002.0, Decimal(2))], self.reader.read_new_ticks())
+
+    def test_overwritten_ticks_are_dropped(self):
+        for i in range(10):
+            self.market_state.publish(1000.0 + i, Decimal(i))
+
+        self.assertEqual([Decimal(i) for i in range(6, 10)], [price for _, price in self.reader.read_new_ticks()])
+        self.assertEqual(6, self.reader.dropped_ticks)
+
+    def test_mid_price_too_long_raises(self):
+        with self.assertRaises(ValueError):
+            self.market_state.publish(1000.0, Decimal("1." + "1" * 70))
+
+
+class PMMScriptBaseChannelTest(unittest.TestCase):
+    def setUp(self) -> None:
+        super().setUp()
+        self.ev_loop = asyncio.new_event_loop()
+        self.parent_queue = SharedMemoryQueue()
+        self.child_queue = SharedMemoryQueue()
+        self.market_state = SharedMarketState()
+        self.script = RecordingScript()
+        self.script.assign_init(self.parent_queue, self.child_queue, 0.001, self.market_state)
+
+    def tearDown(self) -> None:
+        self.ev_loop.close()
+        for channel in (self.parent_queue, self.child_queue, self.market_state):
+            channel.close()
+        super().tearDown()
+
+    def test_ticks_are_processed_with_the_parameters_and_balances_queued_before(self):
+        parameters = PMMParameters()
+        parameters._bid_spread = Decimal("0.01")
+        self.parent_queue.put(parameters)
+        self.parent_queue.put(OnBalances({"binance": {"BTC": Decimal("1")}}, {"binance": {"BTC": Decimal("0.5")}}))
+        self.market_state.publish(1000.0, Decimal("100"))
+        self.market_state.publish(1001.0, Decimal("101"))
+
+        async def run_until_ticks_processed():
+            task = asyncio.ensure_future(self.script.listen_to_parent())
+            while len(self.script.ticks) < 2:
+                await asyncio.sleep(0.001)
+            parameters._bid_spread = Decimal("0.02")
+            self.parent_queue.put(parameters)
+            self.market_state.publish(1002.0, Decimal("102"))
+            while len(self.script.ticks) < 3:
+                await asyncio.sleep(0.001)
+            task.cancel()
+
+        self.ev_loop.run_until_complete(asyncio.wait_for(run_until_ticks_processed(), 1))
+
+        self.assertEqual(
+            [(Decimal("100"), Decimal("0.01"), {"binance": {"BTC": Decimal("1")}}),
+             (Decimal("101"), Decimal("0.01"), {"binance": {"BTC": Decimal("1")}}),
+             (Decimal("102"), Decimal("0.02"), {"binance": {"BTC": Decimal("1")}})],
+            self.script.ticks)
+        self.assertEqual({"binance": {"BTC": Decimal("0.5")}}, self.script.all_available_balances)
@@ -3,7 +3,7 @@ from test.isolated_asyncio_wrapper_test_case import IsolatedAsyncioWrapperTestCa
 from unittest.mock import MagicMock, PropertyMock, patch
 
 from hummingbot.connector.connector_base import ConnectorBase
-from hummingbot.core.data_type.common import OrderType, TradeType
+from hummingbot.core.data_type.common import OrderType, PriceType, TradeType
 from hummingbot.core.data_type.in_flight_order import InFlightOrder, OrderState, TradeUpdate
 from hummingbot.core.data_type.trade_fee import AddedToCostTradeFee, TokenAmount
 from hummingbot.core.event.events import (
@@ -19,7 +19,9 @@ from hummingbot.smart_components.executors.position_executor.data_types import (
     PositionExecutorStatus,
     TrailingStop,
 )
+from hummingbot.smart_components.executor_scheduler import ExecutorScheduler
 from hummingbot.smart_components.executors.position_executor.position_executor import PositionExecutor
+from hummingbot.smart_components.price_barrier_index import PriceBarrierIndex
 from hummingbot.strategy.script_strategy_base import ScriptStrategyBase
 
 
@@ -556,3 +558,56 @@ class TestPositionExecutor(IsolatedAsyncioWrapperTestCase):
         # Forth: triggered
         self.assertEqual(position_executor.trailing_stop_condition(), True)
         position_executor.terminate_control_loop()
+
+    def test_barrier_levels_long(self):
+        position_executor = PositionExecutor(self.strategy, self.get_position_config_market_long())
+        self.assertEqual((Decimal("95"), None), position_executor.get_barrier_levels())
+
+        position_executor = PositionExecutor(self.strategy, self.get_position_config_market_long_tp_market())
+        self.assertEqual((Decimal("95"), Decimal("110")), position_executor.get_barrier_levels())
+        self.assertEqual(PriceType.BestBid, position_executor.close_price_type)
+        position_executor.terminate_control_loop()
+
+    def test_barrier_levels_short(self):
+        position_executor = PositionExecutor(self.strategy, self.get_position_config_market_short())
+        self.assertEqual((None, Decimal("105")), position_executor.get_barrier_levels())
+        self.assertEqual(PriceType.BestAsk, position_executor.close_price_type)
+        position_executor.terminate_control_loop()
+
+    def test_barrier_levels_trailing_stop(self):
+        position_executor = PositionExecutor(self.strategy, self.get_position_config_trailing_stop())
+        self.assertEqual((Decimal("95"), Decimal("102")), position_executor.get_barrier_levels())
+
+        position_executor._trailing_stop_activated = True
+        position_executor._trailing_stop_price = Decimal("101.97")
+
+        self.assertEqual((Decimal("101.97"), Decimal("103")), position_executor.get_barrier_levels())
+        position_executor.terminate_control_loop()
+
+    @patch("hummingbot.smart_components.executors.position_executor.position_executor.PositionExecutor.get_price",
+           return_value=Decimal("100"))
+    async def test_control_task_indexes_barriers_not_crossed(self, _):
+        position_config = self.get_position_config_market_long_tp_market()
+        type(self.strategy).current_timestamp = PropertyMock(return_value=1234567890)
+        position_executor = PositionExecutor(self.strategy, position_config)
+        scheduler = ExecutorScheduler.get_instance()
+        position_executor._scheduler = scheduler
+        scheduler.add(position_executor)
+        position_executor.executor_status = PositionExecutorStatus.ACTIVE_POSITION
+
+        await position_executor.control_task()
+
+        barrier_index = PriceBarrierIndex.get_instance(
+            self.strategy, self.strategy.connectors["binance"], "ETH-USDT", scheduler)
+        self.assertIsNone(position_executor.close_order.order_id)
+        self.assertTrue(barrier_index.is_registered(position_executor))
+        self.assertTrue(scheduler.is_suspended(position_executor))
+
+        self.strategy.connectors["binance"].get_price_by_type = MagicMock(return_value=Decimal("94"))
+        self.assertEqual({position_executor}, barrier_index.pop_crossed())
+
+        position_executor.index_barriers()
+        position_executor.terminate_control_loop()
+        position_executor.on_stop()
+        self.assertFalse(barrier_index.is_registered(position_executor))
+        scheduler.stop()
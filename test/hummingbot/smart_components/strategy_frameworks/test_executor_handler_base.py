@@ -9,6 +9,7 @@ from hummingbot.core.data_type.common import OrderType, PositionAction, Position
 from hummingbot.logger import HummingbotLogger
 from hummingbot.smart_components.strategy_frameworks.controller_base import ControllerBase
 from hummingbot.smart_components.strategy_frameworks.executor_handler_base import ExecutorHandlerBase
+from hummingbot.smart_components.utils.executor_history_store import ExecutorHistoryStore
 
 
 class TestExecutorHandlerBase(IsolatedAsyncioWrapperTestCase):
@@ -80,6 +81,30 @@ class TestExecutorHandlerBase(IsolatedAsyncioWrapperTestCase):
         self.executor_handler.store_executor(mock_executor, mock_order_level)
         self.assertIsNone(self.executor_handler.level_executors[mock_order_level.level_id])
 
+    @patch("hummingbot.smart_components.strategy_frameworks.executor_handler_base.MarketsRecorder")
+    def test_executor_store_used_for_closed_executors(self, _):
+        executor_store = MagicMock(spec=ExecutorHistoryStore)
+        executor_store.query_df.return_value = pd.DataFrame([{"net_pnl": 0.01}])
+        self.mock_controller.config.exchange = "binance_perpetual"
+        self.mock_controller.config.trading_pair = "BTC-USDT"
+        executor_handler = ExecutorHandlerBase(self.mock_strategy, self.mock_controller, executor_store=executor_store)
+        mock_executor = MagicMock()
+        mock_executor.to_json.return_value = {"timestamp": 123445634, "net_pnl": 0.01}
+        mock_order_level = MagicMock()
+        mock_order_level.level_id = "BUY_1"
+
+        executor_handler.store_executor(mock_executor, mock_order_level)
+        closed_executors_df = executor_handler.get_closed_executors_df()
+        executor_handler.on_stop()
+
+        executor_store.append.assert_called_once_with({"timestamp": 123445634, "net_pnl": 0.01, "order_level": "BUY_1",
+                                                       "controller_name": "test_strategy"})
+        executor_store.query_df.assert_called_once_with(controller_name="test_strategy",
+                                                        exchange="binance_perpetual",
+                                                        trading_pair="BTC-USDT")
+        self.assertEqual(0.01, closed_executors_df["net_pnl"].iloc[0])
+        executor_store.flush.assert_called_once()
+
     @patch.object(ExecutorHandlerBase, "_sleep", new_callable=AsyncMock)
     @patch.object(ExecutorHandlerBase, "control_task", new_callable=AsyncMock)
     async def test_control_loop(self, mock_control_task, mock_sleep):
@@ -0,0 +1,168 @@
+import asyncio
+from test.isolated_asyncio_wrapper_test_case import IsolatedAsyncioWrapperTestCase
+
+from hummingbot.smart_components.executor_scheduler import ExecutorScheduler
+
+
+class ComponentMock:
+    def __init__(self, update_interval: float, fail: bool = False):
+        self.update_interval = update_interval
+        self.fail = fail
+        self.run_times = []
+
+    async def control_task(self):
+        self.run_times.append(asyncio.get_event_loop().time())
+        if self.fail:
+            raise Exception("Control task error")
+
+
+class AwaitingComponentMock(ComponentMock):
+    def __init__(self, update_interval: float, fail: bool = False):
+        super().__init__(update_interval, fail)
+        self.release_event = asyncio.Event()
+        self.finished_count = 0
+
+    async def control_task(self):
+        self.run_times.append(asyncio.get_event_loop().time())
+        await self.release_event.wait()
+        self.release_event.clear()
+        if self.fail:
+            raise Exception("Control task error")
+        self.finished_count += 1
+
+
+class ExecutorSchedulerTests(IsolatedAsyncioWrapperTestCase):
+    level = 0
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.log_records = []
+        ExecutorScheduler.logger().setLevel(1)
+        ExecutorScheduler.logger().addHandler(self)
+
+    async def asyncSetUp(self) -> None:
+        await super().asyncSetUp()
+        self.scheduler = ExecutorScheduler.get_instance()
+        self.scheduler.stop()
+
+    async def asyncTearDown(self) -> None:
+        self.scheduler.stop()
+        await super().asyncTearDown()
+
+    def handle(self, record):
+        self.log_records.append(record)
+
+    def is_logged(self, log_level: str, message: str) -> bool:
+        return any(record.levelname == log_level and record.getMessage() == message for record in self.log_records)
+
+    async def test_get_instance_returns_one_scheduler_per_event_loop(self):
+        self.assertIs(self.scheduler, ExecutorScheduler.get_instance())
+
+    async def test_components_due_together_run_in_the_same_tick(self):
+        components = [ComponentMock(update_interval=10) for _ in range(500)]
+        for component in components:
+            self.scheduler.add(component)
+
+        await asyncio.sleep(0.05)
+
+        self.assertTrue(all(len(component.run_times) == 1 for component in components))
+        self.assertEqual(500, self.scheduler.components_count)
+        self.assertEqual(1, self.scheduler.ticks_count)
+
+    async def test_components_run_at_their_own_interval(self):
+        fast_component = ComponentMock(update_interval=0.02)
+        slow_component = ComponentMock(update_interval=0.2)
+        self.scheduler.add(fast_component)
+        self.scheduler.add(slow_component)
+
+        await asyncio.sleep(0.15)
+
+        self.assertGreaterEqual(len(fast_component.run_times), 5)
+        self.assertEqual(1, len(slow_component.run_times))
+
+    async def test_trigger_runs_control_task_before_interval(self):
+        component = ComponentMock(update_interval=10)
+        self.scheduler.add(component)
+        await asyncio.sleep(0.01)
+        self.assertEqual(1, len(component.run_times))
+
+        self.scheduler.trigger(component)
+        await asyncio.sleep(0.01)
+
+        self.assertEqual(2, len(component.run_times))
+
+    async def test_trigger_ignores_components_not_scheduled(self):
+        component = ComponentMock(update_interval=10)
+
+        self.scheduler.trigger(component)
+        await asyncio.sleep(0.01)
+
+        self.assertEqual(0, len(component.run_times))
+        self.assertFalse(self.scheduler.is_scheduled(component))
+
+    async def test_removed_component_is_not_run_again(self):
+        component = ComponentMock(update_interval=0.02)
+        self.scheduler.add(component)
+        await asyncio.sleep(0.01)
+
+        self.scheduler.remove(component)
+        await asyncio.sleep(0.05)
+
+        self.assertEqual(1, len(component.run_times))
+        self.assertEqual(0, self.scheduler.components_count)
+
+    async def test_control_task_errors_are_logged_and_component_kept_scheduled(self):
+        failing_component = ComponentMock(update_interval=0.02, fail=True)
+        component = ComponentMock(update_interval=0.02)
+        self.scheduler.add(failing_component)
+        self.scheduler.add(component)
+
+        await asyncio.sleep(0.05)
+
+        self.assertGreaterEqual(len(failing_component.run_times), 2)
+        self.assertGreaterEqual(len(component.run_times), 2)
+        self.assertTrue(self.is_logged("ERROR", f"Error running the control task of {failing_component}."))
+
+    async def test_lag_stats(self):
+        component = ComponentMock(update_interval=0.02)
+        self.scheduler.add(component)
+        await asyncio.sleep(0.05)
+
+        stats = self.scheduler.lag_stats()
+
+        self.assertEqual(self.scheduler.ticks_count, stats["ticks"])
+        self.assertGreater(stats["ticks"], 0)
+        self.assertGreaterEqual(stats["max_lag"], stats["average_lag"])
+        self.assertGreaterEqual(stats["average_lag"], 0)
+
+        self.scheduler.reset_lag_stats()
+
+        self.assertEqual(0, self.scheduler.ticks_count)
+        self.assertEqual(0, self.scheduler.max_lag)
+
+    async def test_awaiting_control_task_completes_and_is_not_started_again_while_running(self):
+        component = AwaitingComponentMock(update_interval=0.01)
+        self.scheduler.add(component)
+        await asyncio.sleep(0.05)
+
+        self.assertEqual(1, len(component.run_times))
+        self.assertEqual(0, component.finished_count)
+
+        self.scheduler.trigger(component)
+        component.release_event.set()
+        await asyncio.sleep(0.005)
+
+        self.assertEqual(1, component.finished_count)
+        self.assertEqual(2, len(component.run_times))
+
+    async def test_awaiting_control_task_errors_are_logged(self):
+        component = AwaitingComponentMock(update_interval=10, fail=True)
+        self.scheduler.add(component)
+        await asyncio.sleep(0.01)
+
+        running_task = self.scheduler.remove(component)
+        component.release_event.set()
+        await running_task
+
+        self.assertTrue(self.is_logged("ERROR", f"Error running the control task of {component}."))
+        self.assertFalse(self.scheduler.is_scheduled(component))
@@ -0,0 +1,120 @@
+from decimal import Decimal
+from test.isolated_asyncio_wrapper_test_case import IsolatedAsyncioWrapperTestCase
+from unittest.mock import MagicMock, PropertyMock
+
+from hummingbot.connector.exchange_base import ExchangeBase
+from hummingbot.core.data_type.common import PriceType
+from hummingbot.smart_components.executor_scheduler import ExecutorScheduler
+from hummingbot.smart_components.price_barrier_index import PriceBarrierIndex
+from hummingbot.strategy.script_strategy_base import ScriptStrategyBase
+
+
+class ComponentMock:
+    def __init__(self, update_interval: float = 1.0):
+        self.update_interval = update_interval
+        self.trigger_control_task = MagicMock()
+
+
+class PriceBarrierIndexTests(IsolatedAsyncioWrapperTestCase):
+    trading_pair = "ETH-USDT"
+
+    async def asyncSetUp(self) -> None:
+        await super().asyncSetUp()
+        self.scheduler = ExecutorScheduler.get_instance()
+        self.scheduler.stop()
+        self.strategy = MagicMock(spec=ScriptStrategyBase)
+        type(self.strategy).current_timestamp = PropertyMock(return_value=1000)
+        self.prices = {PriceType.BestBid: Decimal("100"), PriceType.BestAsk: Decimal("101")}
+        self.connector = MagicMock(spec=ExchangeBase)
+        self.connector.get_price_by_type.side_effect = lambda trading_pair, price_type: self.prices[price_type]
+        self.index = PriceBarrierIndex.get_instance(self.strategy, self.connector, self.trading_pair, self.scheduler)
+
+    async def asyncTearDown(self) -> None:
+        PriceBarrierIndex._instances.clear()
+        self.scheduler.stop()
+        await super().asyncTearDown()
+
+    def test_get_instance_returns_the_index_of_the_trading_pair(self):
+        self.assertIs(self.index,
+                      PriceBarrierIndex.get_instance(self.strategy, self.connector, self.trading_pair, self.scheduler))
+        self.assertIsNot(self.index,
+                         PriceBarrierIndex.get_instance(self.strategy, self.connector, "BTC-USDT", self.scheduler))
+
+    def test_only_crossed_components_are_popped(self):
+        components = [ComponentMock() for _ in range(10)]
+        for i, component in enumerate(components):
+            self.index.register(component, PriceType.BestBid,
+                                lower=Decimal("95") - i, upper=Decimal("105") + i)
+
+        self.prices[PriceType.BestBid] = Decimal("106.5")
+        crossed = self.index.pop_crossed()
+
+        self.assertEqual(set(components[:2]), crossed)
+        self.assertEqual(8, self.index.components_count)
+        self.assertEqual(set(), self.index.pop_crossed())
+
+        self.prices[PriceType.BestBid] = Decimal("90")
+        crossed = self.index.pop_crossed()
+
+        self.assertEqual(set(components[2:6]), crossed)
+        self.assertEqual(4, self.index.components_count)
+
+    def test_barriers_are_compared_with_their_price_type(self):
+        buy_component = ComponentMock()
+        sell_component = ComponentMock()
+        self.index.register(buy_component, PriceType.BestBid, upper=Decimal("100.5"))
+        self.index.register(sell_component, PriceType.BestAsk, upper=Decimal("100.5"))
+
+        self.assertEqual({sell_component}, self.index.pop_crossed())
+
+    def test_register_replaces_previous_barriers(self):
+        component = ComponentMock()
+        self.index.register(component, PriceType.BestBid, lower=Decimal("99"), upper=Decimal("101"))
+        self.index.register(component, PriceType.BestBid, lower=Decimal("90"), upper=Decimal("110"))
+
+        self.prices[PriceType.BestBid] = Decimal("95")
+
+        self.assertEqual(set(), self.index.pop_crossed())
+        self.assertTrue(self.index.is_registered(component))
+
+    def test_time_limits_are_popped_when_expired(self):
+        expired_component = ComponentMock()
+        active_component = ComponentMock()
+        self.index.register(expired_component, PriceType.BestBid, end_time=1000)
+        self.index.register(active_component, PriceType.BestBid, end_time=1001)
+
+        self.assertEqual({expired_component}, self.index.pop_crossed())
+        self.assertTrue(self.index.is_registered(active_component))
+
+    def test_index_is_scheduled_while_it_has_components(self):
+        component = ComponentMock(update_interval=0.5)
+        other_component = ComponentMock(update_interval=0.2)
+        self.index.register(component, PriceType.BestBid, lower=Decimal("90"))
+        self.index.register(other_component, PriceType.BestBid, lower=Decimal("90"))
+
+        self.assertTrue(self.scheduler.is_scheduled(self.index))
+        self.assertEqual(0.2, self.index.update_interval)
+
+        self.index.remove(component)
+        self.index.remove(other_component)
+
+        self.assertFalse(self.scheduler.is_scheduled(self.index))
+        self.assertNotIn((self.connector, self.trading_pair), PriceBarrierIndex._instances)
+
+    def test_stale_entries_are_compacted(self):
+        component = ComponentMock()
+        for i in range(200):
+            self.index.register(component, PriceType.BestBid, lower=Decimal("90"), upper=Decimal("110"), end_time=2000)
+
+        self.assertLessEqual(self.index._entries_count(), 3 * 66)
+
+    async def test_control_task_triggers_crossed_components(self):
+        crossed_component = ComponentMock()
+        component = ComponentMock()
+        self.index.register(crossed_component, PriceType.BestBid, lower=Decimal("100"))
+        self.index.register(component, PriceType.BestBid, lower=Decimal("99"))
+
+        await self.index.control_task()
+
+        crossed_component.trigger_control_task.assert_called_once()
+        component.trigger_control_task.assert_not_called()
@@ -2,7 +2,7 @@ import asyncio
 import unittest
 from decimal import Decimal
 from typing import Awaitable
-from unittest.mock import MagicMock, PropertyMock
+from unittest.mock import AsyncMock, MagicMock, PropertyMock
 
 from hummingbot.connector.connector_base import ConnectorBase
 from hummingbot.core.data_type.common import OrderType, TradeType
@@ -126,6 +126,42 @@ class TestSmartComponentBase(unittest.TestCase):
         self.component.process_order_filled_event(event_tag, market, event)
         self.assertIsNone(self.component.process_order_filled_event(event_tag, market, event))
 
+    def test_order_filled_event_triggers_control_task(self):
+        event = OrderFilledEvent(
+            timestamp=1234567890,
+            order_id="OID-BUY-1",
+            exchange_order_id="ED140",
+            trading_pair="ETH-USDT",
+            trade_type=TradeType.BUY,
+            order_type=OrderType.LIMIT,
+            price=Decimal("1000.0"),
+            amount=Decimal("1.0"),
+            trade_fee=AddedToCostTradeFee(percent=Decimal("0.001")),
+        )
+        component = SmartComponentBase(self.strategy, ["connector1"], update_interval=10)
+        component.control_task = AsyncMock()
+        component.process_order_filled_event = MagicMock()
+        control_loop_task = asyncio.get_event_loop().create_task(component.control_loop())
+        self.async_run_with_timeout(asyncio.sleep(0.01))
+        self.assertEqual(1, component.control_task.call_count)
+
+        component._fill_order_forwarder(event)
+        self.async_run_with_timeout(asyncio.sleep(0.01))
+
+        component.process_order_filled_event.assert_called_once()
+        self.assertEqual(1, component.control_task.call_count)
+
+        component.place_order(connector_name="connector1", trading_pair="ETH-USDT", order_type=OrderType.LIMIT,
+                              side=TradeType.BUY, amount=Decimal("1.0"), price=Decimal("1000.0"))
+        component._fill_order_forwarder(event)
+        self.async_run_with_timeout(asyncio.sleep(0.01))
+
+        self.assertEqual(2, component.process_order_filled_event.call_count)
+        self.assertEqual(2, component.control_task.call_count)
+        component.terminate_control_loop()
+        self.async_run_with_timeout(control_loop_task)
+        self.assertEqual(SmartComponentStatus.TERMINATED, component.status)
+
     def test_process_order_failed_event(self):
         event_tag = 1
         market = MagicMock()
@@ -0,0 +1,159 @@
+import json
+import tempfile
+import unittest
+from decimal import Decimal
+from pathlib import Path
+
+import numpy as np
+
+from hummingbot.smart_components.utils.executor_history_store import (
+    EXECUTOR_SCHEMA,
+    MANIFEST_FILE_NAME,
+    ExecutorHistoryStore,
+)
+
+DAY = 86400
+START = 1_700_000_000 // DAY * DAY
+
+
+class ExecutorHistoryStoreTest(unittest.TestCase):
+    def setUp(self) -> None:
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.store = ExecutorHistoryStore(self.temp_dir.name, batch_size=4)
+
+    def tearDown(self) -> None:
+        self.temp_dir.cleanup()
+
+    @staticmethod
+    def executor_data(timestamp: float, controller_name: str = "dman_v3", trading_pair: str = "ETH-USDT",
+                      net_pnl: Decimal = Decimal("0.01"), close_type: str = "TAKE_PROFIT"):
+        return {
+            "timestamp": timestamp,
+            "exchange": "binance_perpetual",
+            "trading_pair": trading_pair,
+            "side": "BUY",
+            "amount": Decimal("1"),
+            "trade_pnl": net_pnl,
+            "trade_pnl_quote": net_pnl * 100,
+            "cum_fee_quote": Decimal("0.1"),
+            "net_pnl_quote": net_pnl * 100 - Decimal("0.1"),
+            "net_pnl": net_pnl,
+            "close_timestamp": None if close_type is None else timestamp + 60,
+            "executor_status": "COMPLETED",
+            "close_type": close_type,
+            "entry_price": Decimal("100"),
+            "close_price": Decimal("101"),
+            "sl": Decimal("0.03"),
+            "tp": Decimal("0.02"),
+            "tl": 3600,
+            "open_order_type": "LIMIT",
+            "take_profit_order_type": "LIMIT",
+            "stop_loss_order_type": "MARKET",
+            "time_limit_order_type": "MARKET",
+            "leverage": 10,
+            "order_level": "BUY_1",
+            "controller_name": controller_name,
+        }
+
+    def partitions(self):
+        return sorted(path.name for path in Path(self.temp_dir.name).iterdir())
+
+    def test_rows_are_written_in_batches(self):
+        for i in range(3):
+            self.store.append(self.executor_data(START + i))
+
+        self.assertEqual([], self.partitions())
+        self.assertEqual(3, self.store.pending_rows_count)
+        self.assertEqual(3, len(self.store.query()))
+
+        self.store.append(self.executor_data(START + 3))
+
+        self.assertEqual(0, self.store.pending_rows_count)
+        self.assertEqual(["2023-11-14"], self.partitions())
+        batch_path = Path(self.temp_dir.name) / "2023-11-14" / "batch_000000"
+        self.assertEqual(sorted(f"{name}.npy" for name in EXECUTOR_SCHEMA.names),
+                         sorted(path.name for path in batch_path.iterdir()))
+        self.assertEqual(4, len(self.store.query()))
+
+    def test_rows_are_partitioned_by_day(self):
+        self.store.append(self.executor_data(START + DAY - 1))
+        self.store.append(self.executor_data(START + DAY))
+        self.store.flush()
+
+        self.assertEqual(["2023-11-14", "2023-11-15"], self.partitions())
+        with open(Path(self.temp_dir.name) / "2023-11-15" / MANIFEST_FILE_NAME) as manifest_file:
+            batch = json.loads(manifest_file.readline())
+        self.assertEqual(1, batch["rows"])
+        self.assertEqual(["dman_v3"], batch["controller_name"])
+        self.assertEqual(START + DAY, batch["min_timestamp"])
+
+    def test_values_are_typed(self):
+        self.store.append(self.executor_data(START, close_type=None))
+        self.store.flush()
+
+        row = self.store.query()[0]
+
+        self.assertEqual(START, row["timestamp"])
+        self.assertTrue(np.isnan(row["close_timestamp"]))
+        self.assertEqual(0.01, row["net_pnl"])
+        self.assertEqual(10, row["leverage"])
+        self.assertEqual("", row["close_type"])
+        self.assertEqual("BUY_1", row["order_level"])
+
+    def test_query_filters_by_controller_pair_and_time(self):
+        for i in range(10):
+            self.store.append(self.executor_data(START + i * DAY / 2,
+                                                 controller_name=f"controller_{i % 2}",
+                                                 trading_pair="ETH-USDT" if i < 5 else "BTC-USDT"))
+        self.store.flush()
+
+        self.assertEqual(5, len(self.store.query(controller_name="controller_0")))
+        self.assertEqual([START + 5 * DAY / 2, START + 7 * DAY / 2, START + 9 * DAY / 2],
+                         self.store.query(controller_name="controller_1", trading_pair="BTC-USDT")["timestamp"].tolist())
+        self.assertEqual([START + DAY, START + 3 * DAY / 2],
+                         self.store.query(start_time=START + DAY, end_time=START + 2 * DAY)["timestamp"].tolist())
+        self.assertEqual(0, len(self.store.query(controller_name="unknown")))
+
+    def test_query_skips_batches_not_matching_the_manifest(self):
+        for i in range(4):
+            self.store.append(self.executor_data(START + i, controller_name="controller_a"))
+        for i in range(4):
+            self.store.append(self.executor_data(START + 10 + i, controller_name="controller_b"))
+        batch_path = Path(self.temp_dir.name) / "2023-11-14" / "batch_000000"
+        for path in batch_path.iterdir():
+            path.unlink()
+
+        result = self.store.query(controller_name="controller_b")
+
+        self.assertEqual(4, len(result))
+        with self.assertRaises(FileNotFoundError):
+            self.store.query(controller_name="controller_a")
+
+    def test_query_returns_requested_columns_sorted_by_timestamp(self):
+        self.store.append(self.executor_data(START + 5, net_pnl=Decimal("0.05")))
+        self.store.flush()
+        self.store.append(self.executor_data(START + 1, net_pnl=Decimal("0.01")))
+
+        result = self.store.query(columns=["net_pnl", "close_type"])
+
+        self.assertEqual(("net_pnl", "close_type"), result.dtype.names)
+        self.assertEqual([0.01, 0.05], result["net_pnl"].tolist())
+
+    def test_query_df(self):
+        self.store.append(self.executor_data(START, close_type=None))
+        self.store.append(self.executor_data(START + 1))
+
+        df = self.store.query_df(controller_name="dman_v3")
+
+        self.assertEqual(list(EXECUTOR_SCHEMA.names), list(df.columns))
+        self.assertIsNone(df["close_type"].iloc[0])
+        self.assertIsNone(df["close_timestamp"].iloc[0])
+        self.assertEqual("TAKE_PROFIT", df["close_type"].iloc[1])
+        self.assertEqual(START + 61, df["close_timestamp"].iloc[1])
+
+    def test_empty_query(self):
+        result = self.store.query(columns=["timestamp", "net_pnl"])
+
+        self.assertEqual(0, len(result))
+        self.assertEqual(("timestamp", "net_pnl"), result.dtype.names)
+        self.assertEqual(0, len(self.store.query_df()))
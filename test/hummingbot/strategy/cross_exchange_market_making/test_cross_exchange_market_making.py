@@ -379,6 +379,37 @@ class HedgedMarketMakingUnitTest(unittest.TestCase):
         self.assertAlmostEqual(Decimal("3.0"), maker_fill.amount)
         self.assertAlmostEqual(Decimal("3.0"), taker_fill.amount)
 
+    @patch("hummingbot.client.settings.AllConnectorSettings.get_exchange_names")
+    @patch("hummingbot.client.settings.AllConnectorSettings.get_connector_settings")
+    @patch('hummingbot.strategy.cross_exchange_market_making.cross_exchange_market_making.'
+           'CrossExchangeMarketMakingStrategy.is_gateway_market')
+    def test_format_status_renders_sections_again_only_on_changes(self,
+                                                                  is_gateway_mock: unittest.mock.Mock,
+                                                                  get_connector_settings_mock,
+                                                                  get_exchange_names_mock):
+        is_gateway_mock.return_value = False
+        get_exchange_names_mock.return_value = set(self.get_mock_connector_settings().keys())
+        get_connector_settings_mock.return_value = self.get_mock_connector_settings()
+
+        self.clock.backtest_til(self.start_timestamp + 5)
+        if len(self.maker_order_created_logger.event_log) == 0:
+            self.async_run_with_timeout(self.maker_order_created_logger.wait_for(BuyOrderCreatedEvent))
+        self.assertEqual(1, len(self.strategy.active_maker_bids))
+
+        with patch.object(self.strategy, "wallet_balance_data_frame",
+                          wraps=self.strategy.wallet_balance_data_frame) as wallet_balance_mock:
+            status = self.strategy.format_status()
+            self.assertEqual(status, self.strategy.format_status())
+            self.assertEqual(1, wallet_balance_mock.call_count)
+
+            self.maker_market.set_balance("COINALPHA", 10)
+            new_status = self.strategy.format_status()
+            self.assertEqual(2, wallet_balance_mock.call_count)
+
+        self.assertIn("  Markets:", status)
+        self.assertIn("  Active maker market orders:", status)
+        self.assertNotEqual(status, new_status)
+
     def test_top_depth_tolerance(self):  # TODO
         self.clock.remove_iterator(self.strategy)
         self.clock.add_iterator(self.strategy_with_top_depth_tolerance)
@@ -360,6 +360,40 @@ class PMMUnitTest(unittest.TestCase):
         self.assertEqual(3, len(strategy.active_buys))
         self.assertEqual(3, len(strategy.active_sells))
 
+    def test_many_levels_match_decimal_level_calculation(self):
+        strategy = PureMarketMakingStrategy()
+        strategy.init_params(
+            self.market_info,
+            bid_spread=Decimal("0.0013"),
+            ask_spread=Decimal("0.0013"),
+            order_amount=Decimal("0.5"),
+            order_refresh_time=5.0,
+            filled_order_delay=5.0,
+            order_refresh_tolerance_pct=-1,
+            order_levels=20,
+            order_level_spread=Decimal("0.0007"),
+            order_level_amount=Decimal("0.1"),
+            minimum_spread=-1,
+        )
+        self.clock.add_iterator(strategy)
+        self.clock.backtest_til(self.start_timestamp + self.clock_tick_size)
+
+        mid_price = strategy.get_price()
+        expected_buys = [
+            (self.market.quantize_order_price(
+                self.trading_pair, mid_price * (Decimal("1") - Decimal("0.0013") - level * Decimal("0.0007"))),
+             self.market.quantize_order_amount(self.trading_pair, Decimal("0.5") + level * Decimal("0.1")))
+            for level in range(20)
+        ]
+        expected_sells = [
+            (self.market.quantize_order_price(
+                self.trading_pair, mid_price * (Decimal("1") + Decimal("0.0013") + level * Decimal("0.0007"))),
+             self.market.quantize_order_amount(self.trading_pair, Decimal("0.5") + level * Decimal("0.1")))
+            for level in range(20)
+        ]
+        self.assertEqual(expected_buys, [(order.price, order.quantity) for order in strategy.active_buys])
+        self.assertEqual(expected_sells, [(order.price, order.quantity) for order in strategy.active_sells])
+
     def test_apply_budget_constraint_to_proposal(self):
         strategy = self.multi_levels_strategy
         self.clock.add_iterator(strategy)
@@ -0,0 +1,67 @@
+import unittest
+from decimal import Decimal
+
+import numpy as np
+
+from hummingbot.strategy.proposal_levels import quantize_levels
+
+
+class ProposalLevelsTest(unittest.TestCase):
+
+    @staticmethod
+    def decimal_level_prices(reference_price: Decimal, spread: Decimal, level_spread: Decimal, levels: int,
+                             quantum: Decimal):
+        return [(reference_price * (Decimal("1") - spread - (level * level_spread))) // quantum * quantum
+                for level in range(levels)]
+
+    def test_quantized_levels_match_decimal_calculation(self):
+        reference_price = Decimal("1843.27")
+        spread = Decimal("0.0013")
+        level_spread = Decimal("0.0007")
+        levels = 40
+        quantum = Decimal("0.01")
+        level_spreads = float(spread) + np.arange(levels) * float(level_spread)
+        fallback_levels = []
+
+        prices = quantize_levels(float(reference_price) * (1 - level_spreads),
+                                 lambda price: quantum,
+                                 lambda level: fallback_levels.append(level))
+
+        self.assertEqual([], fallback_levels)
+        self.assertEqual(self.decimal_level_prices(reference_price, spread, level_spread, levels, quantum), prices)
+
+    def test_quantized_sizes_match_decimal_calculation(self):
+        quantum = Decimal("0.001")
+        sizes = quantize_levels(0.1 + np.arange(30) * 0.1, lambda size: quantum, lambda level: None)
+
+        self.assertEqual([(Decimal("0.1") + Decimal("0.1") * level) // quantum * quantum for level in range(30)],
+                         sizes)
+
+    def test_levels_quantized_with_decimal_when_quantum_changes_between_levels(self):
+        quantums = {True: Decimal("0.1"), False: Decimal("0.01")}
+        values = np.array([101.0, 99.0])
+
+        quantized = quantize_levels(values,
+                                    lambda value: quantums[value >= 100],
+                                    lambda level: Decimal(str(values[level])) // quantums[values[level] >= 100])
+
+        self.assertEqual([Decimal("1010"), Decimal("9900")], quantized)
+
+    def test_levels_quantized_with_decimal_when_quantum_below_float_resolution(self):
+        fallback_levels = []
+
+        quantize_levels(np.array([97.0, 96.0]),
+                        lambda value: Decimal("1e-15"),
+                        lambda level: fallback_levels.append(level))
+
+        self.assertEqual([0, 1], fallback_levels)
+
+    def test_levels_quantized_with_decimal_when_there_are_non_positive_values(self):
+        fallback_levels = []
+
+        quantize_levels(np.array([1.0, 0.0]), lambda value: Decimal("0.1"), lambda level: fallback_levels.append(level))
+
+        self.assertEqual([0, 1], fallback_levels)
+
+    def test_no_levels(self):
+        self.assertEqual([], quantize_levels(np.array([]), lambda value: Decimal("0.1"), lambda level: None))
@@ -0,0 +1,44 @@
+import unittest
+from unittest.mock import MagicMock
+
+import numpy as np
+import pandas as pd
+
+from hummingbot.core.utils import map_df_to_str
+from hummingbot.strategy.status_rendering import StatusSectionCache, format_table
+
+
+class StatusRenderingTest(unittest.TestCase):
+
+    def test_format_table_matches_data_frame_layout(self):
+        columns = ["Exchange", "Market", "Best Bid", "Best Ask", "Ref Price (MidPrice)"]
+        rows = [["binance", "ETH-USDT", 1800.25, 1800.5, float("nan")],
+                ["kucoin", "ETH-USDT", 0.00001, 1801.0, 1800.75]]
+        df = map_df_to_str(pd.DataFrame(data=rows, columns=columns).replace(np.nan, '', regex=True))
+
+        self.assertEqual(df.to_string(index=False).split("\n"), format_table(rows, columns))
+
+    def test_format_table_with_left_aligned_first_column(self):
+        rows = [["", "ETH", "USDT"],
+                ["Total Balance", 1.5, 1000.0],
+                ["Current %", "10.0%", "90.0%"]]
+        df = map_df_to_str(pd.DataFrame(data=rows))
+        first_col_length = max(*df[0].apply(len))
+        expected = df.to_string(index=False, header=False,
+                                formatters={0: ("{:<" + str(first_col_length) + "}").format}).split("\n")
+
+        self.assertEqual(expected, format_table(rows, left_align_first_column=True))
+
+    def test_format_table_without_rows(self):
+        self.assertEqual([], format_table([]))
+
+    def test_section_rendered_again_only_when_key_changes(self):
+        cache = StatusSectionCache()
+        render = MagicMock(side_effect=[["first"], ["second"], ["third"]])
+
+        self.assertEqual(["first"], cache.get_lines("assets", (1, 2), render))
+        self.assertEqual(["first"], cache.get_lines("assets", (1, 2), render))
+        self.assertEqual(["second"], cache.get_lines("assets", (1, 3), render))
+        cache.invalidate("assets")
+        self.assertEqual(["third"], cache.get_lines("assets", (1, 3), render))
+        self.assertEqual(3, render.call_count)
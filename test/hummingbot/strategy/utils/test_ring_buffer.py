@@ -107,3 +107,51 @@ class RingBufferTest(unittest.TestCase):
         self.assertTrue(np.array_equal(buffer.get_as_numpy_array(), np.array([0, 1, 2, 3])))
         buffer.add_value(4)
         self.assertTrue(np.array_equal(buffer.get_as_numpy_array(), np.array([1, 2, 3, 4])))
+
+    def test_numpy_view_is_ordered_without_copy(self):
+        buffer = RingBuffer(4)
+        for i in range(6):
+            buffer.add_value(i)
+
+        view = buffer.get_as_numpy_view()
+
+        self.assertTrue(np.array_equal(view, np.array([2, 3, 4, 5])))
+        self.assertFalse(view.flags.owndata)
+        self.assertFalse(view.flags.writeable)
+        self.assertTrue(view.flags.c_contiguous)
+
+    def test_len(self):
+        self.assertEqual(0, len(self.buffer))
+        for i in range(self.BUFFER_LENGTH + 5):
+            self.buffer.add_value(i)
+            self.assertEqual(min(i + 1, self.BUFFER_LENGTH), len(self.buffer))
+
+    def test_sum_mean_and_variance_match_numpy(self):
+        np.random.seed(3141592653)
+        for value in np.random.normal(100000, 0.5, self.BUFFER_LENGTH * 10 + 7):
+            self.buffer.add_value(value)
+            values = self.buffer.get_as_numpy_array()
+            self.assertAlmostEqual(np.sum(values), self.buffer.sum, 6)
+            if self.buffer.is_full:
+                self.assertAlmostEqual(np.mean(values), self.buffer.mean_value, 8)
+                self.assertAlmostEqual(np.var(values), self.buffer.variance, 6)
+
+    def test_nan_values(self):
+        self.fill_buffer_with_zeros()
+        self.buffer.add_value(np.nan)
+
+        self.assertTrue(np.isnan(self.buffer.mean_value))
+        self.assertTrue(np.isnan(self.buffer.sum))
+
+        self.fill_buffer_with_zeros()
+
+        self.assertEqual(0, self.buffer.mean_value)
+
+    def test_length_change_keeps_latest_values(self):
+        for i in range(self.BUFFER_LENGTH):
+            self.buffer.add_value(i)
+
+        self.buffer.length = 5
+
+        self.assertTrue(np.array_equal(self.buffer.get_as_numpy_view(), np.arange(25, 30)))
+        self.assertEqual(27, self.buffer.mean_value)
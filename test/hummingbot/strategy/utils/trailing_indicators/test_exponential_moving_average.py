@@ -0,0 +1,30 @@
+import unittest
+
+import numpy as np
+import pandas as pd
+
+from hummingbot.strategy.__utils__.trailing_indicators.exponential_moving_average import (
+    ExponentialMovingAverageIndicator,
+)
+
+
+class ExponentialMovingAverageTest(unittest.TestCase):
+    INITIAL_RANDOM_SEED = 3141592653
+
+    def setUp(self) -> None:
+        np.random.seed(self.INITIAL_RANDOM_SEED)
+
+    def test_calculate_ema(self):
+        samples = np.random.normal(100, 10, 100)
+        indicator = ExponentialMovingAverageIndicator(sampling_length=20)
+
+        for sample in samples:
+            indicator.add_sample(sample)
+
+        buffer = indicator._sampling_buffer.get_as_numpy_array()
+        expected = pd.Series(buffer).ewm(span=20, adjust=True).mean().iloc[-1]
+        self.assertAlmostEqual(expected, indicator.current_value, 4)
+
+    def test_processing_length_must_be_one(self):
+        with self.assertRaises(Exception):
+            ExponentialMovingAverageIndicator(sampling_length=20, processing_length=2)
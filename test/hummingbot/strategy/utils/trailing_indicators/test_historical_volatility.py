@@ -66,3 +66,15 @@ class HistoricalVolatilityTest(unittest.TestCase):
         energy_smoothed = sum(x ** 2 for x in np.diff(output_smoothed))
 
         self.assertGreater(energy_normal, energy_smoothed)
+
+    def test_streaming_volatility_matches_buffer_calculation(self):
+        samples = 100 * np.exp(np.cumsum(np.random.normal(0, 0.01, 200)))
+        self.indicator = HistoricalVolatilityIndicator(50, 10)
+        variances = []
+
+        for sample in samples:
+            self.indicator.add_sample(sample)
+            buffer = self.indicator._sampling_buffer.get_as_numpy_array()
+            variances.append(np.var(np.diff(np.log(buffer))) if buffer.size > 1 else np.nan)
+            expected = np.sqrt(np.mean(np.nan_to_num(variances[-10:])))
+            self.assertAlmostEqual(expected, self.indicator.current_value, 6)
@@ -20,3 +20,20 @@ class InstantVolatilityTest(unittest.TestCase):
             self.indicator.add_sample(sample)
 
         self.assertAlmostEqual(self.indicator.current_value, 14.068197250366211, 4)
+
+    def test_streaming_volatility_matches_buffer_calculation(self):
+        samples = np.random.normal(100, 10, 200)
+        self.indicator = InstantVolatilityIndicator(50, 1)
+
+        for sample in samples:
+            self.indicator.add_sample(sample)
+            buffer = self.indicator._sampling_buffer.get_as_numpy_array()
+            expected = np.sqrt(np.sum(np.square(np.diff(buffer))) / buffer.size)
+            self.assertAlmostEqual(expected, self.indicator.current_value, 4)
+
+        self.indicator.sampling_length = 20
+        self.indicator.add_sample(100)
+        buffer = self.indicator._sampling_buffer.get_as_numpy_array()
+
+        self.assertAlmostEqual(np.sqrt(np.sum(np.square(np.diff(buffer))) / buffer.size),
+                               self.indicator.current_value, 4)
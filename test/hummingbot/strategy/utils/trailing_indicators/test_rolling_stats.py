@@ -0,0 +1,63 @@
+import unittest
+
+import numpy as np
+import pandas as pd
+
+from hummingbot.strategy.__utils__.trailing_indicators.rolling_stats import RollingEWMA, RollingStats
+
+
+class RollingStatsTest(unittest.TestCase):
+    INITIAL_RANDOM_SEED = 3141592653
+
+    def setUp(self) -> None:
+        np.random.seed(self.INITIAL_RANDOM_SEED)
+
+    def test_statistics_match_numpy_over_the_window(self):
+        values = np.random.normal(100, 5, 500)
+        stats = RollingStats(50)
+
+        for i, value in enumerate(values):
+            stats.add(value)
+            window = values[max(0, i - 49):i + 1]
+            self.assertEqual(len(window), stats.count)
+            self.assertAlmostEqual(np.mean(window), stats.mean, 9)
+            self.assertAlmostEqual(np.var(window), stats.variance, 9)
+            self.assertAlmostEqual(np.sum(window), stats.sum, 7)
+
+    def test_add_returns_evicted_value(self):
+        stats = RollingStats(2)
+
+        self.assertTrue(np.isnan(stats.add(1)))
+        self.assertTrue(np.isnan(stats.add(2)))
+        self.assertEqual(1, stats.add(3))
+        self.assertTrue(stats.is_full)
+
+    def test_nan_values_are_kept_out_of_finite_statistics(self):
+        stats = RollingStats(3, [np.nan, 1.0, 3.0])
+
+        self.assertTrue(np.isnan(stats.mean))
+        self.assertEqual(4.0, stats.finite_sum)
+        self.assertEqual(1, stats.nan_count)
+
+        stats.add(5.0)
+
+        self.assertEqual(0, stats.nan_count)
+        self.assertEqual(3.0, stats.mean)
+
+    def test_resize_keeps_latest_values(self):
+        stats = RollingStats(5, [1.0, 2.0, 3.0, 4.0, 5.0])
+
+        stats.length = 2
+
+        self.assertEqual(2, stats.count)
+        self.assertEqual(4.5, stats.mean)
+
+    def test_ewma_matches_pandas_over_the_window(self):
+        values = np.random.normal(100, 5, 200)
+        ewma = RollingEWMA(30, span=30)
+
+        for i, value in enumerate(values):
+            ewma.add(value)
+            window = values[max(0, i - 29):i + 1]
+            expected = pd.Series(window).ewm(span=30, adjust=True).mean().iloc[-1]
+            self.assertAlmostEqual(expected, ewma.value, 9)
@@ -1,6 +1,8 @@
+import asyncio
 import math
 import unittest
 from decimal import Decimal
+from unittest.mock import patch
 
 import numpy as np
 import pandas as pd
@@ -13,7 +15,10 @@ from hummingbot.core.data_type.common import TradeType
 from hummingbot.core.data_type.order_book import OrderBook
 from hummingbot.core.data_type.trade_fee import TradeFeeSchema
 from hummingbot.core.event.events import OrderBookTradeEvent
-from hummingbot.strategy.__utils__.trailing_indicators.trading_intensity import TradingIntensityIndicator
+from hummingbot.strategy.__utils__.trailing_indicators.trading_intensity import (
+    TradingIntensityIndicator,
+    fit_intensity,
+)
 from hummingbot.strategy.market_trading_pair_tuple import MarketTradingPairTuple
 from hummingbot.strategy.order_book_asset_price_delegate import OrderBookAssetPriceDelegate
 
@@ -259,3 +264,52 @@ class TradingIntensityTest(unittest.TestCase):
 
         self.assertAlmostEqual(a, alpha, 10)
         self.assertAlmostEqual(b, kappa, 10)
+
+    def register_deterministic_trades(self, indicator: TradingIntensityIndicator, timestamp: float):
+        for p, t in zip([2, 3, 4, 5], [2 * np.exp(-0.1 * (p - 1)) for p in [2, 3, 4, 5]]):
+            indicator.register_trade(OrderBookTradeEvent(
+                trading_pair="COINALPHAHBOT",
+                timestamp=timestamp,
+                price=p,
+                amount=t,
+                type=TradeType.SELL,
+            ))
+
+    @patch("hummingbot.strategy.__utils__.trailing_indicators.trading_intensity.fit_intensity", wraps=fit_intensity)
+    def test_intensity_refitted_only_when_trade_samples_change(self, fit_mock):
+        timestamp = self.start_timestamp
+        indicator = TradingIntensityIndicator(OrderBook(), self.price_delegate, 1)
+        indicator.last_quotes = [{"timestamp": timestamp, "price": 1}]
+        timestamp += 1
+        self.register_deterministic_trades(indicator, timestamp)
+
+        indicator.calculate(timestamp)
+        indicator.calculate(timestamp + 1)
+
+        self.assertEqual(1, fit_mock.call_count)
+
+        self.register_deterministic_trades(indicator, timestamp + 2)
+        indicator.calculate(timestamp + 2)
+
+        self.assertEqual(2, fit_mock.call_count)
+
+    def test_intensity_fitted_in_executor(self):
+        timestamp = self.start_timestamp
+        indicator = TradingIntensityIndicator(OrderBook(), self.price_delegate, 1, fit_in_executor=True)
+        indicator.last_quotes = [{"timestamp": timestamp, "price": 1}]
+        timestamp += 1
+        self.register_deterministic_trades(indicator, timestamp)
+
+        indicator.calculate(timestamp)
+
+        self.assertEqual((0, 0), indicator.current_value)
+
+        async def wait_for_fit():
+            while indicator.current_value == (0, 0):
+                await asyncio.sleep(0.01)
+
+        asyncio.get_event_loop().run_until_complete(asyncio.wait_for(wait_for_fit(), 5))
+        alpha, kappa = indicator.current_value
+
+        self.assertAlmostEqual(2, alpha, 10)
+        self.assertAlmostEqual(0.1, kappa, 10)